@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from app.api.response_cache import CachedResponseRoute, resolve_cached_response
 from app.core.auth import require_request_auth
 from app.db.session import get_db_session
 from app.schemas.horrorfest import (
@@ -32,6 +33,12 @@ router = APIRouter(
     tags=["horrorfest"],
     dependencies=[Depends(require_request_auth)],
 )
+# Included at the bottom of this module, once every analytics route exists.
+analytics_router = APIRouter(
+    prefix="/analytics",
+    route_class=CachedResponseRoute,
+    dependencies=[Depends(resolve_cached_response)],
+)
 
 
 @router.get("/years", response_model=list[HorrorfestYearRead])
@@ -44,7 +51,7 @@ def list_horrorfest_years(
     ]
 
 
-@router.get("/analytics/years", response_model=list[HorrorfestAnalyticsYearRead])
+@analytics_router.get("/years", response_model=list[HorrorfestAnalyticsYearRead])
 def list_horrorfest_analytics_years(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -55,7 +62,7 @@ def list_horrorfest_analytics_years(
     ]
 
 
-@router.get("/analytics/titles", response_model=HorrorfestAnalyticsTitleMatrixRead)
+@analytics_router.get("/titles", response_model=HorrorfestAnalyticsTitleMatrixRead)
 def get_horrorfest_analytics_title_matrix(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -83,8 +90,8 @@ def _csv_response(
     )
 
 
-@router.get(
-    "/analytics/titles/{media_item_id}/entries",
+@analytics_router.get(
+    "/titles/{media_item_id}/entries",
     response_model=list[HorrorfestEntryRead],
 )
 def list_horrorfest_analytics_title_entries(
@@ -104,7 +111,7 @@ def list_horrorfest_analytics_title_entries(
     ]
 
 
-@router.get("/analytics/decades", response_model=HorrorfestAnalyticsDecadeMatrixRead)
+@analytics_router.get("/decades", response_model=HorrorfestAnalyticsDecadeMatrixRead)
 def get_horrorfest_analytics_decade_matrix(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -114,7 +121,7 @@ def get_horrorfest_analytics_decade_matrix(
     )
 
 
-@router.get("/analytics/compare", response_model=HorrorfestAnalyticsComparisonRead)
+@analytics_router.get("/compare", response_model=HorrorfestAnalyticsComparisonRead)
 def get_horrorfest_analytics_comparison(
     left_year: int = Query(),
     right_year: int = Query(),
@@ -139,8 +146,8 @@ def get_horrorfest_analytics_comparison(
     return HorrorfestAnalyticsComparisonRead.model_validate(payload)
 
 
-@router.get(
-    "/analytics/leaderboards/repeated-titles",
+@analytics_router.get(
+    "/leaderboards/repeated-titles",
     response_model=HorrorfestAnalyticsTitleMatrixRead,
 )
 def get_horrorfest_analytics_repeated_titles_leaderboard(
@@ -152,8 +159,8 @@ def get_horrorfest_analytics_repeated_titles_leaderboard(
     )
 
 
-@router.get(
-    "/analytics/leaderboards/highest-rated",
+@analytics_router.get(
+    "/leaderboards/highest-rated",
     response_model=HorrorfestAnalyticsHighestRatedLeaderboardRead,
 )
 def get_horrorfest_analytics_highest_rated_leaderboard(
@@ -172,8 +179,8 @@ def get_horrorfest_analytics_highest_rated_leaderboard(
     )
 
 
-@router.get(
-    "/analytics/leaderboards/rewatches",
+@analytics_router.get(
+    "/leaderboards/rewatches",
     response_model=HorrorfestAnalyticsRewatchLeaderboardRead,
 )
 def get_horrorfest_analytics_rewatch_leaderboard(
@@ -190,8 +197,8 @@ def get_horrorfest_analytics_rewatch_leaderboard(
     )
 
 
-@router.get(
-    "/analytics/curation/staples",
+@analytics_router.get(
+    "/curation/staples",
     response_model=HorrorfestAnalyticsCurationReportRead,
 )
 def get_horrorfest_analytics_curation_staples(
@@ -207,8 +214,8 @@ def get_horrorfest_analytics_curation_staples(
     )
 
 
-@router.get(
-    "/analytics/curation/streaks",
+@analytics_router.get(
+    "/curation/streaks",
     response_model=HorrorfestAnalyticsCurationReportRead,
 )
 def get_horrorfest_analytics_curation_streaks(
@@ -224,8 +231,8 @@ def get_horrorfest_analytics_curation_streaks(
     )
 
 
-@router.get(
-    "/analytics/curation/gaps",
+@analytics_router.get(
+    "/curation/gaps",
     response_model=HorrorfestAnalyticsCurationReportRead,
 )
 def get_horrorfest_analytics_curation_gaps(
@@ -241,8 +248,8 @@ def get_horrorfest_analytics_curation_gaps(
     )
 
 
-@router.get(
-    "/analytics/curation/dormant",
+@analytics_router.get(
+    "/curation/dormant",
     response_model=HorrorfestAnalyticsCurationReportRead,
 )
 def get_horrorfest_analytics_curation_dormant(
@@ -261,8 +268,8 @@ def get_horrorfest_analytics_curation_dormant(
     )
 
 
-@router.get(
-    "/analytics/decades/{decade_start}/entries",
+@analytics_router.get(
+    "/decades/{decade_start}/entries",
     response_model=list[HorrorfestEntryRead],
 )
 def list_horrorfest_analytics_decade_entries(
@@ -286,8 +293,8 @@ def list_horrorfest_analytics_decade_entries(
     return [HorrorfestEntryRead.model_validate(item) for item in rows]
 
 
-@router.get(
-    "/analytics/years/{horrorfest_year}",
+@analytics_router.get(
+    "/years/{horrorfest_year}",
     response_model=HorrorfestAnalyticsYearDetailRead,
 )
 def get_horrorfest_analytics_year_detail(
@@ -308,8 +315,8 @@ def get_horrorfest_analytics_year_detail(
     return HorrorfestAnalyticsYearDetailRead.model_validate(detail)
 
 
-@router.get(
-    "/analytics/years/{horrorfest_year}/entries",
+@analytics_router.get(
+    "/years/{horrorfest_year}/entries",
     response_model=list[HorrorfestEntryRead],
 )
 def list_horrorfest_analytics_year_entries(
@@ -339,7 +346,7 @@ def list_horrorfest_analytics_year_entries(
     return [HorrorfestEntryRead.model_validate(item) for item in rows]
 
 
-@router.get("/analytics/export/years")
+@analytics_router.get("/export/years")
 def export_horrorfest_analytics_years(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -384,7 +391,7 @@ def export_horrorfest_analytics_years(
     )
 
 
-@router.get("/analytics/export/years/{horrorfest_year}/daily")
+@analytics_router.get("/export/years/{horrorfest_year}/daily")
 def export_horrorfest_analytics_year_daily(
     horrorfest_year: int,
     user_id: UUID | None = Query(default=None),
@@ -413,7 +420,7 @@ def export_horrorfest_analytics_year_daily(
     )
 
 
-@router.get("/analytics/export/years/{horrorfest_year}/sources")
+@analytics_router.get("/export/years/{horrorfest_year}/sources")
 def export_horrorfest_analytics_year_sources(
     horrorfest_year: int,
     user_id: UUID | None = Query(default=None),
@@ -442,7 +449,7 @@ def export_horrorfest_analytics_year_sources(
     )
 
 
-@router.get("/analytics/export/years/{horrorfest_year}/ratings")
+@analytics_router.get("/export/years/{horrorfest_year}/ratings")
 def export_horrorfest_analytics_year_ratings(
     horrorfest_year: int,
     user_id: UUID | None = Query(default=None),
@@ -465,7 +472,7 @@ def export_horrorfest_analytics_year_ratings(
     )
 
 
-@router.get("/analytics/export/titles")
+@analytics_router.get("/export/titles")
 def export_horrorfest_title_matrix(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -486,7 +493,7 @@ def export_horrorfest_title_matrix(
     )
 
 
-@router.get("/analytics/export/decades")
+@analytics_router.get("/export/decades")
 def export_horrorfest_decade_matrix(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -507,7 +514,7 @@ def export_horrorfest_decade_matrix(
     )
 
 
-@router.get("/analytics/export/compare")
+@analytics_router.get("/export/compare")
 def export_horrorfest_comparison(
     left_year: int = Query(),
     right_year: int = Query(),
@@ -610,7 +617,7 @@ def export_horrorfest_comparison(
     )
 
 
-@router.get("/analytics/export/drilldown")
+@analytics_router.get("/export/drilldown")
 def export_horrorfest_drilldown(
     kind: str = Query(),
     media_item_id: UUID | None = Query(default=None),
@@ -689,7 +696,7 @@ def export_horrorfest_drilldown(
     )
 
 
-@router.get("/analytics/export/leaderboards/repeated-titles")
+@analytics_router.get("/export/leaderboards/repeated-titles")
 def export_horrorfest_repeated_titles_leaderboard(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -711,7 +718,7 @@ def export_horrorfest_repeated_titles_leaderboard(
     )
 
 
-@router.get("/analytics/export/leaderboards/highest-rated")
+@analytics_router.get("/export/leaderboards/highest-rated")
 def export_horrorfest_highest_rated_leaderboard(
     user_id: UUID | None = Query(default=None),
     minimum_repeat_count: int = Query(default=2, ge=2),
@@ -734,7 +741,7 @@ def export_horrorfest_highest_rated_leaderboard(
     )
 
 
-@router.get("/analytics/export/leaderboards/rewatches")
+@analytics_router.get("/export/leaderboards/rewatches")
 def export_horrorfest_rewatch_leaderboard(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -750,7 +757,7 @@ def export_horrorfest_rewatch_leaderboard(
     )
 
 
-@router.get("/analytics/export/curation/staples")
+@analytics_router.get("/export/curation/staples")
 def export_horrorfest_curation_staples(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -771,7 +778,7 @@ def export_horrorfest_curation_staples(
     )
 
 
-@router.get("/analytics/export/curation/streaks")
+@analytics_router.get("/export/curation/streaks")
 def export_horrorfest_curation_streaks(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -792,7 +799,7 @@ def export_horrorfest_curation_streaks(
     )
 
 
-@router.get("/analytics/export/curation/gaps")
+@analytics_router.get("/export/curation/gaps")
 def export_horrorfest_curation_gaps(
     user_id: UUID | None = Query(default=None),
     session: Session = Depends(get_db_session),
@@ -813,7 +820,7 @@ def export_horrorfest_curation_gaps(
     )
 
 
-@router.get("/analytics/export/curation/dormant")
+@analytics_router.get("/export/curation/dormant")
 def export_horrorfest_curation_dormant(
     user_id: UUID | None = Query(default=None),
     dormant_year_window: int = Query(default=3, ge=1),
@@ -1045,3 +1052,6 @@ def move_horrorfest_entry(
         if item["horrorfest_entry_id"] == entry.horrorfest_entry_id
     )
     return HorrorfestEntryRead.model_validate(selected)
+
+
+router.include_router(analytics_router)
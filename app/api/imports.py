@@ -1,15 +1,17 @@
-import csv
-import io
-import json
-from typing import Literal
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from itertools import batched
+from typing import BinaryIO, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.auth import require_request_auth
 from app.core.config import Settings, get_settings
+from app.db.models.entities import ImportBatch
 from app.db.session import get_db_session
 from app.scripts import import_watch_events as import_watch_events_script
 from app.schemas.collection import (
@@ -17,7 +19,9 @@ from app.schemas.collection import (
     JellyfinCollectionImportResponse,
 )
 from app.schemas.imports import (
+    ImportJobRead,
     ImportMode,
+    LegacySourceWatchEventImportOptions,
     LegacySourceWatchEventImportRequest,
     WatchEventImportRequest,
     WatchEventImportResponse,
@@ -30,9 +34,17 @@ from app.services.collection_imports import (
     JellyfinCollectionImportResult,
     JellyfinCollectionImportService,
 )
+from app.services.import_batches import ImportBatchNotFoundError
+from app.services.import_jobs import ImportJobService
 from app.services.jellyfin import JellyfinClientError, JellyfinConfigurationError
 from app.services.jellyfin_reconciliation import JellyfinReconciliationService
-from app.services.imports import WatchEventImportResult, WatchEventImportService
+from app.services.import_streams import iter_rows
+from app.services.imports import (
+    LegacySourceImportChunk,
+    WatchEventImportFailedError,
+    WatchEventImportResult,
+    WatchEventImportService,
+)
 from app.services.users import UserService
 
 router = APIRouter(
@@ -42,6 +54,17 @@ router = APIRouter(
 )
 
 
+def _import_error(exc: ValueError) -> HTTPException:
+    detail: str | dict[str, str] = str(exc)
+    if isinstance(exc, WatchEventImportFailedError):
+        # Rows before the failure are committed, so the caller needs the batch
+        # to inspect its errors or resume it.
+        detail = {"message": str(exc), "import_batch_id": str(exc.import_batch_id)}
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=detail
+    )
+
+
 def _to_import_response(result: WatchEventImportResult) -> WatchEventImportResponse:
     return WatchEventImportResponse(
         import_batch_id=result.import_batch_id,
@@ -79,6 +102,27 @@ def _to_collection_import_response(
     )
 
 
+def _to_import_job_response(batch: ImportBatch) -> ImportJobRead:
+    parameters = batch.parameters or {}
+    progress = parameters.get("progress") or {}
+    return ImportJobRead(
+        job_id=batch.import_batch_id,
+        status=batch.status,
+        source=batch.source,
+        source_detail=batch.source_detail,
+        started_at=batch.started_at,
+        finished_at=batch.finished_at,
+        processed_count=progress.get("processed_count", 0),
+        total_count=progress.get("total_count"),
+        inserted_count=batch.watch_events_inserted,
+        skipped_count=progress.get("skipped_count", 0),
+        error_count=batch.errors_count,
+        eta_seconds=progress.get("eta_seconds"),
+        progress_updated_at=progress.get("updated_at"),
+        error=parameters.get("job_error"),
+    )
+
+
 def _detect_upload_format(filename: str | None, explicit_format: str) -> str:
     if explicit_format in {"json", "csv"}:
         return explicit_format
@@ -95,42 +139,82 @@ def _detect_upload_format(filename: str | None, explicit_format: str) -> str:
     )
 
 
-def _load_json_rows_from_text(file_text: str) -> list[dict]:
-    parsed = json.loads(file_text)
-
-    if isinstance(parsed, list):
-        return parsed
-
-    if isinstance(parsed, dict):
-        for key in ("rows", "watched", "history"):
-            value = parsed.get(key)
-            if isinstance(value, list):
-                return value
-
-    raise ValueError(
-        "JSON input must be a list of row objects, or object containing one of: rows/watched/history"
-    )
-
-
-def _load_csv_rows_from_text(file_text: str) -> list[dict]:
-    reader = csv.DictReader(io.StringIO(file_text))
-    rows: list[dict] = []
-    for row in reader:
-        cleaned = {
-            (key.lstrip("\ufeff") if isinstance(key, str) else key): value
-            for key, value in row.items()
-            if key is not None
-        }
-        rows.append(cleaned)
-    return rows
-
+def _measure_upload(stream: BinaryIO) -> int:
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _rewind(stream: BinaryIO) -> BinaryIO:
+    stream.seek(0)
+    return stream
+
+
+def _prepare_upload(
+    session: Session,
+    settings: Settings,
+    *,
+    input_file: UploadFile,
+    input_schema: str,
+    file_format: str,
+    user_id: UUID | None,
+) -> tuple[str, str]:
+    """Validate an upload and return its format and naive-datetime timezone."""
+    upload_size = _measure_upload(input_file.file)
+    if upload_size == 0:
+        raise ValueError("Uploaded file is empty")
+    max_upload_bytes = max(1, settings.klug_import_upload_max_mb) * 1024 * 1024
+    if upload_size > max_upload_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=(
+                f"Uploaded file exceeds max size of "
+                f"{settings.klug_import_upload_max_mb} MB"
+            ),
+        )
 
-def _load_uploaded_rows(file_text: str, file_format: str) -> list[dict]:
-    if file_format == "json":
-        return _load_json_rows_from_text(file_text)
-    if file_format == "csv":
-        return _load_csv_rows_from_text(file_text)
-    raise ValueError(f"Unsupported format: {file_format}")
+    detected_format = _detect_upload_format(input_file.filename, file_format)
+    user_timezone = "UTC"
+    if input_schema == "legacy_backup":
+        if user_id is None:
+            raise ValueError("user_id is required for input_schema=legacy_backup")
+        user = UserService.get_user_by_id(session, user_id)
+        user_timezone = user.timezone if user is not None else "UTC"
+    return detected_format, user_timezone if detected_format == "csv" else "UTC"
+
+
+def _iter_upload_chunks(
+    stream: BinaryIO,
+    *,
+    file_format: str,
+    input_schema: str,
+    user_id: UUID | None,
+    dry_run: bool,
+    naive_datetime_timezone: str,
+    chunk_rows: int,
+) -> Iterator[LegacySourceImportChunk]:
+    dry_run_plan = import_watch_events_script.LegacyBackupDryRunPlan()
+    row_index_offset = 0
+    for raw_rows in batched(iter_rows(stream, file_format), max(1, chunk_rows)):
+        if input_schema != "legacy_backup":
+            yield LegacySourceImportChunk(rows=raw_rows)
+            continue
+        preprocess = import_watch_events_script._build_mapped_rows_from_legacy_backup(
+            list(raw_rows),
+            user_id=user_id,
+            dry_run=dry_run,
+            naive_datetime_timezone=naive_datetime_timezone,
+            row_index_offset=row_index_offset,
+            dry_run_plan=dry_run_plan,
+        )
+        row_index_offset += len(raw_rows)
+        yield LegacySourceImportChunk(
+            rows=preprocess.mapped_rows,
+            rejected_before_import=len(preprocess.rejected_rows),
+            media_items_created=preprocess.media_items_created,
+            shows_created=preprocess.shows_created,
+        )
 
 
 @router.post("/watch-events", response_model=WatchEventImportResponse)
@@ -141,10 +225,7 @@ def import_watch_events(
     try:
         result = WatchEventImportService.run_import(session, payload=payload)
     except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail=str(exc),
-        ) from exc
+        raise _import_error(exc) from exc
 
     return _to_import_response(result)
 
@@ -207,14 +288,20 @@ def import_legacy_source_watch_events(
     payload: LegacySourceWatchEventImportRequest,
     session: Session = Depends(get_db_session),
 ) -> WatchEventImportResponse:
-    result = WatchEventImportService.run_legacy_source_import(session, payload=payload)
+    try:
+        result = WatchEventImportService.run_legacy_source_import(
+            session, payload=payload
+        )
+    except ValueError as exc:
+        raise _import_error(exc) from exc
+
     return _to_import_response(result)
 
 
 @router.post(
     "/watch-events/legacy-source/upload", response_model=WatchEventImportResponse
 )
-async def import_legacy_source_watch_events_upload(
+def import_legacy_source_watch_events_upload(
     input_file: UploadFile = File(...),
     input_schema: Literal["mapped_rows", "legacy_backup"] = Form(
         default="legacy_backup"
@@ -224,81 +311,164 @@ async def import_legacy_source_watch_events_upload(
     mode: ImportMode = Form(default=ImportMode.bootstrap),
     dry_run: bool = Form(default=False),
     resume_from_latest: bool = Form(default=False),
+    bulk: bool = Form(default=False),
+    aggregate_skips: bool = Form(default=False),
+    commit_every: int | None = Form(default=None, ge=1),
+    resume_import_batch_id: UUID | None = Form(default=None),
     source_detail: str | None = Form(default=None),
     notes: str | None = Form(default=None),
     session: Session = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
 ) -> WatchEventImportResponse:
-    rejected_rows: list[dict] = []
-    media_items_created = 0
-    shows_created = 0
     try:
-        raw_bytes = await input_file.read()
-        if not raw_bytes:
-            raise ValueError("Uploaded file is empty")
-        max_upload_bytes = max(1, settings.klug_import_upload_max_mb) * 1024 * 1024
-        if len(raw_bytes) > max_upload_bytes:
-            raise HTTPException(
-                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                detail=(
-                    f"Uploaded file exceeds max size of "
-                    f"{settings.klug_import_upload_max_mb} MB"
-                ),
-            )
+        detected_format, naive_datetime_timezone = _prepare_upload(
+            session,
+            settings,
+            input_file=input_file,
+            input_schema=input_schema,
+            file_format=file_format,
+            user_id=user_id,
+        )
+        options = LegacySourceWatchEventImportOptions(
+            mode=mode,
+            dry_run=dry_run,
+            resume_from_latest=resume_from_latest,
+            source_detail=source_detail,
+            notes=notes,
+            bulk=bulk,
+            aggregate_skips=aggregate_skips,
+            commit_every=commit_every,
+            resume_import_batch_id=resume_import_batch_id,
+        )
+        result = WatchEventImportService.run_legacy_source_import_stream(
+            session,
+            options=options,
+            chunks=_iter_upload_chunks(
+                input_file.file,
+                file_format=detected_format,
+                input_schema=input_schema,
+                user_id=user_id,
+                dry_run=dry_run,
+                naive_datetime_timezone=naive_datetime_timezone,
+                chunk_rows=settings.klug_import_stream_chunk_rows,
+            ),
+        )
+    except HTTPException:
+        raise
+    except ValueError as exc:
+        raise _import_error(exc) from exc
 
-        file_text = raw_bytes.decode("utf-8-sig")
-        detected_format = _detect_upload_format(input_file.filename, file_format)
-        raw_rows = _load_uploaded_rows(file_text, detected_format)
-        rows_for_validation = raw_rows
+    return _to_import_response(result)
 
-        if input_schema == "legacy_backup":
-            if user_id is None:
-                raise ValueError("user_id is required for input_schema=legacy_backup")
-            user = UserService.get_user_by_id(session, user_id)
-            user_timezone = user.timezone if user is not None else "UTC"
 
-            preprocess = (
-                import_watch_events_script._build_mapped_rows_from_legacy_backup(
-                    raw_rows,
-                    user_id=user_id,
-                    dry_run=dry_run,
-                    naive_datetime_timezone=(
-                        user_timezone if detected_format == "csv" else "UTC"
-                    ),
-                )
-            )
-            rows_for_validation = preprocess.mapped_rows
-            rejected_rows = preprocess.rejected_rows
-            media_items_created = preprocess.media_items_created
-            shows_created = preprocess.shows_created
+@router.post(
+    "/jobs/watch-events",
+    response_model=ImportJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def enqueue_watch_event_import(
+    payload: WatchEventImportRequest,
+    session: Session = Depends(get_db_session),
+) -> ImportJobRead:
+    try:
+        batch = ImportJobService.enqueue_import(session, payload=payload)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        ) from exc
 
-        if not rows_for_validation:
-            raise ValueError("No valid rows available for import")
+    return _to_import_job_response(batch)
 
-        payload = LegacySourceWatchEventImportRequest(
+
+@router.post(
+    "/jobs/watch-events/legacy-source/upload",
+    response_model=ImportJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def enqueue_legacy_source_watch_events_upload(
+    input_file: UploadFile = File(...),
+    input_schema: Literal["mapped_rows", "legacy_backup"] = Form(
+        default="legacy_backup"
+    ),
+    file_format: Literal["auto", "json", "csv"] = Form(default="auto"),
+    user_id: UUID | None = Form(default=None),
+    mode: ImportMode = Form(default=ImportMode.bootstrap),
+    resume_from_latest: bool = Form(default=False),
+    bulk: bool = Form(default=False),
+    aggregate_skips: bool = Form(default=False),
+    commit_every: int | None = Form(default=None, ge=1),
+    resume_import_batch_id: UUID | None = Form(default=None),
+    source_detail: str | None = Form(default=None),
+    notes: str | None = Form(default=None),
+    session: Session = Depends(get_db_session),
+    settings: Settings = Depends(get_settings),
+) -> ImportJobRead:
+    try:
+        detected_format, naive_datetime_timezone = _prepare_upload(
+            session,
+            settings,
+            input_file=input_file,
+            input_schema=input_schema,
+            file_format=file_format,
+            user_id=user_id,
+        )
+        options = LegacySourceWatchEventImportOptions(
             mode=mode,
-            dry_run=dry_run,
             resume_from_latest=resume_from_latest,
             source_detail=source_detail,
             notes=notes,
-            rejected_before_import=len(rejected_rows),
-            media_items_created=media_items_created,
-            shows_created=shows_created,
-            rows=rows_for_validation,
+            bulk=bulk,
+            aggregate_skips=aggregate_skips,
+            commit_every=commit_every,
+            resume_import_batch_id=resume_import_batch_id,
         )
+        # The request's spooled upload is closed once the response is sent, so
+        # the job reads from its own copy and closes it when it finishes.
+        job_file = tempfile.TemporaryFile()
+        try:
+            shutil.copyfileobj(input_file.file, job_file)
+            batch = ImportJobService.enqueue_legacy_source_import_stream(
+                session,
+                options=options,
+                open_chunks=lambda: _iter_upload_chunks(
+                    _rewind(job_file),
+                    file_format=detected_format,
+                    input_schema=input_schema,
+                    user_id=user_id,
+                    dry_run=False,
+                    naive_datetime_timezone=naive_datetime_timezone,
+                    chunk_rows=settings.klug_import_stream_chunk_rows,
+                ),
+                count_rows=lambda: sum(
+                    1 for _row in iter_rows(_rewind(job_file), detected_format)
+                ),
+                cleanup=job_file.close,
+            )
+        except Exception:
+            job_file.close()
+            raise
     except HTTPException:
         raise
-    except (
-        ValueError,
-        UnicodeDecodeError,
-        ValidationError,
-        json.JSONDecodeError,
-        csv.Error,
-    ) as exc:
+    except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=str(exc),
         ) from exc
 
-    result = WatchEventImportService.run_legacy_source_import(session, payload=payload)
-    return _to_import_response(result)
+    return _to_import_job_response(batch)
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobRead)
+def get_import_job(
+    job_id: UUID,
+    session: Session = Depends(get_db_session),
+) -> ImportJobRead:
+    try:
+        batch = ImportJobService.get_import_job(session, job_id=job_id)
+    except ImportBatchNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+    return _to_import_job_response(batch)
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.auth import require_request_auth
 from app.db.session import get_db_session
+from app.schemas.fieldsets import encode_fieldset_list, parse_fieldset
 from app.schemas.library import LibraryEpisodeRead, LibraryMovieRead, LibraryShowRead
 from app.services.library import LibraryService
 
@@ -21,8 +23,10 @@ def list_library_movies(
     year: int | None = Query(default=None, ge=1800, le=9999),
     limit: int = Query(default=25, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None, max_length=1000),
     session: Session = Depends(get_db_session),
-) -> list[LibraryMovieRead]:
+) -> list[LibraryMovieRead] | Response:
+    fieldset = _parse_fieldset(fields, LibraryMovieRead)
     rows = LibraryService.list_movies(
         session,
         query=query,
@@ -31,7 +35,10 @@ def list_library_movies(
         year=year,
         limit=limit,
         offset=offset,
+        fields=fieldset,
     )
+    if fieldset is not None:
+        return _fieldset_response(LibraryMovieRead, rows, fieldset)
     return [LibraryMovieRead.model_validate(row) for row in rows]
 
 
@@ -43,8 +50,10 @@ def list_library_episodes(
     enrichment_status: str | None = Query(default=None, max_length=40),
     limit: int = Query(default=25, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None, max_length=1000),
     session: Session = Depends(get_db_session),
-) -> list[LibraryEpisodeRead]:
+) -> list[LibraryEpisodeRead] | Response:
+    fieldset = _parse_fieldset(fields, LibraryEpisodeRead)
     rows = LibraryService.list_episodes(
         session,
         query=query,
@@ -53,7 +62,10 @@ def list_library_episodes(
         enrichment_status=enrichment_status,
         limit=limit,
         offset=offset,
+        fields=fieldset,
     )
+    if fieldset is not None:
+        return _fieldset_response(LibraryEpisodeRead, rows, fieldset)
     return [LibraryEpisodeRead.model_validate(row) for row in rows]
 
 
@@ -63,13 +75,40 @@ def list_library_shows(
     watched: bool | None = Query(default=None),
     limit: int = Query(default=25, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None, max_length=1000),
     session: Session = Depends(get_db_session),
-) -> list[LibraryShowRead]:
+) -> list[LibraryShowRead] | Response:
+    fieldset = _parse_fieldset(fields, LibraryShowRead)
     rows = LibraryService.list_shows(
         session,
         query=query,
         watched=watched,
         limit=limit,
         offset=offset,
+        fields=fieldset,
     )
+    if fieldset is not None:
+        return _fieldset_response(LibraryShowRead, rows, fieldset)
     return [LibraryShowRead.model_validate(row) for row in rows]
+
+
+def _parse_fieldset(
+    fields: str | None, model: type[BaseModel]
+) -> frozenset[str] | None:
+    try:
+        return parse_fieldset(fields, model)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
+
+def _fieldset_response(
+    model: type[BaseModel], rows: list[dict], fields: frozenset[str]
+) -> Response:
+    # response_model would demand every field, so sparse pages are encoded here.
+    return Response(
+        content=encode_fieldset_list(model, rows, fields),
+        media_type="application/json",
+    )
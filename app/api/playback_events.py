@@ -1,11 +1,12 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.auth import require_request_auth
 from app.db.session import get_db_session
+from app.schemas.fieldsets import encode_fieldset_list, parse_fieldset
 from app.schemas.playback_events import PlaybackEventRead
 from app.services.playback_events import (
     PlaybackEventNotFoundError,
@@ -30,8 +31,17 @@ def list_playback_events(
     decision_status: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None, max_length=1000),
     session: Session = Depends(get_db_session),
-) -> list[PlaybackEventRead]:
+) -> list[PlaybackEventRead] | Response:
+    try:
+        fieldset = parse_fieldset(fields, PlaybackEventRead)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
     playback_events = PlaybackEventService.list_playback_events(
         session,
         user_id=user_id,
@@ -43,7 +53,13 @@ def list_playback_events(
         decision_status=decision_status,
         limit=limit,
         offset=offset,
+        fields=fieldset,
     )
+    if fieldset is not None:
+        return Response(
+            content=encode_fieldset_list(PlaybackEventRead, playback_events, fieldset),
+            media_type="application/json",
+        )
     return [
         PlaybackEventRead.model_validate(playback_event)
         for playback_event in playback_events
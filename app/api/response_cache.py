@@ -0,0 +1,106 @@
+from collections.abc import Callable, Coroutine
+from typing import Any
+from uuid import UUID
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+
+from app.core.response_cache import (
+    CachedResponse,
+    etag_matches,
+    get_response_cache,
+    strong_etag,
+)
+from app.db.session import get_db_session
+from app.services.data_generations import DataGenerationService
+
+# Clients must revalidate every time; a matching If-None-Match is answered
+# with 304 and no body, so an unchanged dashboard costs one generation lookup.
+CACHE_CONTROL = "private, no-cache"
+_UNCACHED_HEADERS = {"content-length", "etag", "cache-control"}
+
+
+class _CachedResponseHit(Exception):
+    def __init__(self, response: Response) -> None:
+        super().__init__()
+        self.response = response
+
+
+def _render(entry: CachedResponse, request: Request) -> Response:
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": entry.etag, "Cache-Control": CACHE_CONTROL},
+        )
+    return Response(
+        content=entry.body,
+        headers={
+            **dict(entry.headers),
+            "ETag": entry.etag,
+            "Cache-Control": CACHE_CONTROL,
+        },
+    )
+
+
+def _query_user_id(request: Request) -> UUID | None:
+    raw_user_id = request.query_params.get("user_id")
+    return UUID(raw_user_id) if raw_user_id else None
+
+
+def resolve_cached_response(
+    request: Request,
+    session: Session = Depends(get_db_session),
+) -> None:
+    """Serve a cached response for this path, query and data generation.
+
+    Runs after the router's auth dependency. A hit is raised to
+    ``CachedResponseRoute``, which returns it without calling the endpoint;
+    a miss leaves the cache key on ``request.state`` for the route to fill.
+    """
+    cache = get_response_cache()
+    if not cache.enabled:
+        return
+    try:
+        user_id = _query_user_id(request)
+    except ValueError:
+        # Leave the malformed user_id to the endpoint's own validation.
+        return
+    key = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        DataGenerationService.get_generations(session, user_id=user_id),
+    )
+    request.state.response_cache_key = key
+    entry = cache.get(key)
+    if entry is not None:
+        raise _CachedResponseHit(_render(entry, request))
+
+
+class CachedResponseRoute(APIRoute):
+    """Route class for GET endpoints that depend on ``resolve_cached_response``."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except _CachedResponseHit as hit:
+                return hit.response
+            key = getattr(request.state, "response_cache_key", None)
+            if key is None or response.status_code != 200:
+                return response
+            entry = CachedResponse(
+                body=bytes(response.body),
+                headers=tuple(
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name not in _UNCACHED_HEADERS
+                ),
+                etag=strong_etag(bytes(response.body)),
+            )
+            get_response_cache().put(key, entry)
+            return _render(entry, request)
+
+        return cached_handler
@@ -1,17 +1,26 @@
+from datetime import date
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.api.response_cache import CachedResponseRoute, resolve_cached_response
 from app.core.auth import require_request_auth
 from app.db.session import get_db_session
-from app.schemas.stats import StatsHorrorfestRead, StatsMonthlyRead, StatsSummaryRead
+from app.schemas.stats import (
+    StatsHorrorfestRead,
+    StatsMonthlyRead,
+    StatsSummaryRead,
+    StatsTimeSeriesRead,
+)
 from app.services.stats import StatsService
 
 router = APIRouter(
     prefix="/stats",
     tags=["stats"],
-    dependencies=[Depends(require_request_auth)],
+    route_class=CachedResponseRoute,
+    dependencies=[Depends(require_request_auth), Depends(resolve_cached_response)],
 )
 
 
@@ -36,6 +45,32 @@ def list_monthly_stats(
     ]
 
 
+@router.get("/timeseries", response_model=StatsTimeSeriesRead)
+def get_stats_time_series(
+    granularity: Literal["day", "week", "month", "year"] = Query(default="month"),
+    local_date_from: date | None = Query(default=None),
+    local_date_to: date | None = Query(default=None),
+    media_type: Literal["movie", "show", "episode"] | None = Query(default=None),
+    user_id: UUID | None = Query(default=None),
+    session: Session = Depends(get_db_session),
+) -> StatsTimeSeriesRead:
+    try:
+        payload = StatsService.get_time_series(
+            session,
+            user_id=user_id,
+            granularity=granularity,
+            local_date_from=local_date_from,
+            local_date_to=local_date_to,
+            media_type=media_type,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    return StatsTimeSeriesRead.model_validate(payload)
+
+
 @router.get("/horrorfest", response_model=list[StatsHorrorfestRead])
 def list_horrorfest_stats(
     user_id: UUID | None = Query(default=None),
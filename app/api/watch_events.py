@@ -1,25 +1,36 @@
-from datetime import date
+from datetime import UTC, date, datetime
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import AwareDatetime
 from sqlalchemy.orm import Session
 
 from app.core.auth import require_request_auth
 from app.db.session import get_db_session
+from app.schemas.fieldsets import fieldset_list_adapter, parse_fieldset
 from app.schemas.watch_events import (
     ManualWatchEventCreate,
+    WatchEventBatchRead,
+    WatchEventBatchRequest,
     WatchEventCorrect,
     WatchEventCreate,
     WatchEventDelete,
+    WatchEventListAdapter,
     WatchEventListRead,
+    WatchEventOperationResultRead,
     WatchEventRate,
     WatchEventRead,
     WatchEventRestore,
     WatchEventVersionOverride,
 )
-from app.services.watch_events import WatchEventConstraintError, WatchEventService
+from app.services.watch_event_exports import ExportFormat, WatchEventExportService
+from app.services.watch_events import (
+    WatchEventConstraintError,
+    WatchEventOperation,
+    WatchEventService,
+)
 
 router = APIRouter(
     prefix="/watch-events",
@@ -27,6 +38,8 @@ router = APIRouter(
     dependencies=[Depends(require_request_auth)],
 )
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("", response_model=list[WatchEventListRead])
 def list_watch_events(
@@ -42,24 +55,36 @@ def list_watch_events(
     deleted_only: bool = Query(default=False),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1, max_length=200),
+    fields: str | None = Query(default=None, max_length=1000),
     session: Session = Depends(get_db_session),
-) -> list[WatchEventListRead]:
-    watch_events = WatchEventService.list_watch_events(
-        session,
-        user_id=user_id,
-        media_item_id=media_item_id,
-        watched_after=watched_after,
-        watched_before=watched_before,
-        local_date_from=local_date_from,
-        local_date_to=local_date_to,
-        query=query,
-        media_type=media_type,
-        include_deleted=include_deleted,
-        deleted_only=deleted_only,
-        limit=limit,
-        offset=offset,
-    )
-    return [WatchEventListRead.model_validate(item) for item in watch_events]
+) -> Response:
+    try:
+        fieldset = parse_fieldset(fields, WatchEventListRead)
+        watch_events = WatchEventService.list_watch_events(
+            session,
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_after=watched_after,
+            watched_before=watched_before,
+            local_date_from=local_date_from,
+            local_date_to=local_date_to,
+            query=query,
+            media_type=media_type,
+            include_deleted=include_deleted,
+            deleted_only=deleted_only,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fieldset,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
+    return _watch_event_list_response(watch_events, limit=limit, fields=fieldset)
 
 
 @router.get("/unrated", response_model=list[WatchEventListRead])
@@ -67,15 +92,86 @@ def list_unrated_watch_events(
     user_id: UUID | None = Query(default=None),
     limit: int = Query(default=25, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1, max_length=200),
+    fields: str | None = Query(default=None, max_length=1000),
+    session: Session = Depends(get_db_session),
+) -> Response:
+    try:
+        fieldset = parse_fieldset(fields, WatchEventListRead)
+        watch_events = WatchEventService.list_unrated_watch_events(
+            session,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fieldset,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
+    return _watch_event_list_response(watch_events, limit=limit, fields=fieldset)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/gzip": {},
+            },
+            "description": "Active watch history, oldest first.",
+        }
+    },
+)
+def export_watch_events(
+    user_id: UUID | None = Query(default=None),
+    file_format: ExportFormat = Query(default="ndjson"),
+    gzip: bool = Query(default=False),
     session: Session = Depends(get_db_session),
-) -> list[WatchEventListRead]:
-    watch_events = WatchEventService.list_unrated_watch_events(
-        session,
-        user_id=user_id,
-        limit=limit,
-        offset=offset,
+) -> StreamingResponse:
+    filename = WatchEventExportService.filename(
+        file_format=file_format, compress=gzip, now=datetime.now(UTC)
     )
-    return [WatchEventListRead.model_validate(item) for item in watch_events]
+    return StreamingResponse(
+        WatchEventExportService.iter_export(
+            session, user_id=user_id, file_format=file_format, compress=gzip
+        ),
+        media_type=WatchEventExportService.media_type(
+            file_format=file_format, compress=gzip
+        ),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _watch_event_list_response(
+    watch_events: list[dict[str, object]],
+    *,
+    limit: int,
+    fields: frozenset[str] | None = None,
+) -> Response:
+    # Returning a Response skips FastAPI's second validation and jsonable_encoder
+    # pass; the adapter validates once and encodes straight to JSON bytes.
+    adapter = (
+        WatchEventListAdapter
+        if fields is None
+        else fieldset_list_adapter(WatchEventListRead, fields)
+    )
+    response = Response(
+        content=adapter.dump_json(
+            adapter.validate_python(watch_events, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
+    next_cursor = WatchEventService.next_page_cursor(watch_events, limit=limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 
 @router.post("", response_model=WatchEventRead, status_code=status.HTTP_201_CREATED)
@@ -151,6 +247,53 @@ def create_manual_watch_event(
     return WatchEventRead.model_validate(result.watch_event)
 
 
+@router.post("/batch", response_model=WatchEventBatchRead)
+def apply_watch_event_batch(
+    payload: WatchEventBatchRequest,
+    session: Session = Depends(get_db_session),
+) -> WatchEventBatchRead:
+    try:
+        results = WatchEventService.apply_watch_event_operations(
+            session,
+            operations=[
+                WatchEventOperation(**operation.model_dump())
+                for operation in payload.operations
+            ],
+            updated_by=payload.updated_by,
+            update_reason=payload.update_reason,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    except WatchEventConstraintError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+
+    items = [
+        WatchEventOperationResultRead(
+            action=result.action,
+            watch_id=result.watch_id,
+            status="rejected" if result.error is not None else "applied",
+            error=result.error,
+            watch_event=(
+                WatchEventRead.model_validate(result.watch_event)
+                if result.watch_event is not None
+                else None
+            ),
+        )
+        for result in results
+    ]
+    rejected_count = sum(1 for item in items if item.status == "rejected")
+    return WatchEventBatchRead(
+        applied_count=len(items) - rejected_count,
+        rejected_count=rejected_count,
+        results=items,
+    )
+
+
 @router.post("/{watch_id}/delete", response_model=WatchEventRead)
 def delete_watch_event(
     watch_id: UUID,
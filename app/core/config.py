@@ -19,12 +19,15 @@ class Settings(BaseSettings):
     klug_session_ttl_seconds: int = 60 * 60 * 24 * 30
     klug_session_cookie_secure: bool | None = None
     klug_import_upload_max_mb: int = 25
+    klug_import_stream_chunk_rows: int = 1000
+    klug_import_job_workers: int = 2
     klug_scrobble_min_progress_percent: Decimal = Decimal("90")
     klug_scrobble_min_completion_ratio: Decimal = Decimal("0.90")
     klug_watch_collision_window_seconds: int = 300
     klug_tmdb_api_key: str | None = None
     klug_metadata_enrichment_enabled: bool = True
     klug_metadata_cache_ttl_hours: int = 24 * 7
+    klug_response_cache_max_mb: int = 32
     klug_jellyfin_base_url: str | None = None
     klug_jellyfin_api_key: str | None = None
     klug_jellyfin_timeout_seconds: int = 15
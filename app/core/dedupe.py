@@ -0,0 +1,41 @@
+import hashlib
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from app.core.datetime_utils import ensure_timezone_aware
+
+DEDUPE_BUCKET = timedelta(minutes=1)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def watch_event_dedupe_hash(
+    *,
+    user_id: UUID,
+    media_item_id: UUID,
+    playback_source: str,
+    completed: bool,
+    watched_at: datetime,
+) -> str:
+    """Canonical watch identity, mirrored by ``app.watch_event_dedupe_hash()``.
+
+    Watches of one item by one user from one source with the same
+    ``completed`` flag in the same minute share a hash, so the unique
+    ``ux_watch_event_dedupe_hash`` index doubles as an exact duplicate probe
+    ahead of the collision-window range search.
+    """
+    watched_at = ensure_timezone_aware(watched_at, field_name="watched_at")
+    bucket = (watched_at - _EPOCH) // DEDUPE_BUCKET
+    payload = (
+        f"{user_id}|{media_item_id}|{playback_source}|{str(completed).lower()}|{bucket}"
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def dedupe_hash_enabled(collision_window_seconds: int) -> bool:
+    """Whether the hash probe can stand in for the collision-window search.
+
+    Two watches in one minute bucket can be up to a minute apart, so with a
+    narrower window the probe would merge watches the search keeps apart.
+    Rows are then stored without a hash and only the range search applies.
+    """
+    return timedelta(seconds=collision_window_seconds) >= DEDUPE_BUCKET
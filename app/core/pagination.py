@@ -0,0 +1,34 @@
+import base64
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from app.core.datetime_utils import ensure_timezone_aware
+
+
+@dataclass(frozen=True)
+class WatchEventCursor:
+    """Keyset position in watch history ordered by (watched_at, watch_id) desc."""
+
+    watched_at: datetime
+    watch_id: UUID
+
+    def encode(self) -> str:
+        watched_at = ensure_timezone_aware(self.watched_at, field_name="watched_at")
+        raw = f"{watched_at.astimezone(UTC).isoformat()}|{self.watch_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "WatchEventCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            watched_at_text, watch_id_text = raw.split("|")
+            cursor = cls(
+                watched_at=datetime.fromisoformat(watched_at_text),
+                watch_id=UUID(watch_id_text),
+            )
+            ensure_timezone_aware(cursor.watched_at, field_name="watched_at")
+        except ValueError as exc:
+            raise ValueError("cursor is invalid") from exc
+        return cursor
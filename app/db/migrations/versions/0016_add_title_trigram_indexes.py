@@ -0,0 +1,36 @@
+"""Add pg_trgm GIN indexes for media item and show title search."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0016_add_title_trigram_indexes"
+down_revision = "0015_add_jellyfin_user_mapping"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+    op.create_index(
+        "ix_media_item_title_trgm",
+        "media_item",
+        ["title"],
+        schema="app",
+        postgresql_using="gin",
+        postgresql_ops={"title": "public.gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_shows_title_trgm",
+        "shows",
+        ["title"],
+        schema="app",
+        postgresql_using="gin",
+        postgresql_ops={"title": "public.gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shows_title_trgm", table_name="shows", schema="app")
+    op.drop_index("ix_media_item_title_trgm", table_name="media_item", schema="app")
@@ -0,0 +1,136 @@
+"""Persist user-local watch date, year, and month on watch_event."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0017_add_watch_event_local_dates"
+down_revision = "0016_add_title_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "watch_event",
+        sa.Column("watched_local_date", sa.Date(), nullable=True),
+        schema=APP_SCHEMA,
+    )
+    op.add_column(
+        "watch_event",
+        sa.Column("watched_local_year", sa.SmallInteger(), nullable=True),
+        schema=APP_SCHEMA,
+    )
+    op.add_column(
+        "watch_event",
+        sa.Column("watched_local_month", sa.SmallInteger(), nullable=True),
+        schema=APP_SCHEMA,
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION app.set_watch_event_local_dates() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+          v_local timestamp;
+        BEGIN
+          SELECT timezone(u.timezone, NEW.watched_at)
+            INTO v_local
+            FROM app.users AS u
+           WHERE u.user_id = NEW.user_id;
+
+          NEW.watched_local_date := v_local::date;
+          NEW.watched_local_year := extract(year FROM v_local)::smallint;
+          NEW.watched_local_month := extract(month FROM v_local)::smallint;
+
+          RETURN NEW;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_watch_event_set_local_dates
+        BEFORE INSERT OR UPDATE OF watched_at, user_id ON app.watch_event
+        FOR EACH ROW EXECUTE FUNCTION app.set_watch_event_local_dates();
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION app.refresh_watch_event_local_dates() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          UPDATE app.watch_event AS w
+             SET watched_local_date = timezone(NEW.timezone, w.watched_at)::date,
+                 watched_local_year =
+                   extract(year FROM timezone(NEW.timezone, w.watched_at))::smallint,
+                 watched_local_month =
+                   extract(month FROM timezone(NEW.timezone, w.watched_at))::smallint
+           WHERE w.user_id = NEW.user_id;
+
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_users_refresh_watch_event_local_dates
+        AFTER UPDATE OF timezone ON app.users
+        FOR EACH ROW
+        WHEN (OLD.timezone IS DISTINCT FROM NEW.timezone)
+        EXECUTE FUNCTION app.refresh_watch_event_local_dates();
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE app.watch_event AS w
+           SET watched_local_date = timezone(u.timezone, w.watched_at)::date,
+               watched_local_year =
+                 extract(year FROM timezone(u.timezone, w.watched_at))::smallint,
+               watched_local_month =
+                 extract(month FROM timezone(u.timezone, w.watched_at))::smallint
+          FROM app.users AS u
+         WHERE u.user_id = w.user_id;
+        """
+    )
+
+    op.create_index(
+        "ix_watch_event_user_local_date",
+        "watch_event",
+        ["user_id", "watched_local_date"],
+        schema=APP_SCHEMA,
+    )
+    op.create_index(
+        "ix_watch_event_user_local_month",
+        "watch_event",
+        ["user_id", "watched_local_year", "watched_local_month"],
+        schema=APP_SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_watch_event_user_local_month", table_name="watch_event", schema=APP_SCHEMA
+    )
+    op.drop_index(
+        "ix_watch_event_user_local_date", table_name="watch_event", schema=APP_SCHEMA
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_users_refresh_watch_event_local_dates ON app.users"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_watch_event_set_local_dates ON app.watch_event"
+    )
+    op.execute("DROP FUNCTION IF EXISTS app.refresh_watch_event_local_dates()")
+    op.execute("DROP FUNCTION IF EXISTS app.set_watch_event_local_dates()")
+    op.drop_column("watch_event", "watched_local_month", schema=APP_SCHEMA)
+    op.drop_column("watch_event", "watched_local_year", schema=APP_SCHEMA)
+    op.drop_column("watch_event", "watched_local_date", schema=APP_SCHEMA)
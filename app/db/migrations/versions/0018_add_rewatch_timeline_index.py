@@ -0,0 +1,26 @@
+"""Add a (user, media item, watched_at) index for rewatch maintenance."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0018_add_rewatch_timeline_index"
+down_revision = "0017_add_watch_event_local_dates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_watch_event_user_media_time",
+        "watch_event",
+        ["user_id", "media_item_id", "watched_at"],
+        schema="app",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_watch_event_user_media_time", table_name="watch_event", schema="app"
+    )
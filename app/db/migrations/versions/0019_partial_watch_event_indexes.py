@@ -0,0 +1,56 @@
+"""Replace watch_event timeline and is_deleted indexes with a partial index."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0019_partial_watch_event_indexes"
+down_revision = "0018_add_rewatch_timeline_index"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+
+def upgrade() -> None:
+    # Collision-window matching, prior-watch checks, rewatch maintenance and
+    # import staging all read active rows of one (user, media item) timeline.
+    # The predicate is spelled like the queries' `is_deleted IS false` filter:
+    # Postgres rewrites `= false` to `NOT is_deleted`, which it cannot match
+    # against an IS FALSE test.
+    op.create_index(
+        "ix_watch_event_active_user_media_time",
+        "watch_event",
+        ["user_id", "media_item_id", "watched_at"],
+        schema=APP_SCHEMA,
+        postgresql_where=sa.text("is_deleted IS FALSE"),
+    )
+    op.drop_index(
+        "ix_watch_event_user_media_time", table_name="watch_event", schema=APP_SCHEMA
+    )
+    op.drop_index(
+        "ix_watch_event_is_deleted", table_name="watch_event", schema=APP_SCHEMA
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_watch_event_is_deleted",
+        "watch_event",
+        ["is_deleted"],
+        unique=False,
+        schema=APP_SCHEMA,
+    )
+    op.create_index(
+        "ix_watch_event_user_media_time",
+        "watch_event",
+        ["user_id", "media_item_id", "watched_at"],
+        schema=APP_SCHEMA,
+    )
+    op.drop_index(
+        "ix_watch_event_active_user_media_time",
+        table_name="watch_event",
+        schema=APP_SCHEMA,
+    )
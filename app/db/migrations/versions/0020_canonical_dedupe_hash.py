@@ -0,0 +1,174 @@
+"""Compute watch_event.dedupe_hash from a canonical key and backfill history."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0020_canonical_dedupe_hash"
+down_revision = "0019_partial_watch_event_indexes"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+
+def upgrade() -> None:
+    # Must stay byte-for-byte equal to app.core.dedupe.watch_event_dedupe_hash:
+    # the epoch-minute bucket keeps the hash independent of the session TimeZone.
+    op.execute(
+        """
+        CREATE FUNCTION app.watch_event_dedupe_hash(
+          p_user_id uuid,
+          p_media_item_id uuid,
+          p_playback_source text,
+          p_completed boolean,
+          p_watched_at timestamptz
+        ) RETURNS text
+        LANGUAGE sql
+        IMMUTABLE
+        AS $$
+          SELECT encode(
+            digest(
+              p_user_id::text || '|' ||
+              p_media_item_id::text || '|' ||
+              p_playback_source || '|' ||
+              p_completed::text || '|' ||
+              floor(extract(epoch FROM p_watched_at) / 60)::bigint::text,
+              'sha256'
+            ),
+            'hex'
+          );
+        $$;
+        """
+    )
+    # The application decides whether a row takes a hash: it writes NULL when
+    # the collision window is narrower than the hash bucket. The trigger keeps
+    # a requested hash canonical and stores NULL instead when another row
+    # already holds the key, so restoring or moving a watch into an occupied
+    # minute never trips the unique index. Deleted watches hold no hash, and
+    # updates that leave the key alone skip the lookup.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION app.set_watch_event_dedupe_hash() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          IF NEW.is_deleted OR NEW.dedupe_hash IS NULL THEN
+            NEW.dedupe_hash := NULL;
+            RETURN NEW;
+          END IF;
+
+          IF TG_OP = 'UPDATE'
+             AND NOT OLD.is_deleted
+             AND NEW.dedupe_hash IS NOT DISTINCT FROM OLD.dedupe_hash
+             AND (
+               NEW.user_id,
+               NEW.media_item_id,
+               NEW.playback_source,
+               NEW.completed,
+               NEW.watched_at
+             ) IS NOT DISTINCT FROM (
+               OLD.user_id,
+               OLD.media_item_id,
+               OLD.playback_source,
+               OLD.completed,
+               OLD.watched_at
+             )
+          THEN
+            RETURN NEW;
+          END IF;
+
+          NEW.dedupe_hash := app.watch_event_dedupe_hash(
+            NEW.user_id,
+            NEW.media_item_id,
+            NEW.playback_source,
+            NEW.completed,
+            NEW.watched_at
+          );
+          IF EXISTS (
+            SELECT 1
+              FROM app.watch_event
+             WHERE dedupe_hash = NEW.dedupe_hash
+               AND watch_id <> NEW.watch_id
+          ) THEN
+            NEW.dedupe_hash := NULL;
+          END IF;
+
+          RETURN NEW;
+        END;
+        $$;
+        """
+    )
+
+    # Existing history may already hold several active watches per canonical
+    # key; the earliest keeps the hash and the rest stay unhashed, so they are
+    # still found by the collision-window search.
+    op.execute(
+        "UPDATE app.watch_event SET dedupe_hash = NULL WHERE dedupe_hash IS NOT NULL"
+    )
+    op.execute(
+        """
+        WITH ranked AS (
+          SELECT watch_id,
+                 dedupe_hash,
+                 row_number() OVER (
+                   PARTITION BY dedupe_hash
+                   ORDER BY watched_at, created_at, watch_id
+                 ) AS position
+            FROM (
+              SELECT watch_id,
+                     watched_at,
+                     created_at,
+                     app.watch_event_dedupe_hash(
+                       user_id, media_item_id, playback_source, completed, watched_at
+                     ) AS dedupe_hash
+                FROM app.watch_event
+               WHERE is_deleted IS FALSE
+            ) AS hashed
+        )
+        UPDATE app.watch_event AS w
+           SET dedupe_hash = r.dedupe_hash
+          FROM ranked AS r
+         WHERE r.watch_id = w.watch_id
+           AND r.position = 1;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION app.set_watch_event_dedupe_hash() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+          v_bucket timestamptz;
+          v_payload text;
+        BEGIN
+          IF NEW.dedupe_hash IS NULL OR NEW.dedupe_hash = '' THEN
+            v_bucket := date_trunc('minute', NEW.watched_at);
+
+            v_payload :=
+              NEW.user_id::text || '|' ||
+              NEW.media_item_id::text || '|' ||
+              NEW.playback_source || '|' ||
+              v_bucket::text || '|' ||
+              COALESCE(NEW.media_version_id::text, '') || '|' ||
+              COALESCE(NEW.completed::text, '') || '|' ||
+              COALESCE(NEW.progress_percent::text, '') || '|' ||
+              COALESCE(NEW.total_seconds::text, '') || '|' ||
+              COALESCE(NEW.watched_seconds::text, '');
+
+            NEW.dedupe_hash := encode(digest(v_payload, 'sha256'), 'hex');
+          END IF;
+
+          RETURN NEW;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "app.watch_event_dedupe_hash(uuid, uuid, text, boolean, timestamptz)"
+    )
@@ -0,0 +1,343 @@
+"""Keep per-user monthly watch stats in a trigger-maintained rollup table."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0021_stats_monthly_rollup"
+down_revision = "0020_canonical_dedupe_hash"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+# Columns whose change can move a watch between buckets or change what it
+# contributes to one; updates touching nothing else skip the refresh.
+_WATCH_EVENT_ROLLUP_COLUMNS = (
+    "is_deleted",
+    "user_id",
+    "media_item_id",
+    "media_version_id",
+    "watched_local_year",
+    "watched_local_month",
+    "completed",
+    "rewatch",
+    "rating_value",
+    "watch_runtime_seconds",
+    "total_seconds",
+)
+
+
+def _row(alias: str) -> str:
+    return ", ".join(f"{alias}.{column}" for column in _WATCH_EVENT_ROLLUP_COLUMNS)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_monthly_rollup",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("local_year", sa.SmallInteger(), nullable=False),
+        sa.Column("local_month", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "media_type",
+            postgresql.ENUM(name="media_type", schema="public", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("watch_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("rewatch_count", sa.Integer(), nullable=False),
+        sa.Column("rated_count", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.Numeric(12, 2), nullable=False),
+        sa.Column("unrated_completed_count", sa.Integer(), nullable=False),
+        sa.Column("runtime_seconds", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            [f"{APP_SCHEMA}.users.user_id"],
+            name="stats_monthly_rollup_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id",
+            "local_year",
+            "local_month",
+            "media_type",
+            name="stats_monthly_rollup_pkey",
+        ),
+        schema=APP_SCHEMA,
+    )
+    # Media item and version runtime changes refresh the buckets of the
+    # item's active watches; nothing else looks watches up by item alone.
+    op.create_index(
+        "ix_watch_event_active_media_item",
+        "watch_event",
+        ["media_item_id"],
+        schema=APP_SCHEMA,
+        postgresql_where=sa.text("is_deleted IS FALSE"),
+    )
+
+    # Buckets are recomputed from watch_event rather than adjusted by deltas,
+    # so the effective runtime always reflects the current version and item
+    # runtimes. The per-user advisory lock makes a concurrent refresh of the
+    # same user wait for this transaction, then recompute from its committed
+    # rows instead of overwriting them with an older snapshot.
+    op.execute(
+        """
+        CREATE FUNCTION app.refresh_stats_monthly_rollup(
+          p_user_id uuid,
+          p_year smallint,
+          p_month smallint
+        ) RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          PERFORM pg_advisory_xact_lock(
+            hashtext('app.stats_monthly_rollup'),
+            hashtext(p_user_id::text)
+          );
+
+          DELETE FROM app.stats_monthly_rollup
+           WHERE user_id = p_user_id
+             AND local_year = p_year
+             AND local_month = p_month;
+
+          INSERT INTO app.stats_monthly_rollup (
+            user_id,
+            local_year,
+            local_month,
+            media_type,
+            watch_count,
+            completed_count,
+            rewatch_count,
+            rated_count,
+            rating_sum,
+            unrated_completed_count,
+            runtime_seconds
+          )
+          SELECT w.user_id,
+                 w.watched_local_year,
+                 w.watched_local_month,
+                 m.type,
+                 count(*),
+                 count(*) FILTER (WHERE w.completed),
+                 count(*) FILTER (WHERE w.rewatch),
+                 count(w.rating_value),
+                 coalesce(sum(w.rating_value), 0),
+                 count(*) FILTER (WHERE w.completed AND w.rating_value IS NULL),
+                 sum(
+                   coalesce(
+                     w.watch_runtime_seconds,
+                     v.runtime_seconds,
+                     w.total_seconds,
+                     m.base_runtime_seconds,
+                     0
+                   )
+                 )
+            FROM app.watch_event AS w
+            JOIN app.media_item AS m ON m.media_item_id = w.media_item_id
+            LEFT JOIN app.media_version AS v
+              ON v.media_version_id = w.media_version_id
+           WHERE w.user_id = p_user_id
+             AND w.watched_local_year = p_year
+             AND w.watched_local_month = p_month
+             AND w.is_deleted IS FALSE
+           GROUP BY w.user_id, w.watched_local_year, w.watched_local_month, m.type;
+        END;
+        $$;
+        """
+    )
+
+    # Statement-level triggers with transition tables refresh each touched
+    # bucket once per statement, so bulk imports and set-based rewatch
+    # recomputes cost one refresh per user-month rather than one per row.
+    # Keys are visited in order so concurrent writers take locks in order.
+    op.execute(
+        f"""
+        CREATE FUNCTION app.refresh_stats_monthly_rollup_for_watch_events()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+          k record;
+        BEGIN
+          IF TG_OP = 'INSERT' THEN
+            FOR k IN
+              SELECT DISTINCT user_id, watched_local_year, watched_local_month
+                FROM new_rows
+               WHERE is_deleted IS FALSE
+               ORDER BY 1, 2, 3
+            LOOP
+              PERFORM app.refresh_stats_monthly_rollup(
+                k.user_id, k.watched_local_year, k.watched_local_month
+              );
+            END LOOP;
+          ELSIF TG_OP = 'DELETE' THEN
+            FOR k IN
+              SELECT DISTINCT user_id, watched_local_year, watched_local_month
+                FROM old_rows
+               WHERE is_deleted IS FALSE
+               ORDER BY 1, 2, 3
+            LOOP
+              PERFORM app.refresh_stats_monthly_rollup(
+                k.user_id, k.watched_local_year, k.watched_local_month
+              );
+            END LOOP;
+          ELSE
+            FOR k IN
+              WITH changed AS (
+                SELECT o.user_id AS old_user_id,
+                       o.watched_local_year AS old_year,
+                       o.watched_local_month AS old_month,
+                       n.user_id AS new_user_id,
+                       n.watched_local_year AS new_year,
+                       n.watched_local_month AS new_month
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.watch_id = o.watch_id
+                 WHERE ({_row("o")}) IS DISTINCT FROM ({_row("n")})
+                   AND NOT (o.is_deleted AND n.is_deleted)
+              )
+              SELECT old_user_id AS user_id,
+                     old_year AS watched_local_year,
+                     old_month AS watched_local_month
+                FROM changed
+              UNION
+              SELECT new_user_id, new_year, new_month
+                FROM changed
+               ORDER BY 1, 2, 3
+            LOOP
+              PERFORM app.refresh_stats_monthly_rollup(
+                k.user_id, k.watched_local_year, k.watched_local_month
+              );
+            END LOOP;
+          END IF;
+
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    # Transition tables cannot be shared by a multi-event trigger, so each
+    # event gets its own trigger on the same function.
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_watch_event_stats_rollup_{event.lower()}
+            AFTER {event} ON app.watch_event
+            REFERENCING {transition}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.refresh_stats_monthly_rollup_for_watch_events();
+            """
+        )
+
+    # Enrichment can change an item's type or base runtime, and a version's
+    # runtime can be edited; both feed every active watch of the item. Most
+    # updates touch neither, so they return before looking at watch_event.
+    for table, key, compared, watch_match in (
+        (
+            "media_item",
+            "media_item_id",
+            ("type", "base_runtime_seconds"),
+            "w.media_item_id = n.media_item_id",
+        ),
+        (
+            "media_version",
+            "media_version_id",
+            ("runtime_seconds",),
+            "w.media_item_id = n.media_item_id"
+            " AND w.media_version_id = n.media_version_id",
+        ),
+    ):
+        old_values = ", ".join(f"o.{column}" for column in compared)
+        new_values = ", ".join(f"n.{column}" for column in compared)
+        op.execute(
+            f"""
+            CREATE FUNCTION app.refresh_stats_monthly_rollup_for_{table}()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+              k record;
+            BEGIN
+              IF NOT EXISTS (
+                SELECT 1
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.{key} = o.{key}
+                 WHERE ({old_values}) IS DISTINCT FROM ({new_values})
+              ) THEN
+                RETURN NULL;
+              END IF;
+
+              FOR k IN
+                SELECT DISTINCT w.user_id, w.watched_local_year, w.watched_local_month
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.{key} = o.{key}
+                  JOIN app.watch_event AS w
+                    ON {watch_match}
+                   AND w.is_deleted IS FALSE
+                 WHERE ({old_values}) IS DISTINCT FROM ({new_values})
+                 ORDER BY 1, 2, 3
+              LOOP
+                PERFORM app.refresh_stats_monthly_rollup(
+                  k.user_id, k.watched_local_year, k.watched_local_month
+                );
+              END LOOP;
+
+              RETURN NULL;
+            END;
+            $$;
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_stats_rollup
+            AFTER UPDATE ON app.{table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.refresh_stats_monthly_rollup_for_{table}();
+            """
+        )
+
+    op.execute(
+        """
+        SELECT app.refresh_stats_monthly_rollup(
+                 k.user_id, k.watched_local_year, k.watched_local_month
+               )
+          FROM (
+            SELECT DISTINCT user_id, watched_local_year, watched_local_month
+              FROM app.watch_event
+             WHERE is_deleted IS FALSE
+             ORDER BY 1, 2, 3
+          ) AS k;
+        """
+    )
+
+
+def downgrade() -> None:
+    for table in ("media_item", "media_version"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_stats_rollup ON app.{table}")
+        op.execute(
+            f"DROP FUNCTION IF EXISTS app.refresh_stats_monthly_rollup_for_{table}()"
+        )
+    for event in ("insert", "update", "delete"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_watch_event_stats_rollup_{event} "
+            "ON app.watch_event"
+        )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.refresh_stats_monthly_rollup_for_watch_events()"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.refresh_stats_monthly_rollup(uuid, smallint, smallint)"
+    )
+    op.drop_index(
+        "ix_watch_event_active_media_item",
+        table_name="watch_event",
+        schema=APP_SCHEMA,
+    )
+    op.drop_table("stats_monthly_rollup", schema=APP_SCHEMA)
@@ -0,0 +1,226 @@
+"""Track a per-user data generation for stats and analytics response caching."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0022_data_generation"
+down_revision = "0021_stats_monthly_rollup"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE app.data_generation_seq")
+    # scope_id is a user_id, or the nil UUID for changes that are not tied to
+    # one user (Horrorfest year windows). There is deliberately no foreign key:
+    # rows outlive deleted users so the highest generation never goes back.
+    op.create_table(
+        "data_generation",
+        sa.Column("scope_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("scope_id", name="data_generation_pkey"),
+        schema=APP_SCHEMA,
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION app.bump_data_generation(p_scope_ids uuid[]) RETURNS void
+        LANGUAGE sql
+        AS $$
+          INSERT INTO app.data_generation (scope_id, generation)
+          SELECT scope_id, nextval('app.data_generation_seq')
+            FROM (
+              SELECT DISTINCT scope_id
+                FROM unnest(p_scope_ids) AS scope_id
+               WHERE scope_id IS NOT NULL
+               ORDER BY scope_id
+            ) AS scopes
+          ON CONFLICT (scope_id)
+          DO UPDATE SET generation = EXCLUDED.generation;
+        $$;
+        """
+    )
+
+    # Every statement that writes watches, ratings or Horrorfest entries bumps
+    # the generation of each user it touched, in the writing transaction, so a
+    # reader never sees new data under an old generation.
+    op.execute(
+        """
+        CREATE FUNCTION app.bump_data_generation_for_watch_events() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          IF TG_OP = 'INSERT' THEN
+            PERFORM app.bump_data_generation(ARRAY(SELECT user_id FROM new_rows));
+          ELSIF TG_OP = 'DELETE' THEN
+            PERFORM app.bump_data_generation(ARRAY(SELECT user_id FROM old_rows));
+          ELSE
+            PERFORM app.bump_data_generation(
+              ARRAY(
+                SELECT user_id FROM old_rows
+                UNION
+                SELECT user_id FROM new_rows
+              )
+            );
+          END IF;
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION app.bump_data_generation_for_horrorfest_entries()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          IF TG_OP = 'INSERT' THEN
+            PERFORM app.bump_data_generation(
+              ARRAY(
+                SELECT w.user_id
+                  FROM new_rows AS e
+                  JOIN app.watch_event AS w ON w.watch_id = e.watch_id
+              )
+            );
+          ELSIF TG_OP = 'DELETE' THEN
+            PERFORM app.bump_data_generation(
+              ARRAY(
+                SELECT w.user_id
+                  FROM old_rows AS e
+                  JOIN app.watch_event AS w ON w.watch_id = e.watch_id
+              )
+            );
+          ELSE
+            PERFORM app.bump_data_generation(
+              ARRAY(
+                SELECT w.user_id
+                  FROM (
+                    SELECT watch_id FROM old_rows
+                    UNION
+                    SELECT watch_id FROM new_rows
+                  ) AS e
+                  JOIN app.watch_event AS w ON w.watch_id = e.watch_id
+              )
+            );
+          END IF;
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    for table, function in (
+        ("watch_event", "bump_data_generation_for_watch_events"),
+        ("horrorfest_entry", "bump_data_generation_for_horrorfest_entries"),
+    ):
+        for event, transition in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                f"""
+                CREATE TRIGGER trg_{table}_data_generation_{event.lower()}
+                AFTER {event} ON app.{table}
+                REFERENCING {transition}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION app.{function}();
+                """
+            )
+
+    # Titles, runtimes and years shown in stats come from media items and
+    # versions; only users who watched a changed row need a new generation,
+    # so collection snapshots of unwatched items invalidate nothing.
+    for table, watch_match in (
+        ("media_item", "w.media_item_id = n.media_item_id"),
+        (
+            "media_version",
+            "w.media_item_id = n.media_item_id"
+            " AND w.media_version_id = n.media_version_id",
+        ),
+    ):
+        op.execute(
+            f"""
+            CREATE FUNCTION app.bump_data_generation_for_{table}() RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+              PERFORM app.bump_data_generation(
+                ARRAY(
+                  SELECT DISTINCT w.user_id
+                    FROM new_rows AS n
+                    JOIN app.watch_event AS w
+                      ON {watch_match}
+                     AND w.is_deleted IS FALSE
+                )
+              );
+              RETURN NULL;
+            END;
+            $$;
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_data_generation
+            AFTER UPDATE ON app.{table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.bump_data_generation_for_{table}();
+            """
+        )
+
+    op.execute(
+        """
+        CREATE FUNCTION app.bump_data_generation_for_horrorfest_years()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          PERFORM app.bump_data_generation(
+            ARRAY['00000000-0000-0000-0000-000000000000'::uuid]
+          );
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_horrorfest_year_data_generation
+        AFTER INSERT OR UPDATE OR DELETE ON app.horrorfest_year
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION app.bump_data_generation_for_horrorfest_years();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_horrorfest_year_data_generation "
+        "ON app.horrorfest_year"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.bump_data_generation_for_horrorfest_years()"
+    )
+    for table in ("media_item", "media_version"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_data_generation ON app.{table}")
+        op.execute(f"DROP FUNCTION IF EXISTS app.bump_data_generation_for_{table}()")
+    for table in ("watch_event", "horrorfest_entry"):
+        for event in ("insert", "update", "delete"):
+            op.execute(
+                f"DROP TRIGGER IF EXISTS trg_{table}_data_generation_{event} "
+                f"ON app.{table}"
+            )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.bump_data_generation_for_horrorfest_entries()"
+    )
+    op.execute("DROP FUNCTION IF EXISTS app.bump_data_generation_for_watch_events()")
+    op.execute("DROP FUNCTION IF EXISTS app.bump_data_generation(uuid[])")
+    op.drop_table("data_generation", schema=APP_SCHEMA)
+    op.execute("DROP SEQUENCE IF EXISTS app.data_generation_seq")
@@ -0,0 +1,309 @@
+"""Keep per-user daily watch stats in a trigger-maintained rollup table."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0023_stats_daily_rollup"
+down_revision = "0022_data_generation"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+# Same as the monthly rollup, keyed by the local date instead of year/month.
+_WATCH_EVENT_ROLLUP_COLUMNS = (
+    "is_deleted",
+    "user_id",
+    "media_item_id",
+    "media_version_id",
+    "watched_local_date",
+    "completed",
+    "rewatch",
+    "rating_value",
+    "watch_runtime_seconds",
+    "total_seconds",
+)
+
+
+def _row(alias: str) -> str:
+    return ", ".join(f"{alias}.{column}" for column in _WATCH_EVENT_ROLLUP_COLUMNS)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_daily_rollup",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        sa.Column(
+            "media_type",
+            postgresql.ENUM(name="media_type", schema="public", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("watch_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("rewatch_count", sa.Integer(), nullable=False),
+        sa.Column("rated_count", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.Numeric(12, 2), nullable=False),
+        sa.Column("unrated_completed_count", sa.Integer(), nullable=False),
+        sa.Column("runtime_seconds", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            [f"{APP_SCHEMA}.users.user_id"],
+            name="stats_daily_rollup_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id",
+            "local_date",
+            "media_type",
+            name="stats_daily_rollup_pkey",
+        ),
+        schema=APP_SCHEMA,
+    )
+    # All-user time series scan a date range without a leading user_id.
+    op.create_index(
+        "ix_stats_daily_rollup_local_date",
+        "stats_daily_rollup",
+        ["local_date"],
+        schema=APP_SCHEMA,
+    )
+
+    # Takes the monthly rollup's per-user lock, so both rollups of a user are
+    # recomputed by one transaction at a time and in a consistent order.
+    op.execute(
+        """
+        CREATE FUNCTION app.refresh_stats_daily_rollup(
+          p_user_id uuid,
+          p_local_date date
+        ) RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          PERFORM pg_advisory_xact_lock(
+            hashtext('app.stats_monthly_rollup'),
+            hashtext(p_user_id::text)
+          );
+
+          DELETE FROM app.stats_daily_rollup
+           WHERE user_id = p_user_id
+             AND local_date = p_local_date;
+
+          INSERT INTO app.stats_daily_rollup (
+            user_id,
+            local_date,
+            media_type,
+            watch_count,
+            completed_count,
+            rewatch_count,
+            rated_count,
+            rating_sum,
+            unrated_completed_count,
+            runtime_seconds
+          )
+          SELECT w.user_id,
+                 w.watched_local_date,
+                 m.type,
+                 count(*),
+                 count(*) FILTER (WHERE w.completed),
+                 count(*) FILTER (WHERE w.rewatch),
+                 count(w.rating_value),
+                 coalesce(sum(w.rating_value), 0),
+                 count(*) FILTER (WHERE w.completed AND w.rating_value IS NULL),
+                 sum(
+                   coalesce(
+                     w.watch_runtime_seconds,
+                     v.runtime_seconds,
+                     w.total_seconds,
+                     m.base_runtime_seconds,
+                     0
+                   )
+                 )
+            FROM app.watch_event AS w
+            JOIN app.media_item AS m ON m.media_item_id = w.media_item_id
+            LEFT JOIN app.media_version AS v
+              ON v.media_version_id = w.media_version_id
+           WHERE w.user_id = p_user_id
+             AND w.watched_local_date = p_local_date
+             AND w.is_deleted IS FALSE
+           GROUP BY w.user_id, w.watched_local_date, m.type;
+        END;
+        $$;
+        """
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION app.refresh_stats_daily_rollup_for_watch_events()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+          k record;
+        BEGIN
+          IF TG_OP = 'INSERT' THEN
+            FOR k IN
+              SELECT DISTINCT user_id, watched_local_date
+                FROM new_rows
+               WHERE is_deleted IS FALSE
+               ORDER BY 1, 2
+            LOOP
+              PERFORM app.refresh_stats_daily_rollup(k.user_id, k.watched_local_date);
+            END LOOP;
+          ELSIF TG_OP = 'DELETE' THEN
+            FOR k IN
+              SELECT DISTINCT user_id, watched_local_date
+                FROM old_rows
+               WHERE is_deleted IS FALSE
+               ORDER BY 1, 2
+            LOOP
+              PERFORM app.refresh_stats_daily_rollup(k.user_id, k.watched_local_date);
+            END LOOP;
+          ELSE
+            FOR k IN
+              WITH changed AS (
+                SELECT o.user_id AS old_user_id,
+                       o.watched_local_date AS old_date,
+                       n.user_id AS new_user_id,
+                       n.watched_local_date AS new_date
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.watch_id = o.watch_id
+                 WHERE ({_row("o")}) IS DISTINCT FROM ({_row("n")})
+                   AND NOT (o.is_deleted AND n.is_deleted)
+              )
+              SELECT old_user_id AS user_id, old_date AS watched_local_date
+                FROM changed
+              UNION
+              SELECT new_user_id, new_date
+                FROM changed
+               ORDER BY 1, 2
+            LOOP
+              PERFORM app.refresh_stats_daily_rollup(k.user_id, k.watched_local_date);
+            END LOOP;
+          END IF;
+
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_watch_event_stats_daily_rollup_{event.lower()}
+            AFTER {event} ON app.watch_event
+            REFERENCING {transition}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.refresh_stats_daily_rollup_for_watch_events();
+            """
+        )
+
+    for table, key, compared, watch_match in (
+        (
+            "media_item",
+            "media_item_id",
+            ("type", "base_runtime_seconds"),
+            "w.media_item_id = n.media_item_id",
+        ),
+        (
+            "media_version",
+            "media_version_id",
+            ("runtime_seconds",),
+            "w.media_item_id = n.media_item_id"
+            " AND w.media_version_id = n.media_version_id",
+        ),
+    ):
+        old_values = ", ".join(f"o.{column}" for column in compared)
+        new_values = ", ".join(f"n.{column}" for column in compared)
+        op.execute(
+            f"""
+            CREATE FUNCTION app.refresh_stats_daily_rollup_for_{table}()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+              k record;
+            BEGIN
+              IF NOT EXISTS (
+                SELECT 1
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.{key} = o.{key}
+                 WHERE ({old_values}) IS DISTINCT FROM ({new_values})
+              ) THEN
+                RETURN NULL;
+              END IF;
+
+              FOR k IN
+                SELECT DISTINCT w.user_id, w.watched_local_date
+                  FROM old_rows AS o
+                  JOIN new_rows AS n ON n.{key} = o.{key}
+                  JOIN app.watch_event AS w
+                    ON {watch_match}
+                   AND w.is_deleted IS FALSE
+                 WHERE ({old_values}) IS DISTINCT FROM ({new_values})
+                 ORDER BY 1, 2
+              LOOP
+                PERFORM app.refresh_stats_daily_rollup(
+                  k.user_id, k.watched_local_date
+                );
+              END LOOP;
+
+              RETURN NULL;
+            END;
+            $$;
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_stats_daily_rollup
+            AFTER UPDATE ON app.{table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.refresh_stats_daily_rollup_for_{table}();
+            """
+        )
+
+    op.execute(
+        """
+        SELECT app.refresh_stats_daily_rollup(k.user_id, k.watched_local_date)
+          FROM (
+            SELECT DISTINCT user_id, watched_local_date
+              FROM app.watch_event
+             WHERE is_deleted IS FALSE
+               AND watched_local_date IS NOT NULL
+             ORDER BY 1, 2
+          ) AS k;
+        """
+    )
+
+
+def downgrade() -> None:
+    for table in ("media_item", "media_version"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_{table}_stats_daily_rollup ON app.{table}"
+        )
+        op.execute(
+            f"DROP FUNCTION IF EXISTS app.refresh_stats_daily_rollup_for_{table}()"
+        )
+    for event in ("insert", "update", "delete"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_watch_event_stats_daily_rollup_{event} "
+            "ON app.watch_event"
+        )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.refresh_stats_daily_rollup_for_watch_events()"
+    )
+    op.execute("DROP FUNCTION IF EXISTS app.refresh_stats_daily_rollup(uuid, date)")
+    op.drop_index(
+        "ix_stats_daily_rollup_local_date",
+        table_name="stats_daily_rollup",
+        schema=APP_SCHEMA,
+    )
+    op.drop_table("stats_daily_rollup", schema=APP_SCHEMA)
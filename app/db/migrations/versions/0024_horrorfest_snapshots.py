@@ -0,0 +1,365 @@
+"""Freeze analytics aggregates of closed Horrorfest years into snapshots."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0024_horrorfest_snapshots"
+down_revision = "0023_stats_daily_rollup"
+branch_labels = None
+depends_on = None
+
+APP_SCHEMA = "app"
+
+# Watch columns that feed a Horrorfest analytics bucket.
+_WATCH_EVENT_SNAPSHOT_COLUMNS = (
+    "is_deleted",
+    "user_id",
+    "media_item_id",
+    "media_version_id",
+    "watched_at",
+    "watched_local_date",
+    "playback_source",
+    "rating_value",
+    "rewatch",
+    "watch_runtime_seconds",
+    "total_seconds",
+)
+_ENTRY_SNAPSHOT_COLUMNS = ("is_removed", "horrorfest_year", "watch_id")
+
+
+def _row(alias: str, columns: tuple[str, ...]) -> str:
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "horrorfest_snapshot",
+        sa.Column("horrorfest_year", sa.Integer(), nullable=False),
+        sa.Column(
+            "frozen_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["horrorfest_year"],
+            [f"{APP_SCHEMA}.horrorfest_year.horrorfest_year"],
+            name="horrorfest_snapshot_horrorfest_year_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("horrorfest_year", name="horrorfest_snapshot_pkey"),
+        schema=APP_SCHEMA,
+    )
+    # One row per year, user and bucket key; only the key column of the
+    # row's kind is set, mirroring a GROUPING SETS result.
+    op.create_table(
+        "horrorfest_snapshot_bucket",
+        sa.Column(
+            "snapshot_bucket_id",
+            sa.BigInteger(),
+            sa.Identity(always=True),
+            nullable=False,
+        ),
+        sa.Column("horrorfest_year", sa.Integer(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("bucket_kind", sa.String(), nullable=False),
+        sa.Column("media_item_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("watch_date", sa.Date(), nullable=True),
+        sa.Column("playback_source", sa.String(), nullable=True),
+        sa.Column("rating_value", sa.Numeric(4, 2), nullable=True),
+        sa.Column("watch_count", sa.Integer(), nullable=False),
+        sa.Column("rewatch_count", sa.Integer(), nullable=False),
+        sa.Column("rated_count", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.Numeric(12, 2), nullable=False),
+        sa.Column("runtime_seconds", sa.BigInteger(), nullable=False),
+        sa.Column("first_watch_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("latest_watch_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "bucket_kind IN ('title', 'day', 'source', 'rating')",
+            name="ck_horrorfest_snapshot_bucket_kind",
+        ),
+        sa.ForeignKeyConstraint(
+            ["horrorfest_year"],
+            [f"{APP_SCHEMA}.horrorfest_snapshot.horrorfest_year"],
+            name="horrorfest_snapshot_bucket_horrorfest_year_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            [f"{APP_SCHEMA}.users.user_id"],
+            name="horrorfest_snapshot_bucket_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["media_item_id"],
+            [f"{APP_SCHEMA}.media_item.media_item_id"],
+            name="horrorfest_snapshot_bucket_media_item_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "snapshot_bucket_id", name="horrorfest_snapshot_bucket_pkey"
+        ),
+        schema=APP_SCHEMA,
+    )
+    op.create_index(
+        "ix_horrorfest_snapshot_bucket_year_kind",
+        "horrorfest_snapshot_bucket",
+        ["horrorfest_year", "bucket_kind"],
+        schema=APP_SCHEMA,
+    )
+
+    # Snapshots are built by the application under the same per-year lock.
+    # Taking it here means a freeze either finishes first and is dropped, or
+    # waits for this transaction and then aggregates its committed rows.
+    op.execute(
+        """
+        CREATE FUNCTION app.drop_horrorfest_snapshots(p_years integer[])
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+          y integer;
+        BEGIN
+          FOR y IN
+            SELECT DISTINCT years.horrorfest_year
+              FROM unnest(p_years) AS years(horrorfest_year)
+             WHERE years.horrorfest_year IS NOT NULL
+             ORDER BY 1
+          LOOP
+            PERFORM pg_advisory_xact_lock(hashtext('app.horrorfest_snapshot'), y);
+            DELETE FROM app.horrorfest_snapshot WHERE horrorfest_year = y;
+          END LOOP;
+        END;
+        $$;
+        """
+    )
+    # Writes to a year that is still open skip the lock, so concurrent
+    # imports into the current festival do not queue behind each other.
+    # Years are only frozen a grace period after their window closes.
+    op.execute(
+        """
+        CREATE FUNCTION app.drop_closed_horrorfest_snapshots(p_years integer[])
+        RETURNS void
+        LANGUAGE sql
+        AS $$
+          SELECT app.drop_horrorfest_snapshots(
+            ARRAY(
+              SELECT horrorfest_year
+                FROM app.horrorfest_year
+               WHERE horrorfest_year = ANY(p_years)
+                 AND window_end_at <= clock_timestamp()
+            )
+          );
+        $$;
+        """
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION app.drop_horrorfest_snapshots_for_entries()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          IF TG_OP = 'INSERT' THEN
+            PERFORM app.drop_closed_horrorfest_snapshots(
+              ARRAY(SELECT horrorfest_year FROM new_rows)
+            );
+          ELSIF TG_OP = 'DELETE' THEN
+            PERFORM app.drop_closed_horrorfest_snapshots(
+              ARRAY(SELECT horrorfest_year FROM old_rows)
+            );
+          ELSE
+            PERFORM app.drop_closed_horrorfest_snapshots(
+              ARRAY(
+                SELECT unnest(ARRAY[o.horrorfest_year, n.horrorfest_year])
+                  FROM old_rows AS o
+                  JOIN new_rows AS n
+                    ON n.horrorfest_entry_id = o.horrorfest_entry_id
+                 WHERE ({_row("o", _ENTRY_SNAPSHOT_COLUMNS)})
+                       IS DISTINCT FROM ({_row("n", _ENTRY_SNAPSHOT_COLUMNS)})
+              )
+            );
+          END IF;
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_horrorfest_entry_snapshot_{event.lower()}
+            AFTER {event} ON app.horrorfest_entry
+            REFERENCING {transition}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.drop_horrorfest_snapshots_for_entries();
+            """
+        )
+
+    # Hard-deleted watches cascade to their entries, so only updates need a
+    # watch_event trigger.
+    op.execute(
+        f"""
+        CREATE FUNCTION app.drop_horrorfest_snapshots_for_watch_events()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          PERFORM app.drop_closed_horrorfest_snapshots(
+            ARRAY(
+              SELECT DISTINCT e.horrorfest_year
+                FROM old_rows AS o
+                JOIN new_rows AS n ON n.watch_id = o.watch_id
+                JOIN app.horrorfest_entry AS e ON e.watch_id = n.watch_id
+               WHERE ({_row("o", _WATCH_EVENT_SNAPSHOT_COLUMNS)})
+                     IS DISTINCT FROM ({_row("n", _WATCH_EVENT_SNAPSHOT_COLUMNS)})
+            )
+          );
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_watch_event_horrorfest_snapshot
+        AFTER UPDATE ON app.watch_event
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION app.drop_horrorfest_snapshots_for_watch_events();
+        """
+    )
+
+    # Titles and release years are joined live when snapshots are read, so
+    # only runtime changes reach into frozen buckets.
+    for table, key, compared, watch_match in (
+        (
+            "media_item",
+            "media_item_id",
+            ("base_runtime_seconds",),
+            "w.media_item_id = n.media_item_id",
+        ),
+        (
+            "media_version",
+            "media_version_id",
+            ("runtime_seconds",),
+            "w.media_item_id = n.media_item_id"
+            " AND w.media_version_id = n.media_version_id",
+        ),
+    ):
+        old_values = ", ".join(f"o.{column}" for column in compared)
+        new_values = ", ".join(f"n.{column}" for column in compared)
+        op.execute(
+            f"""
+            CREATE FUNCTION app.drop_horrorfest_snapshots_for_{table}()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+              PERFORM app.drop_closed_horrorfest_snapshots(
+                ARRAY(
+                  SELECT DISTINCT e.horrorfest_year
+                    FROM old_rows AS o
+                    JOIN new_rows AS n ON n.{key} = o.{key}
+                    JOIN app.watch_event AS w
+                      ON {watch_match}
+                     AND w.is_deleted IS FALSE
+                    JOIN app.horrorfest_entry AS e ON e.watch_id = w.watch_id
+                   WHERE ({old_values}) IS DISTINCT FROM ({new_values})
+                )
+              );
+              RETURN NULL;
+            END;
+            $$;
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_horrorfest_snapshot
+            AFTER UPDATE ON app.{table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION app.drop_horrorfest_snapshots_for_{table}();
+            """
+        )
+
+    # Moving a window can reopen a frozen year, so window edits always drop
+    # the year's snapshot, open or not.
+    op.execute(
+        """
+        CREATE FUNCTION app.drop_horrorfest_snapshots_for_horrorfest_years()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          PERFORM app.drop_horrorfest_snapshots(
+            ARRAY(
+              SELECT n.horrorfest_year
+                FROM old_rows AS o
+                JOIN new_rows AS n ON n.horrorfest_year = o.horrorfest_year
+               WHERE (o.window_start_at, o.window_end_at)
+                     IS DISTINCT FROM (n.window_start_at, n.window_end_at)
+            )
+          );
+          RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_horrorfest_year_snapshot
+        AFTER UPDATE ON app.horrorfest_year
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION app.drop_horrorfest_snapshots_for_horrorfest_years();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_horrorfest_year_snapshot ON app.horrorfest_year"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.drop_horrorfest_snapshots_for_horrorfest_years()"
+    )
+    for table in ("media_item", "media_version"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_{table}_horrorfest_snapshot ON app.{table}"
+        )
+        op.execute(
+            f"DROP FUNCTION IF EXISTS app.drop_horrorfest_snapshots_for_{table}()"
+        )
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_watch_event_horrorfest_snapshot ON app.watch_event"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.drop_horrorfest_snapshots_for_watch_events()"
+    )
+    for event in ("insert", "update", "delete"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_horrorfest_entry_snapshot_{event} "
+            "ON app.horrorfest_entry"
+        )
+    op.execute("DROP FUNCTION IF EXISTS app.drop_horrorfest_snapshots_for_entries()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS app.drop_closed_horrorfest_snapshots(integer[])"
+    )
+    op.execute("DROP FUNCTION IF EXISTS app.drop_horrorfest_snapshots(integer[])")
+    op.drop_index(
+        "ix_horrorfest_snapshot_bucket_year_kind",
+        table_name="horrorfest_snapshot_bucket",
+        schema=APP_SCHEMA,
+    )
+    op.drop_table("horrorfest_snapshot_bucket", schema=APP_SCHEMA)
+    op.drop_table("horrorfest_snapshot", schema=APP_SCHEMA)
@@ -6,16 +6,20 @@ from typing import Any
 from uuid import UUID
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
     Computed,
     Date,
     DateTime,
+    FetchedValue,
     ForeignKey,
     ForeignKeyConstraint,
+    Identity,
     Index,
     Integer,
     Numeric,
+    SmallInteger,
     String,
 )
 from sqlalchemy import UniqueConstraint, text
@@ -119,6 +123,12 @@ class Show(Base):
         UniqueConstraint("tmdb_id", name="uq_shows_tmdb"),
         Index("ix_shows_imdb_id", "imdb_id"),
         Index("ix_shows_tvdb_id", "tvdb_id"),
+        Index(
+            "ix_shows_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "public.gin_trgm_ops"},
+        ),
         {"schema": APP_SCHEMA},
     )
 
@@ -157,6 +167,12 @@ class MediaItem(Base):
         ),
         Index("ix_media_item_show_id", "show_id"),
         Index("ix_media_item_show_tmdb", "show_tmdb_id"),
+        Index(
+            "ix_media_item_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "public.gin_trgm_ops"},
+        ),
         Index(
             "ux_media_item_episode_key",
             "show_tmdb_id",
@@ -492,9 +508,27 @@ class WatchEvent(Base):
             postgresql_where=text("source_event_id IS NOT NULL"),
         ),
         Index("ix_watch_event_user_time", "user_id", text("watched_at DESC")),
+        Index(
+            "ix_watch_event_active_user_media_time",
+            "user_id",
+            "media_item_id",
+            "watched_at",
+            postgresql_where=text("is_deleted IS FALSE"),
+        ),
+        Index("ix_watch_event_user_local_date", "user_id", "watched_local_date"),
+        Index(
+            "ix_watch_event_user_local_month",
+            "user_id",
+            "watched_local_year",
+            "watched_local_month",
+        ),
         Index("ix_watch_event_watched_at", text("watched_at DESC")),
         Index("ix_watch_event_origin_playback", "origin_playback_event_id"),
-        Index("ix_watch_event_is_deleted", "is_deleted"),
+        Index(
+            "ix_watch_event_active_media_item",
+            "media_item_id",
+            postgresql_where=text("is_deleted IS FALSE"),
+        ),
         Index(
             "ux_watch_event_dedupe_hash",
             "dedupe_hash",
@@ -520,6 +554,16 @@ class WatchEvent(Base):
     watched_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+    # Maintained by trg_watch_event_set_local_dates from the owner's timezone.
+    watched_local_date: Mapped[date | None] = mapped_column(
+        Date, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    watched_local_year: Mapped[int | None] = mapped_column(
+        SmallInteger, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    watched_local_month: Mapped[int | None] = mapped_column(
+        SmallInteger, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
     playback_source: Mapped[str] = mapped_column(String, nullable=False)
     total_seconds: Mapped[int | None] = mapped_column(Integer)
     watched_seconds: Mapped[int | None] = mapped_column(Integer)
@@ -661,3 +705,128 @@ class HorrorfestEntry(Base):
 
     watch_event: Mapped[WatchEvent] = relationship(back_populates="horrorfest_entries")
     year_config: Mapped[HorrorfestYear] = relationship(back_populates="entries")
+
+
+# Maintained by the watch_event, media_item and media_version triggers from
+# migration 0021; the application only reads it.
+class StatsMonthlyRollup(Base):
+    __tablename__ = "stats_monthly_rollup"
+    __table_args__ = {"schema": APP_SCHEMA}
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey(f"{APP_SCHEMA}.users.user_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    local_year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    local_month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    media_type: Mapped[str] = mapped_column(MEDIA_TYPE_ENUM, primary_key=True)
+    watch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rewatch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rated_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating_sum: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    unrated_completed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    runtime_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# The day-level sibling of StatsMonthlyRollup, maintained by the triggers
+# from migration 0023 and read by the stats time series.
+class StatsDailyRollup(Base):
+    __tablename__ = "stats_daily_rollup"
+    __table_args__ = (
+        Index("ix_stats_daily_rollup_local_date", "local_date"),
+        {"schema": APP_SCHEMA},
+    )
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey(f"{APP_SCHEMA}.users.user_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    local_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    media_type: Mapped[str] = mapped_column(MEDIA_TYPE_ENUM, primary_key=True)
+    watch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rewatch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rated_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating_sum: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    unrated_completed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    runtime_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# Bumped by triggers from migration 0022 whenever a user's watches, ratings or
+# Horrorfest entries change; the nil UUID scope covers Horrorfest year windows.
+class DataGeneration(Base):
+    __tablename__ = "data_generation"
+    __table_args__ = {"schema": APP_SCHEMA}
+
+    scope_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# Frozen analytics of a closed Horrorfest year (migration 0024). Triggers drop
+# a year's snapshot on any write that touches it; the application rebuilds it.
+class HorrorfestSnapshot(Base):
+    __tablename__ = "horrorfest_snapshot"
+    __table_args__ = {"schema": APP_SCHEMA}
+
+    horrorfest_year: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(f"{APP_SCHEMA}.horrorfest_year.horrorfest_year", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    frozen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("now()"), nullable=False
+    )
+
+
+class HorrorfestSnapshotBucket(Base):
+    __tablename__ = "horrorfest_snapshot_bucket"
+    __table_args__ = (
+        CheckConstraint(
+            "bucket_kind IN ('title', 'day', 'source', 'rating')",
+            name="ck_horrorfest_snapshot_bucket_kind",
+        ),
+        Index(
+            "ix_horrorfest_snapshot_bucket_year_kind",
+            "horrorfest_year",
+            "bucket_kind",
+        ),
+        {"schema": APP_SCHEMA},
+    )
+
+    snapshot_bucket_id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=True), primary_key=True
+    )
+    horrorfest_year: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            f"{APP_SCHEMA}.horrorfest_snapshot.horrorfest_year", ondelete="CASCADE"
+        ),
+        nullable=False,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey(f"{APP_SCHEMA}.users.user_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    bucket_kind: Mapped[str] = mapped_column(String, nullable=False)
+    media_item_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey(f"{APP_SCHEMA}.media_item.media_item_id", ondelete="CASCADE"),
+    )
+    watch_date: Mapped[date | None] = mapped_column(Date)
+    playback_source: Mapped[str | None] = mapped_column(String)
+    rating_value: Mapped[Decimal | None] = mapped_column(Numeric(4, 2))
+    watch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rewatch_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rated_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating_sum: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    runtime_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_watch_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    latest_watch_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
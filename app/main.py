@@ -1,4 +1,9 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from sqlalchemy.exc import OperationalError
 
 from app.api.collection import router as collection_router
 from app.api.frontend import FrontendStaticFiles, WEB_ROOT, router as frontend_router
@@ -20,6 +25,27 @@ from app.api.users import router as users_router
 from app.api.watch_events import router as watch_events_router
 from app.api.webhooks import router as webhooks_router
 from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.services.import_jobs import ImportJobService
+
+logger = logging.getLogger(__name__)
+
+
+def recover_import_jobs() -> None:
+    session = SessionLocal()
+    try:
+        ImportJobService.recover_interrupted_jobs(session)
+    except OperationalError:
+        # Serving must not wait on the database; the next start retries.
+        logger.warning("Skipped import job recovery: database unavailable")
+    finally:
+        session.close()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    recover_import_jobs()
+    yield
 
 
 def create_app() -> FastAPI:
@@ -29,6 +55,7 @@ def create_app() -> FastAPI:
         version="1.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
     app.mount("/web", FrontendStaticFiles(directory=WEB_ROOT), name="web")
     app.include_router(frontend_router)
@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Select, asc, desc, func, or_, select, update
+from sqlalchemy import Select, asc, desc, func, select, update
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import CollectionEntry, MediaItem, Show
+from app.repositories.title_search import title_matches, title_rank
 
 
 def find_collection_entry_by_source_item(
@@ -178,7 +179,9 @@ def list_collection_movies(
         .where(CollectionEntry.item_type == "movie")
     )
     if query:
-        statement = statement.where(MediaItem.title.ilike(f"%{query}%"))
+        statement = statement.where(title_matches(query, MediaItem.title)).order_by(
+            title_rank(query, MediaItem.title).desc()
+        )
     statement = _present_filter(statement, present=present)
     statement = (
         statement.order_by(
@@ -225,7 +228,9 @@ def list_collection_shows(
         .where(CollectionEntry.item_type == "show")
     )
     if query:
-        statement = statement.where(Show.title.ilike(f"%{query}%"))
+        statement = statement.where(title_matches(query, Show.title)).order_by(
+            title_rank(query, Show.title).desc()
+        )
     statement = _present_filter(statement, present=present)
     statement = (
         statement.order_by(
@@ -277,10 +282,9 @@ def list_collection_episodes(
         .where(CollectionEntry.item_type == "episode")
     )
     if query:
-        pattern = f"%{query}%"
         statement = statement.where(
-            or_(MediaItem.title.ilike(pattern), Show.title.ilike(pattern))
-        )
+            title_matches(query, MediaItem.title, Show.title)
+        ).order_by(title_rank(query, MediaItem.title, Show.title).desc())
     statement = _present_filter(statement, present=present)
     statement = (
         statement.order_by(
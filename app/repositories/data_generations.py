@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.entities import DataGeneration
+
+GLOBAL_SCOPE_ID = UUID(int=0)
+
+
+def list_data_generations(session: Session, *, user_id: UUID | None) -> tuple[int, ...]:
+    """Exact generation of each scope a user's data, or everyone's when None, reads.
+
+    Writers draw generations from one sequence but commit in any order, so a
+    lower number can become visible after a higher one. The highest alone
+    would hide that write; the value of every scope cannot.
+    """
+    statement = select(DataGeneration.generation).order_by(DataGeneration.scope_id)
+    if user_id is not None:
+        statement = statement.where(
+            DataGeneration.scope_id.in_([user_id, GLOBAL_SCOPE_ID])
+        )
+    return tuple(session.scalars(statement))
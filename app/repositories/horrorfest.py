@@ -2,15 +2,30 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Date, Integer, Select, and_, case, cast, func, select
+from sqlalchemy import (
+    Integer,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    func,
+    insert,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import (
     HorrorfestEntry,
+    HorrorfestSnapshot,
+    HorrorfestSnapshotBucket,
     HorrorfestYear,
     MediaItem,
     MediaVersion,
-    User,
     WatchEvent,
 )
 
@@ -48,12 +63,11 @@ def _horrorfest_analytics_base_statement(
     horrorfest_year: int | None = None,
     user_id: UUID | None = None,
 ) -> Select:
-    local_ts = func.timezone(User.timezone, WatchEvent.watched_at)
-    local_date = cast(local_ts, Date)
     statement = (
         select(
             HorrorfestEntry.horrorfest_year.label("horrorfest_year"),
-            local_date.label("watch_date"),
+            WatchEvent.user_id.label("user_id"),
+            WatchEvent.watched_local_date.label("watch_date"),
             WatchEvent.playback_source.label("playback_source"),
             WatchEvent.rating_value.label("rating_value"),
             WatchEvent.watched_at.label("watched_at"),
@@ -65,7 +79,6 @@ def _horrorfest_analytics_base_statement(
         )
         .select_from(HorrorfestEntry)
         .join(WatchEvent, WatchEvent.watch_id == HorrorfestEntry.watch_id)
-        .join(User, User.user_id == WatchEvent.user_id)
         .join(MediaItem, MediaItem.media_item_id == WatchEvent.media_item_id)
         .outerjoin(
             MediaVersion, MediaVersion.media_version_id == WatchEvent.media_version_id
@@ -82,6 +95,135 @@ def _horrorfest_analytics_base_statement(
     return statement
 
 
+# Kinds of horrorfest_snapshot_bucket rows, keyed by the GROUPING() mask over
+# (media_item_id, watch_date, playback_source, rating_value) of the bucket
+# query; a set bit marks a column outside the row's grouping set.
+_BUCKET_KINDS_BY_GROUPING = {
+    0b0111: "title",
+    0b1011: "day",
+    0b1101: "source",
+    0b1110: "rating",
+}
+
+
+def _horrorfest_live_bucket_statement(
+    *,
+    horrorfest_years: list[int] | None = None,
+    exclude_frozen: bool = False,
+    user_id: UUID | None = None,
+) -> Select:
+    """Aggregate analytics rows into per-user title, day, source and rating buckets.
+
+    The columns match ``HorrorfestSnapshotBucket``, so the same statement
+    freezes a closed year and computes the years that are not frozen.
+    """
+    statement = _horrorfest_analytics_base_statement(user_id=user_id)
+    if horrorfest_years is not None:
+        statement = statement.where(
+            HorrorfestEntry.horrorfest_year.in_(horrorfest_years)
+        )
+    if exclude_frozen:
+        statement = statement.where(
+            HorrorfestEntry.horrorfest_year.not_in(
+                select(HorrorfestSnapshot.horrorfest_year)
+            )
+        )
+    analytics_rows = statement.subquery()
+    grouping = func.grouping(
+        analytics_rows.c.media_item_id,
+        analytics_rows.c.watch_date,
+        analytics_rows.c.playback_source,
+        analytics_rows.c.rating_value,
+    )
+    return select(
+        analytics_rows.c.horrorfest_year,
+        analytics_rows.c.user_id,
+        case(_BUCKET_KINDS_BY_GROUPING, value=grouping).label("bucket_kind"),
+        analytics_rows.c.media_item_id,
+        analytics_rows.c.watch_date,
+        analytics_rows.c.playback_source,
+        analytics_rows.c.rating_value,
+        func.count().label("watch_count"),
+        func.count().filter(analytics_rows.c.rewatch.is_(True)).label("rewatch_count"),
+        func.count(analytics_rows.c.rating_value).label("rated_count"),
+        func.coalesce(func.sum(analytics_rows.c.rating_value), 0).label("rating_sum"),
+        func.coalesce(func.sum(analytics_rows.c.effective_runtime_seconds), 0).label(
+            "runtime_seconds"
+        ),
+        func.min(analytics_rows.c.watched_at).label("first_watch_at"),
+        func.max(analytics_rows.c.watched_at).label("latest_watch_at"),
+    ).group_by(
+        analytics_rows.c.horrorfest_year,
+        analytics_rows.c.user_id,
+        func.grouping_sets(
+            tuple_(analytics_rows.c.media_item_id),
+            tuple_(analytics_rows.c.watch_date),
+            tuple_(analytics_rows.c.playback_source),
+            tuple_(analytics_rows.c.rating_value),
+        ),
+    )
+
+
+def _horrorfest_analytics_buckets(
+    *,
+    horrorfest_years: list[int] | None = None,
+    user_id: UUID | None = None,
+):
+    """Frozen snapshot buckets merged with live buckets of unfrozen years."""
+    frozen = select(
+        HorrorfestSnapshotBucket.horrorfest_year,
+        HorrorfestSnapshotBucket.user_id,
+        HorrorfestSnapshotBucket.bucket_kind,
+        HorrorfestSnapshotBucket.media_item_id,
+        HorrorfestSnapshotBucket.watch_date,
+        HorrorfestSnapshotBucket.playback_source,
+        HorrorfestSnapshotBucket.rating_value,
+        HorrorfestSnapshotBucket.watch_count,
+        HorrorfestSnapshotBucket.rewatch_count,
+        HorrorfestSnapshotBucket.rated_count,
+        HorrorfestSnapshotBucket.rating_sum,
+        HorrorfestSnapshotBucket.runtime_seconds,
+        HorrorfestSnapshotBucket.first_watch_at,
+        HorrorfestSnapshotBucket.latest_watch_at,
+    )
+    if horrorfest_years is not None:
+        frozen = frozen.where(
+            HorrorfestSnapshotBucket.horrorfest_year.in_(horrorfest_years)
+        )
+    if user_id is not None:
+        frozen = frozen.where(HorrorfestSnapshotBucket.user_id == user_id)
+    live = _horrorfest_live_bucket_statement(
+        horrorfest_years=horrorfest_years,
+        exclude_frozen=True,
+        user_id=user_id,
+    )
+    return union_all(frozen, live).subquery("buckets")
+
+
+def _bucket_average_rating_expr(buckets):
+    return func.sum(buckets.c.rating_sum) / func.nullif(
+        func.sum(buckets.c.rated_count), 0
+    )
+
+
+def _bucket_year_summary_columns(buckets) -> list:
+    watch_count = func.sum(buckets.c.watch_count)
+    rewatch_count = func.sum(buckets.c.rewatch_count)
+    return [
+        watch_count.label("watch_count"),
+        func.count(func.distinct(buckets.c.watch_date)).label("watch_days"),
+        (watch_count - rewatch_count).label("new_watch_count"),
+        rewatch_count.label("rewatch_count"),
+        func.coalesce(func.sum(buckets.c.runtime_seconds), 0).label(
+            "total_runtime_seconds"
+        ),
+        _bucket_average_rating_expr(buckets).label("average_rating_value"),
+        func.sum(buckets.c.rated_count).label("rated_watch_count"),
+        func.min(buckets.c.first_watch_at).label("first_watch_at"),
+        func.max(buckets.c.latest_watch_at).label("latest_watch_at"),
+    ]
+
+
 def _build_analytics_summary(row: object) -> dict[str, object]:
     watch_count = int(row.watch_count or 0)
     watch_days = int(row.watch_days or 0)
@@ -395,35 +537,80 @@ def list_horrorfest_years(session: Session) -> list[dict[str, object]]:
     return payload
 
 
+def list_unfrozen_closed_horrorfest_years(
+    session: Session,
+    *,
+    closed_before: datetime,
+) -> list[int]:
+    statement = (
+        select(HorrorfestYear.horrorfest_year)
+        .where(
+            HorrorfestYear.window_end_at < closed_before,
+            ~select(HorrorfestSnapshot.horrorfest_year)
+            .where(HorrorfestSnapshot.horrorfest_year == HorrorfestYear.horrorfest_year)
+            .exists(),
+        )
+        .order_by(HorrorfestYear.horrorfest_year)
+    )
+    return list(session.scalars(statement))
+
+
+def freeze_horrorfest_years(
+    session: Session,
+    *,
+    horrorfest_years: list[int],
+    closed_before: datetime,
+) -> list[int]:
+    """Snapshot the analytics buckets of closed years; returns the years frozen.
+
+    Takes the per-year advisory lock that the invalidation triggers take, then
+    re-checks the window and existing snapshot, so a concurrent write or
+    freeze of the same year is never lost or duplicated.
+    """
+    for horrorfest_year in sorted(set(horrorfest_years)):
+        session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    func.hashtext("app.horrorfest_snapshot"), horrorfest_year
+                )
+            )
+        )
+    candidates = select(HorrorfestYear.horrorfest_year).where(
+        HorrorfestYear.horrorfest_year.in_(horrorfest_years),
+        HorrorfestYear.window_end_at < closed_before,
+        ~select(HorrorfestSnapshot.horrorfest_year)
+        .where(HorrorfestSnapshot.horrorfest_year == HorrorfestYear.horrorfest_year)
+        .exists(),
+    )
+    frozen_years = sorted(
+        session.scalars(
+            insert(HorrorfestSnapshot)
+            .from_select(["horrorfest_year"], candidates)
+            .returning(HorrorfestSnapshot.horrorfest_year)
+        )
+    )
+    if frozen_years:
+        live_buckets = _horrorfest_live_bucket_statement(horrorfest_years=frozen_years)
+        session.execute(
+            insert(HorrorfestSnapshotBucket).from_select(
+                [column.name for column in live_buckets.selected_columns],
+                live_buckets,
+            )
+        )
+    return frozen_years
+
+
 def list_horrorfest_analytics_years(
     session: Session,
     *,
     user_id: UUID | None = None,
 ) -> list[dict[str, object]]:
-    analytics_rows = _horrorfest_analytics_base_statement(user_id=user_id).subquery()
+    buckets = _horrorfest_analytics_buckets(user_id=user_id)
     statement = (
-        select(
-            analytics_rows.c.horrorfest_year,
-            func.count().label("watch_count"),
-            func.count(func.distinct(analytics_rows.c.watch_date)).label("watch_days"),
-            func.sum(case((analytics_rows.c.rewatch.is_(False), 1), else_=0)).label(
-                "new_watch_count"
-            ),
-            func.sum(case((analytics_rows.c.rewatch.is_(True), 1), else_=0)).label(
-                "rewatch_count"
-            ),
-            func.coalesce(
-                func.sum(analytics_rows.c.effective_runtime_seconds), 0
-            ).label("total_runtime_seconds"),
-            func.avg(analytics_rows.c.rating_value).label("average_rating_value"),
-            func.sum(
-                case((analytics_rows.c.rating_value.is_not(None), 1), else_=0)
-            ).label("rated_watch_count"),
-            func.min(analytics_rows.c.watched_at).label("first_watch_at"),
-            func.max(analytics_rows.c.watched_at).label("latest_watch_at"),
-        )
-        .group_by(analytics_rows.c.horrorfest_year)
-        .order_by(analytics_rows.c.horrorfest_year.desc())
+        select(buckets.c.horrorfest_year, *_bucket_year_summary_columns(buckets))
+        .where(buckets.c.bucket_kind == "day")
+        .group_by(buckets.c.horrorfest_year)
+        .order_by(buckets.c.horrorfest_year.desc())
     )
     rows = session.execute(statement).all()
     return [_build_analytics_summary(row) for row in rows]
@@ -434,25 +621,27 @@ def list_horrorfest_analytics_title_matrix(
     *,
     user_id: UUID | None = None,
 ) -> dict[str, object]:
-    analytics_rows = _horrorfest_analytics_base_statement(user_id=user_id).subquery()
+    buckets = _horrorfest_analytics_buckets(user_id=user_id)
     statement = (
         select(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
-            analytics_rows.c.horrorfest_year,
-            func.count().label("watch_count"),
+            buckets.c.media_item_id,
+            MediaItem.title.label("media_item_title"),
+            MediaItem.year.label("media_item_year"),
+            buckets.c.horrorfest_year,
+            func.sum(buckets.c.watch_count).label("watch_count"),
         )
+        .join(MediaItem, MediaItem.media_item_id == buckets.c.media_item_id)
+        .where(buckets.c.bucket_kind == "title")
         .group_by(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
-            analytics_rows.c.horrorfest_year,
+            buckets.c.media_item_id,
+            MediaItem.title,
+            MediaItem.year,
+            buckets.c.horrorfest_year,
         )
         .order_by(
-            analytics_rows.c.media_item_title.asc(),
-            analytics_rows.c.media_item_year.asc().nulls_last(),
-            analytics_rows.c.horrorfest_year.desc(),
+            MediaItem.title.asc(),
+            MediaItem.year.asc().nulls_last(),
+            buckets.c.horrorfest_year.desc(),
         )
     )
     rows = session.execute(statement).all()
@@ -470,19 +659,20 @@ def list_horrorfest_analytics_decade_matrix(
     *,
     user_id: UUID | None = None,
 ) -> dict[str, object]:
-    analytics_rows = _horrorfest_analytics_base_statement(user_id=user_id).subquery()
-    decade_start = cast((analytics_rows.c.media_item_year / 10), Integer) * 10
+    buckets = _horrorfest_analytics_buckets(user_id=user_id)
+    decade_start = cast((MediaItem.year / 10), Integer) * 10
     decade_label = func.concat(decade_start, "s")
     statement = (
         select(
             decade_start.label("decade_start"),
             decade_label.label("decade"),
-            analytics_rows.c.horrorfest_year,
-            func.count().label("watch_count"),
+            buckets.c.horrorfest_year,
+            func.sum(buckets.c.watch_count).label("watch_count"),
         )
-        .where(analytics_rows.c.media_item_year.is_not(None))
-        .group_by(decade_start, decade_label, analytics_rows.c.horrorfest_year)
-        .order_by(decade_start.asc(), analytics_rows.c.horrorfest_year.desc())
+        .join(MediaItem, MediaItem.media_item_id == buckets.c.media_item_id)
+        .where(buckets.c.bucket_kind == "title", MediaItem.year.is_not(None))
+        .group_by(decade_start, decade_label, buckets.c.horrorfest_year)
+        .order_by(decade_start.asc(), buckets.c.horrorfest_year.desc())
     )
     rows = session.execute(statement).all()
     years = sorted({int(row.horrorfest_year) for row in rows}, reverse=True)
@@ -505,111 +695,119 @@ def list_horrorfest_analytics_decade_matrix(
     }
 
 
-def get_horrorfest_analytics_year_detail(
+def _runtime_hours(total_runtime_seconds: int) -> Decimal:
+    return (Decimal(total_runtime_seconds) / Decimal("3600")).quantize(Decimal("0.01"))
+
+
+def _list_horrorfest_analytics_year_details(
     session: Session,
     *,
-    horrorfest_year: int,
+    horrorfest_years: list[int],
     user_id: UUID | None = None,
-) -> dict[str, object] | None:
-    analytics_rows = _horrorfest_analytics_base_statement(
-        horrorfest_year=horrorfest_year,
+) -> dict[int, dict[str, object]]:
+    """Summary, daily, source and rating breakdowns of several years at once.
+
+    One GROUPING SETS query re-aggregates the day, source and rating buckets
+    per key and per kind; the per-kind total of the day buckets is the year
+    summary, and the remaining rows are split back into sections by kind.
+    """
+    buckets = _horrorfest_analytics_buckets(
+        horrorfest_years=horrorfest_years,
         user_id=user_id,
-    ).subquery()
-    summary_statement = select(
-        analytics_rows.c.horrorfest_year,
-        func.count().label("watch_count"),
-        func.count(func.distinct(analytics_rows.c.watch_date)).label("watch_days"),
-        func.sum(case((analytics_rows.c.rewatch.is_(False), 1), else_=0)).label(
-            "new_watch_count"
-        ),
-        func.sum(case((analytics_rows.c.rewatch.is_(True), 1), else_=0)).label(
-            "rewatch_count"
-        ),
-        func.coalesce(func.sum(analytics_rows.c.effective_runtime_seconds), 0).label(
-            "total_runtime_seconds"
-        ),
-        func.avg(analytics_rows.c.rating_value).label("average_rating_value"),
-        func.sum(case((analytics_rows.c.rating_value.is_not(None), 1), else_=0)).label(
-            "rated_watch_count"
-        ),
-        func.min(analytics_rows.c.watched_at).label("first_watch_at"),
-        func.max(analytics_rows.c.watched_at).label("latest_watch_at"),
-    ).group_by(analytics_rows.c.horrorfest_year)
-    summary_row = session.execute(summary_statement).one_or_none()
-    if summary_row is None:
-        return None
-
-    daily_statement = (
-        select(
-            analytics_rows.c.watch_date,
-            func.count().label("watch_count"),
-            func.coalesce(
-                func.sum(analytics_rows.c.effective_runtime_seconds), 0
-            ).label("total_runtime_seconds"),
-            func.avg(analytics_rows.c.rating_value).label("average_rating_value"),
-        )
-        .group_by(analytics_rows.c.watch_date)
-        .order_by(analytics_rows.c.watch_date.asc())
     )
-    source_statement = (
+    year = buckets.c.horrorfest_year
+    bucket_kind = buckets.c.bucket_kind
+    watch_date = buckets.c.watch_date
+    playback_source = buckets.c.playback_source
+    rating_value = buckets.c.rating_value
+    statement = (
         select(
-            analytics_rows.c.playback_source,
-            func.count().label("watch_count"),
-            func.coalesce(
-                func.sum(analytics_rows.c.effective_runtime_seconds), 0
-            ).label("total_runtime_seconds"),
-            func.avg(analytics_rows.c.rating_value).label("average_rating_value"),
+            year,
+            bucket_kind,
+            watch_date,
+            playback_source,
+            rating_value,
+            func.grouping(watch_date, playback_source, rating_value).label(
+                "grouping_set"
+            ),
+            *_bucket_year_summary_columns(buckets),
         )
-        .group_by(analytics_rows.c.playback_source)
-        .order_by(func.count().desc(), analytics_rows.c.playback_source.asc())
-    )
-    rating_statement = (
-        select(
-            analytics_rows.c.rating_value,
-            func.count().label("watch_count"),
+        .where(bucket_kind.in_(("day", "source", "rating")))
+        .group_by(
+            func.grouping_sets(
+                tuple_(year, bucket_kind),
+                tuple_(year, bucket_kind, watch_date, playback_source, rating_value),
+            )
+        )
+        .order_by(
+            # Columns outside a row's kind are NULL, so one ordering gives days
+            # ascending, ratings descending and sources by count then name.
+            "grouping_set",
+            watch_date.asc(),
+            rating_value.desc().nulls_last(),
+            func.sum(buckets.c.watch_count).desc(),
+            playback_source.asc(),
         )
-        .where(analytics_rows.c.rating_value.is_not(None))
-        .group_by(analytics_rows.c.rating_value)
-        .order_by(analytics_rows.c.rating_value.desc())
     )
 
-    daily_rows = session.execute(daily_statement).all()
-    source_rows = session.execute(source_statement).all()
-    rating_rows = session.execute(rating_statement).all()
-    return {
-        "summary": _build_analytics_summary(summary_row),
-        "daily_rows": [
-            {
-                "watch_date": row.watch_date,
-                "watch_count": int(row.watch_count or 0),
-                "total_runtime_seconds": int(row.total_runtime_seconds or 0),
-                "total_runtime_hours": (
-                    Decimal(int(row.total_runtime_seconds or 0)) / Decimal("3600")
-                ).quantize(Decimal("0.01")),
-                "average_rating_value": row.average_rating_value,
-            }
-            for row in daily_rows
-        ],
-        "source_rows": [
-            {
-                "playback_source": row.playback_source,
-                "watch_count": int(row.watch_count or 0),
-                "total_runtime_seconds": int(row.total_runtime_seconds or 0),
-                "total_runtime_hours": (
-                    Decimal(int(row.total_runtime_seconds or 0)) / Decimal("3600")
-                ).quantize(Decimal("0.01")),
-                "average_rating_value": row.average_rating_value,
-            }
-            for row in source_rows
-        ],
-        "rating_rows": [
-            {
-                "rating_value": row.rating_value,
-                "watch_count": int(row.watch_count or 0),
+    details: dict[int, dict[str, object]] = {}
+    sections: list[object] = []
+    for row in session.execute(statement).all():
+        if row.grouping_set == 0:
+            sections.append(row)
+        elif row.bucket_kind == "day":
+            details[int(row.horrorfest_year)] = {
+                "summary": _build_analytics_summary(row),
+                "daily_rows": [],
+                "source_rows": [],
+                "rating_rows": [],
             }
-            for row in rating_rows
-        ],
-    }
+
+    for row in sections:
+        detail = details[int(row.horrorfest_year)]
+        total_runtime_seconds = int(row.total_runtime_seconds or 0)
+        if row.bucket_kind == "day":
+            detail["daily_rows"].append(
+                {
+                    "watch_date": row.watch_date,
+                    "watch_count": int(row.watch_count or 0),
+                    "total_runtime_seconds": total_runtime_seconds,
+                    "total_runtime_hours": _runtime_hours(total_runtime_seconds),
+                    "average_rating_value": row.average_rating_value,
+                }
+            )
+        elif row.bucket_kind == "source":
+            detail["source_rows"].append(
+                {
+                    "playback_source": row.playback_source,
+                    "watch_count": int(row.watch_count or 0),
+                    "total_runtime_seconds": total_runtime_seconds,
+                    "total_runtime_hours": _runtime_hours(total_runtime_seconds),
+                    "average_rating_value": row.average_rating_value,
+                }
+            )
+        elif row.rating_value is not None:
+            detail["rating_rows"].append(
+                {
+                    "rating_value": row.rating_value,
+                    "watch_count": int(row.watch_count or 0),
+                }
+            )
+
+    return details
+
+
+def get_horrorfest_analytics_year_detail(
+    session: Session,
+    *,
+    horrorfest_year: int,
+    user_id: UUID | None = None,
+) -> dict[str, object] | None:
+    return _list_horrorfest_analytics_year_details(
+        session,
+        horrorfest_years=[horrorfest_year],
+        user_id=user_id,
+    ).get(horrorfest_year)
 
 
 def get_horrorfest_analytics_comparison(
@@ -619,16 +817,13 @@ def get_horrorfest_analytics_comparison(
     right_year: int,
     user_id: UUID | None = None,
 ) -> dict[str, object] | None:
-    left_detail = get_horrorfest_analytics_year_detail(
+    details = _list_horrorfest_analytics_year_details(
         session,
-        horrorfest_year=left_year,
-        user_id=user_id,
-    )
-    right_detail = get_horrorfest_analytics_year_detail(
-        session,
-        horrorfest_year=right_year,
+        horrorfest_years=[left_year, right_year],
         user_id=user_id,
     )
+    left_detail = details.get(left_year)
+    right_detail = details.get(right_year)
     if left_detail is None or right_detail is None:
         return None
 
@@ -745,29 +940,27 @@ def list_horrorfest_analytics_highest_rated_titles(
     user_id: UUID | None = None,
     minimum_repeat_count: int = 2,
 ) -> list[dict[str, object]]:
-    analytics_rows = _horrorfest_analytics_base_statement(user_id=user_id).subquery()
+    buckets = _horrorfest_analytics_buckets(user_id=user_id)
+    total_count = func.sum(buckets.c.watch_count)
+    average_rating_value = _bucket_average_rating_expr(buckets)
     statement = (
         select(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
-            func.count().label("total_count"),
-            func.avg(analytics_rows.c.rating_value).label("average_rating_value"),
-            func.sum(
-                case((analytics_rows.c.rating_value.is_not(None), 1), else_=0)
-            ).label("rated_watch_count"),
-        )
-        .group_by(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
+            buckets.c.media_item_id,
+            MediaItem.title.label("media_item_title"),
+            MediaItem.year.label("media_item_year"),
+            total_count.label("total_count"),
+            average_rating_value.label("average_rating_value"),
+            func.sum(buckets.c.rated_count).label("rated_watch_count"),
         )
-        .having(func.count() >= minimum_repeat_count)
+        .join(MediaItem, MediaItem.media_item_id == buckets.c.media_item_id)
+        .where(buckets.c.bucket_kind == "title")
+        .group_by(buckets.c.media_item_id, MediaItem.title, MediaItem.year)
+        .having(total_count >= minimum_repeat_count)
         .order_by(
-            func.avg(analytics_rows.c.rating_value).desc().nulls_last(),
-            func.count().desc(),
-            analytics_rows.c.media_item_title.asc(),
-            analytics_rows.c.media_item_year.asc().nulls_last(),
+            average_rating_value.desc().nulls_last(),
+            total_count.desc(),
+            MediaItem.title.asc(),
+            MediaItem.year.asc().nulls_last(),
         )
     )
     rows = session.execute(statement).all()
@@ -794,30 +987,26 @@ def list_horrorfest_analytics_rewatch_leaderboard(
     *,
     user_id: UUID | None = None,
 ) -> list[dict[str, object]]:
-    analytics_rows = _horrorfest_analytics_base_statement(user_id=user_id).subquery()
+    buckets = _horrorfest_analytics_buckets(user_id=user_id)
+    total_count = func.sum(buckets.c.watch_count)
+    rewatch_count = func.sum(buckets.c.rewatch_count)
     statement = (
         select(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
-            func.count().label("total_count"),
-            func.sum(case((analytics_rows.c.rewatch.is_(True), 1), else_=0)).label(
-                "rewatch_count"
-            ),
-            func.sum(case((analytics_rows.c.rewatch.is_(False), 1), else_=0)).label(
-                "new_watch_count"
-            ),
-        )
-        .group_by(
-            analytics_rows.c.media_item_id,
-            analytics_rows.c.media_item_title,
-            analytics_rows.c.media_item_year,
+            buckets.c.media_item_id,
+            MediaItem.title.label("media_item_title"),
+            MediaItem.year.label("media_item_year"),
+            total_count.label("total_count"),
+            rewatch_count.label("rewatch_count"),
+            (total_count - rewatch_count).label("new_watch_count"),
         )
+        .join(MediaItem, MediaItem.media_item_id == buckets.c.media_item_id)
+        .where(buckets.c.bucket_kind == "title")
+        .group_by(buckets.c.media_item_id, MediaItem.title, MediaItem.year)
         .order_by(
-            func.sum(case((analytics_rows.c.rewatch.is_(True), 1), else_=0)).desc(),
-            func.count().desc(),
-            analytics_rows.c.media_item_title.asc(),
-            analytics_rows.c.media_item_year.asc().nulls_last(),
+            rewatch_count.desc(),
+            total_count.desc(),
+            MediaItem.title.asc(),
+            MediaItem.year.asc().nulls_last(),
         )
     )
     rows = session.execute(statement).all()
@@ -975,7 +1164,6 @@ def _list_horrorfest_entry_rows(
         select(HorrorfestEntry, WatchEvent, MediaItem)
         .join(WatchEvent, WatchEvent.watch_id == HorrorfestEntry.watch_id)
         .join(MediaItem, MediaItem.media_item_id == WatchEvent.media_item_id)
-        .join(User, User.user_id == WatchEvent.user_id)
     )
     if not include_removed:
         statement = statement.where(
@@ -995,10 +1183,7 @@ def _list_horrorfest_entry_rows(
             MediaItem.year < decade_start + 10,
         )
     if watch_date is not None:
-        local_watch_date = func.date(
-            func.timezone(User.timezone, WatchEvent.watched_at)
-        )
-        statement = statement.where(local_watch_date == watch_date)
+        statement = statement.where(WatchEvent.watched_local_date == watch_date)
     if playback_source is not None:
         statement = statement.where(WatchEvent.playback_source == playback_source)
     if rating_value is not None:
@@ -1148,6 +1333,38 @@ def find_horrorfest_year_for_timestamp(
     return session.scalar(statement.limit(1))
 
 
+def list_watch_ids_inside_horrorfest_windows(
+    session: Session,
+    *,
+    watch_ids: list[UUID],
+) -> list[UUID]:
+    if not watch_ids:
+        return []
+    statement = (
+        select(WatchEvent.watch_id)
+        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
+        .join(
+            HorrorfestYear,
+            and_(
+                HorrorfestYear.is_active.is_(True),
+                HorrorfestYear.window_start_at <= WatchEvent.watched_at,
+                HorrorfestYear.window_end_at >= WatchEvent.watched_at,
+            ),
+        )
+        .where(
+            WatchEvent.watch_id
+            == any_(
+                bindparam("watch_ids", watch_ids, type_=ARRAY(PGUUID(as_uuid=True)))
+            ),
+            WatchEvent.is_deleted.is_(False),
+            WatchEvent.completed.is_(True),
+            MediaItem.type == "movie",
+        )
+        .distinct()
+    )
+    return list(session.scalars(statement))
+
+
 def create_horrorfest_entry(
     session: Session,
     *,
@@ -1183,3 +1400,91 @@ def update_horrorfest_entry(
     session.flush()
     session.refresh(entry)
     return entry
+
+
+def list_horrorfest_years_by_id(
+    session: Session,
+    *,
+    horrorfest_years: list[int],
+) -> dict[int, HorrorfestYear]:
+    if not horrorfest_years:
+        return {}
+    statement = select(HorrorfestYear).where(
+        HorrorfestYear.horrorfest_year
+        == any_(bindparam("horrorfest_years", horrorfest_years, type_=ARRAY(Integer)))
+    )
+    return {row.horrorfest_year: row for row in session.scalars(statement)}
+
+
+def list_horrorfest_watch_candidates(
+    session: Session,
+    *,
+    watch_ids: list[UUID],
+) -> dict[UUID, tuple[WatchEvent, str | None]]:
+    if not watch_ids:
+        return {}
+    statement = (
+        select(WatchEvent, MediaItem.type)
+        .outerjoin(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
+        .where(
+            WatchEvent.watch_id
+            == any_(
+                bindparam("watch_ids", watch_ids, type_=ARRAY(PGUUID(as_uuid=True)))
+            )
+        )
+    )
+    return {
+        watch_event.watch_id: (watch_event, media_type)
+        for watch_event, media_type in session.execute(statement)
+    }
+
+
+def list_horrorfest_entries_for_watches(
+    session: Session,
+    *,
+    watch_ids: list[UUID],
+) -> list[HorrorfestEntry]:
+    if not watch_ids:
+        return []
+    statement = select(HorrorfestEntry).where(
+        HorrorfestEntry.watch_id
+        == any_(bindparam("watch_ids", watch_ids, type_=ARRAY(PGUUID(as_uuid=True))))
+    )
+    return list(session.scalars(statement))
+
+
+def list_active_horrorfest_entries_for_years(
+    session: Session,
+    *,
+    horrorfest_years: list[int],
+) -> list[tuple[HorrorfestEntry, datetime]]:
+    if not horrorfest_years:
+        return []
+    statement = (
+        select(HorrorfestEntry, WatchEvent.watched_at)
+        .join(WatchEvent, HorrorfestEntry.watch_id == WatchEvent.watch_id)
+        .where(
+            HorrorfestEntry.horrorfest_year
+            == any_(
+                bindparam("horrorfest_years", horrorfest_years, type_=ARRAY(Integer))
+            ),
+            HorrorfestEntry.is_removed.is_(False),
+        )
+        .order_by(
+            HorrorfestEntry.horrorfest_year.asc(),
+            HorrorfestEntry.watch_order.asc().nulls_last(),
+            HorrorfestEntry.created_at.asc(),
+            HorrorfestEntry.horrorfest_entry_id.asc(),
+        )
+    )
+    return [(entry, watched_at) for entry, watched_at in session.execute(statement)]
+
+
+def create_horrorfest_entries(
+    session: Session,
+    *,
+    entries: list[HorrorfestEntry],
+) -> list[HorrorfestEntry]:
+    session.add_all(entries)
+    session.flush()
+    return entries
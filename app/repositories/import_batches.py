@@ -1,7 +1,8 @@
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Connection, Select, func, insert, select
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import ImportBatch, ImportBatchError
@@ -12,6 +13,20 @@ def list_import_batches(session: Session, *, limit: int) -> list[ImportBatch]:
     return list(session.scalars(statement))
 
 
+def list_background_import_batches(
+    session: Session, *, statuses: Iterable[str]
+) -> list[ImportBatch]:
+    statement = (
+        select(ImportBatch)
+        .where(
+            ImportBatch.status.in_(tuple(statuses)),
+            ImportBatch.parameters.contains({"background": True}),
+        )
+        .order_by(ImportBatch.started_at)
+    )
+    return list(session.scalars(statement))
+
+
 def get_import_batch(session: Session, *, import_batch_id: UUID) -> ImportBatch | None:
     statement = select(ImportBatch).where(
         ImportBatch.import_batch_id == import_batch_id
@@ -26,12 +41,13 @@ def create_import_batch(
     source_detail: str | None,
     notes: str | None,
     parameters: dict | None = None,
+    status: str = "running",
 ) -> ImportBatch:
     batch = ImportBatch(
         source=source,
         source_detail=source_detail,
         notes=notes,
-        status="running",
+        status=status,
         parameters=parameters or {},
     )
     session.add(batch)
@@ -71,6 +87,27 @@ def finish_import_batch(
     return import_batch
 
 
+def update_import_batch_progress(
+    session: Session,
+    *,
+    import_batch: ImportBatch,
+    status: str,
+    watch_events_inserted: int,
+    errors_count: int,
+    parameters_patch: dict | None = None,
+) -> ImportBatch:
+    import_batch.status = status
+    import_batch.watch_events_inserted = watch_events_inserted
+    import_batch.errors_count = errors_count
+    if parameters_patch:
+        merged_parameters = dict(import_batch.parameters or {})
+        merged_parameters.update(parameters_patch)
+        import_batch.parameters = merged_parameters
+
+    session.flush()
+    return import_batch
+
+
 def list_import_batch_errors(
     session: Session,
     *,
@@ -111,17 +148,40 @@ def create_import_batch_error(
     return error
 
 
+def create_import_batch_errors(
+    session: Session,
+    *,
+    import_batch: ImportBatch,
+    errors: list[dict],
+) -> int:
+    session.execute(
+        insert(ImportBatchError),
+        [
+            {"import_batch_id": import_batch.import_batch_id, **error}
+            for error in errors
+        ],
+    )
+    import_batch.errors_count = (import_batch.errors_count or 0) + len(errors)
+    session.flush()
+    return len(errors)
+
+
 def get_latest_import_batch_for_source(
     session: Session,
     *,
     source: str,
     source_detail: str | None,
+    exclude_import_batch_id: UUID | None = None,
 ) -> ImportBatch | None:
     statement: Select[tuple[ImportBatch]] = select(ImportBatch).where(
         ImportBatch.source == source
     )
     if source_detail is not None:
         statement = statement.where(ImportBatch.source_detail == source_detail)
+    if exclude_import_batch_id is not None:
+        statement = statement.where(
+            ImportBatch.import_batch_id != exclude_import_batch_id
+        )
 
     statement = statement.order_by(ImportBatch.started_at.desc()).limit(1)
     return session.scalar(statement)
@@ -141,3 +201,20 @@ def get_latest_completed_import_batch_for_source(
         statement = statement.where(ImportBatch.source_detail == source_detail)
     statement = statement.order_by(ImportBatch.finished_at.desc()).limit(1)
     return session.scalar(statement)
+
+
+def _import_batch_lock_key(import_batch_id: UUID):
+    return (func.hashtext("app.import_batch"), func.hashtext(str(import_batch_id)))
+
+
+def try_lock_import_batch(connection: Connection, *, import_batch_id: UUID) -> bool:
+    statement = select(
+        func.pg_try_advisory_lock(*_import_batch_lock_key(import_batch_id))
+    )
+    return bool(connection.scalar(statement))
+
+
+def unlock_import_batch(connection: Connection, *, import_batch_id: UUID) -> None:
+    connection.execute(
+        select(func.pg_advisory_unlock(*_import_batch_lock_key(import_batch_id)))
+    )
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from sqlalchemy import Select, String, and_, case, cast, distinct, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    distinct,
+    func,
+    select,
+)
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import HorrorfestEntry, MediaItem, Show, WatchEvent
+from app.repositories.title_search import title_matches, title_rank
 
 
 def _latest_rating_subquery() -> Select:
@@ -59,6 +70,16 @@ def _horrorfest_stats_subquery() -> Select:
     )
 
 
+def _project(
+    columns: dict[str, ColumnElement], fields: frozenset[str] | None
+) -> list[ColumnElement]:
+    return [
+        column.label(name)
+        for name, column in columns.items()
+        if fields is None or name in fields
+    ]
+
+
 def list_library_movies(
     session: Session,
     *,
@@ -68,6 +89,7 @@ def list_library_movies(
     year: int | None,
     limit: int,
     offset: int,
+    fields: frozenset[str] | None = None,
 ) -> list[dict]:
     if watched is False:
         return []
@@ -75,33 +97,44 @@ def list_library_movies(
     watch_stats = _watch_stats_subquery().subquery()
     latest_rating = _latest_rating_subquery().subquery()
     horrorfest_stats = _horrorfest_stats_subquery().subquery()
+    columns = _project(
+        {
+            "media_item_id": MediaItem.media_item_id,
+            "title": MediaItem.title,
+            "year": MediaItem.year,
+            "watch_count": watch_stats.c.watch_count,
+            "latest_watched_at": watch_stats.c.latest_watched_at,
+            "latest_rating_value": latest_rating.c.rating_value,
+            "latest_rating_scale": latest_rating.c.rating_scale,
+            "enrichment_status": MediaItem.enrichment_status,
+            "horrorfest_year": horrorfest_stats.c.horrorfest_year,
+        },
+        fields,
+    )
 
+    # The rating and Horrorfest subqueries scan all watch events, so sparse
+    # fieldsets that skip their columns skip the joins as well.
     statement = (
-        select(
-            MediaItem.media_item_id,
-            MediaItem.title,
-            MediaItem.year,
-            watch_stats.c.watch_count,
-            watch_stats.c.latest_watched_at,
-            latest_rating.c.rating_value.label("latest_rating_value"),
-            latest_rating.c.rating_scale.label("latest_rating_scale"),
-            MediaItem.enrichment_status,
-            horrorfest_stats.c.horrorfest_year,
-        )
+        select(*columns)
+        .select_from(MediaItem)
         .join(watch_stats, watch_stats.c.media_item_id == MediaItem.media_item_id)
-        .outerjoin(
+    )
+    if fields is None or fields & {"latest_rating_value", "latest_rating_scale"}:
+        statement = statement.outerjoin(
             latest_rating,
             latest_rating.c.media_item_id == MediaItem.media_item_id,
         )
-        .outerjoin(
+    if fields is None or "horrorfest_year" in fields:
+        statement = statement.outerjoin(
             horrorfest_stats,
             horrorfest_stats.c.media_item_id == MediaItem.media_item_id,
         )
-        .where(MediaItem.type == "movie")
-    )
+    statement = statement.where(MediaItem.type == "movie")
 
     if query:
-        statement = statement.where(MediaItem.title.ilike(f"%{query}%"))
+        statement = statement.where(title_matches(query, MediaItem.title)).order_by(
+            title_rank(query, MediaItem.title).desc()
+        )
     if enrichment_status:
         statement = statement.where(MediaItem.enrichment_status == enrichment_status)
     if year is not None:
@@ -129,42 +162,50 @@ def list_library_episodes(
     enrichment_status: str | None,
     limit: int,
     offset: int,
+    fields: frozenset[str] | None = None,
 ) -> list[dict]:
     if watched is False:
         return []
 
     watch_stats = _watch_stats_subquery().subquery()
     horrorfest_stats = _horrorfest_stats_subquery().subquery()
+    columns = _project(
+        {
+            "media_item_id": MediaItem.media_item_id,
+            "show_id": MediaItem.show_id,
+            "show_title": Show.title,
+            "season_number": MediaItem.season_number,
+            "episode_number": MediaItem.episode_number,
+            "title": MediaItem.title,
+            "watch_count": watch_stats.c.watch_count,
+            "latest_watched_at": watch_stats.c.latest_watched_at,
+            "enrichment_status": MediaItem.enrichment_status,
+            "horrorfest_year": horrorfest_stats.c.horrorfest_year,
+        },
+        fields,
+    )
 
     statement = (
-        select(
-            MediaItem.media_item_id,
-            MediaItem.show_id,
-            Show.title.label("show_title"),
-            MediaItem.season_number,
-            MediaItem.episode_number,
-            MediaItem.title,
-            watch_stats.c.watch_count,
-            watch_stats.c.latest_watched_at,
-            MediaItem.enrichment_status,
-            horrorfest_stats.c.horrorfest_year,
-        )
+        select(*columns)
+        .select_from(MediaItem)
         .join(watch_stats, watch_stats.c.media_item_id == MediaItem.media_item_id)
         .outerjoin(Show, Show.show_id == MediaItem.show_id)
-        .outerjoin(
+    )
+    if fields is None or "horrorfest_year" in fields:
+        statement = statement.outerjoin(
             horrorfest_stats,
             horrorfest_stats.c.media_item_id == MediaItem.media_item_id,
         )
-        .where(MediaItem.type == "episode")
-    )
+    statement = statement.where(MediaItem.type == "episode")
 
     if query:
-        pattern = f"%{query}%"
         statement = statement.where(
-            (MediaItem.title.ilike(pattern)) | (Show.title.ilike(pattern))
-        )
+            title_matches(query, MediaItem.title, Show.title)
+        ).order_by(title_rank(query, MediaItem.title, Show.title).desc())
     if show_query:
-        statement = statement.where(Show.title.ilike(f"%{show_query}%"))
+        statement = statement.where(title_matches(show_query, Show.title)).order_by(
+            title_rank(show_query, Show.title).desc()
+        )
     if enrichment_status:
         statement = statement.where(MediaItem.enrichment_status == enrichment_status)
 
@@ -190,6 +231,7 @@ def list_library_shows(
     watched: bool | None,
     limit: int,
     offset: int,
+    fields: frozenset[str] | None = None,
 ) -> list[dict]:
     watched_episode_case = case(
         (WatchEvent.completed.is_(True), MediaItem.media_item_id),
@@ -208,12 +250,15 @@ def list_library_shows(
         .subquery()
     )
 
+    # The representative media item is a separate aggregate over all shows, so
+    # it is only joined when the fieldset asks for it.
+    with_media_item = fields is None or "media_item_id" in fields
+    group_by = [Show.show_id, Show.title, Show.year]
+    if with_media_item:
+        group_by.append(show_media_subquery.c.media_item_id)
     statement = (
         select(
-            Show.show_id,
-            show_media_subquery.c.media_item_id,
-            Show.title,
-            Show.year,
+            *group_by,
             func.count(distinct(MediaItem.media_item_id)).label("total_episodes"),
             func.count(distinct(watched_episode_case)).label("watched_episodes"),
         )
@@ -228,20 +273,21 @@ def list_library_shows(
                 WatchEvent.is_deleted.is_(False),
             ),
         )
-        .outerjoin(
+        .group_by(*group_by)
+        .having(func.count(distinct(watched_episode_case)) > 0)
+    )
+    if with_media_item:
+        statement = statement.outerjoin(
             show_media_subquery,
             show_media_subquery.c.show_id == Show.show_id,
         )
-        .group_by(
-            Show.show_id, show_media_subquery.c.media_item_id, Show.title, Show.year
-        )
-        .having(func.count(distinct(watched_episode_case)) > 0)
-    )
 
     if watched is False:
         return []
     if query:
-        statement = statement.where(Show.title.ilike(f"%{query}%"))
+        statement = statement.where(title_matches(query, Show.title)).order_by(
+            title_rank(query, Show.title).desc()
+        )
 
     statement = (
         statement.order_by(
@@ -260,15 +306,16 @@ def list_library_shows(
         watched_percent = (
             round((watched_episodes / total_episodes) * 100, 2) if total_episodes else 0
         )
-        payload.append(
-            {
-                "show_id": row["show_id"],
-                "media_item_id": row["media_item_id"],
-                "title": row["title"],
-                "year": row["year"],
-                "watched_episodes": watched_episodes,
-                "total_episodes": total_episodes,
-                "watched_percent": watched_percent,
-            }
-        )
+        item = {
+            "show_id": row["show_id"],
+            "media_item_id": row.get("media_item_id"),
+            "title": row["title"],
+            "year": row["year"],
+            "watched_episodes": watched_episodes,
+            "total_episodes": total_episodes,
+            "watched_percent": watched_percent,
+        }
+        if fields is not None:
+            item = {name: value for name, value in item.items() if name in fields}
+        payload.append(item)
     return payload
@@ -1,7 +1,19 @@
+from collections import defaultdict
+from collections.abc import Collection
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import case, func, or_, select
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    bindparam,
+    case,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import CollectionEntry, MediaItem, Show, WatchEvent
@@ -146,6 +158,39 @@ def find_media_item_by_external_ids(
     return None
 
 
+def list_media_items_by_external_ids(
+    session: Session,
+    *,
+    tmdb_keys: Collection[tuple[str, int]],
+    imdb_keys: Collection[tuple[str, str]],
+) -> tuple[list[MediaItem], list[MediaItem]]:
+    """Return the items matching (type, tmdb_id) keys and (type, imdb_id) keys."""
+    tmdb_ids_by_type: dict[str, list[int]] = defaultdict(list)
+    for media_type, tmdb_id in tmdb_keys:
+        tmdb_ids_by_type[media_type].append(tmdb_id)
+    imdb_ids_by_type: dict[str, list[str]] = defaultdict(list)
+    for media_type, imdb_id in imdb_keys:
+        imdb_ids_by_type[media_type].append(imdb_id)
+
+    tmdb_matches: list[MediaItem] = []
+    for media_type, tmdb_ids in tmdb_ids_by_type.items():
+        statement = select(MediaItem).where(
+            MediaItem.type == media_type,
+            MediaItem.tmdb_id
+            == any_(bindparam("tmdb_ids", tmdb_ids, type_=ARRAY(Integer))),
+        )
+        tmdb_matches.extend(session.scalars(statement))
+    imdb_matches: list[MediaItem] = []
+    for media_type, imdb_ids in imdb_ids_by_type.items():
+        statement = select(MediaItem).where(
+            MediaItem.type == media_type,
+            MediaItem.imdb_id
+            == any_(bindparam("imdb_ids", imdb_ids, type_=ARRAY(String))),
+        )
+        imdb_matches.extend(session.scalars(statement))
+    return tmdb_matches, imdb_matches
+
+
 def find_media_item_by_jellyfin_item_id(
     session: Session, *, jellyfin_item_id: str
 ) -> MediaItem | None:
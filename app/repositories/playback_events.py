@@ -18,8 +18,15 @@ def list_playback_events(
     decision_status: str | None,
     limit: int,
     offset: int,
-) -> list[PlaybackEvent]:
-    statement: Select[tuple[PlaybackEvent]] = select(PlaybackEvent)
+    fields: frozenset[str] | None = None,
+) -> list[PlaybackEvent] | list[dict]:
+    # Sparse fieldsets read plain columns, which keeps large raw payloads out of
+    # the query unless they are asked for.
+    statement: Select = (
+        select(PlaybackEvent)
+        if fields is None
+        else select(*(getattr(PlaybackEvent, name) for name in sorted(fields)))
+    )
     if user_id is not None:
         statement = statement.where(PlaybackEvent.user_id == user_id)
     if playback_source is not None:
@@ -42,6 +49,8 @@ def list_playback_events(
         .offset(offset)
         .limit(limit)
     )
+    if fields is not None:
+        return [dict(row) for row in session.execute(statement).mappings()]
     return list(session.scalars(statement))
 
 
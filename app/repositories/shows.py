@@ -1,7 +1,9 @@
+from collections.abc import Collection
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import Show
@@ -12,6 +14,18 @@ def find_show_by_tmdb_id(session: Session, *, tmdb_id: int) -> Show | None:
     return session.scalar(statement)
 
 
+def list_shows_by_tmdb_ids(
+    session: Session, *, tmdb_ids: Collection[int]
+) -> list[Show]:
+    if not tmdb_ids:
+        return []
+    statement = select(Show).where(
+        Show.tmdb_id
+        == sa.any_(sa.bindparam("tmdb_ids", list(tmdb_ids), type_=ARRAY(sa.Integer)))
+    )
+    return list(session.scalars(statement))
+
+
 def find_show_by_external_ids(
     session: Session,
     *,
@@ -1,18 +1,24 @@
+from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Integer, case, cast, func, select
+from sqlalchemy import Date, DateTime, case, cast, func, literal_column, select, union
 from sqlalchemy.orm import Session
 
 from app.db.models.entities import (
     HorrorfestEntry,
     MediaItem,
     MediaVersion,
+    StatsDailyRollup,
+    StatsMonthlyRollup,
     User,
     WatchEvent,
 )
 
 
+TIME_SERIES_GRANULARITIES = ("day", "week", "month", "year")
+
+
 def _effective_runtime_seconds_expr():
     return func.coalesce(
         WatchEvent.watch_runtime_seconds,
@@ -23,44 +29,36 @@ def _effective_runtime_seconds_expr():
     )
 
 
+def _rollup_average_rating_expr(rollup=StatsMonthlyRollup):
+    return func.sum(rollup.rating_sum) / func.nullif(func.sum(rollup.rated_count), 0)
+
+
+def _rollup_media_type_count_expr(media_type: str, rollup=StatsMonthlyRollup):
+    return func.sum(
+        case(
+            (rollup.media_type == media_type, rollup.watch_count),
+            else_=0,
+        )
+    )
+
+
 def get_summary_stats(
     session: Session,
     *,
     user_id: UUID | None,
 ) -> dict[str, object]:
-    effective_runtime_seconds = _effective_runtime_seconds_expr()
-    statement = (
-        select(
-            func.count(WatchEvent.watch_id),
-            func.sum(case((WatchEvent.completed.is_(True), 1), else_=0)),
-            func.sum(case((WatchEvent.rewatch.is_(True), 1), else_=0)),
-            func.coalesce(func.sum(effective_runtime_seconds), 0),
-            func.sum(case((MediaItem.type == "movie", 1), else_=0)),
-            func.sum(case((MediaItem.type == "episode", 1), else_=0)),
-            func.avg(WatchEvent.rating_value),
-            func.sum(
-                case(
-                    (
-                        (
-                            WatchEvent.completed.is_(True)
-                            & WatchEvent.rating_value.is_(None)
-                        ),
-                        1,
-                    ),
-                    else_=0,
-                )
-            ),
-        )
-        .select_from(WatchEvent)
-        .join(User, WatchEvent.user_id == User.user_id)
-        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
-        .outerjoin(
-            MediaVersion, WatchEvent.media_version_id == MediaVersion.media_version_id
-        )
-        .where(WatchEvent.is_deleted.is_(False))
+    statement = select(
+        func.sum(StatsMonthlyRollup.watch_count),
+        func.sum(StatsMonthlyRollup.completed_count),
+        func.sum(StatsMonthlyRollup.rewatch_count),
+        func.coalesce(func.sum(StatsMonthlyRollup.runtime_seconds), 0),
+        _rollup_media_type_count_expr("movie"),
+        _rollup_media_type_count_expr("episode"),
+        _rollup_average_rating_expr(),
+        func.sum(StatsMonthlyRollup.unrated_completed_count),
     )
     if user_id is not None:
-        statement = statement.where(WatchEvent.user_id == user_id)
+        statement = statement.where(StatsMonthlyRollup.user_id == user_id)
 
     row = session.execute(statement).one()
     total_runtime_seconds = int(row[3] or 0)
@@ -86,34 +84,25 @@ def list_monthly_stats(
     *,
     user_id: UUID | None,
 ) -> list[dict[str, object]]:
-    effective_runtime_seconds = _effective_runtime_seconds_expr()
-    local_ts = func.timezone(User.timezone, WatchEvent.watched_at)
-    local_year = cast(func.extract("year", local_ts), Integer)
-    local_month = cast(func.extract("month", local_ts), Integer)
+    local_year = StatsMonthlyRollup.local_year
+    local_month = StatsMonthlyRollup.local_month
     statement = (
         select(
-            local_year.label("year"),
-            local_month.label("month"),
-            func.count(WatchEvent.watch_id),
-            func.sum(case((MediaItem.type == "movie", 1), else_=0)),
-            func.sum(case((MediaItem.type == "episode", 1), else_=0)),
-            func.sum(case((WatchEvent.rewatch.is_(True), 1), else_=0)),
-            func.sum(case((WatchEvent.rating_value.is_not(None), 1), else_=0)),
-            func.coalesce(func.sum(effective_runtime_seconds), 0),
-            func.avg(WatchEvent.rating_value),
+            local_year,
+            local_month,
+            func.sum(StatsMonthlyRollup.watch_count),
+            _rollup_media_type_count_expr("movie"),
+            _rollup_media_type_count_expr("episode"),
+            func.sum(StatsMonthlyRollup.rewatch_count),
+            func.sum(StatsMonthlyRollup.rated_count),
+            func.coalesce(func.sum(StatsMonthlyRollup.runtime_seconds), 0),
+            _rollup_average_rating_expr(),
         )
-        .select_from(WatchEvent)
-        .join(User, WatchEvent.user_id == User.user_id)
-        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
-        .outerjoin(
-            MediaVersion, WatchEvent.media_version_id == MediaVersion.media_version_id
-        )
-        .where(WatchEvent.is_deleted.is_(False))
         .group_by(local_year, local_month)
         .order_by(local_year.desc(), local_month.desc())
     )
     if user_id is not None:
-        statement = statement.where(WatchEvent.user_id == user_id)
+        statement = statement.where(StatsMonthlyRollup.user_id == user_id)
 
     rows = session.execute(statement).all()
     payload: list[dict[str, object]] = []
@@ -135,6 +124,191 @@ def list_monthly_stats(
     return payload
 
 
+def list_rollup_user_ids(session: Session) -> list[UUID]:
+    statement = union(
+        select(WatchEvent.user_id).where(WatchEvent.is_deleted.is_(False)),
+        select(StatsMonthlyRollup.user_id),
+        select(StatsDailyRollup.user_id),
+    ).order_by("user_id")
+    return list(session.scalars(statement))
+
+
+def rebuild_monthly_rollup(session: Session, *, user_id: UUID) -> int:
+    """Recompute every rollup bucket of one user; returns the buckets refreshed.
+
+    Buckets come from the user's active watches and existing rollup rows, so
+    stale rows for months without active watches are removed as well.
+    """
+    keys = (
+        union(
+            select(
+                WatchEvent.user_id,
+                WatchEvent.watched_local_year.label("local_year"),
+                WatchEvent.watched_local_month.label("local_month"),
+            ).where(
+                WatchEvent.user_id == user_id,
+                WatchEvent.is_deleted.is_(False),
+                WatchEvent.watched_local_year.is_not(None),
+            ),
+            select(
+                StatsMonthlyRollup.user_id,
+                StatsMonthlyRollup.local_year,
+                StatsMonthlyRollup.local_month,
+            ).where(StatsMonthlyRollup.user_id == user_id),
+        )
+        .order_by("local_year", "local_month")
+        .subquery()
+    )
+    statement = select(
+        func.app.refresh_stats_monthly_rollup(
+            keys.c.user_id, keys.c.local_year, keys.c.local_month
+        )
+    )
+    return len(session.execute(statement).all())
+
+
+def rebuild_daily_rollup(session: Session, *, user_id: UUID) -> int:
+    """Daily counterpart of ``rebuild_monthly_rollup``."""
+    keys = (
+        union(
+            select(
+                WatchEvent.user_id,
+                WatchEvent.watched_local_date.label("local_date"),
+            ).where(
+                WatchEvent.user_id == user_id,
+                WatchEvent.is_deleted.is_(False),
+                WatchEvent.watched_local_date.is_not(None),
+            ),
+            select(StatsDailyRollup.user_id, StatsDailyRollup.local_date).where(
+                StatsDailyRollup.user_id == user_id
+            ),
+        )
+        .order_by("local_date")
+        .subquery()
+    )
+    statement = select(
+        func.app.refresh_stats_daily_rollup(keys.c.user_id, keys.c.local_date)
+    )
+    return len(session.execute(statement).all())
+
+
+def get_daily_rollup_date_range(
+    session: Session,
+    *,
+    user_id: UUID | None,
+    media_type: str | None,
+) -> tuple[date | None, date | None]:
+    statement = select(
+        func.min(StatsDailyRollup.local_date),
+        func.max(StatsDailyRollup.local_date),
+    )
+    if user_id is not None:
+        statement = statement.where(StatsDailyRollup.user_id == user_id)
+    if media_type is not None:
+        statement = statement.where(StatsDailyRollup.media_type == media_type)
+    first_date, last_date = session.execute(statement).one()
+    return first_date, last_date
+
+
+def list_time_series_stats(
+    session: Session,
+    *,
+    user_id: UUID | None,
+    granularity: str,
+    local_date_from: date,
+    local_date_to: date,
+    media_type: str | None,
+) -> list[dict[str, object]]:
+    """Aggregate daily rollup buckets into gap-filled periods, oldest first.
+
+    ``granularity`` must be one of ``TIME_SERIES_GRANULARITIES``; it is
+    inlined so the truncation in the select list and GROUP BY is one
+    expression. Periods are calendar-aligned (ISO weeks start on Monday), so
+    the first and last period may extend past the requested range while only
+    counting days inside it.
+    """
+    if granularity not in TIME_SERIES_GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+    unit = literal_column(f"'{granularity}'")
+    step = literal_column(f"interval '1 {granularity}'")
+
+    period_start = cast(
+        func.date_trunc(unit, cast(StatsDailyRollup.local_date, DateTime)), Date
+    )
+    buckets_statement = (
+        select(
+            period_start.label("period_start"),
+            func.sum(StatsDailyRollup.watch_count).label("watch_count"),
+            _rollup_media_type_count_expr("movie", StatsDailyRollup).label(
+                "movie_count"
+            ),
+            _rollup_media_type_count_expr("episode", StatsDailyRollup).label(
+                "episode_count"
+            ),
+            func.sum(StatsDailyRollup.rewatch_count).label("rewatch_count"),
+            func.sum(StatsDailyRollup.rated_count).label("rated_watch_count"),
+            func.sum(StatsDailyRollup.runtime_seconds).label("runtime_seconds"),
+            _rollup_average_rating_expr(StatsDailyRollup).label("average_rating"),
+        )
+        .where(
+            StatsDailyRollup.local_date >= local_date_from,
+            StatsDailyRollup.local_date <= local_date_to,
+        )
+        .group_by(period_start)
+    )
+    if user_id is not None:
+        buckets_statement = buckets_statement.where(StatsDailyRollup.user_id == user_id)
+    if media_type is not None:
+        buckets_statement = buckets_statement.where(
+            StatsDailyRollup.media_type == media_type
+        )
+    buckets = buckets_statement.subquery("buckets")
+
+    series = (
+        func.generate_series(
+            func.date_trunc(unit, cast(local_date_from, DateTime)),
+            cast(local_date_to, DateTime),
+            step,
+        )
+        .table_valued("period_start")
+        .render_derived("periods")
+    )
+    statement = (
+        select(
+            cast(series.c.period_start, Date),
+            cast(
+                series.c.period_start + step - literal_column("interval '1 day'"), Date
+            ),
+            buckets.c.watch_count,
+            buckets.c.movie_count,
+            buckets.c.episode_count,
+            buckets.c.rewatch_count,
+            buckets.c.rated_watch_count,
+            buckets.c.runtime_seconds,
+            buckets.c.average_rating,
+        )
+        .select_from(series)
+        .outerjoin(buckets, buckets.c.period_start == cast(series.c.period_start, Date))
+        .order_by(series.c.period_start)
+    )
+
+    rows = session.execute(statement).all()
+    return [
+        {
+            "period_start": row[0],
+            "period_end": row[1],
+            "watch_count": int(row[2] or 0),
+            "movie_count": int(row[3] or 0),
+            "episode_count": int(row[4] or 0),
+            "rewatch_count": int(row[5] or 0),
+            "rated_watch_count": int(row[6] or 0),
+            "total_runtime_seconds": int(row[7] or 0),
+            "average_rating_value": row[8],
+        }
+        for row in rows
+    ]
+
+
 def list_horrorfest_stats(
     session: Session,
     *,
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, Float, func, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def title_matches(
+    query: str, *columns: InstrumentedAttribute[str | None]
+) -> ColumnElement[bool]:
+    # ILIKE keeps substring semantics; the pg_trgm GIN indexes on media_item and
+    # shows titles serve it for queries of three or more characters.
+    pattern = f"%{query}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+def title_rank(
+    query: str, *columns: InstrumentedAttribute[str | None]
+) -> ColumnElement[float]:
+    scores = [
+        func.coalesce(func.similarity(column, query), 0.0, type_=Float)
+        for column in columns
+    ]
+    if len(scores) == 1:
+        return scores[0]
+    return func.greatest(*scores, type_=Float)
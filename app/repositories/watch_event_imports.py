@@ -0,0 +1,211 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    any_,
+    bindparam,
+    insert,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+from sqlalchemy.orm import Session
+
+from app.db.models.entities import WatchEvent
+
+# Session-local staging table used by the bulk import path. It lives in its own
+# metadata so Alembic never sees it, and is dropped when the transaction ends.
+_stage_metadata = MetaData()
+watch_event_import_stage = Table(
+    "watch_event_import_stage",
+    _stage_metadata,
+    Column("row_index", Integer, primary_key=True, autoincrement=False),
+    Column("watch_id", PGUUID(as_uuid=True), nullable=False),
+    Column("user_id", PGUUID(as_uuid=True), nullable=False),
+    Column("media_item_id", PGUUID(as_uuid=True), nullable=False),
+    Column("watched_at", DateTime(timezone=True), nullable=False),
+    Column("playback_source", String, nullable=False),
+    Column("total_seconds", Integer),
+    Column("watched_seconds", Integer),
+    Column("progress_percent", Numeric(5, 2)),
+    Column("completed", Boolean, nullable=False),
+    Column("rating_value", Numeric(4, 2)),
+    Column("rating_scale", String),
+    Column("media_version_id", PGUUID(as_uuid=True)),
+    Column("source_event_id", String),
+    Column("dedupe_hash", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+STAGE_COLUMNS = tuple(column.name for column in watch_event_import_stage.columns)
+
+StagedWatchEventRow = tuple[
+    int,
+    UUID,
+    UUID,
+    UUID,
+    datetime,
+    str,
+    int | None,
+    int | None,
+    Decimal | None,
+    bool,
+    Decimal | None,
+    str | None,
+    UUID | None,
+    str | None,
+    str | None,
+]
+
+
+def stage_watch_event_import_rows(
+    session: Session,
+    *,
+    rows: Iterable[StagedWatchEventRow],
+) -> None:
+    connection = session.connection()
+    watch_event_import_stage.create(bind=connection)
+    column_list = ", ".join(STAGE_COLUMNS)
+    cursor = connection.connection.cursor()
+    try:
+        with cursor.copy(
+            f"COPY {watch_event_import_stage.name} ({column_list}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row(row)
+    finally:
+        cursor.close()
+
+
+def list_staged_watch_event_matches(
+    session: Session,
+    *,
+    collision_window_seconds: int,
+) -> dict[int, tuple[UUID | None, UUID | None, UUID | None, datetime | None]]:
+    stage = watch_event_import_stage
+    collision_window = timedelta(seconds=max(0, collision_window_seconds))
+    source_match = (
+        select(WatchEvent.watch_id)
+        .where(
+            WatchEvent.playback_source == stage.c.playback_source,
+            WatchEvent.source_event_id == stage.c.source_event_id,
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    hash_match = WatchEvent.__table__.alias("hash_match")
+    # The range search only runs for rows the unique hash probe did not settle.
+    collision_match = (
+        select(WatchEvent.watch_id, WatchEvent.watched_at)
+        .where(
+            hash_match.c.watch_id.is_(None),
+            WatchEvent.user_id == stage.c.user_id,
+            WatchEvent.media_item_id == stage.c.media_item_id,
+            WatchEvent.completed == stage.c.completed,
+            WatchEvent.is_deleted.is_(False),
+            WatchEvent.watched_at >= stage.c.watched_at - collision_window,
+            WatchEvent.watched_at <= stage.c.watched_at + collision_window,
+        )
+        .order_by(WatchEvent.watched_at.desc(), WatchEvent.created_at.desc())
+        .limit(1)
+        .lateral("collision_match")
+    )
+    statement = select(
+        stage.c.row_index,
+        source_match.label("source_match_watch_id"),
+        hash_match.c.watch_id.label("hash_match_watch_id"),
+        collision_match.c.watch_id,
+        collision_match.c.watched_at,
+    ).select_from(
+        stage.outerjoin(
+            hash_match, hash_match.c.dedupe_hash == stage.c.dedupe_hash
+        ).outerjoin(collision_match, true())
+    )
+    return {
+        row_index: (
+            source_watch_id,
+            hash_watch_id,
+            collision_watch_id,
+            collision_watched_at,
+        )
+        for (
+            row_index,
+            source_watch_id,
+            hash_watch_id,
+            collision_watch_id,
+            collision_watched_at,
+        ) in session.execute(statement)
+    }
+
+
+def insert_staged_watch_events(
+    session: Session,
+    *,
+    row_indexes: Sequence[int],
+    import_batch_id: UUID,
+    origin_kind: str,
+) -> int:
+    if not row_indexes:
+        return 0
+    stage = watch_event_import_stage
+    selected_rows = (
+        select(
+            stage.c.watch_id,
+            stage.c.user_id,
+            stage.c.media_item_id,
+            stage.c.watched_at,
+            stage.c.playback_source,
+            stage.c.total_seconds,
+            stage.c.watched_seconds,
+            stage.c.progress_percent,
+            stage.c.completed,
+            stage.c.rating_value,
+            stage.c.rating_scale,
+            stage.c.media_version_id,
+            stage.c.source_event_id,
+            stage.c.dedupe_hash,
+            literal(import_batch_id, PGUUID(as_uuid=True)),
+            literal(origin_kind),
+            literal(False),
+        )
+        .where(
+            stage.c.row_index
+            == any_(bindparam("row_indexes", list(row_indexes), type_=ARRAY(Integer)))
+        )
+        .order_by(stage.c.row_index)
+    )
+    statement = insert(WatchEvent.__table__).from_select(
+        [
+            "watch_id",
+            "user_id",
+            "media_item_id",
+            "watched_at",
+            "playback_source",
+            "total_seconds",
+            "watched_seconds",
+            "progress_percent",
+            "completed",
+            "rating_value",
+            "rating_scale",
+            "media_version_id",
+            "source_event_id",
+            "dedupe_hash",
+            "import_batch_id",
+            "origin_kind",
+            "rewatch",
+        ],
+        selected_rows,
+    )
+    return session.execute(statement).rowcount
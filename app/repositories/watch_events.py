@@ -1,11 +1,30 @@
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from sqlalchemy import Select, and_, extract, func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Subquery,
+    and_,
+    any_,
+    bindparam,
+    case,
+    false,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Session
 
+from app.core.pagination import WatchEventCursor
 from app.db.models.entities import (
     HorrorfestEntry,
     MediaItem,
@@ -14,6 +33,7 @@ from app.db.models.entities import (
     User,
     WatchEvent,
 )
+from app.repositories.title_search import title_matches
 
 
 def _format_display_title(
@@ -37,6 +57,169 @@ def _format_display_title(
     return base_title
 
 
+def _before_watch_cursor(cursor: WatchEventCursor) -> ColumnElement[bool]:
+    # Spelled out instead of a row comparison so the watched_at bound stays an
+    # index condition on ix_watch_event_user_time.
+    return and_(
+        WatchEvent.watched_at <= cursor.watched_at,
+        or_(
+            WatchEvent.watched_at < cursor.watched_at,
+            WatchEvent.watch_id < cursor.watch_id,
+        ),
+    )
+
+
+_WATCH_EVENT_LIST_COLUMNS: dict[str, ColumnElement] = {
+    column.key: column
+    for column in (
+        WatchEvent.watch_id,
+        WatchEvent.user_id,
+        WatchEvent.media_item_id,
+        WatchEvent.watched_at,
+        WatchEvent.playback_source,
+        WatchEvent.total_seconds,
+        WatchEvent.watched_seconds,
+        WatchEvent.progress_percent,
+        WatchEvent.watch_version_name,
+        WatchEvent.watch_runtime_seconds,
+        WatchEvent.completed,
+        WatchEvent.rating_value,
+        WatchEvent.rating_scale,
+        WatchEvent.media_version_id,
+        WatchEvent.import_batch_id,
+        WatchEvent.origin_kind,
+        WatchEvent.origin_playback_event_id,
+        WatchEvent.created_at,
+        WatchEvent.updated_at,
+        WatchEvent.updated_by,
+        WatchEvent.update_reason,
+        WatchEvent.rewatch,
+        WatchEvent.is_deleted,
+        WatchEvent.deleted_at,
+        WatchEvent.deleted_by,
+        WatchEvent.deleted_reason,
+        WatchEvent.dedupe_hash,
+        WatchEvent.created_by,
+        WatchEvent.source_event_id,
+        HorrorfestEntry.horrorfest_year,
+        HorrorfestEntry.watch_order.label("horrorfest_watch_order"),
+        MediaItem.title.label("media_item_title"),
+        MediaItem.type.label("media_item_type"),
+        MediaItem.season_number.label("media_item_season_number"),
+        MediaItem.episode_number.label("media_item_episode_number"),
+        MediaItem.year.label("media_item_year"),
+        MediaItem.base_runtime_seconds,
+        Show.title.label("show_title"),
+        User.timezone.label("user_timezone"),
+    )
+}
+# Response fields computed from other columns, mapped to the columns they need.
+_WATCH_EVENT_LIST_DERIVED_SOURCES = {
+    "effective_runtime_seconds": (
+        "watch_runtime_seconds",
+        "total_seconds",
+        "base_runtime_seconds",
+    ),
+    "is_horrorfest_watch": ("horrorfest_year",),
+    "display_title": (
+        "media_item_type",
+        "media_item_title",
+        "media_item_year",
+        "show_title",
+        "media_item_season_number",
+        "media_item_episode_number",
+    ),
+    "watched_at_local": ("watched_at", "user_timezone"),
+}
+# The keyset cursor is built from these, so sparse fieldsets always keep them.
+_WATCH_EVENT_LIST_KEY_COLUMNS = ("watch_id", "watched_at")
+
+
+def _watch_event_list_column_names(fields: frozenset[str] | None) -> list[str]:
+    if fields is None:
+        return list(_WATCH_EVENT_LIST_COLUMNS)
+    wanted = set(_WATCH_EVENT_LIST_KEY_COLUMNS)
+    for field in fields:
+        wanted.update(_WATCH_EVENT_LIST_DERIVED_SOURCES.get(field, (field,)))
+    return [name for name in _WATCH_EVENT_LIST_COLUMNS if name in wanted]
+
+
+def _watch_event_list_statement(
+    fields: frozenset[str] | None = None, *, join_show: bool = False
+) -> Select:
+    # Plain columns rather than WatchEvent entities: list pages never need the
+    # identity map, and skipping ORM hydration is most of the per-row cost.
+    # Optional joins are only added when a selected column or filter needs them.
+    column_names = _watch_event_list_column_names(fields)
+    statement = (
+        select(*(_WATCH_EVENT_LIST_COLUMNS[name] for name in column_names))
+        .select_from(WatchEvent)
+        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
+    )
+    if "user_timezone" in column_names:
+        statement = statement.join(User, WatchEvent.user_id == User.user_id)
+    if join_show or "show_title" in column_names:
+        statement = statement.outerjoin(Show, MediaItem.show_id == Show.show_id)
+    if "horrorfest_year" in column_names or "horrorfest_watch_order" in column_names:
+        statement = statement.outerjoin(
+            HorrorfestEntry,
+            and_(
+                HorrorfestEntry.watch_id == WatchEvent.watch_id,
+                HorrorfestEntry.is_removed.is_(False),
+            ),
+        )
+    return statement
+
+
+@lru_cache(maxsize=128)
+def _user_zone(timezone_name: str) -> ZoneInfo | None:
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        return None
+
+
+def _watch_event_list_payload(
+    rows: Iterable[Row], fields: frozenset[str] | None = None
+) -> list[dict[str, object]]:
+    def wants(name: str) -> bool:
+        return fields is None or name in fields
+
+    payload: list[dict[str, object]] = []
+    for row in rows:
+        item = row._asdict()
+        item_year = item.pop("media_item_year", None)
+        base_runtime_seconds = item.pop("base_runtime_seconds", None)
+        show_title = item.pop("show_title", None)
+        if "user_timezone" in item:
+            item["user_timezone"] = item["user_timezone"] or "UTC"
+        if wants("effective_runtime_seconds"):
+            item["effective_runtime_seconds"] = (
+                item["watch_runtime_seconds"]
+                or item["total_seconds"]
+                or base_runtime_seconds
+            )
+        if wants("is_horrorfest_watch"):
+            item["is_horrorfest_watch"] = item["horrorfest_year"] is not None
+        if wants("display_title"):
+            item["display_title"] = _format_display_title(
+                item_type=item["media_item_type"],
+                item_title=item["media_item_title"],
+                item_year=item_year,
+                show_title=show_title,
+                season_number=item["media_item_season_number"],
+                episode_number=item["media_item_episode_number"],
+            )
+        if wants("watched_at_local"):
+            watched_at = item["watched_at"]
+            zone = _user_zone(item["user_timezone"])
+            item["watched_at_local"] = (
+                watched_at.astimezone(zone) if zone is not None else watched_at
+            )
+        payload.append(item)
+    return payload
+
+
 def list_watch_events(
     session: Session,
     *,
@@ -52,52 +235,10 @@ def list_watch_events(
     deleted_only: bool,
     limit: int,
     offset: int,
+    cursor: WatchEventCursor | None = None,
+    fields: frozenset[str] | None = None,
 ) -> list[dict[str, object]]:
-    statement: Select[
-        tuple[
-            WatchEvent,
-            str,
-            str,
-            int | None,
-            int | None,
-            int | None,
-            int | None,
-            str | None,
-            str,
-            int | None,
-            int | None,
-        ]
-    ] = (
-        select(
-            WatchEvent,
-            MediaItem.title,
-            MediaItem.type,
-            MediaItem.season_number,
-            MediaItem.episode_number,
-            MediaItem.year,
-            MediaItem.base_runtime_seconds,
-            Show.title,
-            User.timezone,
-            HorrorfestEntry.horrorfest_year,
-            HorrorfestEntry.watch_order,
-        )
-        .join(User, WatchEvent.user_id == User.user_id)
-        .join(
-            MediaItem,
-            WatchEvent.media_item_id == MediaItem.media_item_id,
-        )
-        .outerjoin(
-            Show,
-            MediaItem.show_id == Show.show_id,
-        )
-        .outerjoin(
-            HorrorfestEntry,
-            and_(
-                HorrorfestEntry.watch_id == WatchEvent.watch_id,
-                HorrorfestEntry.is_removed.is_(False),
-            ),
-        )
-    )
+    statement = _watch_event_list_statement(fields, join_show=query is not None)
     if media_type is not None:
         statement = statement.where(MediaItem.type == media_type)
     if deleted_only:
@@ -113,98 +254,23 @@ def list_watch_events(
         statement = statement.where(WatchEvent.watched_at >= watched_after)
     if watched_before is not None:
         statement = statement.where(WatchEvent.watched_at <= watched_before)
-    local_watch_date = func.date(func.timezone(User.timezone, WatchEvent.watched_at))
     if local_date_from is not None:
-        statement = statement.where(local_watch_date >= local_date_from)
+        statement = statement.where(WatchEvent.watched_local_date >= local_date_from)
     if local_date_to is not None:
-        statement = statement.where(local_watch_date <= local_date_to)
+        statement = statement.where(WatchEvent.watched_local_date <= local_date_to)
     if query is not None:
-        pattern = f"%{query}%"
-        statement = statement.where(
-            or_(
-                MediaItem.title.ilike(pattern),
-                Show.title.ilike(pattern),
-            )
-        )
+        # History stays chronological (the cursor depends on it), so the search
+        # only filters here instead of ranking by similarity.
+        statement = statement.where(title_matches(query, MediaItem.title, Show.title))
 
+    if cursor is not None:
+        statement = statement.where(_before_watch_cursor(cursor))
     statement = (
-        statement.order_by(WatchEvent.watched_at.desc()).offset(offset).limit(limit)
+        statement.order_by(WatchEvent.watched_at.desc(), WatchEvent.watch_id.desc())
+        .offset(offset)
+        .limit(limit)
     )
-    rows = session.execute(statement).all()
-    payload: list[dict[str, object]] = []
-    for (
-        watch_event,
-        item_title,
-        item_type,
-        season_number,
-        episode_number,
-        item_year,
-        base_runtime_seconds,
-        show_title,
-        user_timezone,
-        horrorfest_year,
-        horrorfest_watch_order,
-    ) in rows:
-        normalized_user_timezone = user_timezone or "UTC"
-        try:
-            watched_at_local = watch_event.watched_at.astimezone(
-                ZoneInfo(normalized_user_timezone)
-            )
-        except ZoneInfoNotFoundError:
-            watched_at_local = watch_event.watched_at
-        payload.append(
-            {
-                "watch_id": watch_event.watch_id,
-                "user_id": watch_event.user_id,
-                "media_item_id": watch_event.media_item_id,
-                "watched_at": watch_event.watched_at,
-                "playback_source": watch_event.playback_source,
-                "total_seconds": watch_event.total_seconds,
-                "watched_seconds": watch_event.watched_seconds,
-                "progress_percent": watch_event.progress_percent,
-                "watch_version_name": watch_event.watch_version_name,
-                "watch_runtime_seconds": watch_event.watch_runtime_seconds,
-                "effective_runtime_seconds": (
-                    watch_event.watch_runtime_seconds
-                    or watch_event.total_seconds
-                    or base_runtime_seconds
-                ),
-                "completed": watch_event.completed,
-                "rating_value": watch_event.rating_value,
-                "rating_scale": watch_event.rating_scale,
-                "media_version_id": watch_event.media_version_id,
-                "import_batch_id": watch_event.import_batch_id,
-                "origin_kind": watch_event.origin_kind,
-                "origin_playback_event_id": watch_event.origin_playback_event_id,
-                "created_at": watch_event.created_at,
-                "updated_at": watch_event.updated_at,
-                "updated_by": watch_event.updated_by,
-                "update_reason": watch_event.update_reason,
-                "rewatch": watch_event.rewatch,
-                "is_deleted": watch_event.is_deleted,
-                "deleted_at": watch_event.deleted_at,
-                "deleted_by": watch_event.deleted_by,
-                "deleted_reason": watch_event.deleted_reason,
-                "dedupe_hash": watch_event.dedupe_hash,
-                "created_by": watch_event.created_by,
-                "source_event_id": watch_event.source_event_id,
-                "media_item_title": item_title,
-                "media_item_type": item_type,
-                "media_item_season_number": season_number,
-                "media_item_episode_number": episode_number,
-                "display_title": _format_display_title(
-                    item_type=item_type,
-                    item_title=item_title,
-                    item_year=item_year,
-                    show_title=show_title,
-                    season_number=season_number,
-                    episode_number=episode_number,
-                ),
-                "watched_at_local": watched_at_local,
-                "user_timezone": normalized_user_timezone,
-            }
-        )
-    return payload
+    return _watch_event_list_payload(session.execute(statement), fields)
 
 
 def create_watch_event(
@@ -227,6 +293,7 @@ def create_watch_event(
     origin_kind: str,
     origin_playback_event_id: UUID | None,
     rewatch: bool,
+    dedupe_hash: str | None = None,
 ) -> WatchEvent:
     watch_event = WatchEvent(
         user_id=user_id,
@@ -246,6 +313,7 @@ def create_watch_event(
         source_event_id=source_event_id,
         created_by=created_by,
         rewatch=rewatch,
+        dedupe_hash=dedupe_hash,
     )
     session.add(watch_event)
     session.flush()
@@ -279,11 +347,107 @@ def get_watch_event_by_source_event(
     return session.scalar(statement)
 
 
+def get_watch_event_by_dedupe_hash(
+    session: Session,
+    *,
+    dedupe_hash: str,
+) -> WatchEvent | None:
+    statement = select(WatchEvent).where(WatchEvent.dedupe_hash == dedupe_hash)
+    return session.scalar(statement)
+
+
 def get_watch_event(session: Session, *, watch_id: UUID) -> WatchEvent | None:
     statement = select(WatchEvent).where(WatchEvent.watch_id == watch_id)
     return session.scalar(statement)
 
 
+def list_watch_events_by_ids(
+    session: Session, *, watch_ids: Sequence[UUID]
+) -> list[WatchEvent]:
+    if not watch_ids:
+        return []
+    statement = select(WatchEvent).where(
+        WatchEvent.watch_id
+        == any_(
+            bindparam(
+                "batch_watch_ids", list(watch_ids), type_=ARRAY(PGUUID(as_uuid=True))
+            )
+        )
+    )
+    return list(session.scalars(statement))
+
+
+# Labels follow the legacy_backup import row shape, so an export can be fed
+# straight back into app.scripts.import_watch_events.
+_WATCH_EVENT_EXPORT_COLUMNS = (
+    WatchEvent.watch_id,
+    WatchEvent.user_id,
+    WatchEvent.media_item_id,
+    WatchEvent.watched_at,
+    WatchEvent.playback_source.label("player"),
+    WatchEvent.source_event_id,
+    WatchEvent.completed,
+    WatchEvent.rewatch,
+    WatchEvent.total_seconds,
+    WatchEvent.watched_seconds,
+    WatchEvent.progress_percent,
+    WatchEvent.rating_value.label("rating"),
+    WatchEvent.rating_scale,
+    MediaVersion.version_name.label("media_version_name"),
+    WatchEvent.watch_version_name,
+    WatchEvent.watch_runtime_seconds,
+    WatchEvent.origin_kind,
+    WatchEvent.created_at,
+    MediaItem.type,
+    MediaItem.title,
+    MediaItem.year,
+    MediaItem.tmdb_id,
+    MediaItem.imdb_id,
+    MediaItem.tvdb_id,
+    MediaItem.season_number,
+    MediaItem.episode_number,
+    func.coalesce(MediaItem.show_tmdb_id, Show.tmdb_id).label("show_tmdb_id"),
+    Show.title.label("show_title"),
+    Show.year.label("show_year"),
+    Show.tvdb_id.label("show_tvdb_id"),
+    Show.imdb_id.label("show_imdb_id"),
+    HorrorfestEntry.horrorfest_year,
+    HorrorfestEntry.watch_order.label("horrorfest_watch_order"),
+)
+WATCH_EVENT_EXPORT_FIELDS = tuple(column.key for column in _WATCH_EVENT_EXPORT_COLUMNS)
+
+
+def iter_watch_event_export_rows(
+    session: Session,
+    *,
+    user_id: UUID | None,
+    batch_size: int,
+) -> Iterator[Sequence[Row]]:
+    """Yield active watch history oldest first, one server-side batch at a time."""
+    statement = (
+        select(*_WATCH_EVENT_EXPORT_COLUMNS)
+        .select_from(WatchEvent)
+        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
+        .outerjoin(Show, MediaItem.show_id == Show.show_id)
+        .outerjoin(
+            MediaVersion, WatchEvent.media_version_id == MediaVersion.media_version_id
+        )
+        .outerjoin(
+            HorrorfestEntry,
+            and_(
+                HorrorfestEntry.watch_id == WatchEvent.watch_id,
+                HorrorfestEntry.is_removed.is_(False),
+            ),
+        )
+        .where(WatchEvent.is_deleted.is_(False))
+        .order_by(WatchEvent.watched_at.asc(), WatchEvent.watch_id.asc())
+    )
+    if user_id is not None:
+        statement = statement.where(WatchEvent.user_id == user_id)
+    result = session.execute(statement.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+
 def find_user_watch_event_by_source_event_id(
     session: Session,
     *,
@@ -381,23 +545,128 @@ def update_watch_event(
     return watch_event
 
 
-def list_user_media_watch_events(
+def first_active_watch_event(
     session: Session,
     *,
     user_id: UUID,
     media_item_id: UUID,
-) -> list[WatchEvent]:
-    statement = (
-        select(WatchEvent)
-        .where(
-            WatchEvent.user_id == user_id,
-            WatchEvent.media_item_id == media_item_id,
+    watched_from: datetime | None = None,
+    exclude_watch_id: UUID | None = None,
+) -> WatchEvent | None:
+    # A single seek on ix_watch_event_active_user_media_time, whatever the
+    # timeline size.
+    statement = select(WatchEvent).where(
+        WatchEvent.user_id == user_id,
+        WatchEvent.media_item_id == media_item_id,
+        WatchEvent.is_deleted.is_(False),
+    )
+    if watched_from is not None:
+        statement = statement.where(WatchEvent.watched_at >= watched_from)
+    if exclude_watch_id is not None:
+        statement = statement.where(WatchEvent.watch_id != exclude_watch_id)
+    statement = statement.order_by(
+        WatchEvent.watched_at.asc(),
+        WatchEvent.created_at.asc(),
+        WatchEvent.watch_id.asc(),
+    ).limit(1)
+    return session.scalar(statement)
+
+
+def _rewatch_drift(scope: ColumnElement[bool]) -> Subquery:
+    """Watches in scope whose rewatch flag disagrees with their timeline position.
+
+    The scope must cover whole (user, media item) timelines.
+    """
+    position = func.row_number().over(
+        partition_by=(
+            WatchEvent.user_id,
+            WatchEvent.media_item_id,
+            WatchEvent.is_deleted,
+        ),
+        order_by=(WatchEvent.watched_at, WatchEvent.created_at, WatchEvent.watch_id),
+    )
+    ranked = (
+        select(
+            WatchEvent.watch_id,
+            WatchEvent.rewatch,
+            case((WatchEvent.is_deleted.is_(True), false()), else_=position > 1).label(
+                "desired_rewatch"
+            ),
         )
-        .order_by(WatchEvent.watched_at.asc(), WatchEvent.created_at.asc())
+        .where(scope)
+        .subquery()
+    )
+    return (
+        select(ranked.c.watch_id, ranked.c.desired_rewatch)
+        .where(ranked.c.rewatch.is_distinct_from(ranked.c.desired_rewatch))
+        .subquery()
+    )
+
+
+def _apply_rewatch_drift(session: Session, drift: Subquery, *, dry_run: bool) -> int:
+    if dry_run:
+        return session.scalar(select(func.count()).select_from(drift)) or 0
+    result = session.execute(
+        update(WatchEvent)
+        .where(WatchEvent.watch_id == drift.c.watch_id)
+        .values(rewatch=drift.c.desired_rewatch)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def recompute_rewatch_flags(
+    session: Session,
+    *,
+    timelines: Sequence[tuple[UUID, UUID]],
+) -> int:
+    """Set-based equivalent of the service's per-timeline rewatch recompute."""
+    if not timelines:
+        return 0
+    timeline_scope = select(
+        func.unnest(
+            bindparam(
+                "timeline_user_ids",
+                [user_id for user_id, _media_item_id in timelines],
+                type_=ARRAY(PGUUID(as_uuid=True)),
+            )
+        ),
+        func.unnest(
+            bindparam(
+                "timeline_media_item_ids",
+                [media_item_id for _user_id, media_item_id in timelines],
+                type_=ARRAY(PGUUID(as_uuid=True)),
+            )
+        ),
     )
+    in_scope = tuple_(WatchEvent.user_id, WatchEvent.media_item_id).in_(timeline_scope)
+    return _apply_rewatch_drift(session, _rewatch_drift(in_scope), dry_run=False)
+
+
+def list_watch_event_user_ids(session: Session) -> list[UUID]:
+    statement = select(WatchEvent.user_id).distinct().order_by(WatchEvent.user_id)
     return list(session.scalars(statement))
 
 
+def recompute_rewatch_flags_for_users(
+    session: Session,
+    *,
+    user_ids: Sequence[UUID],
+    dry_run: bool = False,
+) -> int:
+    """Recompute every timeline of the given users; dry runs only count changes."""
+    if not user_ids:
+        return 0
+    in_scope = WatchEvent.user_id == any_(
+        bindparam(
+            "rewatch_user_ids",
+            list(user_ids),
+            type_=ARRAY(PGUUID(as_uuid=True)),
+        )
+    )
+    return _apply_rewatch_drift(session, _rewatch_drift(in_scope), dry_run=dry_run)
+
+
 def list_user_movie_watch_events_by_tmdb_and_local_date(
     session: Session,
     *,
@@ -405,17 +674,15 @@ def list_user_movie_watch_events_by_tmdb_and_local_date(
     tmdb_id: int,
     local_date: date,
 ) -> list[WatchEvent]:
-    local_watch_date = func.date(func.timezone(User.timezone, WatchEvent.watched_at))
     statement = (
         select(WatchEvent)
-        .join(User, WatchEvent.user_id == User.user_id)
         .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
         .where(
             WatchEvent.user_id == user_id,
             WatchEvent.is_deleted.is_(False),
             MediaItem.type == "movie",
             MediaItem.tmdb_id == tmdb_id,
-            local_watch_date == local_date,
+            WatchEvent.watched_local_date == local_date,
         )
         .order_by(WatchEvent.watched_at.asc(), WatchEvent.created_at.asc())
     )
@@ -429,19 +696,15 @@ def list_user_movie_watch_events_by_tmdb_and_local_year(
     tmdb_id: int,
     local_year: int,
 ) -> list[WatchEvent]:
-    local_watch_year = extract(
-        "year", func.timezone(User.timezone, WatchEvent.watched_at)
-    )
     statement = (
         select(WatchEvent)
-        .join(User, WatchEvent.user_id == User.user_id)
         .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
         .where(
             WatchEvent.user_id == user_id,
             WatchEvent.is_deleted.is_(False),
             MediaItem.type == "movie",
             MediaItem.tmdb_id == tmdb_id,
-            local_watch_year == local_year,
+            WatchEvent.watched_local_year == local_year,
         )
         .order_by(WatchEvent.watched_at.asc(), WatchEvent.created_at.asc())
     )
@@ -454,18 +717,14 @@ def list_user_movie_watch_events_by_local_year(
     user_id: UUID,
     local_year: int,
 ) -> list[WatchEvent]:
-    local_watch_year = extract(
-        "year", func.timezone(User.timezone, WatchEvent.watched_at)
-    )
     statement = (
         select(WatchEvent)
-        .join(User, WatchEvent.user_id == User.user_id)
         .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
         .where(
             WatchEvent.user_id == user_id,
             WatchEvent.is_deleted.is_(False),
             MediaItem.type == "movie",
-            local_watch_year == local_year,
+            WatchEvent.watched_local_year == local_year,
         )
         .order_by(WatchEvent.watched_at.asc(), WatchEvent.created_at.asc())
     )
@@ -478,117 +737,21 @@ def list_unrated_watch_events(
     user_id: UUID | None,
     limit: int,
     offset: int,
+    cursor: WatchEventCursor | None = None,
+    fields: frozenset[str] | None = None,
 ) -> list[dict[str, object]]:
-    statement = (
-        select(
-            WatchEvent,
-            MediaItem.title,
-            MediaItem.type,
-            MediaItem.season_number,
-            MediaItem.episode_number,
-            MediaItem.year,
-            MediaItem.base_runtime_seconds,
-            Show.title,
-            User.timezone,
-            HorrorfestEntry.horrorfest_year,
-            HorrorfestEntry.watch_order,
-        )
-        .join(User, WatchEvent.user_id == User.user_id)
-        .join(MediaItem, WatchEvent.media_item_id == MediaItem.media_item_id)
-        .outerjoin(Show, MediaItem.show_id == Show.show_id)
-        .outerjoin(
-            HorrorfestEntry,
-            and_(
-                HorrorfestEntry.watch_id == WatchEvent.watch_id,
-                HorrorfestEntry.is_removed.is_(False),
-            ),
-        )
-        .where(
-            WatchEvent.completed.is_(True),
-            WatchEvent.rating_value.is_(None),
-            WatchEvent.is_deleted.is_(False),
-        )
+    statement = _watch_event_list_statement(fields).where(
+        WatchEvent.completed.is_(True),
+        WatchEvent.rating_value.is_(None),
+        WatchEvent.is_deleted.is_(False),
     )
     if user_id is not None:
         statement = statement.where(WatchEvent.user_id == user_id)
+    if cursor is not None:
+        statement = statement.where(_before_watch_cursor(cursor))
     statement = (
-        statement.order_by(WatchEvent.watched_at.desc()).offset(offset).limit(limit)
+        statement.order_by(WatchEvent.watched_at.desc(), WatchEvent.watch_id.desc())
+        .offset(offset)
+        .limit(limit)
     )
-    rows = session.execute(statement).all()
-    payload: list[dict[str, object]] = []
-    for (
-        watch_event,
-        item_title,
-        item_type,
-        season_number,
-        episode_number,
-        item_year,
-        base_runtime_seconds,
-        show_title,
-        user_timezone,
-        horrorfest_year,
-        horrorfest_watch_order,
-    ) in rows:
-        normalized_user_timezone = user_timezone or "UTC"
-        try:
-            watched_at_local = watch_event.watched_at.astimezone(
-                ZoneInfo(normalized_user_timezone)
-            )
-        except ZoneInfoNotFoundError:
-            watched_at_local = watch_event.watched_at
-        payload.append(
-            {
-                "watch_id": watch_event.watch_id,
-                "user_id": watch_event.user_id,
-                "media_item_id": watch_event.media_item_id,
-                "watched_at": watch_event.watched_at,
-                "playback_source": watch_event.playback_source,
-                "total_seconds": watch_event.total_seconds,
-                "watched_seconds": watch_event.watched_seconds,
-                "progress_percent": watch_event.progress_percent,
-                "watch_version_name": watch_event.watch_version_name,
-                "watch_runtime_seconds": watch_event.watch_runtime_seconds,
-                "effective_runtime_seconds": (
-                    watch_event.watch_runtime_seconds
-                    or watch_event.total_seconds
-                    or base_runtime_seconds
-                ),
-                "completed": watch_event.completed,
-                "rating_value": watch_event.rating_value,
-                "rating_scale": watch_event.rating_scale,
-                "media_version_id": watch_event.media_version_id,
-                "import_batch_id": watch_event.import_batch_id,
-                "origin_kind": watch_event.origin_kind,
-                "origin_playback_event_id": watch_event.origin_playback_event_id,
-                "created_at": watch_event.created_at,
-                "updated_at": watch_event.updated_at,
-                "updated_by": watch_event.updated_by,
-                "update_reason": watch_event.update_reason,
-                "rewatch": watch_event.rewatch,
-                "is_deleted": watch_event.is_deleted,
-                "deleted_at": watch_event.deleted_at,
-                "deleted_by": watch_event.deleted_by,
-                "deleted_reason": watch_event.deleted_reason,
-                "dedupe_hash": watch_event.dedupe_hash,
-                "created_by": watch_event.created_by,
-                "source_event_id": watch_event.source_event_id,
-                "horrorfest_year": horrorfest_year,
-                "horrorfest_watch_order": horrorfest_watch_order,
-                "is_horrorfest_watch": horrorfest_year is not None,
-                "media_item_title": item_title,
-                "media_item_type": item_type,
-                "media_item_season_number": season_number,
-                "media_item_episode_number": episode_number,
-                "display_title": _format_display_title(
-                    item_type=item_type,
-                    item_title=item_title,
-                    item_year=item_year,
-                    show_title=show_title,
-                    season_number=season_number,
-                    episode_number=episode_number,
-                ),
-                "watched_at_local": watched_at_local,
-                "user_timezone": normalized_user_timezone,
-            }
-        )
-    return payload
+    return _watch_event_list_payload(session.execute(statement), fields)
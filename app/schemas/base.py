@@ -1,16 +1,43 @@
 from datetime import datetime
+from functools import cache
+from typing import Any, get_args
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 from app.core.datetime_utils import to_utc_z_string
 
 
+def _may_hold_datetime(annotation: object) -> bool:
+    if annotation in (datetime, Any, object):
+        return True
+    return any(_may_hold_datetime(arg) for arg in get_args(annotation))
+
+
+@cache
+def _datetime_field_names(model: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(
+        name
+        for name, field in model.model_fields.items()
+        if _may_hold_datetime(field.annotation)
+    )
+
+
 class KlugBaseModel(BaseModel):
-    @field_serializer("*", when_used="json", check_fields=False)
-    def _serialize_datetimes(self, value: object) -> object:
-        if isinstance(value, datetime):
-            return to_utc_z_string(value)
-        return value
+    # One wrap per model over the fields that can hold datetimes, instead of a
+    # per-field hook on every field: list pages serialize thousands of fields.
+    @model_serializer(mode="wrap", when_used="json")
+    def _serialize_datetimes(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        for name in _datetime_field_names(type(self)):
+            value = getattr(self, name)
+            if isinstance(value, datetime) and name in data:
+                data[name] = to_utc_z_string(value)
+        return data
 
 
 class KlugORMModel(KlugBaseModel):
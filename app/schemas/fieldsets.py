@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+from functools import lru_cache
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from app.schemas.base import KlugORMModel
+
+
+def parse_fieldset(raw: str | None, model: type[BaseModel]) -> frozenset[str] | None:
+    """Parse a comma-separated ``fields`` query value against ``model``."""
+    if raw is None:
+        return None
+    names = {part.strip() for part in raw.split(",") if part.strip()}
+    if not names:
+        raise ValueError("fields must name at least one field")
+    unknown = sorted(names - model.model_fields.keys())
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return frozenset(names)
+
+
+@lru_cache(maxsize=128)
+def fieldset_list_adapter(
+    model: type[BaseModel], fields: frozenset[str]
+) -> TypeAdapter[list[BaseModel]]:
+    fieldset_model = create_model(
+        f"{model.__name__}Fieldset",
+        __base__=KlugORMModel,
+        **{
+            name: (field.annotation, field)
+            for name, field in model.model_fields.items()
+            if name in fields
+        },
+    )
+    return TypeAdapter(list[fieldset_model])
+
+
+def encode_fieldset_list(
+    model: type[BaseModel], rows: Sequence[object], fields: frozenset[str]
+) -> bytes:
+    adapter = fieldset_list_adapter(model, fields)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
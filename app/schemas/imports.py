@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from uuid import UUID
@@ -29,7 +30,7 @@ class ImportedWatchEvent(KlugBaseModel):
     horrorfest_watch_order: int | None = Field(default=None, ge=1)
 
 
-class WatchEventImportRequest(KlugBaseModel):
+class WatchEventImportOptions(KlugBaseModel):
     source: str = Field(min_length=1, max_length=100)
     mode: ImportMode
     dry_run: bool = False
@@ -39,6 +40,13 @@ class WatchEventImportRequest(KlugBaseModel):
     rejected_before_import: int = Field(default=0, ge=0)
     media_items_created: int = Field(default=0, ge=0)
     shows_created: int = Field(default=0, ge=0)
+    bulk: bool = False
+    aggregate_skips: bool = False
+    commit_every: int | None = Field(default=None, ge=1)
+    resume_import_batch_id: UUID | None = None
+
+
+class WatchEventImportRequest(WatchEventImportOptions):
     events: list[ImportedWatchEvent] = Field(min_length=1)
 
 
@@ -74,7 +82,7 @@ class LegacySourceWatchEventRow(KlugBaseModel):
     horrorfest_watch_order: int | None = Field(default=None, ge=1)
 
 
-class LegacySourceWatchEventImportRequest(KlugBaseModel):
+class LegacySourceWatchEventImportOptions(KlugBaseModel):
     mode: ImportMode
     dry_run: bool = False
     resume_from_latest: bool = False
@@ -83,4 +91,28 @@ class LegacySourceWatchEventImportRequest(KlugBaseModel):
     rejected_before_import: int = Field(default=0, ge=0)
     media_items_created: int = Field(default=0, ge=0)
     shows_created: int = Field(default=0, ge=0)
+    bulk: bool = False
+    aggregate_skips: bool = False
+    commit_every: int | None = Field(default=None, ge=1)
+    resume_import_batch_id: UUID | None = None
+
+
+class LegacySourceWatchEventImportRequest(LegacySourceWatchEventImportOptions):
     rows: list[LegacySourceWatchEventRow] = Field(min_length=1)
+
+
+class ImportJobRead(KlugBaseModel):
+    job_id: UUID
+    status: str
+    source: str
+    source_detail: str | None
+    started_at: datetime
+    finished_at: datetime | None
+    processed_count: int = 0
+    total_count: int | None = None
+    inserted_count: int = 0
+    skipped_count: int = 0
+    error_count: int = 0
+    eta_seconds: float | None = None
+    progress_updated_at: datetime | None = None
+    error: str | None = None
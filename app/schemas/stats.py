@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
@@ -42,3 +42,24 @@ class StatsHorrorfestRead(KlugORMModel):
     rewatch_count: int
     first_watch_at: datetime | None = None
     latest_watch_at: datetime | None = None
+
+
+class StatsTimeSeriesPointRead(KlugORMModel):
+    period_start: date
+    period_end: date
+    watch_count: int
+    movie_count: int
+    episode_count: int
+    rewatch_count: int
+    rated_watch_count: int
+    total_runtime_seconds: int
+    average_rating_value: Decimal | None = None
+
+
+class StatsTimeSeriesRead(KlugORMModel):
+    user_id: UUID | None = None
+    granularity: str
+    media_type: str | None = None
+    local_date_from: date | None = None
+    local_date_to: date | None = None
+    points: list[StatsTimeSeriesPointRead]
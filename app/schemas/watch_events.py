@@ -1,8 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
-from pydantic import AwareDatetime, Field
+from pydantic import AwareDatetime, Field, TypeAdapter
 from pydantic import model_validator
 
 from app.schemas.base import KlugBaseModel, KlugORMModel
@@ -118,6 +119,10 @@ class WatchEventListRead(WatchEventRead):
     user_timezone: str | None = None
 
 
+# Built once: list endpoints validate and encode whole pages in a single pass.
+WatchEventListAdapter = TypeAdapter(list[WatchEventListRead])
+
+
 class WatchEventDelete(KlugBaseModel):
     updated_by: str = Field(min_length=1, max_length=100)
     update_reason: str | None = Field(default=None, max_length=500)
@@ -143,6 +148,36 @@ class WatchEventRate(KlugBaseModel):
     rating_value: int = Field(ge=1, le=10)
 
 
+class WatchEventOperationRequest(KlugBaseModel):
+    action: Literal["delete", "restore", "correct", "rate"]
+    watch_id: UUID
+    watched_at: AwareDatetime | None = None
+    media_item_id: UUID | None = None
+    completed: bool | None = None
+    rewatch: bool | None = None
+    rating_value: int | None = Field(default=None, ge=1, le=10)
+
+
+class WatchEventBatchRequest(KlugBaseModel):
+    updated_by: str = Field(min_length=1, max_length=100)
+    update_reason: str | None = Field(default=None, max_length=500)
+    operations: list[WatchEventOperationRequest] = Field(min_length=1, max_length=500)
+
+
+class WatchEventOperationResultRead(KlugBaseModel):
+    action: str
+    watch_id: UUID
+    status: Literal["applied", "rejected"]
+    error: str | None = None
+    watch_event: WatchEventRead | None = None
+
+
+class WatchEventBatchRead(KlugBaseModel):
+    applied_count: int
+    rejected_count: int
+    results: list[WatchEventOperationResultRead]
+
+
 class WatchEventVersionOverride(KlugBaseModel):
     updated_by: str = Field(min_length=1, max_length=100)
     update_reason: str | None = Field(default=None, max_length=500)
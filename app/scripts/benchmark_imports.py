@@ -0,0 +1,582 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, event, exists, select
+
+from app.core.config import get_settings
+from app.db.models.entities import (
+    HorrorfestEntry,
+    HorrorfestYear,
+    ImportBatch,
+    MediaItem,
+    Show,
+    User,
+    WatchEvent,
+)
+from app.db.session import SessionLocal, engine
+from app.scripts import import_watch_events
+from app.scripts.generate_import_dataset import (
+    DEFAULT_ID_BASE,
+    DatasetSpec,
+    write_dataset,
+)
+from app.services.horrorfest import HorrorfestService
+from app.services.users import UserService
+
+IMPORT_PHASES = ("cli", "upload")
+PHASE_ID_STRIDE = 10_000_000
+
+
+@dataclass(frozen=True)
+class PhaseResult:
+    phase: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+    peak_rss_mb: float
+    query_count: int
+    inserted_count: int | None = None
+    skipped_count: int | None = None
+    error_count: int | None = None
+
+
+class _QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *_args: Any) -> None:
+        self.count += 1
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark watch-event imports through the CLI and the upload endpoint "
+            "against the configured database. The run writes synthetic users, "
+            "watches, media items and Horrorfest year configs, and deletes them "
+            "when it finishes; point DATABASE_URL at a scratch database."
+        )
+    )
+    parser.add_argument(
+        "--confirm-database-writes",
+        action="store_true",
+        help="Required: confirm the run may write to the configured database",
+    )
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Leave the run's synthetic users, media items and years in place",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=10_000, help="Synthetic watch rows per phase"
+    )
+    parser.add_argument(
+        "--format", choices=["json", "csv"], default="json", help="Dataset format"
+    )
+    parser.add_argument(
+        "--phases",
+        nargs="+",
+        choices=IMPORT_PHASES,
+        default=list(IMPORT_PHASES),
+        help="Import paths to benchmark",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Use the set-based bulk engine instead of row by row",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=None,
+        help="Commit and checkpoint the import batch every N rows",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Dataset random seed")
+    parser.add_argument(
+        "--id-base",
+        type=int,
+        default=DEFAULT_ID_BASE,
+        help="First synthetic TMDB id; each phase gets its own id range",
+    )
+    parser.add_argument(
+        "--run-tag",
+        default=None,
+        help="Label for generated users and source ids (default: current UTC time)",
+    )
+    parser.add_argument(
+        "--work-dir",
+        default="benchmark-data",
+        help="Directory for generated datasets",
+    )
+    parser.add_argument(
+        "--keep-datasets",
+        action="store_true",
+        help="Keep generated dataset files after each phase",
+    )
+    parser.add_argument(
+        "--output", default=None, help="Optional path to write results as JSON"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Results JSON from an earlier run to compare against",
+    )
+    parser.add_argument(
+        "--max-regression-percent",
+        type=float,
+        default=20.0,
+        help="Allowed slowdown, query growth or RSS growth against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes; macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _phase_result(
+    phase: str,
+    *,
+    rows: int,
+    started: float,
+    query_count: int,
+    counts: dict[str, int] | None = None,
+) -> PhaseResult:
+    seconds = time.perf_counter() - started
+    return PhaseResult(
+        phase=phase,
+        rows=rows,
+        seconds=round(seconds, 3),
+        rows_per_second=round(rows / seconds, 1) if seconds > 0 else 0.0,
+        peak_rss_mb=_peak_rss_mb(),
+        query_count=query_count,
+        **(counts or {}),
+    )
+
+
+def _generate_phase(
+    *, phase: str, spec: DatasetSpec, path: Path, file_format: str
+) -> PhaseResult:
+    started = time.perf_counter()
+    written = write_dataset(spec, path, file_format=file_format)
+    return _phase_result(phase, rows=written, started=started, query_count=0)
+
+
+def _import_phase(
+    *,
+    phase: str,
+    import_path: str,
+    rows: int,
+    dataset_path: Path,
+    file_format: str,
+    user_id: str,
+    bulk: bool,
+    commit_every: int | None,
+) -> PhaseResult:
+    counter = _QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    started = time.perf_counter()
+    if import_path == "cli":
+        counts = _run_cli_import(
+            dataset_path=dataset_path,
+            file_format=file_format,
+            user_id=user_id,
+            bulk=bulk,
+            commit_every=commit_every,
+        )
+    else:
+        counts = _run_upload_import(
+            dataset_path=dataset_path,
+            file_format=file_format,
+            user_id=user_id,
+            bulk=bulk,
+            commit_every=commit_every,
+        )
+    return _phase_result(
+        phase,
+        rows=rows,
+        started=started,
+        query_count=counter.count,
+        counts=counts,
+    )
+
+
+def _run_cli_import(
+    *,
+    dataset_path: Path,
+    file_format: str,
+    user_id: str,
+    bulk: bool,
+    commit_every: int | None,
+) -> dict[str, int]:
+    argv = [
+        "--input",
+        str(dataset_path),
+        "--format",
+        file_format,
+        "--input-schema",
+        "legacy_backup",
+        "--user-id",
+        user_id,
+        "--mode",
+        "bootstrap",
+    ]
+    if bulk:
+        argv.append("--bulk")
+    if commit_every is not None:
+        argv.extend(["--commit-every", str(commit_every)])
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        exit_code = import_watch_events.run(argv)
+    if exit_code != 0:
+        raise RuntimeError(
+            f"import_watch_events exited with {exit_code}: {output.getvalue().strip()}"
+        )
+
+    summary = {}
+    for line in output.getvalue().splitlines():
+        key, separator, value = line.strip().partition(": ")
+        if separator:
+            summary[key] = value
+    return {
+        "inserted_count": int(summary["inserted"]),
+        "skipped_count": int(summary["skipped"]),
+        "error_count": int(summary["errors"]),
+    }
+
+
+def _run_upload_import(
+    *,
+    dataset_path: Path,
+    file_format: str,
+    user_id: str,
+    bulk: bool,
+    commit_every: int | None,
+) -> dict[str, int]:
+    from fastapi.testclient import TestClient
+
+    from app.core.config import get_settings
+    from app.main import app
+
+    settings = get_settings()
+    # Large synthetic files would otherwise trip the upload size guard.
+    upload_max_mb = dataset_path.stat().st_size // (1024 * 1024) + 1
+    app.dependency_overrides[get_settings] = lambda: settings.model_copy(
+        update={
+            "klug_import_upload_max_mb": max(
+                settings.klug_import_upload_max_mb, upload_max_mb
+            )
+        }
+    )
+    headers = {"X-API-Key": settings.klug_api_key} if settings.klug_api_key else {}
+    data = {
+        "input_schema": "legacy_backup",
+        "file_format": file_format,
+        "user_id": user_id,
+        "mode": "bootstrap",
+        "bulk": str(bulk).lower(),
+    }
+    if commit_every is not None:
+        data["commit_every"] = str(commit_every)
+
+    with TestClient(app) as client, dataset_path.open("rb") as input_file:
+        response = client.post(
+            f"{settings.api_v1_prefix}/imports/watch-events/legacy-source/upload",
+            files={"input_file": (dataset_path.name, input_file)},
+            data=data,
+            headers=headers,
+        )
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Upload import returned {response.status_code}: {response.text}"
+        )
+    payload = response.json()
+    return {
+        "inserted_count": payload["inserted_count"],
+        "skipped_count": payload["skipped_count"],
+        "error_count": payload["error_count"],
+    }
+
+
+def _run_isolated(function, /, **kwargs: Any) -> PhaseResult:
+    # A fresh interpreter per phase keeps peak RSS and query counts per phase.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(function, **kwargs).result()
+
+
+def _ensure_horrorfest_years(years: list[int], *, created: list[int]) -> None:
+    session = SessionLocal()
+    try:
+        configured = {
+            row["horrorfest_year"] for row in HorrorfestService.list_years(session)
+        }
+        for year in years:
+            if year in configured:
+                continue
+            HorrorfestService.upsert_year_config(
+                session,
+                horrorfest_year=year,
+                window_start_at=datetime(year, 10, 1, tzinfo=UTC),
+                window_end_at=datetime(year, 11, 1, tzinfo=UTC) - timedelta(seconds=1),
+                label=None,
+                notes="Created by the import benchmark",
+                is_active=True,
+            )
+            created.append(year)
+    finally:
+        session.close()
+
+
+def _create_benchmark_user(username: str) -> str:
+    session = SessionLocal()
+    try:
+        return str(UserService.create_user(session, username).user_id)
+    finally:
+        session.close()
+
+
+def _delete_benchmark_data(
+    *,
+    user_ids: list[str],
+    tmdb_id_range: tuple[int, int],
+    horrorfest_years: list[int],
+) -> None:
+    """Delete what a run created, so stats and analytics stop counting it.
+
+    Deleting the users cascades to their watches, Horrorfest entries and
+    rollups. Media items, shows and year configs are only removed once nothing
+    else references them.
+    """
+    first_tmdb_id, end_tmdb_id = tmdb_id_range
+    user_uuids = [UUID(user_id) for user_id in user_ids]
+    session = SessionLocal()
+    try:
+        import_batch_ids = list(
+            session.scalars(
+                select(WatchEvent.import_batch_id)
+                .where(
+                    WatchEvent.user_id.in_(user_uuids),
+                    WatchEvent.import_batch_id.is_not(None),
+                )
+                .distinct()
+            )
+        )
+        session.execute(delete(User).where(User.user_id.in_(user_uuids)))
+        session.execute(
+            delete(MediaItem).where(
+                MediaItem.tmdb_id >= first_tmdb_id,
+                MediaItem.tmdb_id < end_tmdb_id,
+                ~exists().where(WatchEvent.media_item_id == MediaItem.media_item_id),
+            )
+        )
+        session.execute(
+            delete(Show).where(
+                Show.tmdb_id >= first_tmdb_id,
+                Show.tmdb_id < end_tmdb_id,
+                ~exists().where(MediaItem.show_id == Show.show_id),
+            )
+        )
+        session.execute(
+            delete(HorrorfestYear).where(
+                HorrorfestYear.horrorfest_year.in_(horrorfest_years),
+                ~exists().where(
+                    HorrorfestEntry.horrorfest_year == HorrorfestYear.horrorfest_year
+                ),
+            )
+        )
+        session.execute(
+            delete(ImportBatch).where(ImportBatch.import_batch_id.in_(import_batch_ids))
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def _find_regressions(
+    results: list[PhaseResult],
+    baseline: dict[str, Any],
+    *,
+    max_regression_percent: float,
+) -> list[str]:
+    tolerance = max_regression_percent / 100
+    baseline_phases = {phase["phase"]: phase for phase in baseline.get("phases", [])}
+    regressions: list[str] = []
+    for result in results:
+        previous = baseline_phases.get(result.phase)
+        if previous is None or previous["rows"] != result.rows:
+            continue
+        if result.rows_per_second < previous["rows_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result.phase}: rows/sec {previous['rows_per_second']} -> "
+                f"{result.rows_per_second}"
+            )
+        if result.query_count > previous["query_count"] * (1 + tolerance):
+            regressions.append(
+                f"{result.phase}: queries {previous['query_count']} -> "
+                f"{result.query_count}"
+            )
+        if result.peak_rss_mb > previous["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result.phase}: peak RSS MB {previous['peak_rss_mb']} -> "
+                f"{result.peak_rss_mb}"
+            )
+    return regressions
+
+
+def _print_results(results: list[PhaseResult]) -> None:
+    print(
+        f"{'phase':<16} {'rows':>9} {'seconds':>9} {'rows/sec':>10} "
+        f"{'peak_rss_mb':>12} {'queries':>9} {'inserted':>9}"
+    )
+    for result in results:
+        inserted = "" if result.inserted_count is None else result.inserted_count
+        print(
+            f"{result.phase:<16} {result.rows:>9} {result.seconds:>9.2f} "
+            f"{result.rows_per_second:>10.1f} {result.peak_rss_mb:>12.1f} "
+            f"{result.query_count:>9} {inserted:>9}"
+        )
+
+
+def run(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.rows <= 0:
+        print("--rows must be greater than zero")
+        return 2
+    if args.commit_every is not None and args.commit_every <= 0:
+        print("--commit-every must be greater than zero")
+        return 2
+
+    settings = get_settings()
+    database = engine.url.render_as_string(hide_password=True)
+    if settings.app_env == "prod":
+        print(f"Refusing to benchmark against a prod database: {database}")
+        return 2
+    if not args.confirm_database_writes:
+        print(
+            f"The benchmark writes synthetic data to {database}; "
+            "pass --confirm-database-writes to run it"
+        )
+        return 2
+
+    baseline = None
+    if args.baseline is not None:
+        with Path(args.baseline).open("r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    run_tag = args.run_tag or datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    work_dir = Path(args.work_dir)
+    results: list[PhaseResult] = []
+    user_ids: list[str] = []
+    created_years: list[int] = []
+    try:
+        for position, import_path in enumerate(args.phases):
+            # Source ids and external ids are namespaced per phase so the second
+            # import inserts rows instead of deduplicating against the first.
+            spec = DatasetSpec(
+                rows=args.rows,
+                seed=args.seed,
+                namespace=f"{run_tag}-{import_path}",
+                id_base=args.id_base + position * PHASE_ID_STRIDE,
+            )
+            if position == 0:
+                _ensure_horrorfest_years(spec.horrorfest_years, created=created_years)
+            dataset_path = work_dir / f"{run_tag}-{import_path}.{args.format}"
+            results.append(
+                _run_isolated(
+                    _generate_phase,
+                    phase=f"{import_path}.generate",
+                    spec=spec,
+                    path=dataset_path,
+                    file_format=args.format,
+                )
+            )
+            user_ids.append(_create_benchmark_user(f"benchmark-{spec.namespace}"))
+            results.append(
+                _run_isolated(
+                    _import_phase,
+                    phase=f"{import_path}.import",
+                    import_path=import_path,
+                    rows=args.rows,
+                    dataset_path=dataset_path,
+                    file_format=args.format,
+                    user_id=user_ids[-1],
+                    bulk=args.bulk,
+                    commit_every=args.commit_every,
+                )
+            )
+            if not args.keep_datasets:
+                dataset_path.unlink(missing_ok=True)
+    except Exception as exc:
+        print(f"Benchmark failed: {exc}")
+        return 1
+    finally:
+        if not args.keep_data:
+            _delete_benchmark_data(
+                user_ids=user_ids,
+                tmdb_id_range=(
+                    args.id_base,
+                    args.id_base + len(args.phases) * PHASE_ID_STRIDE,
+                ),
+                horrorfest_years=created_years,
+            )
+
+    _print_results(results)
+    if args.output is not None:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "generated_at": datetime.now(UTC).isoformat(),
+                    "run_tag": run_tag,
+                    "rows": args.rows,
+                    "format": args.format,
+                    "bulk": args.bulk,
+                    "commit_every": args.commit_every,
+                    "phases": [asdict(result) for result in results],
+                },
+                file,
+                indent=2,
+            )
+        print(f"Wrote benchmark results: {output_path}")
+
+    if baseline is not None:
+        regressions = _find_regressions(
+            results,
+            baseline,
+            max_regression_percent=args.max_regression_percent,
+        )
+        if regressions:
+            print("Regressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+def main() -> None:
+    raise SystemExit(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import namedtuple
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.api.watch_events import _watch_event_list_response
+from app.repositories.watch_events import (
+    _format_display_title,
+    _watch_event_list_payload,
+    _watch_event_list_statement,
+)
+from app.schemas.watch_events import WatchEventListAdapter, WatchEventListRead
+
+TIMEZONES = ("UTC", "America/Edmonton", "Europe/Berlin", "Asia/Tokyo")
+WatchEventListRow = namedtuple(
+    "WatchEventListRow", list(_watch_event_list_statement().selected_columns.keys())
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-page CPU time of the previous watch-event list "
+            "serialization with the current lean path. No database is needed."
+        )
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="Watch events per page"
+    )
+    parser.add_argument("--pages", type=int, default=200, help="Pages to encode")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    return parser.parse_args(argv)
+
+
+def _synthetic_rows(page_size: int, *, seed: int) -> list[WatchEventListRow]:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    rows: list[WatchEventListRow] = []
+    for index in range(page_size):
+        is_episode = rng.random() < 0.6
+        watched_at = start - timedelta(hours=index * 7)
+        rows.append(
+            WatchEventListRow(
+                watch_id=uuid4(),
+                user_id=uuid4(),
+                media_item_id=uuid4(),
+                watched_at=watched_at,
+                playback_source="jellyfin",
+                total_seconds=2700 if is_episode else 6300,
+                watched_seconds=2650 if is_episode else 6200,
+                progress_percent=Decimal("98.15"),
+                watch_version_name=None,
+                watch_runtime_seconds=None,
+                completed=True,
+                rating_value=None if index % 3 else Decimal("8.00"),
+                rating_scale=None if index % 3 else "10-point",
+                media_version_id=None,
+                import_batch_id=uuid4() if index % 2 else None,
+                origin_kind="playback_event",
+                origin_playback_event_id=uuid4(),
+                created_at=watched_at + timedelta(seconds=5),
+                updated_at=None,
+                updated_by=None,
+                update_reason=None,
+                rewatch=index % 5 == 0,
+                is_deleted=False,
+                deleted_at=None,
+                deleted_by=None,
+                deleted_reason=None,
+                dedupe_hash=f"{index:064x}",
+                created_by=None,
+                source_event_id=f"evt-{index}",
+                horrorfest_year=2025 if index % 11 == 0 else None,
+                horrorfest_watch_order=index if index % 11 == 0 else None,
+                media_item_title=f"Episode {index}" if is_episode else f"Movie {index}",
+                media_item_type="episode" if is_episode else "movie",
+                media_item_season_number=1 if is_episode else None,
+                media_item_episode_number=index if is_episode else None,
+                media_item_year=None if is_episode else 1980 + index % 40,
+                base_runtime_seconds=2700 if is_episode else 6300,
+                show_title=f"Show {index % 7}" if is_episode else None,
+                user_timezone=TIMEZONES[index % len(TIMEZONES)],
+            )
+        )
+    return rows
+
+
+def _previous_page_bytes(rows: list[WatchEventListRow]) -> bytes:
+    # The pre-change path: an ORM entity per row, ZoneInfo() per row, per-item
+    # model_validate in the endpoint, then FastAPI's response_model validation,
+    # JSON-mode dump and json.dumps.
+    payload: list[dict[str, object]] = []
+    for row in rows:
+        values = row._asdict()
+        watch_event = SimpleNamespace(**values)
+        user_timezone = values["user_timezone"] or "UTC"
+        try:
+            watched_at_local = watch_event.watched_at.astimezone(
+                ZoneInfo(user_timezone)
+            )
+        except ZoneInfoNotFoundError:
+            watched_at_local = watch_event.watched_at
+        item = {
+            name: getattr(watch_event, name)
+            for name in values
+            if name not in {"media_item_year", "base_runtime_seconds", "show_title"}
+        }
+        item.update(
+            effective_runtime_seconds=(
+                watch_event.watch_runtime_seconds
+                or watch_event.total_seconds
+                or watch_event.base_runtime_seconds
+            ),
+            is_horrorfest_watch=watch_event.horrorfest_year is not None,
+            display_title=_format_display_title(
+                item_type=watch_event.media_item_type,
+                item_title=watch_event.media_item_title,
+                item_year=watch_event.media_item_year,
+                show_title=watch_event.show_title,
+                season_number=watch_event.media_item_season_number,
+                episode_number=watch_event.media_item_episode_number,
+            ),
+            watched_at_local=watched_at_local,
+            user_timezone=user_timezone,
+        )
+        payload.append(item)
+    models = [WatchEventListRead.model_validate(item) for item in payload]
+    validated = WatchEventListAdapter.validate_python(models, from_attributes=True)
+    content = WatchEventListAdapter.dump_python(validated, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _lean_page_bytes(rows: list[WatchEventListRow]) -> bytes:
+    payload = _watch_event_list_payload(rows)
+    return bytes(_watch_event_list_response(payload, limit=len(payload) + 1).body)
+
+
+def _cpu_ms_per_page(
+    encode: Callable[[list[WatchEventListRow]], bytes],
+    rows: list[WatchEventListRow],
+    *,
+    pages: int,
+) -> float:
+    started = time.process_time()
+    for _ in range(pages):
+        encode(rows)
+    return (time.process_time() - started) * 1000 / pages
+
+
+def run(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.page_size <= 0 or args.pages <= 0:
+        print("--page-size and --pages must be greater than zero")
+        return 2
+
+    rows = _synthetic_rows(args.page_size, seed=args.seed)
+    if json.loads(_previous_page_bytes(rows)) != json.loads(_lean_page_bytes(rows)):
+        print("Lean serialization does not match the previous output")
+        return 1
+
+    previous_ms = _cpu_ms_per_page(_previous_page_bytes, rows, pages=args.pages)
+    lean_ms = _cpu_ms_per_page(_lean_page_bytes, rows, pages=args.pages)
+    print(f"{'path':<10} {'cpu_ms/page':>12}")
+    print(f"{'previous':<10} {previous_ms:>12.3f}")
+    print(f"{'lean':<10} {lean_ms:>12.3f}")
+    print(
+        f"{args.page_size} rows/page over {args.pages} pages: "
+        f"{previous_ms / lean_ms:.2f}x less CPU per page"
+    )
+    return 0
+
+
+def main() -> None:
+    raise SystemExit(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from app.db.session import SessionLocal
+from app.services.watch_event_exports import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_MEDIA_TYPES,
+    WatchEventExportService,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Stream active watch history to NDJSON or CSV. The output can be "
+            "re-imported with app.scripts.import_watch_events."
+        )
+    )
+    parser.add_argument(
+        "--output", required=True, help="Output file path, or - for stdout"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["auto", *EXPORT_MEDIA_TYPES],
+        default="auto",
+        help="Output format; auto detects it from the output file extension",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the output (implied by a .gz output file extension)",
+    )
+    parser.add_argument(
+        "--user-id", default=None, help="Only export this user's watch history"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=EXPORT_BATCH_SIZE,
+        help="Rows fetched per server-side cursor round trip",
+    )
+    return parser.parse_args(argv)
+
+
+def _detect_format(output: str, explicit_format: str) -> tuple[str, bool]:
+    suffixes = [suffix.lower() for suffix in Path(output).suffixes]
+    compress = bool(suffixes) and suffixes[-1] == ".gz"
+    if compress:
+        suffixes.pop()
+    if explicit_format != "auto":
+        return explicit_format, compress
+    if suffixes and suffixes[-1] in {".ndjson", ".jsonl"}:
+        return "ndjson", compress
+    if suffixes and suffixes[-1] == ".csv":
+        return "csv", compress
+    raise ValueError(
+        "Could not detect format from the output file extension. "
+        "Use --format ndjson or --format csv."
+    )
+
+
+def run(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.batch_size <= 0:
+        print("--batch-size must be greater than zero")
+        return 2
+    try:
+        file_format, compress = _detect_format(args.output, args.format)
+        user_id = UUID(args.user_id) if args.user_id is not None else None
+    except ValueError as exc:
+        print(f"Invalid arguments: {exc}")
+        return 2
+    compress = compress or args.gzip
+
+    session = SessionLocal()
+    try:
+        chunks = WatchEventExportService.iter_export(
+            session,
+            user_id=user_id,
+            file_format=file_format,
+            compress=compress,
+            batch_size=args.batch_size,
+        )
+        if args.output == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return 0
+
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with output_path.open("wb") as file:
+            for chunk in chunks:
+                written += file.write(chunk)
+        print(f"Wrote {written} bytes to {output_path}")
+        return 0
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
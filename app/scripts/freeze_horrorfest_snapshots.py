@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+
+from app.db.session import SessionLocal
+from app.services.horrorfest import HorrorfestService
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Freeze analytics snapshots of Horrorfest years whose window closed "
+            "more than a day ago. Writes that touch a frozen year drop its "
+            "snapshot; run this again (e.g. nightly) to rebuild it."
+        )
+    )
+    return parser.parse_args(argv)
+
+
+def run(argv: list[str] | None = None) -> int:
+    _parse_args(argv)
+    session = SessionLocal()
+
+    try:
+        frozen_years = HorrorfestService.freeze_closed_years(session)
+    finally:
+        session.close()
+
+    if frozen_years:
+        years = ", ".join(str(year) for year in frozen_years)
+        print(f"Froze {len(frozen_years)} Horrorfest years: {years}.")
+    else:
+        print("No closed Horrorfest years needed freezing.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+DEFAULT_ID_BASE = 900_000_000
+EPISODES_PER_SEASON = 10
+MAX_EPISODES_PER_SHOW = 500
+WATCHES_PER_SHOW = 200
+
+CSV_COLUMNS = [
+    "id",
+    "watched_at",
+    "type",
+    "title",
+    "year",
+    "tmdb_id",
+    "imdb_id",
+    "show_title",
+    "show_year",
+    "show_tmdb_id",
+    "season_number",
+    "episode_number",
+    "episode_tmdb_id",
+    "episode_title",
+    "horrorfest_year",
+    "horrorfest_watch_order",
+]
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    rows: int
+    movie_ratio: float = 0.4
+    rewatch_ratio: float = 0.15
+    horrorfest_ratio: float = 0.05
+    start_year: int = 2013
+    years: int = 13
+    seed: int = 0
+    namespace: str = "bench"
+    id_base: int = DEFAULT_ID_BASE
+
+    @property
+    def horrorfest_years(self) -> list[int]:
+        return list(range(self.start_year, self.start_year + self.years))
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic legacy export for import benchmarks."
+    )
+    parser.add_argument("--output", required=True, help="Path to write JSON or CSV")
+    parser.add_argument(
+        "--format",
+        choices=["auto", "json", "csv"],
+        default="auto",
+        help="Output format; auto uses the file extension",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=10_000, help="Number of watch rows to generate"
+    )
+    parser.add_argument(
+        "--movie-ratio",
+        type=float,
+        default=0.4,
+        help="Share of rows that are movie watches; the rest are episodes",
+    )
+    parser.add_argument(
+        "--rewatch-ratio",
+        type=float,
+        default=0.15,
+        help="Share of watches that repeat an earlier movie or episode",
+    )
+    parser.add_argument(
+        "--horrorfest-ratio",
+        type=float,
+        default=0.05,
+        help="Approximate share of movie watches tagged with a Horrorfest year",
+    )
+    parser.add_argument(
+        "--start-year", type=int, default=2013, help="First year of watch history"
+    )
+    parser.add_argument(
+        "--years", type=int, default=13, help="Number of years of watch history"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--namespace",
+        default="bench",
+        help="Prefix for source event ids, so repeated runs do not dedupe",
+    )
+    parser.add_argument(
+        "--id-base",
+        type=int,
+        default=DEFAULT_ID_BASE,
+        help="First synthetic TMDB id; keep runs apart to avoid sharing media items",
+    )
+    return parser.parse_args(argv)
+
+
+def _validate_spec(spec: DatasetSpec) -> None:
+    if spec.rows <= 0:
+        raise ValueError("--rows must be greater than zero")
+    if spec.years <= 0:
+        raise ValueError("--years must be greater than zero")
+    for name, value in (
+        ("--movie-ratio", spec.movie_ratio),
+        ("--rewatch-ratio", spec.rewatch_ratio),
+        ("--horrorfest-ratio", spec.horrorfest_ratio),
+    ):
+        if not 0 <= value <= 1:
+            raise ValueError(f"{name} must be between 0 and 1")
+
+
+def generate_rows(spec: DatasetSpec) -> Iterator[dict[str, Any]]:
+    rng = random.Random(spec.seed)
+    start = datetime(spec.start_year, 1, 1, tzinfo=UTC)
+    end = datetime(spec.start_year + spec.years, 1, 1, tzinfo=UTC)
+    step = (end - start) / spec.rows
+    # Rows are spread evenly over the span, so October rows are ~31/365 of movies.
+    october_tag_chance = min(1.0, spec.horrorfest_ratio * 365 / 31)
+    show_count = max(1, spec.rows // WATCHES_PER_SHOW)
+    show_progress = [0] * show_count
+    watched_movies: list[int] = []
+    horrorfest_orders: dict[int, int] = {}
+
+    for index in range(spec.rows):
+        watched_at = start + step * (index + rng.random())
+        source_id = f"{spec.namespace}-{index}"
+        if rng.random() < spec.movie_ratio:
+            if watched_movies and rng.random() < spec.rewatch_ratio:
+                movie_index = rng.choice(watched_movies)
+            else:
+                movie_index = len(watched_movies)
+                watched_movies.append(movie_index)
+            row = _movie_row(
+                spec, source_id=source_id, watched_at=watched_at, index=movie_index
+            )
+            if watched_at.month == 10 and rng.random() < october_tag_chance:
+                order = horrorfest_orders.get(watched_at.year, 0) + 1
+                horrorfest_orders[watched_at.year] = order
+                row["horrorfest_year"] = watched_at.year
+                row["horrorfest_watch_order"] = order
+            yield row
+            continue
+
+        show_index = rng.randrange(show_count)
+        watched_episodes = show_progress[show_index]
+        if watched_episodes and (
+            watched_episodes >= MAX_EPISODES_PER_SHOW
+            or rng.random() < spec.rewatch_ratio
+        ):
+            episode_ordinal = rng.randrange(watched_episodes)
+        else:
+            episode_ordinal = watched_episodes
+            show_progress[show_index] = watched_episodes + 1
+        yield _episode_row(
+            spec,
+            source_id=source_id,
+            watched_at=watched_at,
+            show_index=show_index,
+            episode_ordinal=episode_ordinal,
+        )
+
+
+def _movie_row(
+    spec: DatasetSpec,
+    *,
+    source_id: str,
+    watched_at: datetime,
+    index: int,
+) -> dict[str, Any]:
+    tmdb_id = spec.id_base + index
+    return {
+        "id": source_id,
+        "watched_at": watched_at.isoformat(),
+        "type": "movie",
+        "movie": {
+            "title": f"Synthetic Movie {index}",
+            "year": 1950 + index % 75,
+            "ids": {"tmdb": tmdb_id, "imdb": f"tt{tmdb_id}"},
+        },
+    }
+
+
+def _episode_row(
+    spec: DatasetSpec,
+    *,
+    source_id: str,
+    watched_at: datetime,
+    show_index: int,
+    episode_ordinal: int,
+) -> dict[str, Any]:
+    show_tmdb_id = spec.id_base + 2_000_000 + show_index
+    season, episode = divmod(episode_ordinal, EPISODES_PER_SEASON)
+    return {
+        "id": source_id,
+        "watched_at": watched_at.isoformat(),
+        "type": "episode",
+        "episode": {
+            "season": season + 1,
+            "number": episode + 1,
+            "title": f"Episode {episode + 1}",
+            "ids": {
+                "tmdb": spec.id_base
+                + 3_000_000
+                + show_index * MAX_EPISODES_PER_SHOW
+                + episode_ordinal
+            },
+        },
+        "show": {
+            "title": f"Synthetic Show {show_index}",
+            "year": 1990 + show_index % 35,
+            "ids": {"tmdb": show_tmdb_id},
+        },
+    }
+
+
+def _to_csv_row(row: dict[str, Any]) -> dict[str, Any]:
+    flat: dict[str, Any] = {
+        "id": row["id"],
+        "watched_at": row["watched_at"],
+        "type": row["type"],
+        "horrorfest_year": row.get("horrorfest_year"),
+        "horrorfest_watch_order": row.get("horrorfest_watch_order"),
+    }
+    if row["type"] == "movie":
+        movie = row["movie"]
+        flat.update(
+            title=movie["title"],
+            year=movie["year"],
+            tmdb_id=movie["ids"]["tmdb"],
+            imdb_id=movie["ids"]["imdb"],
+        )
+        return flat
+    episode = row["episode"]
+    show = row["show"]
+    flat.update(
+        show_title=show["title"],
+        show_year=show["year"],
+        show_tmdb_id=show["ids"]["tmdb"],
+        season_number=episode["season"],
+        episode_number=episode["number"],
+        episode_tmdb_id=episode["ids"]["tmdb"],
+        episode_title=episode["title"],
+    )
+    return flat
+
+
+def write_dataset(spec: DatasetSpec, path: Path, *, file_format: str) -> int:
+    _validate_spec(spec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    if file_format == "csv":
+        with path.open("w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            for row in generate_rows(spec):
+                writer.writerow(_to_csv_row(row))
+                written += 1
+        return written
+
+    # Rows are streamed out one at a time so 1M-row files never sit in memory.
+    with path.open("w", encoding="utf-8") as file:
+        file.write("[")
+        for row in generate_rows(spec):
+            file.write(",\n" if written else "\n")
+            json.dump(row, file)
+            written += 1
+        file.write("\n]\n")
+    return written
+
+
+def _detect_format(path: Path, explicit_format: str) -> str:
+    if explicit_format in {"json", "csv"}:
+        return explicit_format
+    suffix = path.suffix.lower()
+    if suffix in {".json", ".csv"}:
+        return suffix[1:]
+    raise ValueError(
+        "Could not detect format from file extension. Use --format json or --format csv."
+    )
+
+
+def run(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    spec = DatasetSpec(
+        rows=args.rows,
+        movie_ratio=args.movie_ratio,
+        rewatch_ratio=args.rewatch_ratio,
+        horrorfest_ratio=args.horrorfest_ratio,
+        start_year=args.start_year,
+        years=args.years,
+        seed=args.seed,
+        namespace=args.namespace,
+        id_base=args.id_base,
+    )
+    output_path = Path(args.output)
+    try:
+        written = write_dataset(
+            spec,
+            output_path,
+            file_format=_detect_format(output_path, args.format),
+        )
+    except ValueError as exc:
+        print(f"Invalid dataset options: {exc}")
+        return 2
+
+    print(f"Wrote {written} synthetic watch rows to {output_path}")
+    return 0
+
+
+def main() -> None:
+    raise SystemExit(run())
+
+
+if __name__ == "__main__":
+    main()
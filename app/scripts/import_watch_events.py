@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
@@ -31,16 +32,34 @@ class LegacyBackupPreprocessResult:
     shows_created: int
 
 
+@dataclass(frozen=True)
+class LegacyBackupParsedRow:
+    index: int
+    row: dict[str, Any]
+    watched_at: datetime
+    media_type: str
+    tmdb_id: int | None
+    imdb_id: str | None
+
+
+@dataclass
+class LegacyBackupDryRunPlan:
+    shows: set[int] = field(default_factory=set)
+    media_items: dict[tuple[str, int | str], UUID] = field(default_factory=dict)
+
+
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Import watch events from a legacy source export file."
     )
     parser.add_argument(
-        "--input", required=True, help="Path to JSON or CSV export file"
+        "--input",
+        required=True,
+        help="Path to JSON, NDJSON or CSV export file, optionally gzip-compressed",
     )
     parser.add_argument(
         "--format",
-        choices=["auto", "json", "csv"],
+        choices=["auto", "json", "ndjson", "csv"],
         default="auto",
         help="Input format detection mode",
     )
@@ -75,6 +94,27 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="For incremental mode, resume from latest stored cursor",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Insert rows with the set-based bulk engine instead of row by row",
+    )
+    parser.add_argument(
+        "--aggregate-skips",
+        action="store_true",
+        help="Record info-level skips as per-reason counts instead of error rows",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=None,
+        help="Commit and checkpoint the import batch every N rows",
+    )
+    parser.add_argument(
+        "--resume-batch-id",
+        default=None,
+        help="Resume a crashed or failed import batch from its last checkpoint",
+    )
     parser.add_argument(
         "--error-report",
         default=None,
@@ -84,22 +124,34 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def _detect_format(file_path: Path, explicit_format: str) -> str:
-    if explicit_format in {"json", "csv"}:
+    if explicit_format in {"json", "ndjson", "csv"}:
         return explicit_format
 
-    suffix = file_path.suffix.lower()
+    suffixes = [suffix.lower() for suffix in file_path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    suffix = suffixes[-1] if suffixes else ""
     if suffix == ".json":
         return "json"
+    if suffix in {".ndjson", ".jsonl"}:
+        return "ndjson"
     if suffix == ".csv":
         return "csv"
 
     raise ValueError(
-        "Could not detect format from file extension. Use --format json or --format csv."
+        "Could not detect format from file extension. "
+        "Use --format json, --format ndjson or --format csv."
     )
 
 
+def _open_text(file_path: Path, *, encoding: str, newline: str | None = None):
+    if file_path.suffix.lower() == ".gz":
+        return gzip.open(file_path, "rt", encoding=encoding, newline=newline)
+    return file_path.open("r", encoding=encoding, newline=newline)
+
+
 def _load_json_rows(file_path: Path) -> list[dict[str, Any]]:
-    with file_path.open("r", encoding="utf-8") as file:
+    with _open_text(file_path, encoding="utf-8") as file:
         parsed = json.load(file)
 
     if isinstance(parsed, list):
@@ -116,8 +168,13 @@ def _load_json_rows(file_path: Path) -> list[dict[str, Any]]:
     )
 
 
+def _load_ndjson_rows(file_path: Path) -> list[dict[str, Any]]:
+    with _open_text(file_path, encoding="utf-8-sig") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
 def _load_csv_rows(file_path: Path) -> list[dict[str, Any]]:
-    with file_path.open("r", encoding="utf-8-sig", newline="") as file:
+    with _open_text(file_path, encoding="utf-8-sig", newline="") as file:
         reader = csv.DictReader(file)
         rows: list[dict[str, Any]] = []
         for row in reader:
@@ -133,6 +190,8 @@ def _load_csv_rows(file_path: Path) -> list[dict[str, Any]]:
 def _load_rows(file_path: Path, file_format: str) -> list[dict[str, Any]]:
     if file_format == "json":
         return _load_json_rows(file_path)
+    if file_format == "ndjson":
+        return _load_ndjson_rows(file_path)
     if file_format == "csv":
         return _load_csv_rows(file_path)
     raise ValueError(f"Unsupported format: {file_format}")
@@ -457,14 +516,14 @@ def _extract_season_episode_numbers(
     return None, None
 
 
-def _create_media_item_from_backup_row(
-    session: Any,
+def _new_media_item_from_backup_row(
     *,
     row: dict[str, Any],
     media_type: str,
     tmdb_id: int | None,
     imdb_id: str | None,
-) -> tuple[MediaItem, bool]:
+    show_id: UUID | None,
+) -> MediaItem:
     title = _extract_media_title(row, media_type)
     if not title:
         fallback_id = tmdb_id or imdb_id or row.get("id") or "unknown"
@@ -473,23 +532,6 @@ def _create_media_item_from_backup_row(
     season_number, episode_number = _extract_season_episode_numbers(row, media_type)
     show_tmdb_id = _extract_show_tmdb_id(row, media_type)
     tvdb_id = _extract_tvdb_id(row, media_type)
-    show_id: UUID | None = None
-    show_created = False
-
-    if media_type == "episode" and show_tmdb_id is not None:
-        existing_show = ShowService.find_show_by_tmdb_id(session, tmdb_id=show_tmdb_id)
-        show_title = _extract_show_title(row, media_type) or f"show:{show_tmdb_id}"
-        show = ShowService.get_or_create_show(
-            session,
-            tmdb_id=show_tmdb_id,
-            title=show_title,
-            year=_extract_show_year(row, media_type),
-            tvdb_id=_extract_show_tvdb_id(row, media_type),
-            imdb_id=_extract_show_imdb_id(row, media_type),
-        )
-        show_id = show.show_id
-        show_created = existing_show is None
-
     enrichment_state = MediaItemService.determine_initial_enrichment_state(
         media_type=media_type,
         tmdb_id=tmdb_id,
@@ -498,7 +540,8 @@ def _create_media_item_from_backup_row(
         show_tmdb_id=show_tmdb_id,
     )
 
-    media_item = MediaItem(
+    return MediaItem(
+        media_item_id=uuid4(),
         type=media_type,
         title=title,
         year=_extract_media_year(row, media_type),
@@ -513,9 +556,82 @@ def _create_media_item_from_backup_row(
         enrichment_status=enrichment_state.status,
         enrichment_error=enrichment_state.error,
     )
-    session.add(media_item)
-    session.flush()
-    return media_item, show_created
+
+
+def _media_item_keys(
+    media_type: str, tmdb_id: int | None, imdb_id: str | None
+) -> list[tuple[str, int | str]]:
+    keys: list[tuple[str, int | str]] = []
+    if tmdb_id is not None:
+        keys.append((media_type, tmdb_id))
+    if imdb_id:
+        keys.append((media_type, imdb_id))
+    return keys
+
+
+def _resolve_legacy_backup_references(
+    session: Any,
+    parsed_rows: list[LegacyBackupParsedRow],
+) -> tuple[dict[tuple[str, int | str], UUID], dict[int, UUID]]:
+    tmdb_keys: set[tuple[str, int]] = set()
+    imdb_keys: set[tuple[str, str]] = set()
+    show_tmdb_ids: set[int] = set()
+    for parsed in parsed_rows:
+        if parsed.tmdb_id is not None:
+            tmdb_keys.add((parsed.media_type, parsed.tmdb_id))
+        if parsed.imdb_id:
+            imdb_keys.add((parsed.media_type, parsed.imdb_id))
+        if parsed.media_type == "episode":
+            show_tmdb_id = _extract_show_tmdb_id(parsed.row, parsed.media_type)
+            if show_tmdb_id is not None:
+                show_tmdb_ids.add(show_tmdb_id)
+
+    tmdb_matches, imdb_matches = MediaItemService.list_media_items_by_external_ids(
+        session,
+        tmdb_keys=tmdb_keys,
+        imdb_keys=imdb_keys,
+    )
+    media_item_ids: dict[tuple[str, int | str], UUID] = {}
+    for media_item in tmdb_matches:
+        media_item_ids[(media_item.type, media_item.tmdb_id)] = media_item.media_item_id
+    for media_item in imdb_matches:
+        media_item_ids[(media_item.type, media_item.imdb_id)] = media_item.media_item_id
+    show_ids = {
+        show.tmdb_id: show.show_id
+        for show in ShowService.list_shows_by_tmdb_ids(session, tmdb_ids=show_tmdb_ids)
+    }
+    return media_item_ids, show_ids
+
+
+def _persist_new_media_items(
+    session: Any,
+    new_media_items: list[MediaItem],
+) -> dict[UUID, UUID | None]:
+    try:
+        with session.begin_nested():
+            session.add_all(new_media_items)
+        return {}
+    except IntegrityError:
+        pass
+
+    # Another writer created some of these items since they were resolved, so
+    # insert them one at a time and point conflicting rows at the stored item.
+    replacements: dict[UUID, UUID | None] = {}
+    for media_item in new_media_items:
+        try:
+            with session.begin_nested():
+                session.add(media_item)
+        except IntegrityError:
+            existing = MediaItemService.find_media_item_by_external_ids(
+                session,
+                media_type=media_item.type,
+                tmdb_id=media_item.tmdb_id,
+                imdb_id=media_item.imdb_id,
+            )
+            replacements[media_item.media_item_id] = (
+                existing.media_item_id if existing is not None else None
+            )
+    return replacements
 
 
 def _build_mapped_rows_from_legacy_backup(
@@ -524,17 +640,23 @@ def _build_mapped_rows_from_legacy_backup(
     user_id: UUID,
     dry_run: bool,
     naive_datetime_timezone: str = "UTC",
+    row_index_offset: int = 0,
+    dry_run_plan: LegacyBackupDryRunPlan | None = None,
 ) -> LegacyBackupPreprocessResult:
     session = SessionLocal()
     mapped_rows: list[dict[str, Any]] = []
     rejected_rows: list[dict[str, Any]] = []
     created_media_items = 0
     created_shows = 0
-    planned_shows: set[int] = set()
-    planned_media_items: dict[tuple[str, int | str], UUID] = {}
+    plan = dry_run_plan if dry_run_plan is not None else LegacyBackupDryRunPlan()
+    planned_shows = plan.shows
+    planned_media_items = plan.media_items
+    new_media_items: list[MediaItem] = []
+    rows_by_new_media_item: dict[UUID, list[tuple[LegacyBackupParsedRow, dict]]] = {}
 
     try:
-        for index, row in enumerate(raw_rows):
+        parsed_rows: list[LegacyBackupParsedRow] = []
+        for index, row in enumerate(raw_rows, start=row_index_offset):
             if not isinstance(row, dict):
                 rejected_rows.append(
                     {"row_index": index, "reason": "row is not an object", "row": row}
@@ -563,32 +685,44 @@ def _build_mapped_rows_from_legacy_backup(
                 continue
 
             tmdb_id, imdb_id = _extract_external_ids(row, media_type)
-            media_item = MediaItemService.find_media_item_by_external_ids(
-                session,
-                media_type=media_type,
-                tmdb_id=tmdb_id,
-                imdb_id=imdb_id,
+            parsed_rows.append(
+                LegacyBackupParsedRow(
+                    index=index,
+                    row=row,
+                    watched_at=watched_at,
+                    media_type=media_type,
+                    tmdb_id=tmdb_id,
+                    imdb_id=imdb_id,
+                )
             )
-            if media_item is None:
-                media_key: tuple[str, int | str] | None = None
-                if tmdb_id is not None:
-                    media_key = (media_type, tmdb_id)
-                elif imdb_id is not None:
-                    media_key = (media_type, imdb_id)
 
+        media_item_ids, show_ids = _resolve_legacy_backup_references(
+            session, parsed_rows
+        )
+
+        for parsed in parsed_rows:
+            row = parsed.row
+            media_type = parsed.media_type
+            media_keys = _media_item_keys(media_type, parsed.tmdb_id, parsed.imdb_id)
+            media_item_id = next(
+                (media_item_ids[key] for key in media_keys if key in media_item_ids),
+                None,
+            )
+            if media_item_id is None:
+                media_key = media_keys[0] if media_keys else None
+                show_tmdb_id = (
+                    _extract_show_tmdb_id(row, media_type)
+                    if media_type == "episode"
+                    else None
+                )
                 if dry_run:
-                    if media_type == "episode":
-                        show_tmdb_id = _extract_show_tmdb_id(row, media_type)
-                        if show_tmdb_id is not None:
-                            existing_show = ShowService.find_show_by_tmdb_id(
-                                session, tmdb_id=show_tmdb_id
-                            )
-                            if (
-                                existing_show is None
-                                and show_tmdb_id not in planned_shows
-                            ):
-                                planned_shows.add(show_tmdb_id)
-                                created_shows += 1
+                    if (
+                        show_tmdb_id is not None
+                        and show_tmdb_id not in show_ids
+                        and show_tmdb_id not in planned_shows
+                    ):
+                        planned_shows.add(show_tmdb_id)
+                        created_shows += 1
 
                     if media_key is not None:
                         planned_media_item_id = planned_media_items.get(media_key)
@@ -601,42 +735,37 @@ def _build_mapped_rows_from_legacy_backup(
                         media_item_id = uuid4()
                         created_media_items += 1
                 else:
-                    try:
-                        media_item, show_created = _create_media_item_from_backup_row(
-                            session,
-                            row=row,
-                            media_type=media_type,
-                            tmdb_id=tmdb_id,
-                            imdb_id=imdb_id,
-                        )
-                        created_media_items += 1
-                        if show_created:
-                            created_shows += 1
-                    except IntegrityError:
-                        session.rollback()
-                        media_item = MediaItemService.find_media_item_by_external_ids(
-                            session,
-                            media_type=media_type,
-                            tmdb_id=tmdb_id,
-                            imdb_id=imdb_id,
-                        )
-                        if media_item is None:
-                            rejected_rows.append(
-                                {
-                                    "row_index": index,
-                                    "reason": "no matching media_item for external ids",
-                                    "row": row,
-                                    "lookup": {
-                                        "media_type": media_type,
-                                        "tmdb_id": tmdb_id,
-                                        "imdb_id": imdb_id,
-                                    },
-                                }
+                    show_id: UUID | None = None
+                    if show_tmdb_id is not None:
+                        show_id = show_ids.get(show_tmdb_id)
+                        if show_id is None:
+                            show = ShowService.get_or_create_show(
+                                session,
+                                tmdb_id=show_tmdb_id,
+                                title=(
+                                    _extract_show_title(row, media_type)
+                                    or f"show:{show_tmdb_id}"
+                                ),
+                                year=_extract_show_year(row, media_type),
+                                tvdb_id=_extract_show_tvdb_id(row, media_type),
+                                imdb_id=_extract_show_imdb_id(row, media_type),
                             )
-                            continue
-                    media_item_id = media_item.media_item_id
-            else:
-                media_item_id = media_item.media_item_id
+                            show_id = show.show_id
+                            show_ids[show_tmdb_id] = show_id
+                            created_shows += 1
+                    new_media_item = _new_media_item_from_backup_row(
+                        row=row,
+                        media_type=media_type,
+                        tmdb_id=parsed.tmdb_id,
+                        imdb_id=parsed.imdb_id,
+                        show_id=show_id,
+                    )
+                    new_media_items.append(new_media_item)
+                    media_item_id = new_media_item.media_item_id
+                    rows_by_new_media_item[media_item_id] = []
+                    for key in media_keys:
+                        media_item_ids[key] = media_item_id
+                    created_media_items += 1
 
             source_event_id = (
                 row.get("matchkey") or row.get("source_event_id") or row.get("id")
@@ -652,36 +781,66 @@ def _build_mapped_rows_from_legacy_backup(
                 row.get("player") or row.get("playback_source") or "legacy_backup"
             )
 
-            mapped_rows.append(
-                {
-                    "user_id": str(user_id),
-                    "media_item_id": str(media_item_id),
-                    "watched_at": watched_at.isoformat(),
-                    "player": str(playback_source),
-                    "total_seconds": _parse_int(row.get("total_seconds")),
-                    "watched_seconds": _parse_int(row.get("watched_seconds")),
-                    "progress_percent": _parse_decimal(
-                        row.get("progress_percent") or row.get("progress")
-                    ),
-                    "completed": _parse_bool(row.get("completed"), default=True),
-                    "rating": _parse_decimal(
-                        row.get("rating")
-                        or row.get("rating_value")
-                        or row.get("my_trakt_rating")
-                    ),
-                    "media_version_id": row.get("media_version_id"),
-                    "source_event_id": source_event_id,
-                    "horrorfest_year": _parse_int(
-                        row.get("horrorfest_year") or row.get("festival_year")
-                    ),
-                    "horrorfest_watch_order": _parse_int(
-                        row.get("horrorfest_watch_order")
-                        or row.get("watch_order")
-                        or row.get("festival_watch_order")
-                    ),
-                }
-            )
-        if created_media_items > 0 and not dry_run:
+            mapped_row = {
+                "user_id": str(user_id),
+                "media_item_id": str(media_item_id),
+                "watched_at": parsed.watched_at.isoformat(),
+                "player": str(playback_source),
+                "total_seconds": _parse_int(row.get("total_seconds")),
+                "watched_seconds": _parse_int(row.get("watched_seconds")),
+                "progress_percent": _parse_decimal(
+                    row.get("progress_percent") or row.get("progress")
+                ),
+                "completed": _parse_bool(row.get("completed"), default=True),
+                "rating": _parse_decimal(
+                    row.get("rating")
+                    or row.get("rating_value")
+                    or row.get("my_trakt_rating")
+                ),
+                "media_version_id": row.get("media_version_id"),
+                "source_event_id": source_event_id,
+                "horrorfest_year": _parse_int(
+                    row.get("horrorfest_year") or row.get("festival_year")
+                ),
+                "horrorfest_watch_order": _parse_int(
+                    row.get("horrorfest_watch_order")
+                    or row.get("watch_order")
+                    or row.get("festival_watch_order")
+                ),
+            }
+            mapped_rows.append(mapped_row)
+            if media_item_id in rows_by_new_media_item:
+                rows_by_new_media_item[media_item_id].append((parsed, mapped_row))
+
+        if new_media_items:
+            replacements = _persist_new_media_items(session, new_media_items)
+            dropped_rows: set[int] = set()
+            for new_media_item_id, stored_media_item_id in replacements.items():
+                created_media_items -= 1
+                for parsed, mapped_row in rows_by_new_media_item[new_media_item_id]:
+                    if stored_media_item_id is not None:
+                        mapped_row["media_item_id"] = str(stored_media_item_id)
+                        continue
+                    dropped_rows.add(id(mapped_row))
+                    rejected_rows.append(
+                        {
+                            "row_index": parsed.index,
+                            "reason": "no matching media_item for external ids",
+                            "row": parsed.row,
+                            "lookup": {
+                                "media_type": parsed.media_type,
+                                "tmdb_id": parsed.tmdb_id,
+                                "imdb_id": parsed.imdb_id,
+                            },
+                        }
+                    )
+            if dropped_rows:
+                mapped_rows = [
+                    mapped_row
+                    for mapped_row in mapped_rows
+                    if id(mapped_row) not in dropped_rows
+                ]
+        if not dry_run and (new_media_items or created_shows > 0):
             session.commit()
     finally:
         session.close()
@@ -759,6 +918,10 @@ def run(argv: list[str] | None = None) -> int:
             rejected_before_import=len(rejected_rows),
             media_items_created=media_items_created,
             shows_created=shows_created,
+            bulk=args.bulk,
+            aggregate_skips=args.aggregate_skips,
+            commit_every=args.commit_every,
+            resume_import_batch_id=args.resume_batch_id,
             rows=rows_for_validation,
         )
     except (ValueError, ValidationError, json.JSONDecodeError) as exc:
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+from uuid import UUID
+
+from app.db.session import SessionLocal
+from app.services.stats import StatsService
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Rebuild the monthly and daily stats rollups from watch events. The "
+            "rollups are kept current by triggers; use this to repair drift."
+        )
+    )
+    parser.add_argument(
+        "--user-id",
+        default=None,
+        help="Only rebuild this user's buckets (default: every user).",
+    )
+    return parser.parse_args(argv)
+
+
+def run(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    try:
+        user_id = UUID(args.user_id) if args.user_id is not None else None
+    except ValueError:
+        print(f"Invalid --user-id: {args.user_id}")
+        return 2
+
+    session = SessionLocal()
+
+    try:
+        user_ids = (
+            [user_id]
+            if user_id is not None
+            else StatsService.list_rollup_user_ids(session)
+        )
+        refreshed_count = 0
+        for current_user_id in user_ids:
+            refreshed_count += StatsService.rebuild_rollups(
+                session, user_id=current_user_id
+            )
+
+        print(f"Rebuilt {refreshed_count} rollup buckets across {len(user_ids)} users.")
+        return 0
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import argparse
+from itertools import batched
 
-from sqlalchemy import select
-
-from app.db.models.entities import WatchEvent
 from app.db.session import SessionLocal
 from app.services.watch_events import WatchEventService
 
+DEFAULT_USERS_PER_CHUNK = 50
+
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -16,38 +16,44 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Report the number of affected user/media timelines without writing changes.",
+        help="Report the number of watch events that would change without writing.",
+    )
+    parser.add_argument(
+        "--users-per-chunk",
+        type=int,
+        default=DEFAULT_USERS_PER_CHUNK,
+        help="Number of users recomputed (and committed) per statement.",
     )
     return parser.parse_args(argv)
 
 
 def run(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
+    if args.users_per_chunk <= 0:
+        print("--users-per-chunk must be greater than zero")
+        return 2
+
     session = SessionLocal()
 
     try:
-        timeline_keys = list(
-            session.execute(
-                select(WatchEvent.user_id, WatchEvent.media_item_id).distinct()
-            ).all()
-        )
-
-        for user_id, media_item_id in timeline_keys:
-            WatchEventService._recompute_rewatch_for_media_timeline(
+        user_ids = WatchEventService.list_watch_event_user_ids(session)
+        changed_count = 0
+        for user_chunk in batched(user_ids, args.users_per_chunk):
+            changed_count += WatchEventService.recompute_rewatch_flags_for_users(
                 session,
-                user_id=user_id,
-                media_item_id=media_item_id,
+                user_ids=list(user_chunk),
+                dry_run=args.dry_run,
             )
 
         if args.dry_run:
-            session.rollback()
             print(
-                f"Would recompute rewatch flags for {len(timeline_keys)} user/media timelines."
+                f"Would change rewatch flags on {changed_count} watch events "
+                f"across {len(user_ids)} users."
             )
         else:
-            session.commit()
             print(
-                f"Recomputed rewatch flags for {len(timeline_keys)} user/media timelines."
+                f"Changed rewatch flags on {changed_count} watch events "
+                f"across {len(user_ids)} users."
             )
         return 0
     finally:
@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.repositories import data_generations as data_generation_repository
+
+
+class DataGenerationService:
+    @staticmethod
+    def get_generations(session: Session, *, user_id: UUID | None) -> tuple[int, ...]:
+        return data_generation_repository.list_data_generations(
+            session, user_id=user_id
+        )
@@ -1,6 +1,9 @@
-from datetime import UTC, date, datetime
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -20,6 +23,19 @@ class HorrorfestConstraintError(Exception):
     """Raised when a Horrorfest update violates constraints."""
 
 
+@dataclass(frozen=True)
+class HorrorfestAssignment:
+    watch_id: UUID
+    horrorfest_year: int
+    target_order: int | None = None
+
+
+# A closed year is frozen only once its window has been shut this long, so
+# late imports and corrections right after the festival do not keep dropping
+# and rebuilding its snapshot.
+SNAPSHOT_FREEZE_GRACE = timedelta(days=1)
+
+
 class HorrorfestService:
     AUTO_SOURCE_KINDS = {
         "live_playback": "auto_live",
@@ -115,6 +131,23 @@ class HorrorfestService:
             include_removed=include_removed,
         )
 
+    @staticmethod
+    def freeze_closed_years(session: Session) -> list[int]:
+        closed_before = datetime.now(UTC) - SNAPSHOT_FREEZE_GRACE
+        horrorfest_years = horrorfest_repository.list_unfrozen_closed_horrorfest_years(
+            session,
+            closed_before=closed_before,
+        )
+        if not horrorfest_years:
+            return []
+        frozen_years = horrorfest_repository.freeze_horrorfest_years(
+            session,
+            horrorfest_years=horrorfest_years,
+            closed_before=closed_before,
+        )
+        session.commit()
+        return frozen_years
+
     @staticmethod
     def list_analytics_years(
         session: Session,
@@ -385,6 +418,85 @@ class HorrorfestService:
             target_order=None,
         )
 
+    @staticmethod
+    def sync_watch_events(
+        session: Session,
+        *,
+        watch_ids: list[UUID],
+    ) -> None:
+        candidate_ids = horrorfest_repository.list_watch_ids_inside_horrorfest_windows(
+            session,
+            watch_ids=watch_ids,
+        )
+        for watch_id in candidate_ids:
+            HorrorfestService.sync_watch_event(
+                session,
+                watch_event=HorrorfestService._get_watch_event_or_raise(
+                    session, watch_id=watch_id
+                ),
+            )
+
+    @staticmethod
+    def sync_watch_event_changes(
+        session: Session,
+        *,
+        watch_events: Sequence[WatchEvent],
+    ) -> None:
+        """Batch form of sync_watch_event that renumbers each touched year once.
+
+        A year that gains or keeps a watch is rebuilt by watched_at, exactly as a
+        single sync would; a year that only loses watches keeps its order.
+        """
+        rebuild_years: set[int] = set()
+        compact_years: set[int] = set()
+        for watch_event in watch_events:
+            year_config = HorrorfestService._qualifying_year_config(
+                session, watch_event=watch_event
+            )
+            target_year = None if year_config is None else year_config.horrorfest_year
+            existing_active = (
+                horrorfest_repository.get_active_horrorfest_entry_for_watch(
+                    session, watch_id=watch_event.watch_id
+                )
+            )
+            if (
+                existing_active is not None
+                and existing_active.horrorfest_year != target_year
+            ):
+                HorrorfestService._soft_remove_entry(
+                    session,
+                    entry=existing_active,
+                    updated_by=watch_event.updated_by,
+                    update_reason=watch_event.update_reason,
+                )
+                compact_years.add(existing_active.horrorfest_year)
+            if target_year is None:
+                continue
+            rebuild_years.add(target_year)
+            if (
+                existing_active is None
+                or existing_active.horrorfest_year != target_year
+            ):
+                HorrorfestService._upsert_active_entry(
+                    session,
+                    watch_id=watch_event.watch_id,
+                    horrorfest_year=target_year,
+                    source_kind=HorrorfestService.AUTO_SOURCE_KINDS.get(
+                        watch_event.origin_kind, "manual"
+                    ),
+                    updated_by=watch_event.updated_by,
+                    update_reason=watch_event.update_reason,
+                )
+
+        for horrorfest_year in sorted(compact_years - rebuild_years):
+            HorrorfestService._normalize_year_orders(
+                session, horrorfest_year=horrorfest_year
+            )
+        for horrorfest_year in sorted(rebuild_years):
+            HorrorfestService._rebuild_year_orders_by_watched_at(
+                session, horrorfest_year=horrorfest_year
+            )
+
     @staticmethod
     def include_watch_event(
         session: Session,
@@ -450,6 +562,186 @@ class HorrorfestService:
                 "Horrorfest entry failed database constraints"
             ) from exc
 
+    @staticmethod
+    def include_watch_events(
+        session: Session,
+        *,
+        assignments: list[HorrorfestAssignment],
+        updated_by: str,
+        update_reason: str | None,
+        source_kind: str = "manual",
+        commit: bool = True,
+    ) -> dict[int, str]:
+        if not assignments:
+            return {}
+        normalized_updated_by = HorrorfestService._normalize_required_text(
+            updated_by, field_name="updated_by"
+        )
+        normalized_reason = HorrorfestService._normalize_optional_text(update_reason)
+        watch_ids = list(dict.fromkeys(item.watch_id for item in assignments))
+        candidates = horrorfest_repository.list_horrorfest_watch_candidates(
+            session, watch_ids=watch_ids
+        )
+        year_configs = horrorfest_repository.list_horrorfest_years_by_id(
+            session,
+            horrorfest_years=sorted({item.horrorfest_year for item in assignments}),
+        )
+        entries = {
+            (entry.watch_id, entry.horrorfest_year): entry
+            for entry in horrorfest_repository.list_horrorfest_entries_for_watches(
+                session, watch_ids=watch_ids
+            )
+        }
+        initial_active = {
+            watch_id: entry
+            for (watch_id, _year), entry in entries.items()
+            if not entry.is_removed
+        }
+        affected_years = sorted(
+            set(year_configs)
+            | {entry.horrorfest_year for entry in initial_active.values()}
+        )
+        orders: dict[int, list[UUID]] = defaultdict(list)
+        year_entries: dict[tuple[UUID, int], HorrorfestEntry] = {}
+        watched_at_by_watch = {
+            watch_id: watch_event.watched_at
+            for watch_id, (watch_event, _media_type) in candidates.items()
+        }
+        for (
+            entry,
+            watched_at,
+        ) in horrorfest_repository.list_active_horrorfest_entries_for_years(
+            session, horrorfest_years=affected_years
+        ):
+            orders[entry.horrorfest_year].append(entry.watch_id)
+            year_entries[(entry.watch_id, entry.horrorfest_year)] = entry
+            watched_at_by_watch[entry.watch_id] = watched_at
+        active_year = {
+            watch_id: entry.horrorfest_year
+            for watch_id, entry in initial_active.items()
+        }
+
+        # Replay every assignment against in-memory orderings so each year is
+        # written once instead of being renumbered after every assignment.
+        now = datetime.now(UTC)
+        planned_ids: dict[tuple[UUID, int], UUID] = {}
+
+        def sort_key(watch_id: UUID, horrorfest_year: int):
+            entry = entries.get((watch_id, horrorfest_year)) or year_entries.get(
+                (watch_id, horrorfest_year)
+            )
+            if entry is not None:
+                return (
+                    watched_at_by_watch[watch_id],
+                    entry.created_at,
+                    entry.horrorfest_entry_id,
+                )
+            return (
+                watched_at_by_watch[watch_id],
+                now,
+                planned_ids.setdefault((watch_id, horrorfest_year), uuid4()),
+            )
+
+        # Rejected assignments are reported by position instead of raising, so
+        # one bad row does not abort the rest of the batch.
+        failures: dict[int, str] = {}
+        touched_years: set[int] = set()
+        for position, item in enumerate(assignments):
+            try:
+                HorrorfestService._validate_assignment(
+                    candidates.get(item.watch_id),
+                    year_config=year_configs.get(item.horrorfest_year),
+                    watch_id=item.watch_id,
+                    horrorfest_year=item.horrorfest_year,
+                )
+            except ValueError as exc:
+                failures[position] = str(exc)
+                continue
+
+            year = item.horrorfest_year
+            previous_year = active_year.get(item.watch_id)
+            if previous_year is not None and previous_year != year:
+                orders[previous_year].remove(item.watch_id)
+                touched_years.add(previous_year)
+            active_year[item.watch_id] = year
+            touched_years.add(year)
+            ordering = orders[year]
+            if item.target_order is None:
+                if item.watch_id not in ordering:
+                    ordering.append(item.watch_id)
+                ordering.sort(key=lambda watch_id: sort_key(watch_id, year))
+            else:
+                if item.watch_id in ordering:
+                    ordering.remove(item.watch_id)
+                insert_at = max(0, min(item.target_order - 1, len(ordering)))
+                ordering.insert(insert_at, item.watch_id)
+
+        included = {
+            assignments[position].watch_id
+            for position in range(len(assignments))
+            if position not in failures
+        }
+        for watch_id in included:
+            entry = initial_active.get(watch_id)
+            if entry is not None and entry.horrorfest_year != active_year[watch_id]:
+                HorrorfestService._mark_entry_removed(
+                    entry,
+                    updated_by=normalized_updated_by,
+                    update_reason=normalized_reason,
+                    now=now,
+                )
+        session.flush()
+
+        active_entries: dict[UUID, HorrorfestEntry] = {
+            entry.watch_id: entry
+            for entry in year_entries.values()
+            if entry.watch_id not in included
+        }
+        new_entries: list[HorrorfestEntry] = []
+        for watch_id in included:
+            year = active_year[watch_id]
+            entry = entries.get((watch_id, year))
+            if entry is None:
+                entry = HorrorfestEntry(
+                    horrorfest_entry_id=planned_ids.get((watch_id, year), uuid4()),
+                    watch_id=watch_id,
+                    horrorfest_year=year,
+                    watch_order=None,
+                    source_kind=source_kind,
+                    created_at=now,
+                    updated_at=now,
+                    updated_by=normalized_updated_by,
+                    update_reason=normalized_reason,
+                    is_removed=False,
+                )
+                new_entries.append(entry)
+            else:
+                HorrorfestService._mark_entry_active(
+                    entry,
+                    source_kind=source_kind,
+                    updated_by=normalized_updated_by,
+                    update_reason=normalized_reason,
+                    now=now,
+                )
+            active_entries[watch_id] = entry
+        horrorfest_repository.create_horrorfest_entries(session, entries=new_entries)
+
+        for year in sorted(touched_years):
+            HorrorfestService._apply_ordered_entries(
+                session,
+                horrorfest_year=year,
+                ordered_entries=[active_entries[watch_id] for watch_id in orders[year]],
+            )
+        try:
+            if commit:
+                session.commit()
+            return failures
+        except IntegrityError as exc:
+            session.rollback()
+            raise HorrorfestConstraintError(
+                "Horrorfest entry failed database constraints"
+            ) from exc
+
     @staticmethod
     def remove_entry(
         session: Session,
@@ -565,35 +857,14 @@ class HorrorfestService:
         update_reason: str | None,
         target_order: int | None,
     ) -> HorrorfestEntry:
-        existing = horrorfest_repository.get_horrorfest_entry_for_watch_and_year(
+        entry = HorrorfestService._upsert_active_entry(
             session,
             watch_id=watch_event.watch_id,
             horrorfest_year=horrorfest_year,
+            source_kind=source_kind,
+            updated_by=updated_by,
+            update_reason=update_reason,
         )
-        now = datetime.now(UTC)
-        if existing is None:
-            entry = horrorfest_repository.create_horrorfest_entry(
-                session,
-                watch_id=watch_event.watch_id,
-                horrorfest_year=horrorfest_year,
-                watch_order=None,
-                source_kind=source_kind,
-                updated_at=now,
-                updated_by=updated_by,
-                update_reason=update_reason,
-            )
-        else:
-            existing.is_removed = False
-            existing.removed_at = None
-            existing.removed_by = None
-            existing.removed_reason = None
-            existing.source_kind = source_kind
-            existing.updated_at = now
-            existing.updated_by = updated_by
-            existing.update_reason = update_reason
-            entry = horrorfest_repository.update_horrorfest_entry(
-                session, entry=existing
-            )
 
         active_entries = horrorfest_repository.list_active_horrorfest_entries_for_year(
             session,
@@ -630,6 +901,42 @@ class HorrorfestService:
         )
         return entry
 
+    @staticmethod
+    def _upsert_active_entry(
+        session: Session,
+        *,
+        watch_id: UUID,
+        horrorfest_year: int,
+        source_kind: str,
+        updated_by: str | None,
+        update_reason: str | None,
+    ) -> HorrorfestEntry:
+        existing = horrorfest_repository.get_horrorfest_entry_for_watch_and_year(
+            session,
+            watch_id=watch_id,
+            horrorfest_year=horrorfest_year,
+        )
+        now = datetime.now(UTC)
+        if existing is None:
+            return horrorfest_repository.create_horrorfest_entry(
+                session,
+                watch_id=watch_id,
+                horrorfest_year=horrorfest_year,
+                watch_order=None,
+                source_kind=source_kind,
+                updated_at=now,
+                updated_by=updated_by,
+                update_reason=update_reason,
+            )
+        HorrorfestService._mark_entry_active(
+            existing,
+            source_kind=source_kind,
+            updated_by=updated_by,
+            update_reason=update_reason,
+            now=now,
+        )
+        return horrorfest_repository.update_horrorfest_entry(session, entry=existing)
+
     @staticmethod
     def _apply_ordered_entries(
         session: Session,
@@ -705,7 +1012,22 @@ class HorrorfestService:
         updated_by: str | None,
         update_reason: str | None,
     ) -> HorrorfestEntry:
-        now = datetime.now(UTC)
+        HorrorfestService._mark_entry_removed(
+            entry,
+            updated_by=updated_by,
+            update_reason=update_reason,
+            now=datetime.now(UTC),
+        )
+        return horrorfest_repository.update_horrorfest_entry(session, entry=entry)
+
+    @staticmethod
+    def _mark_entry_removed(
+        entry: HorrorfestEntry,
+        *,
+        updated_by: str | None,
+        update_reason: str | None,
+        now: datetime,
+    ) -> None:
         entry.is_removed = True
         entry.watch_order = None
         entry.removed_at = now
@@ -714,7 +1036,24 @@ class HorrorfestService:
         entry.updated_at = now
         entry.updated_by = updated_by
         entry.update_reason = update_reason
-        return horrorfest_repository.update_horrorfest_entry(session, entry=entry)
+
+    @staticmethod
+    def _mark_entry_active(
+        entry: HorrorfestEntry,
+        *,
+        source_kind: str,
+        updated_by: str | None,
+        update_reason: str | None,
+        now: datetime,
+    ) -> None:
+        entry.is_removed = False
+        entry.removed_at = None
+        entry.removed_by = None
+        entry.removed_reason = None
+        entry.source_kind = source_kind
+        entry.updated_at = now
+        entry.updated_by = updated_by
+        entry.update_reason = update_reason
 
     @staticmethod
     def _qualifying_year_config(
@@ -749,6 +1088,34 @@ class HorrorfestService:
                 "Watch event watched_at must fall inside the configured Horrorfest year window"
             )
 
+    @staticmethod
+    def _validate_assignment(
+        candidate: tuple[WatchEvent, str | None] | None,
+        *,
+        year_config: HorrorfestYear | None,
+        watch_id: UUID,
+        horrorfest_year: int,
+    ) -> None:
+        if candidate is None:
+            raise ValueError(f"Watch event '{watch_id}' not found")
+        watch_event, media_type = candidate
+        if watch_event.is_deleted:
+            raise ValueError("Cannot include a deleted watch event in Horrorfest")
+        if year_config is None:
+            raise ValueError(f"Horrorfest year '{horrorfest_year}' not found")
+        if not watch_event.completed or media_type != "movie":
+            raise ValueError(
+                "Only non-deleted completed movie watch events can be included in Horrorfest"
+            )
+        if not (
+            year_config.window_start_at
+            <= watch_event.watched_at
+            <= year_config.window_end_at
+        ):
+            raise ValueError(
+                "Watch event watched_at must fall inside the configured Horrorfest year window"
+            )
+
     @staticmethod
     def _is_watch_eligible(
         session: Session,
@@ -254,7 +254,6 @@ class HorrorfestImportService:
             watch_event.updated_by = updated_by
             watch_event.update_reason = "Imported preserved Horrorfest version"
             watch_event.updated_at = datetime.now(UTC)
-            watch_event.dedupe_hash = None
             watch_event_repository.update_watch_event(session, watch_event=watch_event)
             changed = True
 
@@ -1,3 +1,6 @@
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
@@ -15,12 +18,24 @@ class ImportBatchConstraintError(Exception):
     """Raised when import batch persistence fails constraints."""
 
 
+class ImportBatchLockedError(ValueError):
+    """Raised when another run already owns an import batch."""
+
+
 class ImportBatchService:
     @staticmethod
     def list_import_batches(session: Session, *, limit: int) -> list[ImportBatch]:
         safe_limit = max(1, min(limit, 100))
         return import_batch_repository.list_import_batches(session, limit=safe_limit)
 
+    @staticmethod
+    def list_background_import_batches(
+        session: Session, *, statuses: Iterable[str]
+    ) -> list[ImportBatch]:
+        return import_batch_repository.list_background_import_batches(
+            session, statuses=statuses
+        )
+
     @staticmethod
     def get_import_batch(session: Session, *, import_batch_id: UUID) -> ImportBatch:
         batch = import_batch_repository.get_import_batch(
@@ -30,6 +45,39 @@ class ImportBatchService:
             raise ImportBatchNotFoundError(str(import_batch_id))
         return batch
 
+    @staticmethod
+    @contextmanager
+    def hold_import_batch_lock(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+    ) -> Iterator[None]:
+        """Own an import batch for the length of one run.
+
+        A run commits many transactions, so the advisory lock is session-level
+        and lives on a dedicated autocommit connection rather than the run's
+        session. A process that dies mid-run drops the connection and with it
+        the lock, which is how an abandoned batch is told from a live one.
+        """
+        connection = (
+            session.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT")
+        )
+        try:
+            if not import_batch_repository.try_lock_import_batch(
+                connection, import_batch_id=import_batch_id
+            ):
+                raise ImportBatchLockedError(
+                    f"Import batch {import_batch_id} is being processed by another run"
+                )
+            try:
+                yield
+            finally:
+                import_batch_repository.unlock_import_batch(
+                    connection, import_batch_id=import_batch_id
+                )
+        finally:
+            connection.close()
+
     @staticmethod
     def start_import_batch(
         session: Session,
@@ -38,6 +86,7 @@ class ImportBatchService:
         source_detail: str | None,
         notes: str | None,
         parameters: dict | None = None,
+        status: str = "running",
     ) -> ImportBatch:
         normalized_source = source.strip()
         normalized_source_detail = source_detail.strip() if source_detail else None
@@ -52,6 +101,7 @@ class ImportBatchService:
                 source_detail=normalized_source_detail,
                 notes=notes,
                 parameters=parameters,
+                status=status,
             )
             session.commit()
             return batch
@@ -102,6 +152,39 @@ class ImportBatchService:
             session.rollback()
             raise ImportBatchConstraintError("Failed to finish import batch") from exc
 
+    @staticmethod
+    def update_import_batch_progress(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        watch_events_inserted: int,
+        errors_count: int,
+        status: str = "running",
+        parameters_patch: dict | None = None,
+    ) -> ImportBatch:
+        batch = import_batch_repository.get_import_batch(
+            session, import_batch_id=import_batch_id
+        )
+        if batch is None:
+            raise ImportBatchNotFoundError(str(import_batch_id))
+
+        try:
+            updated_batch = import_batch_repository.update_import_batch_progress(
+                session,
+                import_batch=batch,
+                status=status,
+                watch_events_inserted=watch_events_inserted,
+                errors_count=errors_count,
+                parameters_patch=parameters_patch,
+            )
+            session.commit()
+            return updated_batch
+        except IntegrityError as exc:
+            session.rollback()
+            raise ImportBatchConstraintError(
+                "Failed to update import batch progress"
+            ) from exc
+
     @staticmethod
     def list_import_batch_errors(
         session: Session,
@@ -123,25 +206,46 @@ class ImportBatchService:
         )
 
     @staticmethod
-    def add_import_batch_error(
-        session: Session,
+    def _normalize_import_batch_error(
         *,
-        import_batch_id: UUID,
         severity: str,
         entity_type: str | None,
         entity_ref: str | None,
         message: str,
         details: dict,
-    ) -> ImportBatchError:
+    ) -> dict:
         normalized_severity = severity.strip()
         normalized_message = message.strip()
-        normalized_entity_type = entity_type.strip() if entity_type else None
-        normalized_entity_ref = entity_ref.strip() if entity_ref else None
-
         if not normalized_severity:
             raise ValueError("severity must not be empty")
         if not normalized_message:
             raise ValueError("message must not be empty")
+        return {
+            "severity": normalized_severity,
+            "entity_type": entity_type.strip() if entity_type else None,
+            "entity_ref": entity_ref.strip() if entity_ref else None,
+            "message": normalized_message,
+            "details": details,
+        }
+
+    @staticmethod
+    def add_import_batch_error(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        severity: str,
+        entity_type: str | None,
+        entity_ref: str | None,
+        message: str,
+        details: dict,
+    ) -> ImportBatchError:
+        normalized = ImportBatchService._normalize_import_batch_error(
+            severity=severity,
+            entity_type=entity_type,
+            entity_ref=entity_ref,
+            message=message,
+            details=details,
+        )
 
         batch = import_batch_repository.get_import_batch(
             session, import_batch_id=import_batch_id
@@ -153,11 +257,7 @@ class ImportBatchService:
             error = import_batch_repository.create_import_batch_error(
                 session,
                 import_batch=batch,
-                severity=normalized_severity,
-                entity_type=normalized_entity_type,
-                entity_ref=normalized_entity_ref,
-                message=normalized_message,
-                details=details,
+                **normalized,
             )
             session.commit()
             return error
@@ -167,17 +267,54 @@ class ImportBatchService:
                 "Failed to add import batch error"
             ) from exc
 
+    @staticmethod
+    def add_import_batch_errors(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        errors: list[dict],
+    ) -> int:
+        """Insert many errors for one batch with a single multi-row insert."""
+        normalized_errors = [
+            ImportBatchService._normalize_import_batch_error(**error)
+            for error in errors
+        ]
+        if not normalized_errors:
+            return 0
+
+        batch = import_batch_repository.get_import_batch(
+            session, import_batch_id=import_batch_id
+        )
+        if batch is None:
+            raise ImportBatchNotFoundError(str(import_batch_id))
+
+        try:
+            inserted = import_batch_repository.create_import_batch_errors(
+                session,
+                import_batch=batch,
+                errors=normalized_errors,
+            )
+            session.commit()
+            return inserted
+        except IntegrityError as exc:
+            session.rollback()
+            raise ImportBatchConstraintError(
+                "Failed to add import batch errors"
+            ) from exc
+
     @staticmethod
     def get_latest_import_batch_for_source(
         session: Session,
         *,
         source: str,
         source_detail: str | None,
+        exclude_import_batch_id: UUID | None = None,
     ) -> ImportBatch | None:
         return import_batch_repository.get_latest_import_batch_for_source(
             session,
             source=source,
             source_detail=source_detail,
+            exclude_import_batch_id=exclude_import_batch_id,
         )
 
     @staticmethod
@@ -192,3 +329,54 @@ class ImportBatchService:
             source=source,
             source_detail=source_detail,
         )
+
+
+class ImportBatchErrorSink:
+    """Buffers import batch errors and writes them in bulk on ``flush``.
+
+    With ``aggregate_info`` set, info-severity records only count their reason.
+    """
+
+    def __init__(
+        self,
+        *,
+        import_batch_id: UUID,
+        aggregate_info: bool = False,
+        info_counts: dict[str, int] | None = None,
+    ) -> None:
+        self.import_batch_id = import_batch_id
+        self.aggregate_info = aggregate_info
+        self.info_counts: Counter[str] = Counter(info_counts or {})
+        self._pending: list[dict] = []
+
+    def add(
+        self,
+        *,
+        severity: str,
+        entity_type: str | None,
+        entity_ref: str | None,
+        message: str,
+        details: dict,
+    ) -> None:
+        if self.aggregate_info and severity == "info":
+            self.info_counts[details.get("reason") or message] += 1
+            return
+        self._pending.append(
+            {
+                "severity": severity,
+                "entity_type": entity_type,
+                "entity_ref": entity_ref,
+                "message": message,
+                "details": details,
+            }
+        )
+
+    def flush(self, session: Session) -> int:
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        return ImportBatchService.add_import_batch_errors(
+            session,
+            import_batch_id=self.import_batch_id,
+            errors=pending,
+        )
@@ -0,0 +1,257 @@
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.models.entities import ImportBatch
+from app.db.session import SessionLocal
+from app.schemas.imports import (
+    LegacySourceWatchEventImportOptions,
+    WatchEventImportOptions,
+    WatchEventImportRequest,
+)
+from app.services.import_batches import (
+    ImportBatchLockedError,
+    ImportBatchNotFoundError,
+    ImportBatchService,
+)
+from app.services.imports import (
+    LegacySourceImportChunk,
+    WatchEventImportResult,
+    WatchEventImportService,
+)
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_IMPORT_JOB_STATUSES = frozenset({"queued", "running"})
+INTERRUPTED_IMPORT_JOB_MESSAGE = (
+    "Import job was interrupted before it finished; "
+    "resume it with resume_import_batch_id"
+)
+
+ImportJobRun = Callable[[Session, UUID | None], WatchEventImportResult]
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().klug_import_job_workers),
+                thread_name_prefix="klug-import",
+            )
+        return _executor
+
+
+def _submit_import_job(job: Callable[[], None]) -> Future:
+    return _get_executor().submit(job)
+
+
+def _run_import_job(
+    *,
+    job_id: UUID,
+    claim_import_batch_id: UUID | None,
+    run: ImportJobRun,
+    cleanup: Callable[[], None] | None,
+) -> None:
+    session = SessionLocal()
+    try:
+        run(session, claim_import_batch_id)
+    except ImportBatchLockedError:
+        # Another run owns the batch and will finish it; failing it here would
+        # overwrite that run's status.
+        logger.warning("Import job %s skipped: batch is owned by another run", job_id)
+    except Exception as exc:
+        # Nothing awaits the future, so the batch row is the only place the
+        # failure can surface.
+        logger.exception("Import job %s failed", job_id)
+        session.rollback()
+        ImportJobService._mark_failed(session, job_id=job_id, message=str(exc))
+    finally:
+        session.close()
+        if cleanup is not None:
+            cleanup()
+
+
+class ImportJobService:
+    @staticmethod
+    def get_import_job(session: Session, *, job_id: UUID) -> ImportBatch:
+        return ImportBatchService.get_import_batch(session, import_batch_id=job_id)
+
+    @staticmethod
+    def enqueue_import(
+        session: Session,
+        *,
+        payload: WatchEventImportRequest,
+    ) -> ImportBatch:
+        payload = payload.model_copy(
+            update={"commit_every": ImportJobService._job_commit_every(payload)}
+        )
+
+        def run(job_session: Session, import_batch_id: UUID | None):
+            return WatchEventImportService.run_import(
+                job_session,
+                payload=payload,
+                import_batch_id=import_batch_id,
+            )
+
+        return ImportJobService._enqueue(
+            session,
+            source=payload.source,
+            options=payload,
+            run=run,
+        )
+
+    @staticmethod
+    def enqueue_legacy_source_import_stream(
+        session: Session,
+        *,
+        options: LegacySourceWatchEventImportOptions,
+        open_chunks: Callable[[], Iterable[LegacySourceImportChunk]],
+        count_rows: Callable[[], int] | None = None,
+        cleanup: Callable[[], None] | None = None,
+    ) -> ImportBatch:
+        options = options.model_copy(
+            update={"commit_every": ImportJobService._job_commit_every(options)}
+        )
+
+        def run(job_session: Session, import_batch_id: UUID | None):
+            total_count = count_rows() if count_rows is not None else None
+            return WatchEventImportService.run_legacy_source_import_stream(
+                job_session,
+                options=options,
+                chunks=open_chunks(),
+                import_batch_id=import_batch_id,
+                total_count=total_count,
+            )
+
+        return ImportJobService._enqueue(
+            session,
+            source="legacy_source_export",
+            options=options,
+            run=run,
+            cleanup=cleanup,
+        )
+
+    @staticmethod
+    def _job_commit_every(
+        options: WatchEventImportOptions | LegacySourceWatchEventImportOptions,
+    ) -> int:
+        # Progress is published with each checkpoint, so jobs always have one.
+        return options.commit_every or get_settings().klug_import_stream_chunk_rows
+
+    @staticmethod
+    def _enqueue(
+        session: Session,
+        *,
+        source: str,
+        options: WatchEventImportOptions | LegacySourceWatchEventImportOptions,
+        run: ImportJobRun,
+        cleanup: Callable[[], None] | None = None,
+    ) -> ImportBatch:
+        if options.dry_run:
+            raise ValueError("dry_run imports cannot run as background jobs")
+
+        if options.resume_import_batch_id is not None:
+            try:
+                batch = ImportBatchService.get_import_batch(
+                    session, import_batch_id=options.resume_import_batch_id
+                )
+            except ImportBatchNotFoundError as exc:
+                raise ValueError(
+                    f"Import batch not found: {options.resume_import_batch_id}"
+                ) from exc
+            # Fail fast while the caller is still waiting; the job takes the
+            # lock again for the whole run.
+            with ImportBatchService.hold_import_batch_lock(
+                session, import_batch_id=batch.import_batch_id
+            ):
+                pass
+            claim_import_batch_id = None
+        else:
+            mode = options.mode.value
+            batch = ImportBatchService.start_import_batch(
+                session,
+                source=source,
+                source_detail=options.source_detail or mode,
+                notes=options.notes,
+                parameters={"mode": mode, "background": True},
+                status="queued",
+            )
+            claim_import_batch_id = batch.import_batch_id
+
+        _submit_import_job(
+            partial(
+                _run_import_job,
+                job_id=batch.import_batch_id,
+                claim_import_batch_id=claim_import_batch_id,
+                run=run,
+                cleanup=cleanup,
+            )
+        )
+        return batch
+
+    @staticmethod
+    def recover_interrupted_jobs(session: Session) -> list[UUID]:
+        """Fail job batches that lost their worker when its process stopped.
+
+        Jobs run in an in-process pool, so after a restart nothing picks up a
+        queued or running job batch again. A batch whose lock is still held
+        belongs to a live run and is left alone; the rest are failed so they
+        stop looking live and can be resumed with `resume_import_batch_id`.
+        """
+        recovered: list[UUID] = []
+        for batch in ImportBatchService.list_background_import_batches(
+            session, statuses=ACTIVE_IMPORT_JOB_STATUSES
+        ):
+            try:
+                with ImportBatchService.hold_import_batch_lock(
+                    session, import_batch_id=batch.import_batch_id
+                ):
+                    ImportJobService._mark_failed(
+                        session,
+                        job_id=batch.import_batch_id,
+                        message=INTERRUPTED_IMPORT_JOB_MESSAGE,
+                    )
+            except ImportBatchLockedError:
+                continue
+            logger.warning(
+                "Import job %s was interrupted and marked failed", batch.import_batch_id
+            )
+            recovered.append(batch.import_batch_id)
+        return recovered
+
+    @staticmethod
+    def _mark_failed(session: Session, *, job_id: UUID, message: str) -> None:
+        batch = ImportBatchService.get_import_batch(session, import_batch_id=job_id)
+        if batch.status not in ACTIVE_IMPORT_JOB_STATUSES:
+            # The import already finished its batch; only attach the error.
+            ImportBatchService.update_import_batch_progress(
+                session,
+                import_batch_id=job_id,
+                status=batch.status,
+                watch_events_inserted=batch.watch_events_inserted,
+                errors_count=batch.errors_count,
+                parameters_patch={"job_error": message},
+            )
+            return
+        ImportBatchService.finish_import_batch(
+            session,
+            import_batch_id=job_id,
+            status="failed",
+            watch_events_inserted=batch.watch_events_inserted,
+            media_items_inserted=batch.media_items_inserted,
+            media_versions_inserted=batch.media_versions_inserted,
+            tags_added=batch.tags_added,
+            errors_count=batch.errors_count + 1,
+            notes=batch.notes,
+            parameters_patch={"job_error": message},
+        )
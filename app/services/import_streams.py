@@ -0,0 +1,153 @@
+import codecs
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+JSON_ROW_CONTAINER_KEYS = ("rows", "watched", "history")
+STREAM_READ_SIZE = 64 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_SHAPE_ERROR = (
+    "JSON input must be a list of row objects, or object containing one of: "
+    "rows/watched/history"
+)
+
+
+class _JsonStreamReader:
+    """Decodes one JSON value at a time from a rolling text buffer."""
+
+    def __init__(self, stream: BinaryIO, *, read_size: int) -> None:
+        self._stream = stream
+        self._read_size = read_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._stream.read(self._read_size)
+        if data:
+            text = self._decoder.decode(data)
+        else:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _JSON_WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        if self.peek() != token:
+            raise ValueError(f"Invalid JSON input: expected '{token}'")
+        self._position += 1
+
+    def value(self) -> Any:
+        if not self.peek():
+            raise ValueError("Invalid JSON input: unexpected end of input")
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value that ends exactly at the buffer edge may be a truncated
+            # number, so only accept it once a delimiter or EOF follows it.
+            if end < len(self._buffer) or self._eof:
+                self._position = end
+                return value
+            self._fill()
+
+    def array_items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            if separator not in {",", "]"}:
+                raise ValueError("Invalid JSON input: expected ',' or ']'")
+            self._position += 1
+            if separator == "]":
+                return
+
+
+def iter_json_rows(
+    stream: BinaryIO,
+    *,
+    read_size: int = STREAM_READ_SIZE,
+) -> Iterator[Any]:
+    reader = _JsonStreamReader(stream, read_size=read_size)
+    opening = reader.peek()
+    if opening == "[":
+        yield from reader.array_items()
+    elif opening == "{":
+        reader.expect("{")
+        found_rows = False
+        if reader.peek() != "}":
+            while True:
+                key = reader.value()
+                reader.expect(":")
+                if (
+                    not found_rows
+                    and key in JSON_ROW_CONTAINER_KEYS
+                    and reader.peek() == "["
+                ):
+                    found_rows = True
+                    yield from reader.array_items()
+                else:
+                    reader.value()
+                if reader.peek() != ",":
+                    break
+                reader.expect(",")
+        reader.expect("}")
+        if not found_rows:
+            raise ValueError(_JSON_SHAPE_ERROR)
+    elif opening:
+        raise ValueError(_JSON_SHAPE_ERROR)
+    else:
+        raise ValueError("Invalid JSON input: unexpected end of input")
+
+    if reader.peek():
+        raise ValueError("Invalid JSON input: unexpected data after the top level")
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[dict[str, Any]]:
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        for row in csv.DictReader(text_stream):
+            yield {
+                (key.lstrip("\ufeff") if isinstance(key, str) else key): value
+                for key, value in row.items()
+                if key is not None
+            }
+    except csv.Error as exc:
+        raise ValueError(f"Invalid CSV input: {exc}") from exc
+    finally:
+        # Leave the caller's stream open.
+        text_stream.detach()
+
+
+def iter_rows(stream: BinaryIO, file_format: str) -> Iterator[Any]:
+    if file_format == "json":
+        return iter_json_rows(stream)
+    if file_format == "csv":
+        return iter_csv_rows(stream)
+    raise ValueError(f"Unsupported format: {file_format}")
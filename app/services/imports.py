@@ -1,26 +1,56 @@
+import hashlib
+import time
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from uuid import UUID
+from datetime import UTC, datetime, timedelta
+from itertools import batched, chain
+from uuid import UUID, uuid4
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.datetime_utils import ensure_timezone_aware, to_utc_z_string
+from app.core.dedupe import dedupe_hash_enabled, watch_event_dedupe_hash
+from app.db.models.entities import ImportBatch
+from app.repositories import watch_event_imports as watch_event_import_repository
+from app.repositories import watch_events as watch_event_repository
 from app.schemas.imports import (
+    ImportedWatchEvent,
+    LegacySourceWatchEventImportOptions,
     LegacySourceWatchEventImportRequest,
+    LegacySourceWatchEventRow,
+    WatchEventImportOptions,
     WatchEventImportRequest,
 )
 from app.services.import_adapters import (
     LegacySourceWatchEventImportAdapter,
+    WatchEventCreateArgs,
+    WatchEventImportAdapter,
     get_watch_event_import_adapter,
 )
-from app.services.import_batches import ImportBatchService
-from app.services.horrorfest import HorrorfestConstraintError, HorrorfestService
+from app.services.import_batches import (
+    ImportBatchErrorSink,
+    ImportBatchNotFoundError,
+    ImportBatchService,
+)
+from app.services.horrorfest import HorrorfestAssignment, HorrorfestService
 from app.services.watch_events import (
     WatchEventConstraintError,
     WatchEventDuplicateError,
     WatchEventService,
 )
 
+RESUMABLE_IMPORT_BATCH_STATUSES = frozenset({"queued", "running", "failed"})
+
+
+class WatchEventImportFailedError(ValueError):
+    """Raised when an import stops after committing part of its batch."""
+
+    def __init__(self, message: str, *, import_batch_id: UUID) -> None:
+        super().__init__(message)
+        self.import_batch_id = import_batch_id
+
 
 @dataclass(frozen=True)
 class WatchEventImportResult:
@@ -39,21 +69,43 @@ class WatchEventImportResult:
     cursor_after: dict | None = None
 
 
+@dataclass(frozen=True)
+class WatchEventImportChunk:
+    events: list[ImportedWatchEvent]
+    rejected_before_import: int = 0
+    media_items_created: int = 0
+    shows_created: int = 0
+
+
+@dataclass(frozen=True)
+class LegacySourceImportChunk:
+    rows: Sequence[dict]
+    rejected_before_import: int = 0
+    media_items_created: int = 0
+    shows_created: int = 0
+
+
+@dataclass(frozen=True)
+class WatchEventImportCounts:
+    inserted_count: int
+    skipped_count: int
+    collision_deduped_count: int
+    error_count: int
+    cursor_after: dict | None
+
+
 class WatchEventImportService:
     @staticmethod
     def _record_skip(
-        session: Session,
+        error_sink: ImportBatchErrorSink,
         *,
-        import_batch_id: UUID,
         row_index: int,
         mapped,
         mode: str,
         reason: str,
         message: str,
     ) -> None:
-        ImportBatchService.add_import_batch_error(
-            session,
-            import_batch_id=import_batch_id,
+        error_sink.add(
             severity="info",
             entity_type="watch_event",
             entity_ref=mapped.source_event_id or str(row_index),
@@ -125,6 +177,7 @@ class WatchEventImportService:
         source: str,
         source_detail: str,
         resume_from_latest: bool,
+        exclude_import_batch_id: UUID | None = None,
     ) -> dict | None:
         if not resume_from_latest:
             return None
@@ -133,6 +186,7 @@ class WatchEventImportService:
             session,
             source=source,
             source_detail=source_detail,
+            exclude_import_batch_id=exclude_import_batch_id,
         )
         if latest_batch is None:
             return None
@@ -143,6 +197,81 @@ class WatchEventImportService:
             return cursor
         return None
 
+    @staticmethod
+    def _get_resumable_import_batch(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        source: str,
+    ) -> ImportBatch:
+        try:
+            batch = ImportBatchService.get_import_batch(
+                session, import_batch_id=import_batch_id
+            )
+        except ImportBatchNotFoundError as exc:
+            raise ValueError(f"Import batch not found: {import_batch_id}") from exc
+        if batch.source != source.strip():
+            raise ValueError(
+                f"Import batch {import_batch_id} belongs to source {batch.source}"
+            )
+        if batch.status not in RESUMABLE_IMPORT_BATCH_STATUSES:
+            raise ValueError(
+                f"Import batch {import_batch_id} is {batch.status} and cannot be resumed"
+            )
+        return batch
+
+    @staticmethod
+    def _get_queued_import_batch(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        source: str,
+    ) -> ImportBatch:
+        try:
+            batch = ImportBatchService.get_import_batch(
+                session, import_batch_id=import_batch_id
+            )
+        except ImportBatchNotFoundError as exc:
+            raise ValueError(f"Import batch not found: {import_batch_id}") from exc
+        if batch.source != source.strip():
+            raise ValueError(
+                f"Import batch {import_batch_id} belongs to source {batch.source}"
+            )
+        if batch.status != "queued":
+            raise ValueError(
+                f"Import batch {import_batch_id} is {batch.status}, not queued"
+            )
+        return batch
+
+    @staticmethod
+    def _progress(
+        *,
+        processed_count: int,
+        total_count: int | None,
+        totals: WatchEventImportCounts,
+        rows_this_run: int,
+        elapsed_seconds: float,
+    ) -> dict:
+        eta_seconds = None
+        if total_count is not None and rows_this_run > 0:
+            remaining = max(0, total_count - processed_count)
+            eta_seconds = round(elapsed_seconds / rows_this_run * remaining, 1)
+        return {
+            "processed_count": processed_count,
+            "total_count": total_count,
+            "inserted_count": totals.inserted_count,
+            "skipped_count": totals.skipped_count,
+            "error_count": totals.error_count,
+            "eta_seconds": eta_seconds,
+            "updated_at": to_utc_z_string(datetime.now(UTC)),
+        }
+
+    @staticmethod
+    def _skip_counts_patch(error_sink: ImportBatchErrorSink) -> dict:
+        if not error_sink.aggregate_info:
+            return {}
+        return {"skip_reason_counts": dict(error_sink.info_counts)}
+
     @staticmethod
     def _max_cursor(left: dict | None, right: dict | None) -> dict | None:
         if left is None:
@@ -159,15 +288,15 @@ class WatchEventImportService:
         return left if left_key >= right_key else right
 
     @staticmethod
-    def run_import(
-        session: Session,
+    def _map_import_chunk(
+        adapter: WatchEventImportAdapter,
+        chunk: WatchEventImportChunk,
         *,
-        payload: WatchEventImportRequest,
-    ) -> WatchEventImportResult:
-        adapter = get_watch_event_import_adapter(payload.source)
+        start_index: int,
+    ) -> list[tuple[int, WatchEventCreateArgs]]:
         mapped_events = [
-            (index, adapter.to_watch_event_create_args(event))
-            for index, event in enumerate(payload.events)
+            (start_index + offset, adapter.to_watch_event_create_args(event))
+            for offset, event in enumerate(chunk.events)
         ]
         mapped_events.sort(
             key=lambda item: (
@@ -176,84 +305,514 @@ class WatchEventImportService:
                 item[0],
             )
         )
-        source_detail = payload.source_detail or payload.mode.value
-        cursor_before = (
-            WatchEventImportService._resolve_cursor_before(
-                session,
-                source=payload.source,
-                source_detail=source_detail,
-                resume_from_latest=payload.resume_from_latest,
+        return mapped_events
+
+    @staticmethod
+    def _digest_input(events: Sequence[ImportedWatchEvent]) -> bytes:
+        return "".join(
+            f"{event.user_id}|{event.media_item_id}|{event.watched_at.isoformat()}|"
+            f"{event.playback_source}|{event.source_event_id or ''}\n"
+            for event in events
+        ).encode()
+
+    @staticmethod
+    def _check_resume_chunk(
+        checkpoint: dict,
+        *,
+        chunk_start: int,
+        chunk_end: int,
+        input_digest: str,
+    ) -> None:
+        """Refuse a resume that would skip different rows than the run committed.
+
+        Rows are ordered within each chunk before they are imported, so a
+        checkpoint covers every chunk before its own plus the first rows of its
+        own chunk in that order. Only the same rows, split at the same chunk
+        boundaries, skip exactly those.
+        """
+        rows_completed = checkpoint["row_index"]
+        saved_start = checkpoint.get("chunk_start")
+        saved_end = checkpoint.get("chunk_end")
+        if saved_end is not None and rows_completed < saved_end:
+            matches = chunk_end <= saved_start or (chunk_start, chunk_end) == (
+                saved_start,
+                saved_end,
+            )
+        else:
+            matches = chunk_end <= rows_completed
+        if matches and chunk_end == saved_end:
+            matches = input_digest == checkpoint.get("input_digest")
+        if not matches:
+            raise ValueError(
+                f"Resume input does not match the checkpoint at row {rows_completed}; "
+                "resume with the same input split into the same chunks as the "
+                "interrupted run"
             )
-            if payload.mode.value == "incremental"
-            else None
+
+    @staticmethod
+    def _merge_counts(
+        left: WatchEventImportCounts,
+        right: WatchEventImportCounts,
+    ) -> WatchEventImportCounts:
+        return WatchEventImportCounts(
+            inserted_count=left.inserted_count + right.inserted_count,
+            skipped_count=left.skipped_count + right.skipped_count,
+            collision_deduped_count=(
+                left.collision_deduped_count + right.collision_deduped_count
+            ),
+            error_count=left.error_count + right.error_count,
+            cursor_after=WatchEventImportService._max_cursor(
+                left.cursor_after, right.cursor_after
+            ),
         )
-        cursor_after = cursor_before
 
+    @staticmethod
+    def _run_dry_run(
+        *,
+        mode: str,
+        mapped_events: list[tuple[int, WatchEventCreateArgs]],
+        cursor_before: dict | None,
+    ) -> WatchEventImportCounts:
+        cursor_after = cursor_before
         inserted_count = 0
         skipped_count = 0
-        collision_deduped_count = 0
         error_count = 0
-
-        if payload.dry_run:
-            for _index, mapped in mapped_events:
-                if not mapped.playback_source.strip():
-                    error_count += 1
-                else:
-                    if payload.mode.value == "incremental" and (
-                        WatchEventImportService._is_at_or_before_cursor(
-                            watched_at=mapped.watched_at,
-                            source_event_id=mapped.source_event_id,
-                            cursor=cursor_before,
-                        )
-                    ):
-                        skipped_count += 1
-                        continue
-                    cursor_after = WatchEventImportService._max_cursor(
-                        cursor_after,
-                        WatchEventImportService._to_cursor(
-                            watched_at=mapped.watched_at,
-                            source_event_id=mapped.source_event_id,
-                        ),
+        for _index, mapped in mapped_events:
+            if not mapped.playback_source.strip():
+                error_count += 1
+            else:
+                if mode == "incremental" and (
+                    WatchEventImportService._is_at_or_before_cursor(
+                        watched_at=mapped.watched_at,
+                        source_event_id=mapped.source_event_id,
+                        cursor=cursor_before,
                     )
-                    inserted_count += 1
+                ):
+                    skipped_count += 1
+                    continue
+                cursor_after = WatchEventImportService._max_cursor(
+                    cursor_after,
+                    WatchEventImportService._to_cursor(
+                        watched_at=mapped.watched_at,
+                        source_event_id=mapped.source_event_id,
+                    ),
+                )
+                inserted_count += 1
+        return WatchEventImportCounts(
+            inserted_count=inserted_count,
+            skipped_count=skipped_count,
+            collision_deduped_count=0,
+            error_count=error_count,
+            cursor_after=cursor_after,
+        )
+
+    @staticmethod
+    def run_import(
+        session: Session,
+        *,
+        payload: WatchEventImportRequest,
+        import_batch_id: UUID | None = None,
+    ) -> WatchEventImportResult:
+        return WatchEventImportService.run_import_stream(
+            session,
+            options=payload,
+            chunks=[WatchEventImportChunk(events=payload.events)],
+            import_batch_id=import_batch_id,
+            total_count=len(payload.events),
+        )
+
+    @staticmethod
+    def run_import_stream(
+        session: Session,
+        *,
+        options: WatchEventImportOptions,
+        chunks: Iterable[WatchEventImportChunk],
+        import_batch_id: UUID | None = None,
+        total_count: int | None = None,
+    ) -> WatchEventImportResult:
+        """Import events chunk by chunk under a single import batch.
+
+        ``import_batch_id`` names a queued batch to claim instead of starting one.
+        The run holds the batch's lock throughout, so a resume or claim of a
+        batch another run is still processing fails instead of racing it.
+        """
+        with ExitStack() as batch_lock:
+            return WatchEventImportService._run_import_stream(
+                session,
+                options=options,
+                chunks=chunks,
+                import_batch_id=import_batch_id,
+                total_count=total_count,
+                batch_lock=batch_lock,
+            )
+
+    @staticmethod
+    def _run_import_stream(
+        session: Session,
+        *,
+        options: WatchEventImportOptions,
+        chunks: Iterable[WatchEventImportChunk],
+        import_batch_id: UUID | None,
+        total_count: int | None,
+        batch_lock: ExitStack,
+    ) -> WatchEventImportResult:
+        adapter = get_watch_event_import_adapter(options.source)
+        chunk_iterator = iter(chunks)
+        leading_chunks: list[WatchEventImportChunk] = []
+        for chunk in chunk_iterator:
+            leading_chunks.append(chunk)
+            if chunk.events:
+                break
+        else:
+            raise ValueError("No valid rows available for import")
+        chunk_iterator = chain(leading_chunks, chunk_iterator)
+
+        mode = options.mode.value
+        source_detail = options.source_detail or mode
+        batch = None
+        checkpoint: dict = {}
+        continuing = False
+        commit_every = options.commit_every
+        if import_batch_id is not None and (
+            options.dry_run or options.resume_import_batch_id is not None
+        ):
+            raise ValueError("A queued import batch cannot run a dry run or a resume")
+        if options.resume_import_batch_id is not None:
+            if options.dry_run:
+                raise ValueError("dry_run cannot resume an import batch")
+            # Lock before reading the checkpoint, so it is the one the previous
+            # owner left behind rather than one it is still advancing.
+            batch_lock.enter_context(
+                ImportBatchService.hold_import_batch_lock(
+                    session, import_batch_id=options.resume_import_batch_id
+                )
+            )
+            batch = WatchEventImportService._get_resumable_import_batch(
+                session,
+                import_batch_id=options.resume_import_batch_id,
+                source=options.source,
+            )
+            parameters = batch.parameters or {}
+            commit_every = commit_every or parameters.get("commit_every")
+            if "cursor_before" not in parameters:
+                # Its job never started, so there is no cursor or checkpoint to
+                # continue; run it as that job would have.
+                import_batch_id = batch.import_batch_id
+            else:
+                continuing = True
+                cursor_before = parameters.get("cursor_before")
+                checkpoint = parameters.get("checkpoint") or {}
+        elif import_batch_id is not None:
+            batch_lock.enter_context(
+                ImportBatchService.hold_import_batch_lock(
+                    session, import_batch_id=import_batch_id
+                )
+            )
+            batch = WatchEventImportService._get_queued_import_batch(
+                session,
+                import_batch_id=import_batch_id,
+                source=options.source,
+            )
+        if not continuing:
+            cursor_before = (
+                WatchEventImportService._resolve_cursor_before(
+                    session,
+                    source=options.source,
+                    source_detail=source_detail,
+                    resume_from_latest=options.resume_from_latest,
+                    exclude_import_batch_id=import_batch_id,
+                )
+                if mode == "incremental"
+                else None
+            )
+        rows_completed = checkpoint.get("row_index", 0)
+        totals = WatchEventImportCounts(
+            inserted_count=checkpoint.get("inserted_count", 0),
+            skipped_count=checkpoint.get("skipped_count", 0),
+            collision_deduped_count=checkpoint.get("collision_deduped_count", 0),
+            error_count=checkpoint.get("error_count", 0),
+            cursor_after=checkpoint.get("cursor", cursor_before),
+        )
+        processed_count = 0
+        rejected_before_import = checkpoint.get(
+            "rejected_before_import", options.rejected_before_import
+        )
+        media_items_created = checkpoint.get(
+            "media_items_created", options.media_items_created
+        )
+        shows_created = checkpoint.get("shows_created", options.shows_created)
+
+        if options.dry_run:
+            for chunk in chunk_iterator:
+                mapped_events = WatchEventImportService._map_import_chunk(
+                    adapter, chunk, start_index=processed_count
+                )
+                processed_count += len(chunk.events)
+                rejected_before_import += chunk.rejected_before_import
+                media_items_created += chunk.media_items_created
+                shows_created += chunk.shows_created
+                totals = WatchEventImportService._merge_counts(
+                    totals,
+                    WatchEventImportService._run_dry_run(
+                        mode=mode,
+                        mapped_events=mapped_events,
+                        cursor_before=cursor_before,
+                    ),
+                )
             return WatchEventImportResult(
                 import_batch_id=UUID("00000000-0000-0000-0000-000000000000"),
                 status="dry_run",
                 dry_run=True,
-                processed_count=len(payload.events),
-                inserted_count=inserted_count,
-                skipped_count=skipped_count,
-                collision_deduped_count=collision_deduped_count,
-                error_count=error_count,
-                rejected_before_import=payload.rejected_before_import,
-                media_items_created=payload.media_items_created,
-                shows_created=payload.shows_created,
+                processed_count=processed_count,
+                inserted_count=totals.inserted_count,
+                skipped_count=totals.skipped_count,
+                collision_deduped_count=totals.collision_deduped_count,
+                error_count=totals.error_count,
+                rejected_before_import=rejected_before_import,
+                media_items_created=media_items_created,
+                shows_created=shows_created,
                 cursor_before=cursor_before,
-                cursor_after=cursor_after,
+                cursor_after=totals.cursor_after,
             )
 
-        batch = ImportBatchService.start_import_batch(
+        start_parameters = {
+            "mode": mode,
+            "resume_from_latest": options.resume_from_latest,
+            "bulk": options.bulk,
+            "aggregate_skips": options.aggregate_skips,
+            "commit_every": commit_every,
+            "cursor_before": cursor_before,
+            "rejected_before_import": rejected_before_import,
+            "media_items_created": media_items_created,
+            "shows_created": shows_created,
+        }
+        if batch is None:
+            batch = ImportBatchService.start_import_batch(
+                session,
+                source=options.source,
+                source_detail=source_detail,
+                notes=options.notes,
+                parameters=start_parameters,
+            )
+            batch_lock.enter_context(
+                ImportBatchService.hold_import_batch_lock(
+                    session, import_batch_id=batch.import_batch_id
+                )
+            )
+        elif import_batch_id is not None:
+            ImportBatchService.update_import_batch_progress(
+                session,
+                import_batch_id=batch.import_batch_id,
+                watch_events_inserted=0,
+                errors_count=0,
+                parameters_patch=start_parameters,
+            )
+        else:
+            ImportBatchService.update_import_batch_progress(
+                session,
+                import_batch_id=batch.import_batch_id,
+                watch_events_inserted=totals.inserted_count,
+                errors_count=totals.error_count,
+                parameters_patch={"resumed_from_row_index": rows_completed},
+            )
+
+        run_engine = (
+            WatchEventImportService._run_bulk_import
+            if options.bulk
+            else WatchEventImportService._run_row_import
+        )
+        error_sink = ImportBatchErrorSink(
+            import_batch_id=batch.import_batch_id,
+            aggregate_info=options.aggregate_skips,
+            info_counts=checkpoint.get("skip_reason_counts"),
+        )
+
+        run_started = time.monotonic()
+        input_digest = hashlib.sha256()
+        try:
+            for chunk in chunk_iterator:
+                chunk_start = processed_count
+                processed_count += len(chunk.events)
+                input_digest.update(WatchEventImportService._digest_input(chunk.events))
+                if chunk_start < rows_completed:
+                    WatchEventImportService._check_resume_chunk(
+                        checkpoint,
+                        chunk_start=chunk_start,
+                        chunk_end=processed_count,
+                        input_digest=input_digest.hexdigest(),
+                    )
+                # Rows before the checkpoint were committed by an earlier run,
+                # including the preprocessing counters of the chunks they came from.
+                if chunk_start >= rows_completed:
+                    rejected_before_import += chunk.rejected_before_import
+                    media_items_created += chunk.media_items_created
+                    shows_created += chunk.shows_created
+                if processed_count <= rows_completed:
+                    continue
+                mapped_events = WatchEventImportService._map_import_chunk(
+                    adapter, chunk, start_index=chunk_start
+                )
+                pending_events = mapped_events[max(0, rows_completed - chunk_start) :]
+                committed_rows = processed_count - len(pending_events)
+                for window in batched(
+                    pending_events, commit_every or len(pending_events)
+                ):
+                    totals = WatchEventImportService._merge_counts(
+                        totals,
+                        run_engine(
+                            session,
+                            import_batch_id=batch.import_batch_id,
+                            error_sink=error_sink,
+                            mode=mode,
+                            mapped_events=list(window),
+                            cursor_before=cursor_before,
+                        ),
+                    )
+                    error_sink.flush(session)
+                    committed_rows += len(window)
+                    if commit_every is not None:
+                        ImportBatchService.update_import_batch_progress(
+                            session,
+                            import_batch_id=batch.import_batch_id,
+                            watch_events_inserted=totals.inserted_count,
+                            errors_count=totals.error_count,
+                            parameters_patch={
+                                "checkpoint": {
+                                    "row_index": committed_rows,
+                                    "chunk_start": chunk_start,
+                                    "chunk_end": processed_count,
+                                    "input_digest": input_digest.hexdigest(),
+                                    "cursor": totals.cursor_after,
+                                    "inserted_count": totals.inserted_count,
+                                    "skipped_count": totals.skipped_count,
+                                    "collision_deduped_count": (
+                                        totals.collision_deduped_count
+                                    ),
+                                    "error_count": totals.error_count,
+                                    "rejected_before_import": rejected_before_import,
+                                    "media_items_created": media_items_created,
+                                    "shows_created": shows_created,
+                                    **WatchEventImportService._skip_counts_patch(
+                                        error_sink
+                                    ),
+                                },
+                                "progress": WatchEventImportService._progress(
+                                    processed_count=committed_rows,
+                                    total_count=total_count,
+                                    totals=totals,
+                                    rows_this_run=committed_rows - rows_completed,
+                                    elapsed_seconds=time.monotonic() - run_started,
+                                ),
+                            },
+                        )
+            if processed_count < rows_completed:
+                raise ValueError(
+                    f"Resume input has {processed_count} rows but the checkpoint "
+                    f"already covers {rows_completed}"
+                )
+        except ValueError as exc:
+            # Chunks already imported stay committed; keep the previous cursor so
+            # a resumed run does not skip rows this run never reached.
+            session.rollback()
+            error_sink.flush(session)
+            ImportBatchService.finish_import_batch(
+                session,
+                import_batch_id=batch.import_batch_id,
+                status="failed",
+                watch_events_inserted=totals.inserted_count,
+                media_items_inserted=0,
+                media_versions_inserted=0,
+                tags_added=0,
+                errors_count=totals.error_count + 1,
+                notes=options.notes,
+                parameters_patch={
+                    "cursor_before": cursor_before,
+                    "cursor": cursor_before,
+                    "processed_count": processed_count,
+                    "rejected_before_import": rejected_before_import,
+                    "media_items_created": media_items_created,
+                    "shows_created": shows_created,
+                    "collision_deduped_count": totals.collision_deduped_count,
+                    **WatchEventImportService._skip_counts_patch(error_sink),
+                },
+            )
+            raise WatchEventImportFailedError(
+                str(exc), import_batch_id=batch.import_batch_id
+            ) from exc
+
+        final_status = (
+            "completed" if totals.error_count == 0 else "completed_with_errors"
+        )
+        finalized_batch = ImportBatchService.finish_import_batch(
             session,
-            source=payload.source,
-            source_detail=source_detail,
-            notes=payload.notes,
-            parameters={
-                "mode": payload.mode.value,
-                "resume_from_latest": payload.resume_from_latest,
+            import_batch_id=batch.import_batch_id,
+            status=final_status,
+            watch_events_inserted=totals.inserted_count,
+            media_items_inserted=0,
+            media_versions_inserted=0,
+            tags_added=0,
+            errors_count=totals.error_count,
+            notes=options.notes,
+            parameters_patch={
                 "cursor_before": cursor_before,
-                "rejected_before_import": payload.rejected_before_import,
-                "media_items_created": payload.media_items_created,
-                "shows_created": payload.shows_created,
+                "cursor": totals.cursor_after,
+                "rejected_before_import": rejected_before_import,
+                "media_items_created": media_items_created,
+                "shows_created": shows_created,
+                "collision_deduped_count": totals.collision_deduped_count,
+                **WatchEventImportService._skip_counts_patch(error_sink),
+                "progress": WatchEventImportService._progress(
+                    processed_count=processed_count,
+                    total_count=processed_count,
+                    totals=totals,
+                    rows_this_run=processed_count - rows_completed,
+                    elapsed_seconds=time.monotonic() - run_started,
+                ),
             },
         )
 
+        return WatchEventImportResult(
+            import_batch_id=finalized_batch.import_batch_id,
+            status=finalized_batch.status,
+            dry_run=False,
+            processed_count=processed_count,
+            inserted_count=totals.inserted_count,
+            skipped_count=totals.skipped_count,
+            collision_deduped_count=totals.collision_deduped_count,
+            error_count=totals.error_count,
+            rejected_before_import=rejected_before_import,
+            media_items_created=media_items_created,
+            shows_created=shows_created,
+            cursor_before=cursor_before,
+            cursor_after=totals.cursor_after,
+        )
+
+    @staticmethod
+    def _run_row_import(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        error_sink: ImportBatchErrorSink,
+        mode: str,
+        mapped_events: list[tuple[int, WatchEventCreateArgs]],
+        cursor_before: dict | None,
+    ) -> WatchEventImportCounts:
+        cursor_after = cursor_before
+        inserted_count = 0
+        skipped_count = 0
+        collision_deduped_count = 0
+        error_count = 0
+        timelines: set[tuple[UUID, UUID]] = set()
+        horrorfest_rows: list[tuple[int, WatchEventCreateArgs, dict]] = []
+        horrorfest_assignments: list[HorrorfestAssignment] = []
+
         for index, mapped in mapped_events:
             row_cursor = WatchEventImportService._to_cursor(
                 watched_at=mapped.watched_at,
                 source_event_id=mapped.source_event_id,
             )
 
-            if payload.mode.value == "incremental" and (
+            if mode == "incremental" and (
                 WatchEventImportService._is_at_or_before_cursor(
                     watched_at=mapped.watched_at,
                     source_event_id=mapped.source_event_id,
@@ -262,18 +821,17 @@ class WatchEventImportService:
             ):
                 skipped_count += 1
                 WatchEventImportService._record_skip(
-                    session,
-                    import_batch_id=batch.import_batch_id,
+                    error_sink,
                     row_index=index,
                     mapped=mapped,
-                    mode=payload.mode.value,
+                    mode=mode,
                     reason="incremental_cursor_skip",
                     message="Skipped because the row is at or before the incremental cursor",
                 )
                 continue
 
             try:
-                if payload.mode.value == "incremental" and mapped.source_event_id:
+                if mode == "incremental" and mapped.source_event_id:
                     if WatchEventService.source_event_exists(
                         session,
                         playback_source=mapped.playback_source,
@@ -281,11 +839,10 @@ class WatchEventImportService:
                     ):
                         skipped_count += 1
                         WatchEventImportService._record_skip(
-                            session,
-                            import_batch_id=batch.import_batch_id,
+                            error_sink,
                             row_index=index,
                             mapped=mapped,
-                            mode=payload.mode.value,
+                            mode=mode,
                             reason="duplicate_source_event",
                             message="Skipped because the source event was already imported",
                         )
@@ -308,103 +865,389 @@ class WatchEventImportService:
                     rating_scale=mapped.rating_scale,
                     media_version_id=mapped.media_version_id,
                     source_event_id=mapped.source_event_id,
-                    import_batch_id=batch.import_batch_id,
+                    import_batch_id=import_batch_id,
                     origin_kind="manual_import",
+                    defer_rewatch=True,
                 )
                 if create_result.created:
                     inserted_count += 1
+                    timelines.add((mapped.user_id, mapped.media_item_id))
                 else:
                     skipped_count += 1
                     skip_reason = create_result.match_reason or "matched_existing_watch"
-                    if create_result.match_reason == "collision_window":
+                    if create_result.match_reason in {
+                        "collision_window",
+                        "dedupe_hash",
+                    }:
                         collision_deduped_count += 1
                     WatchEventImportService._record_skip(
-                        session,
-                        import_batch_id=batch.import_batch_id,
+                        error_sink,
                         row_index=index,
                         mapped=mapped,
-                        mode=payload.mode.value,
+                        mode=mode,
                         reason=skip_reason,
                         message="Skipped because the watch matched an existing imported watch",
                     )
                 if mapped.horrorfest_year is not None:
-                    HorrorfestService.include_watch_event(
-                        session,
-                        watch_id=create_result.watch_event.watch_id,
-                        horrorfest_year=mapped.horrorfest_year,
-                        updated_by="import",
-                        update_reason="Imported Horrorfest assignment",
-                        target_order=mapped.horrorfest_watch_order,
-                        source_kind="auto_import",
-                        commit=False,
+                    # The cursor only advances once the assignment is applied.
+                    horrorfest_rows.append((index, mapped, row_cursor))
+                    horrorfest_assignments.append(
+                        HorrorfestAssignment(
+                            watch_id=create_result.watch_event.watch_id,
+                            horrorfest_year=mapped.horrorfest_year,
+                            target_order=mapped.horrorfest_watch_order,
+                        )
                     )
+                    continue
                 cursor_after = WatchEventImportService._max_cursor(
                     cursor_after, row_cursor
                 )
             except WatchEventDuplicateError:
                 skipped_count += 1
                 WatchEventImportService._record_skip(
-                    session,
-                    import_batch_id=batch.import_batch_id,
+                    error_sink,
                     row_index=index,
                     mapped=mapped,
-                    mode=payload.mode.value,
+                    mode=mode,
                     reason="duplicate_watch_event",
                     message="Skipped because an equivalent watch event already exists",
                 )
                 cursor_after = WatchEventImportService._max_cursor(
                     cursor_after, row_cursor
                 )
-            except (
-                HorrorfestConstraintError,
-                WatchEventConstraintError,
-                ValueError,
-            ) as exc:
+            except (WatchEventConstraintError, ValueError) as exc:
                 error_count += 1
-                ImportBatchService.add_import_batch_error(
-                    session,
-                    import_batch_id=batch.import_batch_id,
+                error_sink.add(
                     severity="error",
                     entity_type="watch_event",
                     entity_ref=mapped.source_event_id or str(index),
                     message=str(exc),
-                    details={"row_index": index, "mode": payload.mode.value},
+                    details={"row_index": index, "mode": mode},
                 )
 
-        final_status = "completed" if error_count == 0 else "completed_with_errors"
-        finalized_batch = ImportBatchService.finish_import_batch(
+        horrorfest_failures = HorrorfestService.include_watch_events(
             session,
-            import_batch_id=batch.import_batch_id,
-            status=final_status,
-            watch_events_inserted=inserted_count,
-            media_items_inserted=0,
-            media_versions_inserted=0,
-            tags_added=0,
-            errors_count=error_count,
-            notes=payload.notes,
-            parameters_patch={
-                "cursor_before": cursor_before,
-                "cursor": cursor_after,
-                "rejected_before_import": payload.rejected_before_import,
-                "media_items_created": payload.media_items_created,
-                "shows_created": payload.shows_created,
-                "collision_deduped_count": collision_deduped_count,
-            },
+            assignments=horrorfest_assignments,
+            updated_by="import",
+            update_reason="Imported Horrorfest assignment",
+            source_kind="auto_import",
+            commit=False,
         )
+        for position, (index, mapped, row_cursor) in enumerate(horrorfest_rows):
+            message = horrorfest_failures.get(position)
+            if message is not None:
+                error_count += 1
+                error_sink.add(
+                    severity="error",
+                    entity_type="watch_event",
+                    entity_ref=mapped.source_event_id or str(index),
+                    message=message,
+                    details={"row_index": index, "mode": mode},
+                )
+                continue
+            cursor_after = WatchEventImportService._max_cursor(cursor_after, row_cursor)
 
-        return WatchEventImportResult(
-            import_batch_id=finalized_batch.import_batch_id,
-            status=finalized_batch.status,
-            dry_run=False,
-            processed_count=len(payload.events),
+        # Rows were created with deferred rewatch flags; settle every touched
+        # timeline with one window-function update per commit window.
+        WatchEventService.recompute_rewatch_flags(session, timelines=timelines)
+
+        return WatchEventImportCounts(
+            inserted_count=inserted_count,
+            skipped_count=skipped_count,
+            collision_deduped_count=collision_deduped_count,
+            error_count=error_count,
+            cursor_after=cursor_after,
+        )
+
+    @staticmethod
+    def _run_bulk_import(
+        session: Session,
+        *,
+        import_batch_id: UUID,
+        error_sink: ImportBatchErrorSink,
+        mode: str,
+        mapped_events: list[tuple[int, WatchEventCreateArgs]],
+        cursor_before: dict | None,
+    ) -> WatchEventImportCounts:
+        collision_window_seconds = WatchEventService._watch_collision_window_seconds()
+        collision_window = timedelta(seconds=collision_window_seconds)
+        hash_rows = dedupe_hash_enabled(collision_window_seconds)
+        cursor_after = cursor_before
+        inserted_count = 0
+        skipped_count = 0
+        collision_deduped_count = 0
+        error_count = 0
+        skips: list[tuple[int, WatchEventCreateArgs, str, str]] = []
+        errors: list[tuple[int, WatchEventCreateArgs, str]] = []
+        staged: list[tuple[int, WatchEventCreateArgs, UUID, str | None]] = []
+
+        for index, mapped in mapped_events:
+            if mode == "incremental" and (
+                WatchEventImportService._is_at_or_before_cursor(
+                    watched_at=mapped.watched_at,
+                    source_event_id=mapped.source_event_id,
+                    cursor=cursor_before,
+                )
+            ):
+                skipped_count += 1
+                skips.append(
+                    (
+                        index,
+                        mapped,
+                        "incremental_cursor_skip",
+                        "Skipped because the row is at or before the incremental cursor",
+                    )
+                )
+                continue
+            if not mapped.playback_source.strip():
+                error_count += 1
+                errors.append((index, mapped, "playback_source must not be empty"))
+                continue
+            staged.append(
+                (
+                    index,
+                    mapped,
+                    uuid4(),
+                    watch_event_dedupe_hash(
+                        user_id=mapped.user_id,
+                        media_item_id=mapped.media_item_id,
+                        playback_source=mapped.playback_source.strip(),
+                        completed=mapped.completed,
+                        watched_at=mapped.watched_at,
+                    )
+                    if hash_rows
+                    else None,
+                )
+            )
+
+        try:
+            matches = {}
+            if staged:
+                watch_event_import_repository.stage_watch_event_import_rows(
+                    session,
+                    rows=(
+                        (
+                            index,
+                            watch_id,
+                            mapped.user_id,
+                            mapped.media_item_id,
+                            mapped.watched_at.astimezone(UTC),
+                            mapped.playback_source.strip(),
+                            mapped.total_seconds,
+                            mapped.watched_seconds,
+                            mapped.progress_percent,
+                            mapped.completed,
+                            mapped.rating_value,
+                            mapped.rating_scale.strip()
+                            if mapped.rating_scale
+                            else None,
+                            mapped.media_version_id,
+                            (
+                                mapped.source_event_id.strip()
+                                if mapped.source_event_id
+                                else None
+                            ),
+                            dedupe_hash,
+                        )
+                        for index, mapped, watch_id, dedupe_hash in staged
+                    ),
+                )
+                matches = watch_event_import_repository.list_staged_watch_event_matches(
+                    session,
+                    collision_window_seconds=collision_window_seconds,
+                )
+
+            # Rows that match the database were resolved in SQL above; rows that
+            # only match earlier rows of this same import depend on which of those
+            # earlier rows survive, so that pass replays the per-row order.
+            survivor_indexes: list[int] = []
+            survivor_watch_ids: list[UUID] = []
+            timelines: set[tuple[UUID, UUID]] = set()
+            inserted_sources: dict[tuple[str, str], UUID] = {}
+            inserted_hashes: dict[str, UUID] = {}
+            latest_inserted: dict[tuple[UUID, UUID, bool], tuple[datetime, UUID]] = {}
+            settled_rows: list[tuple[int, WatchEventCreateArgs, UUID | None]] = []
+            for index, mapped, watch_id, dedupe_hash in staged:
+                source_event_id = (
+                    mapped.source_event_id.strip() if mapped.source_event_id else None
+                )
+                source_key = (mapped.playback_source.strip(), source_event_id or "")
+                (
+                    source_watch_id,
+                    hash_watch_id,
+                    collision_watch_id,
+                    collision_watched_at,
+                ) = matches.get(index, (None, None, None, None))
+                if source_event_id:
+                    existing_watch_id = source_watch_id or inserted_sources.get(
+                        source_key
+                    )
+                    if existing_watch_id is not None:
+                        skipped_count += 1
+                        if mode == "incremental":
+                            skips.append(
+                                (
+                                    index,
+                                    mapped,
+                                    "duplicate_source_event",
+                                    "Skipped because the source event was already imported",
+                                )
+                            )
+                            settled_rows.append((index, mapped, None))
+                        else:
+                            skips.append(
+                                (
+                                    index,
+                                    mapped,
+                                    "source_event",
+                                    "Skipped because the watch matched an existing imported watch",
+                                )
+                            )
+                            settled_rows.append((index, mapped, existing_watch_id))
+                        continue
+
+                if dedupe_hash is not None:
+                    hash_watch_id = hash_watch_id or inserted_hashes.get(dedupe_hash)
+                if hash_watch_id is not None:
+                    skipped_count += 1
+                    collision_deduped_count += 1
+                    skips.append(
+                        (
+                            index,
+                            mapped,
+                            "dedupe_hash",
+                            "Skipped because the watch matched an existing imported watch",
+                        )
+                    )
+                    settled_rows.append((index, mapped, hash_watch_id))
+                    continue
+
+                watched_at = mapped.watched_at.astimezone(UTC)
+                collision_key = (mapped.user_id, mapped.media_item_id, mapped.completed)
+                matched: tuple[datetime, UUID] | None = (
+                    (collision_watched_at, collision_watch_id)
+                    if collision_watch_id is not None
+                    else None
+                )
+                latest_batch_watch = latest_inserted.get(collision_key)
+                if (
+                    latest_batch_watch is not None
+                    and watched_at - latest_batch_watch[0] <= collision_window
+                    and (matched is None or latest_batch_watch[0] >= matched[0])
+                ):
+                    matched = latest_batch_watch
+                if matched is not None:
+                    skipped_count += 1
+                    collision_deduped_count += 1
+                    skips.append(
+                        (
+                            index,
+                            mapped,
+                            "collision_window",
+                            "Skipped because the watch matched an existing imported watch",
+                        )
+                    )
+                    settled_rows.append((index, mapped, matched[1]))
+                    continue
+
+                inserted_count += 1
+                survivor_indexes.append(index)
+                survivor_watch_ids.append(watch_id)
+                timelines.add((mapped.user_id, mapped.media_item_id))
+                if source_event_id:
+                    inserted_sources[source_key] = watch_id
+                if dedupe_hash is not None:
+                    inserted_hashes[dedupe_hash] = watch_id
+                latest_inserted[collision_key] = (watched_at, watch_id)
+                settled_rows.append((index, mapped, watch_id))
+
+            watch_event_import_repository.insert_staged_watch_events(
+                session,
+                row_indexes=survivor_indexes,
+                import_batch_id=import_batch_id,
+                origin_kind="manual_import",
+            )
+            watch_event_repository.recompute_rewatch_flags(
+                session,
+                timelines=sorted(timelines),
+            )
+            HorrorfestService.sync_watch_events(
+                session,
+                watch_ids=survivor_watch_ids,
+            )
+            session.commit()
+        except IntegrityError:
+            # A constraint failure in the set-based insert cannot be pinned to a
+            # single row, so replay the batch through the per-row engine, which
+            # reports offending rows individually.
+            session.rollback()
+            return WatchEventImportService._run_row_import(
+                session,
+                import_batch_id=import_batch_id,
+                error_sink=error_sink,
+                mode=mode,
+                mapped_events=mapped_events,
+                cursor_before=cursor_before,
+            )
+
+        horrorfest_positions: dict[int, int] = {}
+        horrorfest_assignments: list[HorrorfestAssignment] = []
+        for index, mapped, watch_id in settled_rows:
+            if mapped.horrorfest_year is not None and watch_id is not None:
+                horrorfest_positions[index] = len(horrorfest_assignments)
+                horrorfest_assignments.append(
+                    HorrorfestAssignment(
+                        watch_id=watch_id,
+                        horrorfest_year=mapped.horrorfest_year,
+                        target_order=mapped.horrorfest_watch_order,
+                    )
+                )
+        horrorfest_failures = HorrorfestService.include_watch_events(
+            session,
+            assignments=horrorfest_assignments,
+            updated_by="import",
+            update_reason="Imported Horrorfest assignment",
+            source_kind="auto_import",
+            commit=False,
+        )
+
+        for index, mapped, watch_id in settled_rows:
+            message = horrorfest_failures.get(horrorfest_positions.get(index, -1))
+            if message is not None:
+                error_count += 1
+                errors.append((index, mapped, message))
+                continue
+            cursor_after = WatchEventImportService._max_cursor(
+                cursor_after,
+                WatchEventImportService._to_cursor(
+                    watched_at=mapped.watched_at,
+                    source_event_id=mapped.source_event_id,
+                ),
+            )
+
+        for index, mapped, reason, message in skips:
+            WatchEventImportService._record_skip(
+                error_sink,
+                row_index=index,
+                mapped=mapped,
+                mode=mode,
+                reason=reason,
+                message=message,
+            )
+        for index, mapped, message in errors:
+            error_sink.add(
+                severity="error",
+                entity_type="watch_event",
+                entity_ref=mapped.source_event_id or str(index),
+                message=message,
+                details={"row_index": index, "mode": mode},
+            )
+
+        return WatchEventImportCounts(
             inserted_count=inserted_count,
             skipped_count=skipped_count,
             collision_deduped_count=collision_deduped_count,
             error_count=error_count,
-            rejected_before_import=payload.rejected_before_import,
-            media_items_created=payload.media_items_created,
-            shows_created=payload.shows_created,
-            cursor_before=cursor_before,
             cursor_after=cursor_after,
         )
 
@@ -426,6 +1269,57 @@ class WatchEventImportService:
             rejected_before_import=payload.rejected_before_import,
             media_items_created=payload.media_items_created,
             shows_created=payload.shows_created,
+            bulk=payload.bulk,
+            aggregate_skips=payload.aggregate_skips,
+            commit_every=payload.commit_every,
+            resume_import_batch_id=payload.resume_import_batch_id,
             events=internal_events,
         )
         return WatchEventImportService.run_import(session, payload=internal_payload)
+
+    @staticmethod
+    def run_legacy_source_import_stream(
+        session: Session,
+        *,
+        options: LegacySourceWatchEventImportOptions,
+        chunks: Iterable[LegacySourceImportChunk],
+        import_batch_id: UUID | None = None,
+        total_count: int | None = None,
+    ) -> WatchEventImportResult:
+        adapter = LegacySourceWatchEventImportAdapter()
+        internal_options = WatchEventImportOptions(
+            source="legacy_source_export",
+            mode=options.mode,
+            dry_run=options.dry_run,
+            resume_from_latest=options.resume_from_latest,
+            source_detail=options.source_detail,
+            notes=options.notes,
+            rejected_before_import=options.rejected_before_import,
+            media_items_created=options.media_items_created,
+            shows_created=options.shows_created,
+            bulk=options.bulk,
+            aggregate_skips=options.aggregate_skips,
+            commit_every=options.commit_every,
+            resume_import_batch_id=options.resume_import_batch_id,
+        )
+        internal_chunks = (
+            WatchEventImportChunk(
+                events=[
+                    adapter.to_internal_event(
+                        LegacySourceWatchEventRow.model_validate(row)
+                    )
+                    for row in chunk.rows
+                ],
+                rejected_before_import=chunk.rejected_before_import,
+                media_items_created=chunk.media_items_created,
+                shows_created=chunk.shows_created,
+            )
+            for chunk in chunks
+        )
+        return WatchEventImportService.run_import_stream(
+            session,
+            options=internal_options,
+            chunks=internal_chunks,
+            import_batch_id=import_batch_id,
+            total_count=total_count,
+        )
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.datetime_utils import ensure_timezone_aware, to_utc_z_string
+from app.core.dedupe import dedupe_hash_enabled, watch_event_dedupe_hash
 from app.repositories import media_items as media_item_repository
 from app.repositories import watch_events as watch_event_repository
 from app.schemas.jellyfin_integration import (
@@ -136,17 +137,30 @@ class JellyfinReconciliationService:
             collision_window_seconds = (
                 get_settings().klug_watch_collision_window_seconds
             )
-            existing = watch_event_repository.find_matching_watch_event(
-                session,
-                user_id=user.user_id,
-                media_item_id=media_item.media_item_id,
-                watched_at=item.last_played_at,
-                completed=True,
-                collision_window_seconds=collision_window_seconds,
-                collision_window_after_seconds=(
-                    collision_window_seconds + max(0, item.runtime_seconds or 0)
-                ),
-            )
+            existing = None
+            if dedupe_hash_enabled(collision_window_seconds):
+                existing = watch_event_repository.get_watch_event_by_dedupe_hash(
+                    session,
+                    dedupe_hash=watch_event_dedupe_hash(
+                        user_id=user.user_id,
+                        media_item_id=media_item.media_item_id,
+                        playback_source=JellyfinReconciliationService.PLAYBACK_SOURCE,
+                        completed=True,
+                        watched_at=item.last_played_at,
+                    ),
+                )
+            if existing is None:
+                existing = watch_event_repository.find_matching_watch_event(
+                    session,
+                    user_id=user.user_id,
+                    media_item_id=media_item.media_item_id,
+                    watched_at=item.last_played_at,
+                    completed=True,
+                    collision_window_seconds=collision_window_seconds,
+                    collision_window_after_seconds=(
+                        collision_window_seconds + max(0, item.runtime_seconds or 0)
+                    ),
+                )
             if existing is not None:
                 already_present_count += 1
                 continue
@@ -14,6 +14,7 @@ class LibraryService:
         year: int | None,
         limit: int,
         offset: int,
+        fields: frozenset[str] | None = None,
     ) -> list[dict]:
         return library_repository.list_library_movies(
             session,
@@ -23,6 +24,7 @@ class LibraryService:
             year=year,
             limit=limit,
             offset=offset,
+            fields=fields,
         )
 
     @staticmethod
@@ -35,6 +37,7 @@ class LibraryService:
         enrichment_status: str | None,
         limit: int,
         offset: int,
+        fields: frozenset[str] | None = None,
     ) -> list[dict]:
         return library_repository.list_library_episodes(
             session,
@@ -44,6 +47,7 @@ class LibraryService:
             enrichment_status=enrichment_status,
             limit=limit,
             offset=offset,
+            fields=fields,
         )
 
     @staticmethod
@@ -54,6 +58,7 @@ class LibraryService:
         watched: bool | None,
         limit: int,
         offset: int,
+        fields: frozenset[str] | None = None,
     ) -> list[dict]:
         return library_repository.list_library_shows(
             session,
@@ -61,4 +66,5 @@ class LibraryService:
             watched=watched,
             limit=limit,
             offset=offset,
+            fields=fields,
         )
@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from sqlalchemy.exc import IntegrityError
@@ -97,6 +98,19 @@ class MediaItemService:
             tvdb_id=tvdb_id,
         )
 
+    @staticmethod
+    def list_media_items_by_external_ids(
+        session: Session,
+        *,
+        tmdb_keys: Collection[tuple[str, int]],
+        imdb_keys: Collection[tuple[str, str]],
+    ) -> tuple[list[MediaItem], list[MediaItem]]:
+        return media_item_repository.list_media_items_by_external_ids(
+            session,
+            tmdb_keys=tmdb_keys,
+            imdb_keys=imdb_keys,
+        )
+
     @staticmethod
     def find_episode_media_item(
         session: Session,
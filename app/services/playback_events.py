@@ -36,7 +36,8 @@ class PlaybackEventService:
         decision_status: str | None,
         limit: int,
         offset: int,
-    ) -> list[PlaybackEvent]:
+        fields: frozenset[str] | None = None,
+    ) -> list[PlaybackEvent] | list[dict]:
         safe_limit = max(1, min(limit, 100))
         safe_offset = max(0, offset)
         normalized_playback_source = (
@@ -63,6 +64,7 @@ class PlaybackEventService:
             decision_status=normalized_decision_status,
             limit=safe_limit,
             offset=safe_offset,
+            fields=fields,
         )
 
     @staticmethod
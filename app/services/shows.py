@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from uuid import UUID
@@ -15,6 +16,12 @@ class ShowService:
     def find_show_by_tmdb_id(session: Session, *, tmdb_id: int) -> Show | None:
         return show_repository.find_show_by_tmdb_id(session, tmdb_id=tmdb_id)
 
+    @staticmethod
+    def list_shows_by_tmdb_ids(
+        session: Session, *, tmdb_ids: Collection[int]
+    ) -> list[Show]:
+        return show_repository.list_shows_by_tmdb_ids(session, tmdb_ids=tmdb_ids)
+
     @staticmethod
     def get_or_create_show(
         session: Session,
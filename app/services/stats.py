@@ -1,9 +1,31 @@
+from datetime import date, timedelta
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.repositories import stats as stats_repository
 
+# Caps the response size; a decade of weeks or three years of days fits.
+MAX_TIME_SERIES_PERIODS = 1100
+
+
+def _time_series_period_count(
+    granularity: str, local_date_from: date, local_date_to: date
+) -> int:
+    if granularity == "day":
+        return (local_date_to - local_date_from).days + 1
+    if granularity == "week":
+        first_monday = local_date_from - timedelta(days=local_date_from.weekday())
+        return (local_date_to - first_monday).days // 7 + 1
+    if granularity == "month":
+        return (
+            (local_date_to.year - local_date_from.year) * 12
+            + local_date_to.month
+            - local_date_from.month
+            + 1
+        )
+    return local_date_to.year - local_date_from.year + 1
+
 
 class StatsService:
     @staticmethod
@@ -22,6 +44,71 @@ class StatsService:
     ) -> list[dict[str, object]]:
         return stats_repository.list_monthly_stats(session, user_id=user_id)
 
+    @staticmethod
+    def get_time_series(
+        session: Session,
+        *,
+        user_id: UUID | None,
+        granularity: str,
+        local_date_from: date | None,
+        local_date_to: date | None,
+        media_type: str | None,
+    ) -> dict[str, object]:
+        """Watch stats per day, week, month or year over a local date range.
+
+        An open end of the range defaults to the first or last day with
+        matching watches, or to the given end when that lies beyond them.
+        Every period in the range is returned, including empty ones, so the
+        payload size depends only on the range.
+        """
+        if granularity not in stats_repository.TIME_SERIES_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+        if local_date_from is None or local_date_to is None:
+            first_date, last_date = stats_repository.get_daily_rollup_date_range(
+                session, user_id=user_id, media_type=media_type
+            )
+            # A given bound past the matching watches must not leave the
+            # filled-in one on its wrong side.
+            if local_date_from is None:
+                local_date_from = min(
+                    filter(None, (first_date, local_date_to)), default=None
+                )
+            if local_date_to is None:
+                local_date_to = max(
+                    filter(None, (last_date, local_date_from)), default=None
+                )
+
+        payload: dict[str, object] = {
+            "user_id": user_id,
+            "granularity": granularity,
+            "media_type": media_type,
+            "local_date_from": local_date_from,
+            "local_date_to": local_date_to,
+            "points": [],
+        }
+        if local_date_from is None or local_date_to is None:
+            return payload
+        if local_date_from > local_date_to:
+            raise ValueError("local_date_from must be on or before local_date_to")
+        period_count = _time_series_period_count(
+            granularity, local_date_from, local_date_to
+        )
+        if period_count > MAX_TIME_SERIES_PERIODS:
+            raise ValueError(
+                f"Range spans {period_count} {granularity} periods; "
+                f"at most {MAX_TIME_SERIES_PERIODS} are allowed"
+            )
+
+        payload["points"] = stats_repository.list_time_series_stats(
+            session,
+            user_id=user_id,
+            granularity=granularity,
+            local_date_from=local_date_from,
+            local_date_to=local_date_to,
+            media_type=media_type,
+        )
+        return payload
+
     @staticmethod
     def list_horrorfest(
         session: Session,
@@ -29,3 +116,14 @@ class StatsService:
         user_id: UUID | None,
     ) -> list[dict[str, object]]:
         return stats_repository.list_horrorfest_stats(session, user_id=user_id)
+
+    @staticmethod
+    def list_rollup_user_ids(session: Session) -> list[UUID]:
+        return stats_repository.list_rollup_user_ids(session)
+
+    @staticmethod
+    def rebuild_rollups(session: Session, *, user_id: UUID) -> int:
+        refreshed = stats_repository.rebuild_monthly_rollup(session, user_id=user_id)
+        refreshed += stats_repository.rebuild_daily_rollup(session, user_id=user_id)
+        session.commit()
+        return refreshed
@@ -0,0 +1,115 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.core.datetime_utils import to_utc_z_string
+from app.repositories import watch_events as watch_event_repository
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+# 16 + MAX_WBITS asks zlib for a gzip header and trailer.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def _json_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return to_utc_z_string(value)
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Cannot export {type(value).__name__} values")
+
+
+def _csv_value(value: object) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return to_utc_z_string(value)
+    return value
+
+
+def _ndjson_batches(batches: Iterator[Sequence[Row]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(
+            json.dumps(
+                row._asdict(),
+                default=_json_value,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def _csv_batches(batches: Iterator[Sequence[Row]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(watch_event_repository.WATCH_EVENT_EXPORT_FIELDS)
+    for rows in batches:
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class WatchEventExportService:
+    @staticmethod
+    def iter_export(
+        session: Session,
+        *,
+        user_id: UUID | None,
+        file_format: ExportFormat,
+        compress: bool,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream active watch history as NDJSON or CSV, one batch per chunk.
+
+        Rows are read through a server-side cursor, so memory use depends on
+        ``batch_size`` rather than on the size of the history.
+        """
+        if file_format not in EXPORT_MEDIA_TYPES:
+            raise ValueError(f"Unsupported export format: {file_format}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        batches = watch_event_repository.iter_watch_event_export_rows(
+            session, user_id=user_id, batch_size=batch_size
+        )
+        chunks = (
+            _ndjson_batches(batches)
+            if file_format == "ndjson"
+            else _csv_batches(batches)
+        )
+        return _gzip(chunks) if compress else chunks
+
+    @staticmethod
+    def filename(*, file_format: ExportFormat, compress: bool, now: datetime) -> str:
+        suffix = f".{file_format}.gz" if compress else f".{file_format}"
+        return f"klug-watch-history-{now:%Y%m%dT%H%M%SZ}{suffix}"
+
+    @staticmethod
+    def media_type(*, file_format: ExportFormat, compress: bool) -> str:
+        return "application/gzip" if compress else EXPORT_MEDIA_TYPES[file_format]
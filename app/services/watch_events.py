@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from decimal import Decimal
@@ -9,6 +10,8 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.datetime_utils import ensure_timezone_aware
+from app.core.dedupe import dedupe_hash_enabled, watch_event_dedupe_hash
+from app.core.pagination import WatchEventCursor
 from app.db.models.entities import WatchEvent
 from app.services.shows import ShowService
 from app.services.media_items import MediaItemService
@@ -33,6 +36,25 @@ class WatchEventCreateResult:
     match_reason: str | None = None
 
 
+@dataclass(frozen=True)
+class WatchEventOperation:
+    action: Literal["delete", "restore", "correct", "rate"]
+    watch_id: UUID
+    watched_at: datetime | None = None
+    media_item_id: UUID | None = None
+    completed: bool | None = None
+    rewatch: bool | None = None
+    rating_value: int | None = None
+
+
+@dataclass(frozen=True)
+class WatchEventOperationResult:
+    action: str
+    watch_id: UUID
+    watch_event: WatchEvent | None = None
+    error: str | None = None
+
+
 class WatchEventService:
     VALID_ORIGIN_KINDS = {"live_playback", "manual_import", "manual_entry"}
 
@@ -52,9 +74,12 @@ class WatchEventService:
         deleted_only: bool,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> list[dict[str, object]]:
         safe_limit = max(1, min(limit, 100))
         safe_offset = max(0, offset)
+        page_cursor = WatchEventService._decode_page_cursor(cursor, offset=safe_offset)
         normalized_query = query.strip() if query else None
         return watch_event_repository.list_watch_events(
             session,
@@ -70,6 +95,8 @@ class WatchEventService:
             deleted_only=deleted_only,
             limit=safe_limit,
             offset=safe_offset,
+            cursor=page_cursor,
+            fields=fields,
         )
 
     @staticmethod
@@ -79,16 +106,44 @@ class WatchEventService:
         user_id: UUID | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> list[dict[str, object]]:
         safe_limit = max(1, min(limit, 100))
         safe_offset = max(0, offset)
+        page_cursor = WatchEventService._decode_page_cursor(cursor, offset=safe_offset)
         return watch_event_repository.list_unrated_watch_events(
             session,
             user_id=user_id,
             limit=safe_limit,
             offset=safe_offset,
+            cursor=page_cursor,
+            fields=fields,
         )
 
+    @staticmethod
+    def next_page_cursor(
+        watch_events: Sequence[dict[str, object]],
+        *,
+        limit: int,
+    ) -> str | None:
+        if not watch_events or len(watch_events) < limit:
+            return None
+        last = watch_events[-1]
+        return WatchEventCursor(
+            watched_at=last["watched_at"], watch_id=last["watch_id"]
+        ).encode()
+
+    @staticmethod
+    def _decode_page_cursor(
+        cursor: str | None, *, offset: int
+    ) -> WatchEventCursor | None:
+        if cursor is None:
+            return None
+        if offset:
+            raise ValueError("cursor cannot be combined with offset")
+        return WatchEventCursor.decode(cursor)
+
     @staticmethod
     def soft_delete_watch_event(
         session: Session,
@@ -102,28 +157,22 @@ class WatchEventService:
         )
         normalized_updated_by = WatchEventService._normalize_updated_by(updated_by)
         normalized_reason = WatchEventService._normalize_update_reason(update_reason)
-        now = datetime.now(UTC)
-
-        if watch_event.is_deleted:
-            raise ValueError("Watch event is already deleted")
-
-        watch_event.is_deleted = True
-        watch_event.deleted_at = now
-        watch_event.deleted_by = normalized_updated_by
-        watch_event.deleted_reason = normalized_reason
-        watch_event.updated_at = now
-        watch_event.updated_by = normalized_updated_by
-        watch_event.update_reason = normalized_reason
-        watch_event.rewatch = False
-        watch_event.dedupe_hash = None
+        WatchEventService._mark_deleted(
+            watch_event,
+            updated_by=normalized_updated_by,
+            update_reason=normalized_reason,
+            now=datetime.now(UTC),
+        )
         try:
             updated = watch_event_repository.update_watch_event(
                 session, watch_event=watch_event
             )
-            WatchEventService._recompute_rewatch_for_media_timeline(
+            WatchEventService._refresh_rewatch_after_edit(
                 session,
                 user_id=updated.user_id,
                 media_item_id=updated.media_item_id,
+                watch_event=updated,
+                edit_points=[updated.watched_at],
             )
             HorrorfestService.sync_watch_event(session, watch_event=updated)
             session.commit()
@@ -147,27 +196,23 @@ class WatchEventService:
         )
         normalized_updated_by = WatchEventService._normalize_updated_by(updated_by)
         normalized_reason = WatchEventService._normalize_update_reason(update_reason)
-        now = datetime.now(UTC)
-
-        if not watch_event.is_deleted:
-            raise ValueError("Watch event is not deleted")
-
-        watch_event.is_deleted = False
-        watch_event.deleted_at = None
-        watch_event.deleted_by = None
-        watch_event.deleted_reason = None
-        watch_event.updated_at = now
-        watch_event.updated_by = normalized_updated_by
-        watch_event.update_reason = normalized_reason
-        watch_event.dedupe_hash = None
+        WatchEventService._mark_restored(
+            session,
+            watch_event,
+            updated_by=normalized_updated_by,
+            update_reason=normalized_reason,
+            now=datetime.now(UTC),
+        )
         try:
             updated = watch_event_repository.update_watch_event(
                 session, watch_event=watch_event
             )
-            WatchEventService._recompute_rewatch_for_media_timeline(
+            WatchEventService._refresh_rewatch_after_edit(
                 session,
                 user_id=updated.user_id,
                 media_item_id=updated.media_item_id,
+                watch_event=updated,
+                edit_points=[updated.watched_at],
             )
             HorrorfestService.sync_watch_event(session, watch_event=updated)
             session.commit()
@@ -196,65 +241,47 @@ class WatchEventService:
         normalized_updated_by = WatchEventService._normalize_updated_by(updated_by)
         normalized_reason = WatchEventService._normalize_update_reason(update_reason)
 
-        if (
-            watched_at is None
-            and media_item_id is None
-            and completed is None
-            and rewatch is None
-        ):
-            raise ValueError("At least one correction field must be provided")
-
         previous_media_item_id = watch_event.media_item_id
-        new_watched_at = (
-            ensure_timezone_aware(watched_at, field_name="watched_at").astimezone(UTC)
-            if watched_at is not None
-            else watch_event.watched_at
+        previous_watched_at = watch_event.watched_at
+        WatchEventService._apply_correction(
+            session,
+            watch_event,
+            updated_by=normalized_updated_by,
+            update_reason=normalized_reason,
+            watched_at=watched_at,
+            media_item_id=media_item_id,
+            completed=completed,
+            rewatch=rewatch,
+            now=datetime.now(UTC),
         )
-        if media_item_id is not None:
-            media_item = MediaItemService.get_media_item(
-                session, media_item_id=media_item_id
-            )
-            if media_item is None:
-                raise ValueError(f"Media item '{media_item_id}' not found")
-            watch_event.media_item_id = media_item_id
-            if (
-                watch_event.media_version_id is not None
-                and not watch_event_repository.media_version_matches_media_item(
-                    session,
-                    media_version_id=watch_event.media_version_id,
-                    media_item_id=media_item_id,
-                )
-            ):
-                watch_event.media_version_id = None
-
-        watch_event.watched_at = new_watched_at
-        if completed is not None:
-            watch_event.completed = completed
-        if rewatch is not None:
-            watch_event.rewatch = rewatch
-
-        now = datetime.now(UTC)
-        watch_event.updated_at = now
-        watch_event.updated_by = normalized_updated_by
-        watch_event.update_reason = normalized_reason
-        if media_item_id is not None or watched_at is not None or completed is not None:
-            watch_event.dedupe_hash = None
         try:
             updated = watch_event_repository.update_watch_event(
                 session, watch_event=watch_event
             )
 
             if media_item_id is not None or watched_at is not None:
-                WatchEventService._recompute_rewatch_for_media_timeline(
-                    session,
-                    user_id=updated.user_id,
-                    media_item_id=previous_media_item_id,
-                )
-                if updated.media_item_id != previous_media_item_id:
-                    WatchEventService._recompute_rewatch_for_media_timeline(
+                if updated.media_item_id == previous_media_item_id:
+                    WatchEventService._refresh_rewatch_after_edit(
                         session,
                         user_id=updated.user_id,
                         media_item_id=updated.media_item_id,
+                        watch_event=updated,
+                        edit_points=[previous_watched_at, updated.watched_at],
+                    )
+                else:
+                    WatchEventService._refresh_rewatch_after_edit(
+                        session,
+                        user_id=updated.user_id,
+                        media_item_id=previous_media_item_id,
+                        watch_event=updated,
+                        edit_points=[previous_watched_at],
+                    )
+                    WatchEventService._refresh_rewatch_after_edit(
+                        session,
+                        user_id=updated.user_id,
+                        media_item_id=updated.media_item_id,
+                        watch_event=updated,
+                        edit_points=[updated.watched_at],
                     )
             elif rewatch is None:
                 updated.rewatch = watch_event_repository.prior_watch_event_exists(
@@ -290,16 +317,13 @@ class WatchEventService:
         )
         normalized_updated_by = WatchEventService._normalize_updated_by(updated_by)
         normalized_reason = WatchEventService._normalize_update_reason(update_reason)
-        if watch_event.is_deleted:
-            raise ValueError("Cannot rate a deleted watch event")
-        if rating_value < 1 or rating_value > 10:
-            raise ValueError("rating_value must be between 1 and 10")
-
-        watch_event.rating_value = Decimal(rating_value)
-        watch_event.rating_scale = "10-star"
-        watch_event.updated_at = datetime.now(UTC)
-        watch_event.updated_by = normalized_updated_by
-        watch_event.update_reason = normalized_reason
+        WatchEventService._apply_rating(
+            watch_event,
+            updated_by=normalized_updated_by,
+            update_reason=normalized_reason,
+            rating_value=rating_value,
+            now=datetime.now(UTC),
+        )
         try:
             updated = watch_event_repository.update_watch_event(
                 session, watch_event=watch_event
@@ -312,6 +336,95 @@ class WatchEventService:
                 "Watch event failed database constraints"
             ) from exc
 
+    @staticmethod
+    def apply_watch_event_operations(
+        session: Session,
+        *,
+        operations: Sequence[WatchEventOperation],
+        updated_by: str,
+        update_reason: str | None,
+    ) -> list[WatchEventOperationResult]:
+        """Apply delete/restore/correct/rate operations in one transaction.
+
+        Rejected operations are reported per item and the rest still apply.
+        Rewatch flags are recomputed once per touched timeline and Horrorfest
+        orders once per touched year, after every operation has been applied.
+        """
+        normalized_updated_by = WatchEventService._normalize_updated_by(updated_by)
+        normalized_reason = WatchEventService._normalize_update_reason(update_reason)
+        watch_events = {
+            watch_event.watch_id: watch_event
+            for watch_event in watch_event_repository.list_watch_events_by_ids(
+                session,
+                watch_ids=list(dict.fromkeys(op.watch_id for op in operations)),
+            )
+        }
+        now = datetime.now(UTC)
+        timelines: set[tuple[UUID, UUID]] = set()
+        horrorfest_watch_ids: dict[UUID, None] = {}
+        errors: dict[int, str] = {}
+        for position, operation in enumerate(operations):
+            watch_event = watch_events.get(operation.watch_id)
+            if watch_event is None:
+                errors[position] = f"Watch event '{operation.watch_id}' not found"
+                continue
+            previous_timeline = (watch_event.user_id, watch_event.media_item_id)
+            try:
+                moves_watch = WatchEventService._apply_operation(
+                    session,
+                    watch_event,
+                    operation,
+                    updated_by=normalized_updated_by,
+                    update_reason=normalized_reason,
+                    now=now,
+                )
+            except ValueError as exc:
+                errors[position] = str(exc)
+                continue
+            if moves_watch:
+                timelines.update(
+                    {
+                        previous_timeline,
+                        (watch_event.user_id, watch_event.media_item_id),
+                    }
+                )
+            if operation.action != "rate":
+                horrorfest_watch_ids[watch_event.watch_id] = None
+
+        try:
+            session.flush()
+            watch_event_repository.recompute_rewatch_flags(
+                session, timelines=sorted(timelines)
+            )
+            HorrorfestService.sync_watch_event_changes(
+                session,
+                watch_events=[
+                    watch_events[watch_id] for watch_id in horrorfest_watch_ids
+                ],
+            )
+            session.commit()
+        except IntegrityError as exc:
+            session.rollback()
+            raise WatchEventConstraintError(
+                "Watch event failed database constraints"
+            ) from exc
+
+        # One query reloads every watch the commit expired, rewatch flags included.
+        watch_event_repository.list_watch_events_by_ids(
+            session, watch_ids=list(watch_events)
+        )
+        return [
+            WatchEventOperationResult(
+                action=operation.action,
+                watch_id=operation.watch_id,
+                watch_event=(
+                    watch_events[operation.watch_id] if position not in errors else None
+                ),
+                error=errors.get(position),
+            )
+            for position, operation in enumerate(operations)
+        ]
+
     @staticmethod
     def set_watch_event_version_override(
         session: Session,
@@ -348,7 +461,6 @@ class WatchEventService:
         watch_event.updated_at = datetime.now(UTC)
         watch_event.updated_by = normalized_updated_by
         watch_event.update_reason = normalized_reason
-        watch_event.dedupe_hash = None
         try:
             updated = watch_event_repository.update_watch_event(
                 session, watch_event=watch_event
@@ -381,6 +493,7 @@ class WatchEventService:
         import_batch_id: UUID | None = None,
         origin_kind: str = "manual_entry",
         origin_playback_event_id: UUID | None = None,
+        defer_rewatch: bool = False,
     ) -> WatchEventCreateResult:
         normalized_playback_source = playback_source.strip()
         if not normalized_playback_source:
@@ -415,13 +528,34 @@ class WatchEventService:
                     match_reason="source_event",
                 )
 
+        collision_window_seconds = WatchEventService._watch_collision_window_seconds()
+        dedupe_hash = None
+        if dedupe_hash_enabled(collision_window_seconds):
+            dedupe_hash = watch_event_dedupe_hash(
+                user_id=user_id,
+                media_item_id=media_item_id,
+                playback_source=normalized_playback_source,
+                completed=completed,
+                watched_at=normalized_watched_at,
+            )
+            hash_match = watch_event_repository.get_watch_event_by_dedupe_hash(
+                session, dedupe_hash=dedupe_hash
+            )
+            if hash_match is not None:
+                return WatchEventCreateResult(
+                    watch_event=hash_match,
+                    created=False,
+                    matched_existing=True,
+                    match_reason="dedupe_hash",
+                )
+
         collision_match = watch_event_repository.find_matching_watch_event(
             session,
             user_id=user_id,
             media_item_id=media_item_id,
             watched_at=normalized_watched_at,
             completed=completed,
-            collision_window_seconds=WatchEventService._watch_collision_window_seconds(),
+            collision_window_seconds=collision_window_seconds,
         )
         if collision_match is not None:
             return WatchEventCreateResult(
@@ -431,11 +565,14 @@ class WatchEventService:
                 match_reason="collision_window",
             )
 
-        is_rewatch = watch_event_repository.prior_watch_event_exists(
-            session,
-            user_id=user_id,
-            media_item_id=media_item_id,
-            watched_at=normalized_watched_at,
+        # Deferred callers fix the flag later with recompute_rewatch_flags.
+        is_rewatch = not defer_rewatch and (
+            watch_event_repository.prior_watch_event_exists(
+                session,
+                user_id=user_id,
+                media_item_id=media_item_id,
+                watched_at=normalized_watched_at,
+            )
         )
 
         try:
@@ -458,12 +595,16 @@ class WatchEventService:
                 origin_kind=normalized_origin_kind,
                 origin_playback_event_id=origin_playback_event_id,
                 rewatch=is_rewatch,
+                dedupe_hash=dedupe_hash,
             )
-            WatchEventService._recompute_rewatch_for_media_timeline(
-                session,
-                user_id=watch_event.user_id,
-                media_item_id=watch_event.media_item_id,
-            )
+            if not defer_rewatch:
+                WatchEventService._refresh_rewatch_after_edit(
+                    session,
+                    user_id=watch_event.user_id,
+                    media_item_id=watch_event.media_item_id,
+                    watch_event=watch_event,
+                    edit_points=[watch_event.watched_at],
+                )
             HorrorfestService.sync_watch_event(session, watch_event=watch_event)
             session.commit()
             return WatchEventCreateResult(
@@ -717,6 +858,204 @@ class WatchEventService:
         )
         return media_item.media_item_id
 
+    @staticmethod
+    def _apply_operation(
+        session: Session,
+        watch_event: WatchEvent,
+        operation: WatchEventOperation,
+        *,
+        updated_by: str,
+        update_reason: str | None,
+        now: datetime,
+    ) -> bool:
+        """Apply one batch operation; returns whether rewatch flags need a recompute."""
+        if operation.action == "delete":
+            WatchEventService._mark_deleted(
+                watch_event, updated_by=updated_by, update_reason=update_reason, now=now
+            )
+            return True
+        if operation.action == "restore":
+            WatchEventService._mark_restored(
+                session,
+                watch_event,
+                updated_by=updated_by,
+                update_reason=update_reason,
+                now=now,
+            )
+            return True
+        if operation.action == "rate":
+            if operation.rating_value is None:
+                raise ValueError("rating_value is required to rate a watch event")
+            WatchEventService._apply_rating(
+                watch_event,
+                updated_by=updated_by,
+                update_reason=update_reason,
+                rating_value=operation.rating_value,
+                now=now,
+            )
+            return False
+        WatchEventService._apply_correction(
+            session,
+            watch_event,
+            updated_by=updated_by,
+            update_reason=update_reason,
+            watched_at=operation.watched_at,
+            media_item_id=operation.media_item_id,
+            completed=operation.completed,
+            rewatch=operation.rewatch,
+            now=now,
+        )
+        # An explicit rewatch override on an unmoved watch is kept, as in
+        # correct_watch_event.
+        return (
+            operation.watched_at is not None
+            or operation.media_item_id is not None
+            or operation.rewatch is None
+        )
+
+    @staticmethod
+    def _mark_deleted(
+        watch_event: WatchEvent,
+        *,
+        updated_by: str,
+        update_reason: str | None,
+        now: datetime,
+    ) -> None:
+        if watch_event.is_deleted:
+            raise ValueError("Watch event is already deleted")
+
+        watch_event.is_deleted = True
+        watch_event.deleted_at = now
+        watch_event.deleted_by = updated_by
+        watch_event.deleted_reason = update_reason
+        watch_event.updated_at = now
+        watch_event.updated_by = updated_by
+        watch_event.update_reason = update_reason
+        watch_event.rewatch = False
+        watch_event.dedupe_hash = None
+
+    @staticmethod
+    def _mark_restored(
+        session: Session,
+        watch_event: WatchEvent,
+        *,
+        updated_by: str,
+        update_reason: str | None,
+        now: datetime,
+    ) -> None:
+        if not watch_event.is_deleted:
+            raise ValueError("Watch event is not deleted")
+
+        watch_event.is_deleted = False
+        watch_event.deleted_at = None
+        watch_event.deleted_by = None
+        watch_event.deleted_reason = None
+        watch_event.updated_at = now
+        watch_event.updated_by = updated_by
+        watch_event.update_reason = update_reason
+        watch_event.dedupe_hash = WatchEventService._dedupe_hash_for(
+            session, watch_event
+        )
+
+    @staticmethod
+    def _apply_correction(
+        session: Session,
+        watch_event: WatchEvent,
+        *,
+        updated_by: str,
+        update_reason: str | None,
+        watched_at: datetime | None,
+        media_item_id: UUID | None,
+        completed: bool | None,
+        rewatch: bool | None,
+        now: datetime,
+    ) -> None:
+        if (
+            watched_at is None
+            and media_item_id is None
+            and completed is None
+            and rewatch is None
+        ):
+            raise ValueError("At least one correction field must be provided")
+
+        new_watched_at = (
+            ensure_timezone_aware(watched_at, field_name="watched_at").astimezone(UTC)
+            if watched_at is not None
+            else watch_event.watched_at
+        )
+        if media_item_id is not None:
+            media_item = MediaItemService.get_media_item(
+                session, media_item_id=media_item_id
+            )
+            if media_item is None:
+                raise ValueError(f"Media item '{media_item_id}' not found")
+            watch_event.media_item_id = media_item_id
+            if (
+                watch_event.media_version_id is not None
+                and not watch_event_repository.media_version_matches_media_item(
+                    session,
+                    media_version_id=watch_event.media_version_id,
+                    media_item_id=media_item_id,
+                )
+            ):
+                watch_event.media_version_id = None
+
+        watch_event.watched_at = new_watched_at
+        if completed is not None:
+            watch_event.completed = completed
+        if rewatch is not None:
+            watch_event.rewatch = rewatch
+
+        watch_event.updated_at = now
+        watch_event.updated_by = updated_by
+        watch_event.update_reason = update_reason
+        if not watch_event.is_deleted and (
+            media_item_id is not None or watched_at is not None or completed is not None
+        ):
+            watch_event.dedupe_hash = WatchEventService._dedupe_hash_for(
+                session, watch_event
+            )
+
+    @staticmethod
+    def _apply_rating(
+        watch_event: WatchEvent,
+        *,
+        updated_by: str,
+        update_reason: str | None,
+        rating_value: int,
+        now: datetime,
+    ) -> None:
+        if watch_event.is_deleted:
+            raise ValueError("Cannot rate a deleted watch event")
+        if rating_value < 1 or rating_value > 10:
+            raise ValueError("rating_value must be between 1 and 10")
+
+        watch_event.rating_value = Decimal(rating_value)
+        watch_event.rating_scale = "10-star"
+        watch_event.updated_at = now
+        watch_event.updated_by = updated_by
+        watch_event.update_reason = update_reason
+
+    @staticmethod
+    def _dedupe_hash_for(session: Session, watch_event: WatchEvent) -> str | None:
+        # Mirrors the database trigger so the session sees the stored value: no
+        # hash when the probe is disabled or another watch already holds the key.
+        if not dedupe_hash_enabled(WatchEventService._watch_collision_window_seconds()):
+            return None
+        dedupe_hash = watch_event_dedupe_hash(
+            user_id=watch_event.user_id,
+            media_item_id=watch_event.media_item_id,
+            playback_source=watch_event.playback_source,
+            completed=watch_event.completed,
+            watched_at=watch_event.watched_at,
+        )
+        holder = watch_event_repository.get_watch_event_by_dedupe_hash(
+            session, dedupe_hash=dedupe_hash
+        )
+        if holder is not None and holder.watch_id != watch_event.watch_id:
+            return None
+        return dedupe_hash
+
     @staticmethod
     def _get_watch_event_or_raise(session: Session, *, watch_id: UUID) -> WatchEvent:
         watch_event = watch_event_repository.get_watch_event(session, watch_id=watch_id)
@@ -739,22 +1078,73 @@ class WatchEventService:
         return normalized or None
 
     @staticmethod
-    def _recompute_rewatch_for_media_timeline(
+    def recompute_rewatch_flags(
+        session: Session,
+        *,
+        timelines: Iterable[tuple[UUID, UUID]],
+    ) -> int:
+        unique_timelines = sorted(set(timelines))
+        if not unique_timelines:
+            return 0
+        updated = watch_event_repository.recompute_rewatch_flags(
+            session, timelines=unique_timelines
+        )
+        session.commit()
+        return updated
+
+    @staticmethod
+    def list_watch_event_user_ids(session: Session) -> list[UUID]:
+        return watch_event_repository.list_watch_event_user_ids(session)
+
+    @staticmethod
+    def recompute_rewatch_flags_for_users(
+        session: Session,
+        *,
+        user_ids: Sequence[UUID],
+        dry_run: bool = False,
+    ) -> int:
+        changed = watch_event_repository.recompute_rewatch_flags_for_users(
+            session, user_ids=user_ids, dry_run=dry_run
+        )
+        if not dry_run:
+            session.commit()
+        return changed
+
+    @staticmethod
+    def _refresh_rewatch_after_edit(
         session: Session,
         *,
         user_id: UUID,
         media_item_id: UUID,
+        watch_event: WatchEvent,
+        edit_points: Iterable[datetime],
     ) -> None:
-        watch_events = watch_event_repository.list_user_media_watch_events(
-            session,
-            user_id=user_id,
-            media_item_id=media_item_id,
+        """Fix rewatch flags in one timeline after a single watch was written.
+
+        The timeline was consistent before the write, so only the edited watch,
+        the timeline's first active watch, and the watch that was first before
+        the edit can change; the latter is always the first other active watch
+        at or after an edit point. Each lookup is one index seek.
+        """
+        first_watch = watch_event_repository.first_active_watch_event(
+            session, user_id=user_id, media_item_id=media_item_id
         )
-        seen_active_watch = False
-        for watch_event in watch_events:
-            desired_rewatch = False if watch_event.is_deleted else seen_active_watch
-            if watch_event.rewatch != desired_rewatch:
-                watch_event.rewatch = desired_rewatch
-                session.add(watch_event)
-            if not watch_event.is_deleted:
-                seen_active_watch = True
+        candidates = [] if first_watch is None else [first_watch]
+        if watch_event.media_item_id == media_item_id:
+            candidates.append(watch_event)
+        for edit_point in dict.fromkeys(edit_points):
+            next_watch = watch_event_repository.first_active_watch_event(
+                session,
+                user_id=user_id,
+                media_item_id=media_item_id,
+                watched_from=edit_point,
+                exclude_watch_id=watch_event.watch_id,
+            )
+            if next_watch is not None:
+                candidates.append(next_watch)
+
+        for candidate in candidates:
+            desired_rewatch = not candidate.is_deleted and candidate is not first_watch
+            if candidate.rewatch != desired_rewatch:
+                candidate.rewatch = desired_rewatch
+                session.add(candidate)
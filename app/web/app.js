@@ -340,6 +340,8 @@ const IMPORT_UPLOAD_MAX_MB = 25;
 const IMPORT_UPLOAD_MAX_BYTES = IMPORT_UPLOAD_MAX_MB * 1024 * 1024;
 
 let historyOffset = 0;
+// Keyset cursors per history page; index 0 is always the first page.
+let historyPageCursors = [null];
 let activeUsers = [];
 let activeUserId = "";
 let historyLimit = Number.parseInt(historyLimitSelect.value, 10);
@@ -2745,6 +2747,10 @@ function parseApiError(payload) {
     }
   }
 
+  if (detail && typeof detail.import_batch_id === "string") {
+    return `${detail.message} Rows before the failure were imported; resume batch ${detail.import_batch_id} to continue.`;
+  }
+
   return "Import failed due to an unknown error.";
 }
 
@@ -2902,8 +2908,18 @@ async function runImport(event) {
   }
 }
 
+function historyPageIndex() {
+  return Math.floor(historyOffset / historyLimit);
+}
+
+function rememberHistoryNextCursor(response) {
+  const pageIndex = historyPageIndex();
+  historyPageCursors.length = pageIndex + 1;
+  historyPageCursors.push(response.headers.get("X-Next-Cursor"));
+}
+
 function setHistoryPagination(rowsLoaded) {
-  const page = Math.floor(historyOffset / historyLimit) + 1;
+  const page = historyPageIndex() + 1;
   historyPage.textContent = `Page ${page} · showing ${rowsLoaded} row(s) · offset ${historyOffset}`;
   historyPrev.disabled = historyOffset === 0;
   historyNext.disabled = rowsLoaded < historyLimit;
@@ -4314,7 +4330,12 @@ async function includeWatchInHorrorfest() {
 function buildHistoryQuery() {
   const params = new URLSearchParams();
   params.set("limit", String(historyLimit));
-  params.set("offset", String(historyOffset));
+  const pageCursor = historyOffset > 0 ? historyPageCursors[historyPageIndex()] : null;
+  if (pageCursor) {
+    params.set("cursor", pageCursor);
+  } else {
+    params.set("offset", String(historyOffset));
+  }
   if (linkedHistoryContext?.mediaItemId) {
     params.set("media_item_id", linkedHistoryContext.mediaItemId);
   }
@@ -4528,6 +4549,7 @@ async function loadHistory() {
     }
     const rows = await response.json();
     historyRows = rows;
+    rememberHistoryNextCursor(response);
     if (rows.length === 0) {
       historyStatus.textContent =
         linkedHistoryContext?.type === "unrated_queue"
@@ -1,6 +1,7 @@
 import pytest
 
 from app.core.config import get_settings
+from app.core.response_cache import get_response_cache
 
 
 @pytest.fixture(autouse=True)
@@ -13,6 +14,11 @@ def clear_auth_environment(monkeypatch) -> None:
     monkeypatch.delenv("KLUG_SESSION_TTL_SECONDS", raising=False)
     monkeypatch.delenv("KLUG_SESSION_COOKIE_SECURE", raising=False)
     monkeypatch.delenv("KLUG_IMPORT_UPLOAD_MAX_MB", raising=False)
+    # API tests run without a database, so the generation lookup is off unless
+    # a test turns the response cache on.
+    monkeypatch.setenv("KLUG_RESPONSE_CACHE_MAX_MB", "0")
     get_settings.cache_clear()
+    get_response_cache.cache_clear()
     yield
     get_settings.cache_clear()
+    get_response_cache.cache_clear()
@@ -1,7 +1,8 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.db.models.entities import CollectionEntry, Show
+from app.db.models.entities import CollectionEntry, MediaItem, Show
+from app.repositories.collection import list_collection_movies
 
 
 def test_collection_entry_schema_allows_nullable_show_tmdb_and_persists_entries(
@@ -45,3 +46,44 @@ def test_collection_entry_schema_allows_nullable_show_tmdb_and_persists_entries(
     assert tmdb_is_nullable == "YES"
     assert entry.collection_entry_id is not None
     session.close()
+
+
+def test_collection_movie_search_ranks_by_title_similarity(
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    titles = ["Aliens vs. Predator: Requiem", "Alien", "Aliens"]
+    for index, title in enumerate(titles):
+        media_item = MediaItem(type="movie", title=title)
+        session.add(media_item)
+        session.flush()
+        session.add(
+            CollectionEntry(
+                source="jellyfin",
+                source_item_id=f"jf-search-{index}",
+                item_type="movie",
+                media_item_id=media_item.media_item_id,
+                library_id="movies",
+            )
+        )
+    session.commit()
+
+    rows = list_collection_movies(
+        session, query="alien", present=None, limit=10, offset=0
+    )
+    index_names = set(
+        session.execute(
+            text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = 'app' AND indexname LIKE '%_title_trgm'"
+            )
+        ).scalars()
+    )
+    session.close()
+
+    assert [row["title"] for row in rows] == [
+        "Alien",
+        "Aliens",
+        "Aliens vs. Predator: Requiem",
+    ]
+    assert index_names == {"ix_media_item_title_trgm", "ix_shows_title_trgm"}
@@ -1,15 +1,18 @@
 from datetime import datetime
+from decimal import Decimal
 from uuid import uuid4
 
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.db.models.entities import (
     HorrorfestEntry,
+    HorrorfestSnapshot,
     HorrorfestYear,
     MediaItem,
     User,
     WatchEvent,
 )
+from app.services.horrorfest import HorrorfestService
 
 
 def test_horrorfest_title_drilldown_excludes_removed_and_deleted_and_orders_rows(
@@ -425,6 +428,24 @@ def test_horrorfest_selected_year_drilldown_filters_by_date_source_and_rating(
     rating_payload = rating_response.json()
     assert [row["watch_order"] for row in rating_payload] == [1, 3]
 
+    detail_response = integration_client.get(
+        f"/api/v1/horrorfest/analytics/years/2025?user_id={user.user_id}"
+    )
+    assert detail_response.status_code == 200
+    detail = detail_response.json()
+    assert detail["summary"]["watch_count"] == 3
+    assert detail["summary"]["rewatch_count"] == 2
+    daily_dates = [row["watch_date"] for row in detail["daily_rows"]]
+    assert daily_dates == sorted(daily_dates)
+    assert sum(row["watch_count"] for row in detail["daily_rows"]) == 3
+    assert [
+        (row["playback_source"], row["watch_count"]) for row in detail["source_rows"]
+    ] == [("kodi", 2), ("disc", 1)]
+    assert [
+        (Decimal(row["rating_value"]), row["watch_count"])
+        for row in detail["rating_rows"]
+    ] == [(Decimal("8"), 2), (Decimal("7"), 1)]
+
 
 def test_horrorfest_comparison_returns_deltas_and_repeated_titles(
     integration_client,
@@ -748,3 +769,88 @@ def test_horrorfest_curation_reports_return_expected_repeat_patterns(
     dormant_payload = dormant_response.json()["rows"]
     assert dormant_payload[0]["title"] == "The Blob (1988)"
     assert dormant_payload[0]["years_since_last_seen"] == 5
+
+
+def test_horrorfest_closed_year_snapshot_is_frozen_and_dropped_on_writes(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username=f"horrorfest-snapshot-{uuid4().hex[:8]}")
+    movie = MediaItem(type="movie", title="Suspiria", year=1977)
+    session.add_all(
+        [
+            user,
+            movie,
+            HorrorfestYear(
+                horrorfest_year=2023,
+                window_start_at=datetime.fromisoformat("2023-10-01T00:00:00+00:00"),
+                window_end_at=datetime.fromisoformat("2023-10-31T23:59:59+00:00"),
+                label="Horrorfest 2023",
+                is_active=True,
+            ),
+        ]
+    )
+    session.flush()
+    watches = [
+        WatchEvent(
+            user_id=user.user_id,
+            media_item_id=movie.media_item_id,
+            watched_at=datetime.fromisoformat(f"2023-10-{day:02d}T03:00:00+00:00"),
+            playback_source="integration",
+            completed=True,
+            rating_value=Decimal("9"),
+            watch_runtime_seconds=5940,
+        )
+        for day in (3, 8)
+    ]
+    session.add_all(watches)
+    session.flush()
+    entries = [
+        HorrorfestEntry(
+            watch_id=watch.watch_id,
+            horrorfest_year=2023,
+            watch_order=order,
+            source_kind="manual",
+        )
+        for order, watch in enumerate(watches, start=1)
+    ]
+    session.add_all(entries)
+    session.commit()
+    second_entry_id = entries[1].horrorfest_entry_id
+    session.close()
+
+    url = f"/api/v1/horrorfest/analytics/years/2023?user_id={user.user_id}"
+    live = integration_client.get(url)
+    assert live.status_code == 200
+    assert live.json()["summary"]["watch_count"] == 2
+
+    session = integration_session_factory()
+    assert session.get(HorrorfestSnapshot, 2023) is None
+    assert 2023 in HorrorfestService.freeze_closed_years(session)
+    assert session.get(HorrorfestSnapshot, 2023) is not None
+    session.close()
+
+    frozen = integration_client.get(url)
+    assert frozen.status_code == 200
+    assert frozen.json() == live.json()
+
+    session = integration_session_factory()
+    session.get(HorrorfestEntry, second_entry_id).is_removed = True
+    session.commit()
+    assert session.get(HorrorfestSnapshot, 2023) is None
+    session.close()
+
+    live_after_write = integration_client.get(url)
+    assert live_after_write.status_code == 200
+
+    session = integration_session_factory()
+    assert 2023 in HorrorfestService.freeze_closed_years(session)
+    session.close()
+
+    refrozen = integration_client.get(url)
+    assert refrozen.status_code == 200
+    payload = refrozen.json()
+    assert payload == live_after_write.json()
+    assert payload["summary"]["watch_count"] == 1
+    assert [row["watch_date"] for row in payload["daily_rows"]] == ["2023-10-03"]
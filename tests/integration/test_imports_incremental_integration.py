@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.db.models.entities import MediaItem, User
+from app.db.models.entities import MediaItem, User, WatchEvent
 
 
 def test_incremental_reimport_skips_existing_source_event_id(
@@ -52,3 +52,70 @@ def test_incremental_reimport_skips_existing_source_event_id(
     assert second_data["inserted_count"] == 0
     assert second_data["skipped_count"] == 1
     assert second_data["error_count"] == 0
+
+
+def test_bulk_import_matches_row_by_row_counters_and_rewatch_flags(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="bulk-import-user")
+    media_item = MediaItem(type="movie", title="Bulk Movie")
+    session.add_all([user, media_item])
+    session.commit()
+    session.refresh(user)
+    session.refresh(media_item)
+    session.close()
+
+    def _row(watched_at: str, source_event_id: str) -> dict:
+        return {
+            "user_id": str(user.user_id),
+            "media_item_id": str(media_item.media_item_id),
+            "watched_at": watched_at,
+            "player": "legacy_backup",
+            "source_event_id": source_event_id,
+            "completed": True,
+        }
+
+    rows = [
+        _row("2025-01-01T10:00:00+00:00", "bulk-evt-1"),
+        _row("2025-01-01T10:02:00+00:00", "bulk-evt-2"),
+        _row("2025-02-01T10:00:00+00:00", "bulk-evt-3"),
+        _row("2025-02-01T10:00:00+00:00", "bulk-evt-3"),
+    ]
+    response = integration_client.post(
+        "/api/v1/imports/watch-events/legacy-source",
+        json={"mode": "bootstrap", "bulk": True, "rows": rows},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted_count"] == 2
+    assert data["skipped_count"] == 2
+    assert data["collision_deduped_count"] == 1
+    assert data["error_count"] == 0
+    assert data["cursor_after"]["source_event_id"] == "bulk-evt-3"
+
+    rerun = integration_client.post(
+        "/api/v1/imports/watch-events/legacy-source",
+        json={"mode": "incremental", "bulk": True, "rows": rows},
+    )
+    assert rerun.status_code == 200
+    assert rerun.json()["inserted_count"] == 0
+    assert rerun.json()["skipped_count"] == 4
+
+    session = integration_session_factory()
+    try:
+        watches = (
+            session.query(WatchEvent)
+            .filter(WatchEvent.user_id == user.user_id)
+            .order_by(WatchEvent.watched_at.asc())
+            .all()
+        )
+        assert [watch.source_event_id for watch in watches] == [
+            "bulk-evt-1",
+            "bulk-evt-3",
+        ]
+        assert [watch.rewatch for watch in watches] == [False, True]
+        assert all(watch.origin_kind == "manual_import" for watch in watches)
+    finally:
+        session.close()
@@ -2,6 +2,11 @@ import json
 from datetime import UTC, datetime
 from uuid import uuid4
 
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.entities import MediaItem, Show, User, WatchEvent
+
 
 def test_upload_import_dry_run_returns_summary_and_cursor(integration_client) -> None:
     watched_at = (
@@ -47,3 +52,93 @@ def test_upload_import_dry_run_returns_summary_and_cursor(integration_client) ->
     assert data["cursor_before"] is None
     assert data["cursor_after"]["watched_at"] == watched_at
     assert data["cursor_after"]["source_event_id"] == "upload-evt-1"
+
+
+def test_legacy_backup_upload_resolves_repeated_external_ids_in_batch(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+    monkeypatch,
+) -> None:
+    session = integration_session_factory()
+    user = User(username="batched-resolution-user")
+    existing_movie = MediaItem(type="movie", title="Existing Movie", tmdb_id=111)
+    existing_show = Show(title="Existing Show", tmdb_id=900)
+    session.add_all([user, existing_movie, existing_show])
+    session.commit()
+    user_id = user.user_id
+    existing_movie_id = existing_movie.media_item_id
+    existing_show_id = existing_show.show_id
+    session.close()
+
+    monkeypatch.setattr(
+        "app.scripts.import_watch_events.SessionLocal", integration_session_factory
+    )
+    backup_rows = [
+        {
+            "id": "evt-1",
+            "type": "movie",
+            "watched_at": "2025-01-01T00:00:00Z",
+            "tmdb_id": 111,
+        },
+        {
+            "id": "evt-2",
+            "type": "movie",
+            "watched_at": "2025-01-02T00:00:00Z",
+            "tmdb_id": 222,
+            "title": "New Movie",
+        },
+        {
+            "id": "evt-3",
+            "type": "movie",
+            "watched_at": "2025-01-03T00:00:00Z",
+            "tmdb_id": 222,
+            "title": "New Movie",
+        },
+        {
+            "id": "evt-4",
+            "type": "episode",
+            "watched_at": "2025-01-04T00:00:00Z",
+            "episode": {"season": 1, "number": 1, "ids": {"tmdb": 333}},
+            "show": {"title": "Existing Show", "ids": {"tmdb": 900}},
+        },
+    ]
+
+    response = integration_client.post(
+        "/api/v1/imports/watch-events/legacy-source/upload",
+        data={
+            "input_schema": "legacy_backup",
+            "file_format": "json",
+            "mode": "bootstrap",
+            "user_id": str(user_id),
+        },
+        files={
+            "input_file": (
+                "backup.json",
+                json.dumps(backup_rows),
+                "application/json",
+            )
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted_count"] == 4
+    assert data["media_items_created"] == 2
+    assert data["shows_created"] == 0
+
+    verify_session = integration_session_factory()
+    try:
+        media_by_tmdb = {
+            media_item.tmdb_id: media_item
+            for media_item in verify_session.scalars(select(MediaItem))
+        }
+        assert set(media_by_tmdb) == {111, 222, 333}
+        assert media_by_tmdb[111].media_item_id == existing_movie_id
+        assert media_by_tmdb[333].show_id == existing_show_id
+        watch_media_ids = verify_session.scalars(
+            select(WatchEvent.media_item_id).order_by(WatchEvent.watched_at)
+        ).all()
+        assert watch_media_ids[0] == existing_movie_id
+        assert watch_media_ids[1] == watch_media_ids[2]
+    finally:
+        verify_session.close()
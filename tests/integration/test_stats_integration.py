@@ -1,9 +1,12 @@
 from datetime import UTC, datetime
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.core.config import get_settings
+from app.core.response_cache import get_response_cache
 from app.db.models.entities import (
     HorrorfestEntry,
     HorrorfestYear,
@@ -12,6 +15,8 @@ from app.db.models.entities import (
     User,
     WatchEvent,
 )
+from app.services.stats import StatsService
+from app.services.watch_events import WatchEventService
 
 
 def test_stats_summary_uses_effective_runtime_and_excludes_deleted(
@@ -216,3 +221,272 @@ def test_stats_horrorfest_excludes_removed_and_deleted_watches(
     assert row["rewatch_count"] == 1
     assert row["total_runtime_seconds"] == 7200
     assert row["total_runtime_hours"] == "2.00"
+
+
+def test_monthly_rollup_follows_watch_media_and_timezone_writes(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username=f"rollup-user-{uuid4().hex[:8]}", timezone="UTC")
+    movie = MediaItem(type="movie", title="Rollup Movie", base_runtime_seconds=6000)
+    episode = MediaItem(
+        type="episode", title="Rollup Episode", season_number=1, episode_number=1
+    )
+    session.add_all([user, movie, episode])
+    session.commit()
+    user_id = user.user_id
+    edit = {"updated_by": "integration", "update_reason": None}
+
+    def create(media_item: MediaItem, watched_at: str, rating: str | None) -> UUID:
+        return WatchEventService.create_watch_event(
+            session,
+            user_id=user_id,
+            media_item_id=media_item.media_item_id,
+            watched_at=datetime.fromisoformat(watched_at),
+            playback_source="integration",
+            total_seconds=None,
+            watched_seconds=None,
+            progress_percent=None,
+            completed=True,
+            rating_value=Decimal(rating) if rating else None,
+            rating_scale="10-star" if rating else None,
+            media_version_id=None,
+            source_event_id=None,
+        ).watch_event.watch_id
+
+    def months() -> dict[tuple[int, int], dict]:
+        response = integration_client.get(f"/api/v1/stats/monthly?user_id={user_id}")
+        assert response.status_code == 200
+        return {(row["year"], row["month"]): row for row in response.json()}
+
+    movie_watch_id = create(movie, "2026-01-15T20:00:00+00:00", None)
+    episode_watch_id = create(episode, "2026-02-01T03:00:00+00:00", "8")
+    assert {key: row["watch_count"] for key, row in months().items()} == {
+        (2026, 1): 1,
+        (2026, 2): 1,
+    }
+
+    WatchEventService.correct_watch_event(
+        session,
+        watch_id=movie_watch_id,
+        watched_at=datetime.fromisoformat("2026-02-10T20:00:00+00:00"),
+        media_item_id=None,
+        completed=None,
+        rewatch=None,
+        **edit,
+    )
+    february = months()[(2026, 2)]
+    assert list(months()) == [(2026, 2)]
+    assert (february["movie_count"], february["episode_count"]) == (1, 1)
+    assert february["total_runtime_seconds"] == 6000
+
+    WatchEventService.soft_delete_watch_event(
+        session, watch_id=episode_watch_id, **edit
+    )
+    assert months()[(2026, 2)]["watch_count"] == 1
+    WatchEventService.restore_watch_event(session, watch_id=episode_watch_id, **edit)
+    assert months()[(2026, 2)]["rated_watch_count"] == 1
+
+    session.get(MediaItem, movie.media_item_id).base_runtime_seconds = 7200
+    session.get(User, user_id).timezone = "America/Edmonton"
+    session.commit()
+    assert {key: row["watch_count"] for key, row in months().items()} == {
+        (2026, 2): 1,
+        (2026, 1): 1,
+    }
+    assert months()[(2026, 2)]["total_runtime_seconds"] == 7200
+
+    session.execute(text("DELETE FROM app.stats_monthly_rollup"))
+    session.commit()
+    assert months() == {}
+    assert StatsService.rebuild_rollups(session, user_id=user_id) == 4
+    session.close()
+
+    summary = integration_client.get(f"/api/v1/stats/summary?user_id={user_id}")
+    assert summary.json()["total_active_watches"] == 2
+    assert Decimal(summary.json()["average_rating_value"]) == Decimal("8")
+
+
+def test_time_series_gap_fills_periods_from_daily_rollup(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username=f"series-user-{uuid4().hex[:8]}", timezone="UTC")
+    movie = MediaItem(type="movie", title="Series Movie", base_runtime_seconds=6000)
+    episode = MediaItem(
+        type="episode", title="Series Episode", season_number=1, episode_number=1
+    )
+    session.add_all([user, movie, episode])
+    session.flush()
+    session.add_all(
+        [
+            WatchEvent(
+                user_id=user.user_id,
+                media_item_id=movie.media_item_id,
+                watched_at=datetime(2026, 3, 2, 20, 0, tzinfo=UTC),
+                playback_source="integration",
+                completed=True,
+                rating_value=Decimal("7"),
+                rating_scale="10-star",
+            ),
+            WatchEvent(
+                user_id=user.user_id,
+                media_item_id=episode.media_item_id,
+                watched_at=datetime(2026, 3, 4, 20, 0, tzinfo=UTC),
+                playback_source="integration",
+                completed=True,
+                watch_runtime_seconds=1800,
+            ),
+            WatchEvent(
+                user_id=user.user_id,
+                media_item_id=movie.media_item_id,
+                watched_at=datetime(2026, 3, 23, 3, 0, tzinfo=UTC),
+                playback_source="integration",
+                completed=True,
+                rewatch=True,
+            ),
+        ]
+    )
+    session.commit()
+    user_id = user.user_id
+
+    def series(query: str) -> dict:
+        response = integration_client.get(
+            f"/api/v1/stats/timeseries?user_id={user_id}&{query}"
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    weekly = series("granularity=week")
+    assert (weekly["local_date_from"], weekly["local_date_to"]) == (
+        "2026-03-02",
+        "2026-03-23",
+    )
+    assert [
+        (point["period_start"], point["period_end"], point["watch_count"])
+        for point in weekly["points"]
+    ] == [
+        ("2026-03-02", "2026-03-08", 2),
+        ("2026-03-09", "2026-03-15", 0),
+        ("2026-03-16", "2026-03-22", 0),
+        ("2026-03-23", "2026-03-29", 1),
+    ]
+    first_week = weekly["points"][0]
+    assert (first_week["movie_count"], first_week["episode_count"]) == (1, 1)
+    assert first_week["total_runtime_seconds"] == 7800
+    assert Decimal(first_week["average_rating_value"]) == Decimal("7")
+
+    movies = series(
+        "granularity=month&media_type=movie"
+        "&local_date_from=2026-02-01&local_date_to=2026-04-30"
+    )
+    assert [
+        (point["period_start"], point["watch_count"], point["rewatch_count"])
+        for point in movies["points"]
+    ] == [("2026-02-01", 0, 0), ("2026-03-01", 2, 1), ("2026-04-01", 0, 0)]
+
+    session.get(User, user_id).timezone = "America/Edmonton"
+    session.commit()
+    session.close()
+    days = series("granularity=day&local_date_from=2026-03-22&local_date_to=2026-03-23")
+    assert [point["watch_count"] for point in days["points"]] == [1, 0]
+
+
+def test_stats_etag_changes_only_after_the_users_data_changes(
+    monkeypatch,
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    monkeypatch.setenv("KLUG_RESPONSE_CACHE_MAX_MB", "1")
+    get_settings.cache_clear()
+    get_response_cache.cache_clear()
+    session = integration_session_factory()
+    user = User(username=f"etag-user-{uuid4().hex[:8]}")
+    other_user = User(username=f"etag-other-{uuid4().hex[:8]}")
+    movie = MediaItem(type="movie", title="ETag Movie", base_runtime_seconds=5400)
+    session.add_all([user, other_user, movie])
+    session.commit()
+    url = f"/api/v1/stats/summary?user_id={user.user_id}"
+
+    def add_watch(user_id: UUID) -> WatchEvent:
+        watch = WatchEvent(
+            user_id=user_id,
+            media_item_id=movie.media_item_id,
+            watched_at=datetime.now(UTC),
+            playback_source="integration",
+            completed=True,
+        )
+        session.add(watch)
+        session.commit()
+        return watch
+
+    watch = add_watch(user.user_id)
+    first = integration_client.get(url)
+    etag = first.headers["etag"]
+    assert (
+        integration_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    )
+
+    add_watch(other_user.user_id)
+    assert (
+        integration_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    )
+
+    watch.rating_value = Decimal("9")
+    watch.rating_scale = "10-star"
+    session.commit()
+    session.close()
+    changed = integration_client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["average_rating_value"] is not None
+
+
+def test_all_users_cache_sees_a_write_that_commits_after_a_later_generation(
+    monkeypatch,
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    monkeypatch.setenv("KLUG_RESPONSE_CACHE_MAX_MB", "1")
+    get_settings.cache_clear()
+    get_response_cache.cache_clear()
+    session = integration_session_factory()
+    first_user = User(username=f"etag-first-{uuid4().hex[:8]}")
+    second_user = User(username=f"etag-second-{uuid4().hex[:8]}")
+    movie = MediaItem(type="movie", title="Interleaved", base_runtime_seconds=5400)
+    session.add_all([first_user, second_user, movie])
+    session.commit()
+    user_ids = (first_user.user_id, second_user.user_id)
+    media_item_id = movie.media_item_id
+    session.close()
+
+    def watch(user_id: UUID) -> WatchEvent:
+        return WatchEvent(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_at=datetime.now(UTC),
+            playback_source="integration",
+            completed=True,
+        )
+
+    # The first writer draws the lower generation but commits last.
+    slow_writer = integration_session_factory()
+    slow_writer.add(watch(user_ids[0]))
+    slow_writer.flush()
+    fast_writer = integration_session_factory()
+    fast_writer.add(watch(user_ids[1]))
+    fast_writer.commit()
+    fast_writer.close()
+
+    url = "/api/v1/stats/summary"
+    cached = integration_client.get(url)
+    assert cached.json()["total_active_watches"] == 1
+    etag = cached.headers["etag"]
+
+    slow_writer.commit()
+    slow_writer.close()
+    fresh = integration_client.get(url, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["total_active_watches"] == 2
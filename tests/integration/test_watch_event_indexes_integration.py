@@ -0,0 +1,120 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models.entities import MediaItem, User, WatchEvent
+from app.repositories import watch_events as watch_event_repository
+
+ACTIVE_TIMELINE_INDEX = "ix_watch_event_active_user_media_time"
+WATCHES_PER_ITEM = 25
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+@contextmanager
+def _captured_statements(session: Session) -> Iterator[list[tuple[str, object]]]:
+    captured: list[tuple[str, object]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        captured.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+def seeded_timelines(
+    integration_session_factory: sessionmaker[Session],
+) -> Iterator[tuple[Session, User, MediaItem]]:
+    session = integration_session_factory()
+    user = User(username="index-user")
+    media_items = [MediaItem(type="movie", title=f"Index Movie {n}") for n in range(80)]
+    session.add(user)
+    session.add_all(media_items)
+    session.flush()
+    start = datetime(2020, 1, 1, tzinfo=UTC)
+    session.execute(
+        insert(WatchEvent),
+        [
+            {
+                "user_id": user.user_id,
+                "media_item_id": media_item.media_item_id,
+                "watched_at": start + timedelta(days=day, minutes=item_index),
+                "playback_source": "integration",
+                "completed": True,
+                "rewatch": day > 0,
+                "is_deleted": day % 7 == 3,
+            }
+            for item_index, media_item in enumerate(media_items)
+            for day in range(WATCHES_PER_ITEM)
+        ],
+    )
+    session.commit()
+    session.execute(text("ANALYZE app.watch_event"))
+    try:
+        yield session, user, media_items[40]
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize(
+    "lookup",
+    [
+        lambda session, user, item, watched_at: (
+            watch_event_repository.find_matching_watch_event(
+                session,
+                user_id=user.user_id,
+                media_item_id=item.media_item_id,
+                watched_at=watched_at,
+                completed=True,
+                collision_window_seconds=3600,
+            )
+        ),
+        lambda session, user, item, watched_at: (
+            watch_event_repository.prior_watch_event_exists(
+                session,
+                user_id=user.user_id,
+                media_item_id=item.media_item_id,
+                watched_at=watched_at,
+            )
+        ),
+        lambda session, user, item, watched_at: (
+            watch_event_repository.first_active_watch_event(
+                session,
+                user_id=user.user_id,
+                media_item_id=item.media_item_id,
+                watched_from=watched_at,
+            )
+        ),
+    ],
+    ids=["collision_window", "prior_watch", "first_active_watch"],
+)
+def test_timeline_lookups_use_partial_active_index(
+    seeded_timelines: tuple[Session, User, MediaItem],
+    lookup: Callable[[Session, User, MediaItem, datetime], object],
+) -> None:
+    session, user, media_item = seeded_timelines
+    watched_at = datetime(2020, 1, 12, tzinfo=UTC)
+
+    with _captured_statements(session) as captured:
+        lookup(session, user, media_item, watched_at)
+    statement, parameters = captured[-1]
+    explain = session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = explain.scalar_one()[0]["Plan"]
+
+    assert ACTIVE_TIMELINE_INDEX in _index_names(plan)
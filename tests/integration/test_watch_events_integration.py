@@ -1,10 +1,19 @@
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.db.models.entities import MediaItem, User, WatchEvent
+from app.core.dedupe import watch_event_dedupe_hash
+from app.db.models.entities import (
+    HorrorfestEntry,
+    HorrorfestYear,
+    MediaItem,
+    User,
+    WatchEvent,
+)
+from app.services.watch_events import WatchEventService
 
 
 def test_post_watch_event_success(
@@ -115,6 +124,116 @@ def test_list_watch_events_applies_user_local_date_filters(
     assert payload_utc_day_only[0]["watched_at"] == "2026-01-02T09:00:00Z"
 
 
+def test_watch_event_local_dates_follow_watched_at_and_user_timezone(
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="local-columns-user", timezone="America/Edmonton")
+    media_item = MediaItem(type="movie", title="Local Columns Movie")
+    session.add_all([user, media_item])
+    session.flush()
+    watch_event = WatchEvent(
+        user_id=user.user_id,
+        media_item_id=media_item.media_item_id,
+        watched_at=datetime.fromisoformat("2026-01-01T03:00:00+00:00"),
+        playback_source="integration",
+        completed=True,
+    )
+    session.add(watch_event)
+    session.commit()
+
+    assert str(watch_event.watched_local_date) == "2025-12-31"
+    assert (watch_event.watched_local_year, watch_event.watched_local_month) == (
+        2025,
+        12,
+    )
+
+    watch_event.watched_at = datetime.fromisoformat("2026-02-10T20:00:00+00:00")
+    session.commit()
+    assert str(watch_event.watched_local_date) == "2026-02-10"
+
+    session.execute(
+        text("UPDATE app.users SET timezone = 'Asia/Tokyo' WHERE user_id = :user_id"),
+        {"user_id": user.user_id},
+    )
+    session.commit()
+    session.refresh(watch_event)
+    session.close()
+
+    assert str(watch_event.watched_local_date) == "2026-02-11"
+    assert (watch_event.watched_local_year, watch_event.watched_local_month) == (
+        2026,
+        2,
+    )
+
+
+def test_list_watch_events_cursor_pages_are_stable_when_new_watches_arrive(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="cursor-user")
+    media_item = MediaItem(type="movie", title="Cursor Movie")
+    session.add_all([user, media_item])
+    session.flush()
+    shared_time = datetime.fromisoformat("2026-02-01T20:00:00+00:00")
+    session.add_all(
+        [
+            WatchEvent(
+                user_id=user.user_id,
+                media_item_id=media_item.media_item_id,
+                watched_at=shared_time
+                if index < 3
+                else datetime(2026, 1, index, tzinfo=UTC),
+                playback_source="integration",
+                completed=True,
+            )
+            for index in range(5)
+        ]
+    )
+    session.commit()
+    user_id = user.user_id
+    media_item_id = media_item.media_item_id
+    session.close()
+
+    first_page = integration_client.get(
+        f"/api/v1/watch-events?user_id={user_id}&limit=2"
+    )
+    assert first_page.status_code == 200
+    next_cursor = first_page.headers["X-Next-Cursor"]
+
+    session = integration_session_factory()
+    session.add(
+        WatchEvent(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_at=datetime.fromisoformat("2026-03-01T20:00:00+00:00"),
+            playback_source="integration",
+            completed=True,
+        )
+    )
+    session.commit()
+    session.close()
+
+    second_page = integration_client.get(
+        f"/api/v1/watch-events?user_id={user_id}&limit=2&cursor={next_cursor}"
+    )
+    third_page = integration_client.get(
+        f"/api/v1/watch-events?user_id={user_id}&limit=2"
+        f"&cursor={second_page.headers['X-Next-Cursor']}"
+    )
+
+    assert third_page.status_code == 200
+    assert "X-Next-Cursor" not in third_page.headers
+    seen = [
+        row["watch_id"]
+        for page in (first_page, second_page, third_page)
+        for row in page.json()
+    ]
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
 def test_watch_event_enriched_excludes_soft_deleted_rows(
     integration_session_factory: sessionmaker[Session],
 ) -> None:
@@ -161,3 +280,377 @@ def test_watch_event_enriched_excludes_soft_deleted_rows(
     session.close()
 
     assert rows == [kept_event.watch_id]
+
+
+def test_recompute_rewatch_flags_for_users_fixes_only_drifted_rows(
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="rewatch-user")
+    media_item = MediaItem(type="movie", title="Rewatched Movie")
+    session.add_all([user, media_item])
+    session.flush()
+
+    def watch(day: int, *, rewatch: bool, is_deleted: bool = False) -> WatchEvent:
+        return WatchEvent(
+            user_id=user.user_id,
+            media_item_id=media_item.media_item_id,
+            watched_at=datetime.fromisoformat(f"2026-01-0{day}T05:00:00+00:00"),
+            playback_source="integration",
+            completed=True,
+            rewatch=rewatch,
+            is_deleted=is_deleted,
+        )
+
+    first = watch(1, rewatch=True)
+    second = watch(2, rewatch=True)
+    third = watch(3, rewatch=False)
+    deleted = watch(4, rewatch=True, is_deleted=True)
+    session.add_all([first, second, third, deleted])
+    session.commit()
+    watch_ids = [event.watch_id for event in (first, second, third, deleted)]
+
+    would_change = WatchEventService.recompute_rewatch_flags_for_users(
+        session, user_ids=[user.user_id], dry_run=True
+    )
+    changed = WatchEventService.recompute_rewatch_flags_for_users(
+        session, user_ids=[user.user_id]
+    )
+    unchanged = WatchEventService.recompute_rewatch_flags_for_users(
+        session, user_ids=[user.user_id]
+    )
+
+    rewatch_by_id = dict(
+        session.execute(
+            select(WatchEvent.watch_id, WatchEvent.rewatch).where(
+                WatchEvent.user_id == user.user_id
+            )
+        ).all()
+    )
+    session.close()
+
+    assert (would_change, changed, unchanged) == (3, 3, 0)
+    assert [rewatch_by_id[watch_id] for watch_id in watch_ids] == [
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_single_writes_keep_rewatch_flags_consistent(
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="incremental-rewatch-user")
+    movie = MediaItem(type="movie", title="Incremental Movie")
+    other_movie = MediaItem(type="movie", title="Other Incremental Movie")
+    session.add_all([user, movie, other_movie])
+    session.commit()
+
+    def drift() -> int:
+        return WatchEventService.recompute_rewatch_flags_for_users(
+            session, user_ids=[user.user_id], dry_run=True
+        )
+
+    def create(day: int, media_item: MediaItem) -> WatchEvent:
+        return WatchEventService.create_watch_event(
+            session,
+            user_id=user.user_id,
+            media_item_id=media_item.media_item_id,
+            watched_at=datetime(2026, 1, day, 5, tzinfo=UTC),
+            playback_source="integration",
+            total_seconds=None,
+            watched_seconds=None,
+            progress_percent=None,
+            completed=True,
+            rating_value=None,
+            rating_scale=None,
+            media_version_id=None,
+            source_event_id=None,
+        ).watch_event
+
+    third = create(20, movie)
+    second = create(10, movie)
+    first = create(5, movie)
+    assert drift() == 0
+
+    edit = {"updated_by": "integration", "update_reason": None}
+    WatchEventService.soft_delete_watch_event(session, watch_id=first.watch_id, **edit)
+    assert drift() == 0
+    WatchEventService.correct_watch_event(
+        session,
+        watch_id=third.watch_id,
+        watched_at=datetime(2026, 1, 2, 5, tzinfo=UTC),
+        media_item_id=None,
+        completed=None,
+        rewatch=None,
+        **edit,
+    )
+    assert drift() == 0
+    WatchEventService.restore_watch_event(session, watch_id=first.watch_id, **edit)
+    assert drift() == 0
+    WatchEventService.correct_watch_event(
+        session,
+        watch_id=first.watch_id,
+        watched_at=None,
+        media_item_id=other_movie.media_item_id,
+        completed=None,
+        rewatch=None,
+        **edit,
+    )
+    assert drift() == 0
+
+    rewatch_by_id = dict(
+        session.execute(
+            select(WatchEvent.watch_id, WatchEvent.rewatch).where(
+                WatchEvent.user_id == user.user_id
+            )
+        ).all()
+    )
+    session.close()
+
+    assert rewatch_by_id == {
+        first.watch_id: False,
+        second.watch_id: True,
+        third.watch_id: False,
+    }
+
+
+def test_batch_endpoint_cleans_up_duplicate_burst_in_one_transaction(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="batch-user")
+    movie = MediaItem(type="movie", title="Batch Horror Movie")
+    session.add_all(
+        [
+            user,
+            movie,
+            HorrorfestYear(
+                horrorfest_year=2025,
+                window_start_at=datetime.fromisoformat("2025-10-01T00:00:00+00:00"),
+                window_end_at=datetime.fromisoformat("2025-10-31T23:59:59+00:00"),
+                label="Horrorfest 2025",
+                is_active=True,
+            ),
+        ]
+    )
+    session.commit()
+    watches = [
+        WatchEventService.create_watch_event(
+            session,
+            user_id=user.user_id,
+            media_item_id=movie.media_item_id,
+            watched_at=datetime(2025, 10, day, 22, tzinfo=UTC),
+            playback_source="kodi",
+            total_seconds=None,
+            watched_seconds=None,
+            progress_percent=None,
+            completed=True,
+            rating_value=None,
+            rating_scale=None,
+            media_version_id=None,
+            source_event_id=None,
+        ).watch_event
+        for day in (3, 5, 9)
+    ]
+    watch_ids = [watch.watch_id for watch in watches]
+    session.close()
+
+    response = integration_client.post(
+        "/api/v1/watch-events/batch",
+        json={
+            "updated_by": "integration",
+            "update_reason": "kodi duplicate burst",
+            "operations": [
+                {"action": "delete", "watch_id": str(watch_ids[0])},
+                {"action": "rate", "watch_id": str(watch_ids[1]), "rating_value": 7},
+                {"action": "restore", "watch_id": str(watch_ids[2])},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert (payload["applied_count"], payload["rejected_count"]) == (2, 1)
+    assert payload["results"][2]["error"] == "Watch event is not deleted"
+    assert payload["results"][1]["watch_event"]["rewatch"] is False
+
+    session = integration_session_factory()
+    rewatch_by_id = dict(
+        session.execute(
+            select(WatchEvent.watch_id, WatchEvent.rewatch).where(
+                WatchEvent.user_id == user.user_id
+            )
+        ).all()
+    )
+    orders = dict(
+        session.execute(
+            select(HorrorfestEntry.watch_id, HorrorfestEntry.watch_order).where(
+                HorrorfestEntry.watch_id.in_(watch_ids),
+                HorrorfestEntry.is_removed.is_(False),
+            )
+        ).all()
+    )
+    session.close()
+
+    assert [rewatch_by_id[watch_id] for watch_id in watch_ids] == [False, False, True]
+    assert orders == {watch_ids[1]: 1, watch_ids[2]: 2}
+
+
+def test_dedupe_hash_is_canonical_and_released_on_delete(
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="dedupe-hash-user")
+    movie = MediaItem(type="movie", title="Dedupe Movie")
+    session.add_all([user, movie])
+    session.commit()
+
+    def create(second: int, *, completed: bool):
+        return WatchEventService.create_watch_event(
+            session,
+            user_id=user.user_id,
+            media_item_id=movie.media_item_id,
+            watched_at=datetime(2026, 3, 1, 20, 30, second, tzinfo=UTC),
+            playback_source="integration",
+            total_seconds=None,
+            watched_seconds=None,
+            progress_percent=None,
+            completed=completed,
+            rating_value=None,
+            rating_scale=None,
+            media_version_id=None,
+            source_event_id=None,
+        )
+
+    first = create(15, completed=True).watch_event
+    expected_hash = watch_event_dedupe_hash(
+        user_id=user.user_id,
+        media_item_id=movie.media_item_id,
+        playback_source="integration",
+        completed=True,
+        watched_at=first.watched_at,
+    )
+    assert first.dedupe_hash == expected_hash
+    assert (
+        session.scalar(
+            select(
+                func.app.watch_event_dedupe_hash(
+                    user.user_id,
+                    movie.media_item_id,
+                    "integration",
+                    True,
+                    datetime(
+                        2026, 3, 1, 13, 30, 59, tzinfo=timezone(-timedelta(hours=7))
+                    ),
+                )
+            )
+        )
+        == expected_hash
+    )
+
+    # The hash carries `completed`, as the collision window search does.
+    partial = create(50, completed=False)
+    assert partial.created is True
+    duplicate = create(55, completed=True)
+    assert (duplicate.created, duplicate.match_reason) == (False, "dedupe_hash")
+    assert duplicate.watch_event.watch_id == first.watch_id
+
+    WatchEventService.soft_delete_watch_event(
+        session, watch_id=first.watch_id, updated_by="integration", update_reason=None
+    )
+    assert (
+        session.scalar(
+            select(WatchEvent.dedupe_hash).where(WatchEvent.watch_id == first.watch_id)
+        )
+        is None
+    )
+
+    relogged = create(50, completed=True)
+    assert relogged.created is True
+    assert relogged.watch_event.dedupe_hash == expected_hash
+
+    # Restoring or moving a watch into a minute another watch holds keeps the
+    # restored or moved row unhashed instead of tripping the unique index.
+    restored = WatchEventService.restore_watch_event(
+        session, watch_id=first.watch_id, updated_by="integration", update_reason=None
+    )
+    assert restored.is_deleted is False
+    moved = WatchEventService.correct_watch_event(
+        session,
+        watch_id=partial.watch_event.watch_id,
+        updated_by="integration",
+        update_reason=None,
+        watched_at=None,
+        media_item_id=None,
+        completed=True,
+        rewatch=None,
+    )
+    assert moved.completed is True
+    stored_hashes = dict(
+        session.execute(
+            select(WatchEvent.watch_id, WatchEvent.dedupe_hash).where(
+                WatchEvent.media_item_id == movie.media_item_id
+            )
+        ).all()
+    )
+    session.close()
+
+    assert stored_hashes == {
+        first.watch_id: None,
+        partial.watch_event.watch_id: None,
+        relogged.watch_event.watch_id: expected_hash,
+    }
+
+
+def test_export_endpoint_streams_active_history_oldest_first(
+    integration_client,
+    integration_session_factory: sessionmaker[Session],
+) -> None:
+    session = integration_session_factory()
+    user = User(username="export-user")
+    movie = MediaItem(type="movie", title="Export Movie", year=1982, tmdb_id=1091)
+    session.add_all([user, movie])
+    session.commit()
+    watches = [
+        WatchEventService.create_watch_event(
+            session,
+            user_id=user.user_id,
+            media_item_id=movie.media_item_id,
+            watched_at=datetime(2025, month, 1, 21, tzinfo=UTC),
+            playback_source="integration",
+            total_seconds=None,
+            watched_seconds=None,
+            progress_percent=None,
+            completed=True,
+            rating_value=None,
+            rating_scale=None,
+            media_version_id=None,
+            source_event_id=f"export-{month}",
+        ).watch_event
+        for month in (3, 1, 2)
+    ]
+    WatchEventService.soft_delete_watch_event(
+        session,
+        watch_id=watches[2].watch_id,
+        updated_by="integration",
+        update_reason=None,
+    )
+    user_id = user.user_id
+    session.close()
+
+    response = integration_client.get(f"/api/v1/watch-events/export?user_id={user_id}")
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["source_event_id"] for row in rows] == ["export-1", "export-3"]
+    assert rows[0]["watched_at"] == "2025-01-01T21:00:00Z"
+    assert (rows[0]["type"], rows[0]["tmdb_id"], rows[0]["rewatch"]) == (
+        "movie",
+        1091,
+        False,
+    )
+    assert rows[1]["rewatch"] is True
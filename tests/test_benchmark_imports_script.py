@@ -0,0 +1,170 @@
+from pathlib import Path
+
+from app.scripts import benchmark_imports
+from app.scripts.benchmark_imports import PhaseResult
+
+
+def _result(phase: str, **updates) -> PhaseResult:
+    values = {
+        "phase": phase,
+        "rows": 1000,
+        "seconds": 1.0,
+        "rows_per_second": 1000.0,
+        "peak_rss_mb": 100.0,
+        "query_count": 50,
+    }
+    values.update(updates)
+    return PhaseResult(**values)
+
+
+def test_find_regressions_flags_slowdowns_and_query_growth() -> None:
+    baseline = {
+        "phases": [
+            {**_result("cli.import").__dict__},
+            {**_result("upload.import").__dict__},
+            {**_result("other.import", rows=10).__dict__},
+        ]
+    }
+
+    regressions = benchmark_imports._find_regressions(
+        [
+            _result("cli.import", rows_per_second=700.0, query_count=80),
+            _result("upload.import", rows_per_second=900.0),
+            _result("other.import", rows_per_second=1.0),
+        ],
+        baseline,
+        max_regression_percent=20,
+    )
+
+    assert regressions == [
+        "cli.import: rows/sec 1000.0 -> 700.0",
+        "cli.import: queries 50 -> 80",
+    ]
+
+
+def test_run_cli_import_parses_summary(monkeypatch) -> None:
+    captured: list[list[str]] = []
+
+    def fake_run(argv):
+        captured.append(argv)
+        print("Import summary")
+        print("  inserted: 9")
+        print("  skipped: 1")
+        print("  errors: 0")
+        return 0
+
+    monkeypatch.setattr(benchmark_imports.import_watch_events, "run", fake_run)
+
+    counts = benchmark_imports._run_cli_import(
+        dataset_path=Path("export.json"),
+        file_format="json",
+        user_id="user-1",
+        bulk=True,
+        commit_every=500,
+    )
+
+    assert counts == {"inserted_count": 9, "skipped_count": 1, "error_count": 0}
+    assert "--bulk" in captured[0]
+    assert captured[0][-2:] == ["--commit-every", "500"]
+
+
+def test_run_writes_results_and_fails_on_regression(monkeypatch, tmp_path) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(
+        '{"phases": [{"phase": "cli.import", "rows": 1000, "rows_per_second": '
+        '5000.0, "peak_rss_mb": 100.0, "query_count": 50}]}'
+    )
+    output_path = tmp_path / "results.json"
+
+    def fake_run_isolated(_function, /, *, phase, **_kwargs):
+        return _result(phase)
+
+    monkeypatch.setattr(benchmark_imports, "_run_isolated", fake_run_isolated)
+    monkeypatch.setattr(
+        benchmark_imports,
+        "_ensure_horrorfest_years",
+        lambda _years, *, created: created.append(2013),
+    )
+    monkeypatch.setattr(
+        benchmark_imports, "_create_benchmark_user", lambda _username: "user-1"
+    )
+    cleanup: list[dict] = []
+    monkeypatch.setattr(
+        benchmark_imports,
+        "_delete_benchmark_data",
+        lambda **kwargs: cleanup.append(kwargs),
+    )
+
+    exit_code = benchmark_imports.run(
+        [
+            "--confirm-database-writes",
+            "--rows",
+            "1000",
+            "--phases",
+            "cli",
+            "--work-dir",
+            str(tmp_path),
+            "--output",
+            str(output_path),
+            "--baseline",
+            str(baseline_path),
+        ]
+    )
+
+    assert exit_code == 1
+    assert '"phase": "cli.import"' in output_path.read_text()
+    assert cleanup == [
+        {
+            "user_ids": ["user-1"],
+            "tmdb_id_range": (
+                benchmark_imports.DEFAULT_ID_BASE,
+                benchmark_imports.DEFAULT_ID_BASE + benchmark_imports.PHASE_ID_STRIDE,
+            ),
+            "horrorfest_years": [2013],
+        }
+    ]
+
+
+def test_run_cleans_up_after_a_failed_phase(monkeypatch, tmp_path) -> None:
+    def failing_run_isolated(_function, /, *, phase, **_kwargs):
+        if phase.endswith(".import"):
+            raise RuntimeError("import exited with 1")
+        return _result(phase)
+
+    monkeypatch.setattr(benchmark_imports, "_run_isolated", failing_run_isolated)
+    monkeypatch.setattr(
+        benchmark_imports, "_ensure_horrorfest_years", lambda _years, *, created: None
+    )
+    monkeypatch.setattr(
+        benchmark_imports, "_create_benchmark_user", lambda _username: "user-1"
+    )
+    cleanup: list[dict] = []
+    monkeypatch.setattr(
+        benchmark_imports,
+        "_delete_benchmark_data",
+        lambda **kwargs: cleanup.append(kwargs),
+    )
+
+    exit_code = benchmark_imports.run(
+        ["--confirm-database-writes", "--work-dir", str(tmp_path)]
+    )
+
+    assert exit_code == 1
+    assert cleanup[0]["user_ids"] == ["user-1"]
+
+
+def test_run_requires_confirmation_before_writing() -> None:
+    assert benchmark_imports.run([]) == 2
+
+
+def test_run_refuses_prod_database(monkeypatch) -> None:
+    monkeypatch.setenv("APP_ENV", "prod")
+    benchmark_imports.get_settings.cache_clear()
+    try:
+        assert benchmark_imports.run(["--confirm-database-writes"]) == 2
+    finally:
+        benchmark_imports.get_settings.cache_clear()
+
+
+def test_run_rejects_invalid_rows() -> None:
+    assert benchmark_imports.run(["--rows", "0"]) == 2
@@ -0,0 +1,50 @@
+import json
+
+from app.repositories.watch_events import _watch_event_list_payload
+from app.scripts import benchmark_watch_event_serialization
+
+
+def test_lean_page_matches_previous_serialization() -> None:
+    rows = benchmark_watch_event_serialization._synthetic_rows(12, seed=3)
+
+    lean = json.loads(benchmark_watch_event_serialization._lean_page_bytes(rows))
+    previous = json.loads(
+        benchmark_watch_event_serialization._previous_page_bytes(rows)
+    )
+
+    assert lean == previous
+    assert lean[1]["user_timezone"] == "America/Edmonton"
+    assert lean[1]["watched_at_local"].endswith("Z")
+    assert lean[0]["is_horrorfest_watch"] is True
+
+
+def test_list_payload_falls_back_to_utc_for_unknown_timezones() -> None:
+    row = benchmark_watch_event_serialization._synthetic_rows(1, seed=0)[0]
+
+    payload = _watch_event_list_payload(
+        [
+            row._replace(user_timezone="Mars/Olympus_Mons"),
+            row._replace(user_timezone=None),
+        ]
+    )
+
+    assert payload[0]["watched_at_local"] == row.watched_at
+    assert payload[0]["user_timezone"] == "Mars/Olympus_Mons"
+    assert payload[1]["user_timezone"] == "UTC"
+    assert "show_title" not in payload[1]
+
+
+def test_run_reports_cpu_per_page(capsys) -> None:
+    exit_code = benchmark_watch_event_serialization.run(
+        ["--page-size", "5", "--pages", "2"]
+    )
+
+    assert exit_code == 0
+    output = capsys.readouterr().out
+    assert "previous" in output
+    assert "lean" in output
+
+
+def test_run_rejects_non_positive_pages(capsys) -> None:
+    assert benchmark_watch_event_serialization.run(["--pages", "0"]) == 2
+    assert "must be greater than zero" in capsys.readouterr().out
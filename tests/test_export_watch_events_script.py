@@ -0,0 +1,61 @@
+import gzip
+import json
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from app.scripts import export_watch_events
+
+
+class DummySession:
+    def close(self) -> None:
+        return None
+
+
+@pytest.mark.parametrize(
+    ("output", "explicit", "expected"),
+    [
+        ("history.ndjson", "auto", ("ndjson", False)),
+        ("history.jsonl.gz", "auto", ("ndjson", True)),
+        ("history.CSV", "auto", ("csv", False)),
+        ("history.gz", "csv", ("csv", True)),
+        ("-", "ndjson", ("ndjson", False)),
+    ],
+)
+def test_detect_format(output: str, explicit: str, expected: tuple) -> None:
+    assert export_watch_events._detect_format(output, explicit) == expected
+
+
+def test_run_writes_gzip_export(monkeypatch, tmp_path: Path, capsys) -> None:
+    user_id = uuid4()
+    called: dict[str, object] = {}
+
+    def fake_iter_export(_session, **kwargs):
+        called.update(kwargs)
+        return iter([gzip.compress(b'{"title":"Alien"}\n')])
+
+    monkeypatch.setattr(export_watch_events, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        export_watch_events.WatchEventExportService, "iter_export", fake_iter_export
+    )
+    output = tmp_path / "exports" / "history.ndjson.gz"
+
+    exit_code = export_watch_events.run(
+        ["--output", str(output), "--user-id", str(user_id), "--batch-size", "500"]
+    )
+
+    assert exit_code == 0
+    assert called == {
+        "user_id": user_id,
+        "file_format": "ndjson",
+        "compress": True,
+        "batch_size": 500,
+    }
+    assert json.loads(gzip.decompress(output.read_bytes())) == {"title": "Alien"}
+    assert f"to {output}" in capsys.readouterr().out
+
+
+def test_run_rejects_undetectable_format(capsys) -> None:
+    assert export_watch_events.run(["--output", "history.txt"]) == 2
+    assert "Use --format ndjson or --format csv" in capsys.readouterr().out
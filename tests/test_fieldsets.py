@@ -0,0 +1,64 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from app.repositories.watch_events import (
+    _watch_event_list_payload,
+    _watch_event_list_statement,
+)
+from app.schemas.fieldsets import encode_fieldset_list, parse_fieldset
+from app.schemas.watch_events import WatchEventListRead
+from app.scripts import benchmark_watch_event_serialization
+
+
+def test_parse_fieldset_trims_and_dedupes_names() -> None:
+    assert parse_fieldset(None, WatchEventListRead) is None
+    assert parse_fieldset(" watch_id, display_title,watch_id ", WatchEventListRead) == (
+        frozenset({"watch_id", "display_title"})
+    )
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        (" , ", "fields must name at least one field"),
+        ("watch_id,bogus,also_bogus", "Unknown fields: also_bogus, bogus"),
+    ],
+)
+def test_parse_fieldset_rejects_invalid_values(raw: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_fieldset(raw, WatchEventListRead)
+
+
+def test_encode_fieldset_list_keeps_only_requested_fields() -> None:
+    watched_at = datetime(2026, 3, 1, 20, 30, tzinfo=UTC)
+
+    content = encode_fieldset_list(
+        WatchEventListRead,
+        [{"watched_at": watched_at, "display_title": "Alien (1979)", "rewatch": True}],
+        frozenset({"watched_at", "display_title"}),
+    )
+
+    assert json.loads(content) == [
+        {"watched_at": "2026-03-01T20:30:00Z", "display_title": "Alien (1979)"}
+    ]
+
+
+def test_watch_event_list_statement_skips_unneeded_joins() -> None:
+    statement = str(_watch_event_list_statement(frozenset({"display_title"})))
+
+    assert "JOIN app.shows" in statement
+    assert "JOIN app.users" not in statement
+    assert "horrorfest_entry" not in statement
+    assert "watch_id" in statement
+
+
+def test_watch_event_list_payload_computes_only_requested_fields() -> None:
+    row = benchmark_watch_event_serialization._synthetic_rows(1, seed=0)[0]
+
+    payload = _watch_event_list_payload([row], frozenset({"is_horrorfest_watch"}))
+
+    assert payload[0]["is_horrorfest_watch"] is True
+    assert "display_title" not in payload[0]
+    assert "watched_at_local" not in payload[0]
@@ -0,0 +1,30 @@
+from app.scripts import freeze_horrorfest_snapshots
+
+
+class DummySession:
+    def close(self) -> None:
+        return None
+
+
+def test_run_reports_frozen_years(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(freeze_horrorfest_snapshots, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        freeze_horrorfest_snapshots.HorrorfestService,
+        "freeze_closed_years",
+        lambda _session: [2023, 2024],
+    )
+
+    assert freeze_horrorfest_snapshots.run([]) == 0
+    assert "Froze 2 Horrorfest years: 2023, 2024." in capsys.readouterr().out
+
+
+def test_run_reports_nothing_to_freeze(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(freeze_horrorfest_snapshots, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        freeze_horrorfest_snapshots.HorrorfestService,
+        "freeze_closed_years",
+        lambda _session: [],
+    )
+
+    assert freeze_horrorfest_snapshots.run([]) == 0
+    assert "No closed Horrorfest years needed freezing." in capsys.readouterr().out
@@ -0,0 +1,68 @@
+from collections import Counter
+
+from app.scripts import generate_import_dataset, import_watch_events
+from app.scripts.generate_import_dataset import DatasetSpec
+
+
+def test_generate_rows_mixes_movies_episodes_rewatches_and_horrorfest() -> None:
+    rows = list(generate_import_dataset.generate_rows(DatasetSpec(rows=5000)))
+
+    media_types = Counter(import_watch_events._extract_media_type(row) for row in rows)
+    movie_ids = Counter(
+        row["movie"]["ids"]["tmdb"] for row in rows if row["type"] == "movie"
+    )
+    horrorfest_rows = [row for row in rows if "horrorfest_year" in row]
+
+    assert len(rows) == 5000
+    assert set(media_types) == {"movie", "episode"}
+    assert 0.3 < media_types["movie"] / len(rows) < 0.5
+    assert max(movie_ids.values()) > 1
+    assert len({row["id"] for row in rows}) == len(rows)
+    assert horrorfest_rows
+    for row in horrorfest_rows:
+        assert row["watched_at"][5:7] == "10"
+        assert row["watched_at"].startswith(str(row["horrorfest_year"]))
+
+
+def test_generate_rows_is_deterministic_per_seed() -> None:
+    first = list(generate_import_dataset.generate_rows(DatasetSpec(rows=200, seed=7)))
+    second = list(generate_import_dataset.generate_rows(DatasetSpec(rows=200, seed=7)))
+
+    assert first == second
+
+
+def test_run_writes_csv_readable_by_import_script(tmp_path) -> None:
+    output = tmp_path / "export.csv"
+
+    exit_code = generate_import_dataset.run(
+        ["--output", str(output), "--rows", "300", "--namespace", "run-1"]
+    )
+
+    rows = import_watch_events._load_rows(output, "csv")
+    episode = next(row for row in rows if row["type"] == "episode")
+    assert exit_code == 0
+    assert len(rows) == 300
+    assert rows[0]["id"] == "run-1-0"
+    assert import_watch_events._extract_show_tmdb_id(episode, "episode") is not None
+    assert import_watch_events._extract_season_episode_numbers(episode, "episode") == (
+        int(episode["season_number"]),
+        int(episode["episode_number"]),
+    )
+
+
+def test_run_writes_json_readable_by_import_script(tmp_path) -> None:
+    output = tmp_path / "export.json"
+
+    exit_code = generate_import_dataset.run(["--output", str(output), "--rows", "50"])
+
+    rows = import_watch_events._load_rows(output, "json")
+    assert exit_code == 0
+    assert len(rows) == 50
+
+
+def test_run_rejects_invalid_ratio(tmp_path) -> None:
+    exit_code = generate_import_dataset.run(
+        ["--output", str(tmp_path / "export.json"), "--movie-ratio", "1.5"]
+    )
+
+    assert exit_code == 2
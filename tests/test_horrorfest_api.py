@@ -5,7 +5,9 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.core.config import get_settings
+from app.core.response_cache import get_response_cache
 from app.main import app
+from app.services.data_generations import DataGenerationService
 from app.services.horrorfest import HorrorfestService
 
 
@@ -830,3 +832,41 @@ def test_export_horrorfest_curation_staples_returns_csv(monkeypatch) -> None:
         == 'attachment; filename="horrorfest_annual_staples.csv"'
     )
     assert "title,total_count,years_seen" in response.text
+
+
+def test_horrorfest_analytics_csv_export_is_cached_with_its_headers(
+    monkeypatch,
+) -> None:
+    _set_permissive_auth(monkeypatch)
+    monkeypatch.setenv("KLUG_RESPONSE_CACHE_MAX_MB", "1")
+    get_settings.cache_clear()
+    get_response_cache.cache_clear()
+    monkeypatch.setattr(
+        DataGenerationService, "get_generations", lambda _session, *, user_id: (3,)
+    )
+    calls: list[object] = []
+
+    def fake_staples(_session, *, user_id):
+        calls.append(user_id)
+        return []
+
+    monkeypatch.setattr(
+        HorrorfestService, "get_analytics_curation_staples", fake_staples
+    )
+    monkeypatch.setattr(HorrorfestService, "list_years", lambda _session: [])
+    client = TestClient(app)
+
+    first = client.get("/api/v1/horrorfest/analytics/export/curation/staples")
+    cached = client.get("/api/v1/horrorfest/analytics/export/curation/staples")
+    years = client.get("/api/v1/horrorfest/years")
+
+    assert cached.status_code == 200
+    assert cached.content == first.content
+    assert cached.headers["content-type"].startswith("text/csv")
+    assert (
+        cached.headers["content-disposition"]
+        == 'attachment; filename="horrorfest_annual_staples.csv"'
+    )
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert "etag" not in years.headers
+    assert calls == [None]
@@ -1,11 +1,12 @@
 from datetime import UTC, date, datetime
+from types import SimpleNamespace
 from decimal import Decimal
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
-from app.services.horrorfest import HorrorfestService
+from app.services.horrorfest import HorrorfestAssignment, HorrorfestService
 
 
 def test_sync_watch_event_creates_auto_entry_for_qualifying_movie(monkeypatch) -> None:
@@ -148,6 +149,165 @@ def test_include_watch_event_rejects_out_of_window_watch(monkeypatch) -> None:
         )
 
 
+def _patch_bulk_include(
+    monkeypatch,
+    *,
+    candidates: dict,
+    year_configs: dict,
+    entries: list,
+    active_entries: list,
+) -> dict:
+    captured: dict = {"created": [], "orders": {}}
+
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_horrorfest_watch_candidates",
+        lambda *_args, **_kwargs: candidates,
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_horrorfest_years_by_id",
+        lambda *_args, **_kwargs: year_configs,
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_horrorfest_entries_for_watches",
+        lambda *_args, **_kwargs: entries,
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_active_horrorfest_entries_for_years",
+        lambda *_args, **_kwargs: active_entries,
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.create_horrorfest_entries",
+        lambda _session, *, entries: captured["created"].extend(entries),
+    )
+
+    def fake_apply(_session, *, horrorfest_year, ordered_entries):
+        assert horrorfest_year not in captured["orders"]
+        captured["orders"][horrorfest_year] = [
+            entry.watch_id for entry in ordered_entries
+        ]
+
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._apply_ordered_entries",
+        fake_apply,
+    )
+    return captured
+
+
+def _watch(watched_at: datetime, *, completed: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(
+        watch_id=uuid4(), watched_at=watched_at, is_deleted=False, completed=completed
+    )
+
+
+def _year(horrorfest_year: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        horrorfest_year=horrorfest_year,
+        window_start_at=datetime(horrorfest_year, 10, 1, tzinfo=UTC),
+        window_end_at=datetime(horrorfest_year, 10, 31, 23, 59, tzinfo=UTC),
+    )
+
+
+def test_include_watch_events_orders_each_year_once(monkeypatch) -> None:
+    existing_watch = _watch(datetime(2026, 10, 2, tzinfo=UTC))
+    existing_entry = SimpleNamespace(
+        horrorfest_entry_id=uuid4(),
+        watch_id=existing_watch.watch_id,
+        horrorfest_year=2026,
+        watch_order=1,
+        created_at=datetime(2026, 10, 2, tzinfo=UTC),
+        is_removed=False,
+    )
+    late = _watch(datetime(2026, 10, 5, tzinfo=UTC))
+    early = _watch(datetime(2026, 10, 1, tzinfo=UTC))
+    pinned = _watch(datetime(2026, 10, 9, tzinfo=UTC))
+    episode = _watch(datetime(2026, 10, 3, tzinfo=UTC))
+    session = Mock()
+    captured = _patch_bulk_include(
+        monkeypatch,
+        candidates={
+            late.watch_id: (late, "movie"),
+            early.watch_id: (early, "movie"),
+            pinned.watch_id: (pinned, "movie"),
+            episode.watch_id: (episode, "episode"),
+        },
+        year_configs={2026: _year(2026)},
+        entries=[],
+        active_entries=[(existing_entry, existing_watch.watched_at)],
+    )
+
+    failures = HorrorfestService.include_watch_events(
+        session,
+        assignments=[
+            HorrorfestAssignment(watch_id=late.watch_id, horrorfest_year=2026),
+            HorrorfestAssignment(watch_id=early.watch_id, horrorfest_year=2026),
+            HorrorfestAssignment(watch_id=episode.watch_id, horrorfest_year=2026),
+            HorrorfestAssignment(
+                watch_id=pinned.watch_id, horrorfest_year=2026, target_order=1
+            ),
+            HorrorfestAssignment(watch_id=uuid4(), horrorfest_year=2026),
+        ],
+        updated_by="import",
+        update_reason="Imported Horrorfest assignment",
+        source_kind="auto_import",
+        commit=False,
+    )
+
+    assert sorted(failures) == [2, 4]
+    assert "completed movie" in failures[2]
+    assert "not found" in failures[4]
+    assert captured["orders"] == {
+        2026: [
+            pinned.watch_id,
+            early.watch_id,
+            existing_watch.watch_id,
+            late.watch_id,
+        ]
+    }
+    assert {entry.watch_id for entry in captured["created"]} == {
+        late.watch_id,
+        early.watch_id,
+        pinned.watch_id,
+    }
+    assert {entry.source_kind for entry in captured["created"]} == {"auto_import"}
+    session.commit.assert_not_called()
+
+
+def test_include_watch_events_moves_active_entry_between_years(monkeypatch) -> None:
+    moved = _watch(datetime(2026, 10, 4, tzinfo=UTC))
+    stale_entry = SimpleNamespace(
+        horrorfest_entry_id=uuid4(),
+        watch_id=moved.watch_id,
+        horrorfest_year=2025,
+        watch_order=1,
+        created_at=datetime(2025, 10, 4, tzinfo=UTC),
+        is_removed=False,
+    )
+    session = Mock()
+    captured = _patch_bulk_include(
+        monkeypatch,
+        candidates={moved.watch_id: (moved, "movie")},
+        year_configs={2026: _year(2026)},
+        entries=[stale_entry],
+        active_entries=[(stale_entry, moved.watched_at)],
+    )
+
+    failures = HorrorfestService.include_watch_events(
+        session,
+        assignments=[
+            HorrorfestAssignment(watch_id=moved.watch_id, horrorfest_year=2026)
+        ],
+        updated_by="import",
+        update_reason=None,
+    )
+
+    assert failures == {}
+    assert stale_entry.is_removed is True
+    assert stale_entry.removed_by == "import"
+    assert captured["orders"] == {2025: [], 2026: [moved.watch_id]}
+    assert captured["created"][0].horrorfest_year == 2026
+    session.commit.assert_called_once()
+
+
 def test_list_analytics_title_entries_delegates_to_repository(monkeypatch) -> None:
     session = Mock()
     media_item_id = uuid4()
@@ -225,3 +385,104 @@ def test_list_analytics_year_entries_rejects_negative_rating() -> None:
             horrorfest_year=2025,
             rating_value=Decimal("-1"),
         )
+
+
+def test_sync_watch_event_changes_renumbers_each_year_once(monkeypatch) -> None:
+    session = Mock()
+    removed_watch = Mock(watch_id=uuid4(), updated_by="operator", update_reason=None)
+    moved_watch = Mock(
+        watch_id=uuid4(),
+        origin_kind="manual_entry",
+        updated_by="operator",
+        update_reason=None,
+    )
+    active_entries = {
+        removed_watch.watch_id: Mock(horrorfest_year=2025),
+        moved_watch.watch_id: Mock(horrorfest_year=2025),
+    }
+    year_by_watch = {removed_watch.watch_id: None, moved_watch.watch_id: 2026}
+    upserted: list[tuple[object, int]] = []
+    normalized: list[int] = []
+    rebuilt: list[int] = []
+
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._qualifying_year_config",
+        lambda _session, *, watch_event: (
+            None
+            if year_by_watch[watch_event.watch_id] is None
+            else Mock(horrorfest_year=year_by_watch[watch_event.watch_id])
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.get_active_horrorfest_entry_for_watch",
+        lambda _session, *, watch_id: active_entries[watch_id],
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._soft_remove_entry",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._upsert_active_entry",
+        lambda _session, **kwargs: upserted.append(
+            (kwargs["watch_id"], kwargs["horrorfest_year"])
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._normalize_year_orders",
+        lambda _session, *, horrorfest_year: normalized.append(horrorfest_year),
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.HorrorfestService._rebuild_year_orders_by_watched_at",
+        lambda _session, *, horrorfest_year: rebuilt.append(horrorfest_year),
+    )
+
+    HorrorfestService.sync_watch_event_changes(
+        session, watch_events=[removed_watch, moved_watch]
+    )
+
+    assert upserted == [(moved_watch.watch_id, 2026)]
+    assert normalized == [2025]
+    assert rebuilt == [2026]
+
+
+def test_freeze_closed_years_commits_only_when_years_are_frozen(monkeypatch) -> None:
+    session = Mock()
+    freeze = Mock(return_value=[2024])
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_unfrozen_closed_horrorfest_years",
+        lambda *_args, **_kwargs: [],
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.freeze_horrorfest_years",
+        freeze,
+    )
+
+    assert HorrorfestService.freeze_closed_years(session) == []
+    freeze.assert_not_called()
+    session.commit.assert_not_called()
+
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_unfrozen_closed_horrorfest_years",
+        lambda *_args, **_kwargs: [2024],
+    )
+
+    assert HorrorfestService.freeze_closed_years(session) == [2024]
+    assert freeze.call_args.kwargs["horrorfest_years"] == [2024]
+    assert freeze.call_args.kwargs["closed_before"] < datetime.now(UTC)
+    session.commit.assert_called_once()
+
+
+def test_analytics_reads_do_not_write(monkeypatch) -> None:
+    session = Mock()
+    monkeypatch.setattr(
+        HorrorfestService,
+        "freeze_closed_years",
+        staticmethod(Mock(side_effect=AssertionError("reads must not freeze"))),
+    )
+    monkeypatch.setattr(
+        "app.services.horrorfest.horrorfest_repository.list_horrorfest_analytics_years",
+        lambda *_args, **_kwargs: [],
+    )
+
+    assert HorrorfestService.list_analytics_years(session) == []
+    session.commit.assert_not_called()
@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 
 from app.services.import_batches import (
     ImportBatchConstraintError,
+    ImportBatchErrorSink,
     ImportBatchNotFoundError,
     ImportBatchService,
 )
@@ -96,3 +97,90 @@ def test_add_import_batch_error_integrity_error_maps(monkeypatch) -> None:
         )
 
     session.rollback.assert_called_once()
+
+
+def test_add_import_batch_errors_inserts_normalized_rows_at_once(monkeypatch) -> None:
+    session = Mock()
+    batch = Mock()
+    inserted: list[list[dict]] = []
+
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.get_import_batch",
+        lambda _session, **_kwargs: batch,
+    )
+
+    def fake_create_import_batch_errors(_session, *, import_batch, errors):
+        assert import_batch is batch
+        inserted.append(errors)
+        return len(errors)
+
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.create_import_batch_errors",
+        fake_create_import_batch_errors,
+    )
+
+    count = ImportBatchService.add_import_batch_errors(
+        session,
+        import_batch_id=uuid4(),
+        errors=[
+            {
+                "severity": " info ",
+                "entity_type": "watch_event",
+                "entity_ref": " evt-1 ",
+                "message": "skipped",
+                "details": {"reason": "duplicate_watch_event"},
+            },
+            {
+                "severity": "error",
+                "entity_type": None,
+                "entity_ref": None,
+                "message": " bad row ",
+                "details": {},
+            },
+        ],
+    )
+
+    assert count == 2
+    assert len(inserted) == 1
+    assert inserted[0][0]["severity"] == "info"
+    assert inserted[0][0]["entity_ref"] == "evt-1"
+    assert inserted[0][1]["message"] == "bad row"
+    session.commit.assert_called_once()
+
+
+def test_import_batch_error_sink_buffers_until_flush(monkeypatch) -> None:
+    session = Mock()
+    batch_id = uuid4()
+    flushed: list[dict] = []
+
+    def fake_add_import_batch_errors(_session, *, import_batch_id, errors):
+        assert import_batch_id == batch_id
+        flushed.append(errors)
+        return len(errors)
+
+    monkeypatch.setattr(
+        ImportBatchService, "add_import_batch_errors", fake_add_import_batch_errors
+    )
+
+    sink = ImportBatchErrorSink(import_batch_id=batch_id, aggregate_info=True)
+    for reason in ("duplicate_source_event", "duplicate_source_event", "collision"):
+        sink.add(
+            severity="info",
+            entity_type="watch_event",
+            entity_ref=None,
+            message="skipped",
+            details={"reason": reason},
+        )
+    sink.add(
+        severity="error",
+        entity_type="watch_event",
+        entity_ref="evt-9",
+        message="bad row",
+        details={},
+    )
+
+    assert flushed == []
+    assert sink.flush(session) == 1
+    assert sink.flush(session) == 0
+    assert [error["entity_ref"] for error in flushed[0]] == ["evt-9"]
+    assert sink.info_counts == {"duplicate_source_event": 2, "collision": 1}
@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 
 from app.services.import_batches import (
     ImportBatchConstraintError,
+    ImportBatchLockedError,
     ImportBatchNotFoundError,
     ImportBatchService,
 )
@@ -75,3 +76,87 @@ def test_finish_import_batch_not_found(monkeypatch) -> None:
             errors_count=0,
             notes=None,
         )
+
+
+def test_update_import_batch_progress_commits_checkpoint(monkeypatch) -> None:
+    session = Mock()
+    batch = Mock()
+    captured: dict = {}
+
+    def fake_update_import_batch_progress(_session, **kwargs):
+        captured.update(kwargs)
+        return batch
+
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.get_import_batch",
+        lambda _session, *, import_batch_id: batch,
+    )
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.update_import_batch_progress",
+        fake_update_import_batch_progress,
+    )
+
+    updated = ImportBatchService.update_import_batch_progress(
+        session,
+        import_batch_id=uuid4(),
+        watch_events_inserted=5,
+        errors_count=1,
+        parameters_patch={"checkpoint": {"row_index": 6}},
+    )
+
+    assert updated is batch
+    assert captured["status"] == "running"
+    assert captured["parameters_patch"] == {"checkpoint": {"row_index": 6}}
+    session.commit.assert_called_once()
+
+
+def test_hold_import_batch_lock_releases_on_exit(monkeypatch) -> None:
+    session = Mock()
+    connection = session.get_bind.return_value.connect.return_value
+    connection.execution_options.return_value = connection
+    calls: list[str] = []
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.try_lock_import_batch",
+        lambda _connection, *, import_batch_id: calls.append("lock") or True,
+    )
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.unlock_import_batch",
+        lambda _connection, *, import_batch_id: calls.append("unlock"),
+    )
+
+    with pytest.raises(RuntimeError):
+        with ImportBatchService.hold_import_batch_lock(
+            session, import_batch_id=uuid4()
+        ):
+            calls.append("run")
+            raise RuntimeError("run failed")
+
+    assert calls == ["lock", "run", "unlock"]
+    connection.execution_options.assert_called_once_with(isolation_level="AUTOCOMMIT")
+    connection.close.assert_called_once()
+
+
+def test_hold_import_batch_lock_refuses_batch_owned_by_another_run(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    connection = session.get_bind.return_value.connect.return_value
+    connection.execution_options.return_value = connection
+    unlock = Mock()
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.try_lock_import_batch",
+        lambda _connection, *, import_batch_id: False,
+    )
+    monkeypatch.setattr(
+        "app.services.import_batches.import_batch_repository.unlock_import_batch",
+        unlock,
+    )
+
+    with pytest.raises(ImportBatchLockedError, match="another run"):
+        with ImportBatchService.hold_import_batch_lock(
+            session, import_batch_id=uuid4()
+        ):
+            raise AssertionError("the body must not run without the lock")
+
+    unlock.assert_not_called()
+    connection.close.assert_called_once()
@@ -0,0 +1,316 @@
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.schemas.imports import (
+    ImportMode,
+    ImportedWatchEvent,
+    LegacySourceWatchEventImportOptions,
+    WatchEventImportRequest,
+)
+from app.services import import_jobs
+from app.services.import_batches import ImportBatchLockedError
+from app.services.import_jobs import ImportJobService
+
+
+class DummyBatch:
+    def __init__(self, import_batch_id: UUID, status: str = "queued") -> None:
+        self.import_batch_id = import_batch_id
+        self.status = status
+        self.watch_events_inserted = 0
+        self.media_items_inserted = 0
+        self.media_versions_inserted = 0
+        self.tags_added = 0
+        self.errors_count = 0
+        self.notes = None
+
+
+def _payload(**updates) -> WatchEventImportRequest:
+    return WatchEventImportRequest(
+        source="legacy_source_export",
+        mode=ImportMode.bootstrap,
+        events=[
+            ImportedWatchEvent(
+                user_id=uuid4(),
+                media_item_id=uuid4(),
+                watched_at=datetime.now(UTC),
+                playback_source="jellyfin",
+            )
+        ],
+        **updates,
+    )
+
+
+@pytest.fixture
+def submitted(monkeypatch) -> list:
+    jobs: list = []
+    monkeypatch.setattr(import_jobs, "_submit_import_job", jobs.append)
+    return jobs
+
+
+@pytest.fixture
+def job_session(monkeypatch) -> Mock:
+    session_obj = Mock()
+    monkeypatch.setattr(import_jobs, "SessionLocal", lambda: session_obj)
+    return session_obj
+
+
+def test_enqueue_import_queues_batch_and_claims_it_in_worker(
+    monkeypatch, submitted, job_session
+) -> None:
+    batch_id = uuid4()
+    started: list[dict] = []
+    runs: list[dict] = []
+
+    def fake_start_import_batch(_session, **kwargs):
+        started.append(kwargs)
+        return DummyBatch(batch_id)
+
+    def fake_run_import(session, *, payload, import_batch_id):
+        runs.append(
+            {"session": session, "payload": payload, "import_batch_id": import_batch_id}
+        )
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.start_import_batch",
+        fake_start_import_batch,
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.WatchEventImportService.run_import",
+        fake_run_import,
+    )
+
+    batch = ImportJobService.enqueue_import(object(), payload=_payload())
+
+    assert batch.import_batch_id == batch_id
+    assert started[0]["status"] == "queued"
+    assert started[0]["source_detail"] == "bootstrap"
+    assert runs == []
+
+    submitted[0]()
+
+    assert runs[0]["session"] is job_session
+    assert runs[0]["import_batch_id"] == batch_id
+    assert runs[0]["payload"].commit_every == 1000
+    job_session.close.assert_called_once()
+
+
+def test_enqueue_import_rejects_dry_run(submitted) -> None:
+    with pytest.raises(ValueError, match="dry_run"):
+        ImportJobService.enqueue_import(object(), payload=_payload(dry_run=True))
+
+    assert submitted == []
+
+
+def test_enqueue_import_resume_reuses_batch_without_claiming(
+    monkeypatch, submitted, job_session
+) -> None:
+    batch_id = uuid4()
+    runs: list[UUID | None] = []
+    probed: list[UUID] = []
+
+    @contextmanager
+    def fake_lock(_session, *, import_batch_id):
+        probed.append(import_batch_id)
+        yield
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id, "failed"),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.hold_import_batch_lock",
+        fake_lock,
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.WatchEventImportService.run_import",
+        lambda _session, *, payload, import_batch_id: runs.append(import_batch_id),
+    )
+
+    batch = ImportJobService.enqueue_import(
+        object(), payload=_payload(resume_import_batch_id=batch_id, commit_every=5)
+    )
+    submitted[0]()
+
+    assert batch.import_batch_id == batch_id
+    assert probed == [batch_id]
+    assert runs == [None]
+
+
+def test_enqueue_import_resume_refuses_batch_owned_by_live_run(
+    monkeypatch, submitted
+) -> None:
+    batch_id = uuid4()
+
+    @contextmanager
+    def fake_lock(_session, *, import_batch_id):
+        raise ImportBatchLockedError(
+            f"Import batch {import_batch_id} is being processed by another run"
+        )
+        yield
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id, "running"),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.hold_import_batch_lock",
+        fake_lock,
+    )
+
+    with pytest.raises(ImportBatchLockedError, match="another run"):
+        ImportJobService.enqueue_import(
+            object(), payload=_payload(resume_import_batch_id=batch_id)
+        )
+
+    assert submitted == []
+
+
+def test_import_job_locked_by_another_run_leaves_batch_alone(
+    monkeypatch, submitted, job_session
+) -> None:
+    batch_id = uuid4()
+    finished = Mock()
+
+    def fake_run_import(_session, **_kwargs):
+        raise ImportBatchLockedError("Import batch is being processed by another run")
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.finish_import_batch", finished
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.WatchEventImportService.run_import",
+        fake_run_import,
+    )
+
+    ImportJobService.enqueue_import(object(), payload=_payload())
+    submitted[0]()
+
+    finished.assert_not_called()
+    job_session.close.assert_called_once()
+
+
+def test_import_job_failure_marks_batch_failed(
+    monkeypatch, submitted, job_session
+) -> None:
+    batch_id = uuid4()
+    finished: list[dict] = []
+
+    def fake_run_import(_session, **_kwargs):
+        raise ValueError("No valid rows available for import")
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: finished.append(kwargs),
+    )
+    cleanup = Mock()
+    monkeypatch.setattr(
+        "app.services.import_jobs.WatchEventImportService.run_legacy_source_import_stream",
+        fake_run_import,
+    )
+
+    ImportJobService.enqueue_legacy_source_import_stream(
+        object(),
+        options=LegacySourceWatchEventImportOptions(mode=ImportMode.bootstrap),
+        open_chunks=list,
+        cleanup=cleanup,
+    )
+    submitted[0]()
+
+    job_session.rollback.assert_called_once()
+    assert finished[0]["status"] == "failed"
+    assert finished[0]["errors_count"] == 1
+    assert finished[0]["parameters_patch"] == {
+        "job_error": "No valid rows available for import"
+    }
+    cleanup.assert_called_once()
+
+
+def test_import_job_failure_keeps_status_of_finished_batch(
+    monkeypatch, submitted, job_session
+) -> None:
+    batch_id = uuid4()
+    updates: list[dict] = []
+
+    def fake_run_import(_session, **_kwargs):
+        raise ValueError("Invalid JSON input")
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id, "failed"),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.update_import_batch_progress",
+        lambda _session, **kwargs: updates.append(kwargs),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.WatchEventImportService.run_import",
+        fake_run_import,
+    )
+
+    ImportJobService.enqueue_import(object(), payload=_payload())
+    submitted[0]()
+
+    assert updates[0]["status"] == "failed"
+    assert updates[0]["parameters_patch"] == {"job_error": "Invalid JSON input"}
+
+
+def test_recover_interrupted_jobs_fails_unowned_batches(monkeypatch) -> None:
+    orphan_id = uuid4()
+    live_id = uuid4()
+    finished: list[dict] = []
+    batches = {
+        orphan_id: DummyBatch(orphan_id, "running"),
+        live_id: DummyBatch(live_id, "queued"),
+    }
+
+    @contextmanager
+    def fake_lock(_session, *, import_batch_id):
+        if import_batch_id == live_id:
+            raise ImportBatchLockedError("Import batch is being processed")
+        yield
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.list_background_import_batches",
+        lambda _session, *, statuses: list(batches.values()),
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.hold_import_batch_lock",
+        fake_lock,
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: batches[import_batch_id],
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: finished.append(kwargs),
+    )
+
+    recovered = ImportJobService.recover_interrupted_jobs(object())
+
+    assert recovered == [orphan_id]
+    assert [call["import_batch_id"] for call in finished] == [orphan_id]
+    assert finished[0]["status"] == "failed"
+    assert finished[0]["parameters_patch"] == {
+        "job_error": import_jobs.INTERRUPTED_IMPORT_JOB_MESSAGE
+    }
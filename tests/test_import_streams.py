@@ -0,0 +1,61 @@
+import io
+import json
+
+import pytest
+
+from app.services.import_streams import iter_csv_rows, iter_json_rows, iter_rows
+
+
+def _stream(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode("utf-8"))
+
+
+def test_iter_json_rows_streams_top_level_array_across_small_reads() -> None:
+    rows = [{"id": index, "title": "é" * index, "rating": 7.25} for index in range(20)]
+
+    parsed = list(iter_json_rows(_stream(json.dumps(rows)), read_size=3))
+
+    assert parsed == rows
+
+
+def test_iter_json_rows_does_not_split_numbers_at_read_boundaries() -> None:
+    parsed = list(iter_json_rows(_stream("[12345, 678]"), read_size=2))
+
+    assert parsed == [12345, 678]
+
+
+def test_iter_json_rows_reads_wrapped_rows_after_other_keys() -> None:
+    payload = {"meta": {"count": 2, "rows": "ignored"}, "history": [{"id": 1}]}
+
+    parsed = list(iter_json_rows(_stream(json.dumps(payload)), read_size=4))
+
+    assert parsed == [{"id": 1}]
+
+
+def test_iter_json_rows_accepts_utf8_bom() -> None:
+    stream = io.BytesIO(b"\xef\xbb\xbf" + b'{"rows": [{"id": 1}]}')
+
+    assert list(iter_json_rows(stream)) == [{"id": 1}]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"items": []}', '"rows"', "", '[{"id": 1}] trailing', '[{"id": 1}'],
+)
+def test_iter_json_rows_rejects_invalid_input(text: str) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_rows(_stream(text), read_size=4))
+
+
+def test_iter_csv_rows_strips_bom_and_leaves_stream_open() -> None:
+    stream = io.BytesIO(b"\xef\xbb\xbfwatched_at,title\n2024-01-01T00:00:00Z,Alien\n")
+
+    assert list(iter_csv_rows(stream)) == [
+        {"watched_at": "2024-01-01T00:00:00Z", "title": "Alien"}
+    ]
+    assert not stream.closed
+
+
+def test_iter_rows_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported format"):
+        iter_rows(_stream("[]"), "xml")
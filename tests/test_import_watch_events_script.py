@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
 from uuid import uuid4
 
 from app.scripts import import_watch_events
@@ -164,6 +166,8 @@ def test_run_legacy_backup_writes_error_report(monkeypatch, tmp_path: Path) -> N
     class DummyMediaItem:
         def __init__(self) -> None:
             self.media_item_id = uuid4()
+            self.type = "episode"
+            self.tmdb_id = 4765221
 
     expected_result = WatchEventImportResult(
         import_batch_id=uuid4(),
@@ -184,8 +188,13 @@ def test_run_legacy_backup_writes_error_report(monkeypatch, tmp_path: Path) -> N
     )
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: DummyMediaItem(),
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: ([DummyMediaItem()], []),
+    )
+    monkeypatch.setattr(
+        import_watch_events.ShowService,
+        "list_shows_by_tmdb_ids",
+        lambda *_args, **_kwargs: [],
     )
     monkeypatch.setattr(
         import_watch_events.WatchEventImportService,
@@ -267,6 +276,13 @@ def test_legacy_backup_creates_missing_media_item(monkeypatch) -> None:
             self.last_media_item = media_item
             self.created += 1
 
+        def add_all(self, media_items) -> None:
+            for media_item in media_items:
+                self.add(media_item)
+
+        def begin_nested(self):
+            return nullcontext()
+
         def flush(self) -> None:
             return None
 
@@ -280,8 +296,8 @@ def test_legacy_backup_creates_missing_media_item(monkeypatch) -> None:
     monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: dummy_session)
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: None,
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: ([], []),
     )
     monkeypatch.setattr(
         import_watch_events.ShowService,
@@ -290,8 +306,8 @@ def test_legacy_backup_creates_missing_media_item(monkeypatch) -> None:
     )
     monkeypatch.setattr(
         import_watch_events.ShowService,
-        "find_show_by_tmdb_id",
-        lambda *_args, **_kwargs: None,
+        "list_shows_by_tmdb_ids",
+        lambda *_args, **_kwargs: [],
     )
 
     preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
@@ -322,6 +338,13 @@ def test_legacy_backup_dry_run_does_not_create_media_items(monkeypatch) -> None:
         def add(self, _media_item) -> None:
             self.created += 1
 
+        def add_all(self, media_items) -> None:
+            for media_item in media_items:
+                self.add(media_item)
+
+        def begin_nested(self):
+            return nullcontext()
+
         def flush(self) -> None:
             return None
 
@@ -335,13 +358,13 @@ def test_legacy_backup_dry_run_does_not_create_media_items(monkeypatch) -> None:
     monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: dummy_session)
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: None,
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: ([], []),
     )
     monkeypatch.setattr(
         import_watch_events.ShowService,
-        "find_show_by_tmdb_id",
-        lambda *_args, **_kwargs: None,
+        "list_shows_by_tmdb_ids",
+        lambda *_args, **_kwargs: [],
     )
 
     preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
@@ -373,6 +396,13 @@ def test_legacy_backup_maps_flat_trakt_csv_episode_shape(monkeypatch) -> None:
             self.last_media_item = media_item
             self.created += 1
 
+        def add_all(self, media_items) -> None:
+            for media_item in media_items:
+                self.add(media_item)
+
+        def begin_nested(self):
+            return nullcontext()
+
         def flush(self) -> None:
             return None
 
@@ -386,8 +416,8 @@ def test_legacy_backup_maps_flat_trakt_csv_episode_shape(monkeypatch) -> None:
     monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: dummy_session)
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: None,
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: ([], []),
     )
     monkeypatch.setattr(
         import_watch_events.ShowService,
@@ -396,8 +426,8 @@ def test_legacy_backup_maps_flat_trakt_csv_episode_shape(monkeypatch) -> None:
     )
     monkeypatch.setattr(
         import_watch_events.ShowService,
-        "find_show_by_tmdb_id",
-        lambda *_args, **_kwargs: None,
+        "list_shows_by_tmdb_ids",
+        lambda *_args, **_kwargs: [],
     )
 
     preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
@@ -428,8 +458,11 @@ def test_legacy_backup_treats_naive_csv_timestamps_as_user_local_time(
     monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: DummySession())
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: type("Media", (), {"media_item_id": uuid4()})(),
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: (
+            [SimpleNamespace(media_item_id=uuid4(), type="movie", tmdb_id=123)],
+            [],
+        ),
     )
 
     preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
@@ -458,8 +491,11 @@ def test_legacy_backup_treats_naive_json_timestamps_as_utc(monkeypatch) -> None:
     monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: DummySession())
     monkeypatch.setattr(
         import_watch_events.MediaItemService,
-        "find_media_item_by_external_ids",
-        lambda *_args, **_kwargs: type("Media", (), {"media_item_id": uuid4()})(),
+        "list_media_items_by_external_ids",
+        lambda *_args, **_kwargs: (
+            [SimpleNamespace(media_item_id=uuid4(), type="movie", tmdb_id=123)],
+            [],
+        ),
     )
 
     preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
@@ -483,3 +519,79 @@ def test_legacy_backup_treats_naive_json_timestamps_as_utc(monkeypatch) -> None:
 def test_run_returns_2_for_missing_file() -> None:
     exit_code = import_watch_events.run(["--input", "missing.json"])
     assert exit_code == 2
+
+
+def test_legacy_backup_resolves_external_ids_once_per_file(monkeypatch) -> None:
+    class DummySession:
+        def __init__(self) -> None:
+            self.added: list = []
+            self.commits = 0
+
+        def add_all(self, media_items) -> None:
+            self.added.extend(media_items)
+
+        def begin_nested(self):
+            return nullcontext()
+
+        def commit(self) -> None:
+            self.commits += 1
+
+        def close(self) -> None:
+            return None
+
+    existing_movie_id = uuid4()
+    lookups: list[dict] = []
+
+    def fake_list_media_items(_session, *, tmdb_keys, imdb_keys):
+        lookups.append({"tmdb_keys": set(tmdb_keys), "imdb_keys": set(imdb_keys)})
+        return (
+            [SimpleNamespace(media_item_id=existing_movie_id, type="movie", tmdb_id=1)],
+            [],
+        )
+
+    dummy_session = DummySession()
+    monkeypatch.setattr(import_watch_events, "SessionLocal", lambda: dummy_session)
+    monkeypatch.setattr(
+        import_watch_events.MediaItemService,
+        "list_media_items_by_external_ids",
+        fake_list_media_items,
+    )
+    monkeypatch.setattr(
+        import_watch_events.MediaItemService,
+        "find_media_item_by_external_ids",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(
+            AssertionError("Rows must not be resolved one at a time")
+        ),
+    )
+    rows = [
+        {"type": "movie", "watched_at": "2025-01-01T00:00:00Z", "tmdb_id": "1"},
+        {"type": "movie", "watched_at": "2025-01-02T00:00:00Z", "tmdb_id": "2"},
+        {"type": "movie", "watched_at": "2025-01-03T00:00:00Z", "imdb_id": "tt2"},
+        {
+            "type": "movie",
+            "watched_at": "2025-01-04T00:00:00Z",
+            "tmdb_id": "2",
+            "imdb_id": "tt2",
+        },
+        {"type": "movie", "watched_at": "2025-01-05T00:00:00Z", "tmdb_id": "1"},
+    ]
+
+    preprocess = import_watch_events._build_mapped_rows_from_legacy_backup(
+        rows,
+        user_id=uuid4(),
+        dry_run=False,
+    )
+
+    assert lookups == [
+        {
+            "tmdb_keys": {("movie", 1), ("movie", 2)},
+            "imdb_keys": {("movie", "tt2")},
+        }
+    ]
+    assert preprocess.media_items_created == 2
+    assert [media_item.tmdb_id for media_item in dummy_session.added] == [2, None]
+    media_item_ids = [row["media_item_id"] for row in preprocess.mapped_rows]
+    assert media_item_ids[0] == media_item_ids[4] == str(existing_movie_id)
+    assert media_item_ids[1] == media_item_ids[3]
+    assert media_item_ids[2] not in {media_item_ids[0], media_item_ids[1]}
+    assert dummy_session.commits == 1
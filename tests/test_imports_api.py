@@ -1,5 +1,6 @@
 from datetime import UTC, datetime
 import json
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
@@ -13,8 +14,14 @@ from app.services.collection_imports import (
     JellyfinCollectionImportResult,
     JellyfinCollectionImportService,
 )
+from app.services.import_batches import ImportBatchNotFoundError
+from app.services.import_jobs import ImportJobService
 from app.services.jellyfin import JellyfinClientError
-from app.services.imports import WatchEventImportResult, WatchEventImportService
+from app.services.imports import (
+    WatchEventImportFailedError,
+    WatchEventImportResult,
+    WatchEventImportService,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -238,7 +245,7 @@ def test_import_legacy_source_watch_events_upload_endpoint(monkeypatch) -> None:
     )
     monkeypatch.setattr(
         "app.api.imports.import_watch_events_script._build_mapped_rows_from_legacy_backup",
-        lambda _rows, *, user_id, dry_run, naive_datetime_timezone="UTC": (
+        lambda _rows, *, user_id, dry_run, naive_datetime_timezone="UTC", **_kwargs: (
             LegacyBackupPreprocessResult(
                 mapped_rows=[
                     {
@@ -255,16 +262,16 @@ def test_import_legacy_source_watch_events_upload_endpoint(monkeypatch) -> None:
         ),
     )
 
-    def fake_run_legacy_source_import(_session, *, payload):
-        assert payload.mode.value == "incremental"
-        assert payload.dry_run is True
-        assert len(payload.rows) == 1
+    def fake_run_legacy_source_import_stream(_session, *, options, chunks):
+        assert options.mode.value == "incremental"
+        assert options.dry_run is True
+        assert sum(len(chunk.rows) for chunk in chunks) == 1
         return expected_result
 
     monkeypatch.setattr(
         WatchEventImportService,
-        "run_legacy_source_import",
-        fake_run_legacy_source_import,
+        "run_legacy_source_import_stream",
+        fake_run_legacy_source_import_stream,
     )
 
     client = TestClient(app)
@@ -313,7 +320,7 @@ def test_import_upload_legacy_csv_uses_user_timezone_for_naive_timestamps(
         lambda _session, _user_id: DummyUser(),
     )
 
-    def fake_build(_rows, *, user_id, dry_run, naive_datetime_timezone):
+    def fake_build(_rows, *, user_id, dry_run, naive_datetime_timezone, **_kwargs):
         assert naive_datetime_timezone == "America/Edmonton"
         return LegacyBackupPreprocessResult(
             mapped_rows=[
@@ -333,10 +340,15 @@ def test_import_upload_legacy_csv_uses_user_timezone_for_naive_timestamps(
         "app.api.imports.import_watch_events_script._build_mapped_rows_from_legacy_backup",
         fake_build,
     )
+
+    def fake_run_legacy_source_import_stream(_session, *, options, chunks):
+        assert [len(chunk.rows) for chunk in chunks] == [1]
+        return expected_result
+
     monkeypatch.setattr(
         WatchEventImportService,
-        "run_legacy_source_import",
-        lambda _session, *, payload: expected_result,
+        "run_legacy_source_import_stream",
+        fake_run_legacy_source_import_stream,
     )
 
     client = TestClient(app)
@@ -361,6 +373,40 @@ def test_import_upload_legacy_csv_uses_user_timezone_for_naive_timestamps(
     assert response.status_code == 200
 
 
+def test_import_upload_failure_after_commits_returns_batch_id(monkeypatch) -> None:
+    batch_id = uuid4()
+
+    def fake_run_legacy_source_import_stream(_session, *, options, chunks):
+        raise WatchEventImportFailedError(
+            "Invalid JSON input", import_batch_id=batch_id
+        )
+
+    monkeypatch.setattr(
+        WatchEventImportService,
+        "run_legacy_source_import_stream",
+        fake_run_legacy_source_import_stream,
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/imports/watch-events/legacy-source/upload",
+        data={"input_schema": "mapped_rows", "mode": "bootstrap"},
+        files={
+            "input_file": (
+                "history.json",
+                json.dumps([{"player": "legacy_backup"}]),
+                "application/json",
+            )
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == {
+        "message": "Invalid JSON input",
+        "import_batch_id": str(batch_id),
+    }
+
+
 def test_import_upload_legacy_backup_requires_user_id() -> None:
     client = TestClient(app)
     response = client.post(
@@ -407,3 +453,105 @@ def test_import_upload_rejects_oversized_file(monkeypatch) -> None:
 
     assert response.status_code == 413
     assert "exceeds max size" in response.json()["detail"]
+
+
+def _job_batch(**overrides) -> SimpleNamespace:
+    values = {
+        "import_batch_id": uuid4(),
+        "status": "queued",
+        "source": "legacy_source_export",
+        "source_detail": "bootstrap",
+        "started_at": datetime.now(UTC),
+        "finished_at": None,
+        "watch_events_inserted": 0,
+        "errors_count": 0,
+        "parameters": {"mode": "bootstrap", "background": True},
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_enqueue_legacy_source_upload_job_returns_accepted(monkeypatch) -> None:
+    batch = _job_batch()
+    seen: dict = {}
+
+    def fake_enqueue(_session, *, options, open_chunks, count_rows, cleanup):
+        seen["commit_every"] = options.commit_every
+        seen["count"] = count_rows()
+        seen["rows"] = [row for chunk in open_chunks() for row in chunk.rows]
+        cleanup()
+        return batch
+
+    monkeypatch.setattr(
+        ImportJobService, "enqueue_legacy_source_import_stream", fake_enqueue
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/imports/jobs/watch-events/legacy-source/upload",
+        data={"input_schema": "mapped_rows", "mode": "bootstrap", "commit_every": "2"},
+        files={
+            "input_file": (
+                "history.json",
+                json.dumps([{"id": "evt-1"}, {"id": "evt-2"}]),
+                "application/json",
+            )
+        },
+    )
+
+    assert response.status_code == 202
+    assert response.json()["job_id"] == str(batch.import_batch_id)
+    assert response.json()["status"] == "queued"
+    assert seen == {
+        "commit_every": 2,
+        "count": 2,
+        "rows": [{"id": "evt-1"}, {"id": "evt-2"}],
+    }
+
+
+def test_get_import_job_reports_progress(monkeypatch) -> None:
+    batch = _job_batch(
+        status="running",
+        watch_events_inserted=40,
+        errors_count=1,
+        parameters={
+            "progress": {
+                "processed_count": 50,
+                "total_count": 200,
+                "inserted_count": 40,
+                "skipped_count": 9,
+                "error_count": 1,
+                "eta_seconds": 12.5,
+                "updated_at": "2026-01-01T00:00:00Z",
+            }
+        },
+    )
+    monkeypatch.setattr(
+        ImportJobService,
+        "get_import_job",
+        lambda _session, *, job_id: batch,
+    )
+
+    client = TestClient(app)
+    response = client.get(f"/api/v1/imports/jobs/{batch.import_batch_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["processed_count"] == 50
+    assert body["total_count"] == 200
+    assert body["inserted_count"] == 40
+    assert body["skipped_count"] == 9
+    assert body["eta_seconds"] == 12.5
+    assert body["error"] is None
+
+
+def test_get_import_job_returns_404_for_unknown_job(monkeypatch) -> None:
+    def fake_get_import_job(_session, *, job_id):
+        raise ImportBatchNotFoundError(str(job_id))
+
+    monkeypatch.setattr(ImportJobService, "get_import_job", fake_get_import_job)
+
+    client = TestClient(app)
+    response = client.get(f"/api/v1/imports/jobs/{uuid4()}")
+
+    assert response.status_code == 404
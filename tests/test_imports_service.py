@@ -1,21 +1,59 @@
+import hashlib
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from unittest.mock import Mock
 from uuid import UUID, uuid4
 
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.schemas.imports import (
     ImportMode,
     ImportedWatchEvent,
+    LegacySourceWatchEventImportOptions,
     LegacySourceWatchEventImportRequest,
     LegacySourceWatchEventRow,
     WatchEventImportRequest,
 )
-from app.services.imports import WatchEventImportService
+from app.services.horrorfest import HorrorfestAssignment
+from app.services.import_batches import ImportBatchLockedError
+from app.services.imports import (
+    LegacySourceImportChunk,
+    WatchEventImportFailedError,
+    WatchEventImportService,
+)
 from app.services.watch_events import WatchEventCreateResult
 from app.services.watch_events import WatchEventDuplicateError
 
 
+@pytest.fixture(autouse=True)
+def batch_locks(monkeypatch) -> list[UUID]:
+    locked: list[UUID] = []
+
+    @contextmanager
+    def fake_hold_import_batch_lock(_session, *, import_batch_id):
+        locked.append(import_batch_id)
+        yield
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.hold_import_batch_lock",
+        fake_hold_import_batch_lock,
+    )
+    return locked
+
+
+@pytest.fixture(autouse=True)
+def rewatch_recomputes(monkeypatch) -> list[set]:
+    calls: list[set] = []
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.recompute_rewatch_flags",
+        lambda _session, *, timelines: calls.append(set(timelines)) or 0,
+    )
+    return calls
+
+
 def _payload(*, dry_run: bool = False) -> WatchEventImportRequest:
     return WatchEventImportRequest(
         source="legacy_source_export",
@@ -58,7 +96,7 @@ def test_run_import_all_success(monkeypatch) -> None:
         assert _session is session_obj
         return WatchEventCreateResult(watch_event=Mock(), created=True)
 
-    def fake_add_import_batch_error(_session: Session, **_kwargs):
+    def fake_add_import_batch_errors(_session: Session, **_kwargs):
         raise AssertionError("No errors expected")
 
     def fake_finish_import_batch(_session: Session, **kwargs):
@@ -75,8 +113,8 @@ def test_run_import_all_success(monkeypatch) -> None:
         fake_create_watch_event,
     )
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
-        fake_add_import_batch_error,
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        fake_add_import_batch_errors,
     )
     monkeypatch.setattr(
         "app.services.imports.ImportBatchService.finish_import_batch",
@@ -101,7 +139,7 @@ def test_run_import_partial_failure_and_duplicate_skip(monkeypatch) -> None:
             self.import_batch_id = import_batch_id
             self.status = status
 
-    calls = {"create": 0}
+    calls = {"create": 0, "flush": 0}
     recorded_errors: list[dict] = []
 
     def fake_start_import_batch(_session: Session, **_kwargs):
@@ -115,9 +153,10 @@ def test_run_import_partial_failure_and_duplicate_skip(monkeypatch) -> None:
             raise ValueError("bad row")
         return WatchEventCreateResult(watch_event=Mock(), created=True)
 
-    def fake_add_import_batch_error(_session: Session, **kwargs):
-        recorded_errors.append(kwargs)
-        return None
+    def fake_add_import_batch_errors(_session: Session, **kwargs):
+        calls["flush"] += 1
+        recorded_errors.extend(kwargs["errors"])
+        return len(kwargs["errors"])
 
     def fake_finish_import_batch(_session: Session, **kwargs):
         assert kwargs["watch_events_inserted"] == 0
@@ -133,8 +172,8 @@ def test_run_import_partial_failure_and_duplicate_skip(monkeypatch) -> None:
         fake_create_watch_event,
     )
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
-        fake_add_import_batch_error,
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        fake_add_import_batch_errors,
     )
     monkeypatch.setattr(
         "app.services.imports.ImportBatchService.finish_import_batch",
@@ -154,6 +193,89 @@ def test_run_import_partial_failure_and_duplicate_skip(monkeypatch) -> None:
     assert recorded_errors[0]["details"]["reason"] == "duplicate_watch_event"
     assert recorded_errors[1]["severity"] == "error"
     assert recorded_errors[1]["entity_ref"] == "evt-2"
+    assert calls["flush"] == 1
+
+
+def test_run_import_aggregate_skips_counts_info_rows(monkeypatch) -> None:
+    session_obj = object()
+    batch_id = uuid4()
+    flushed: list[list[dict]] = []
+    finished: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fake_create_watch_event(_session: Session, **_kwargs):
+        raise WatchEventDuplicateError("Watch event already exists")
+
+    def fake_finish_import_batch(_session: Session, **kwargs):
+        finished.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs["status"])
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        fake_create_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda _session, **kwargs: flushed.append(kwargs["errors"]),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+
+    payload = _payload().model_copy(update={"aggregate_skips": True})
+    result = WatchEventImportService.run_import(session_obj, payload=payload)
+
+    assert result.skipped_count == 2
+    assert flushed == []
+    assert finished[0]["parameters_patch"]["skip_reason_counts"] == {
+        "duplicate_watch_event": 2
+    }
+
+
+def test_run_import_defers_rewatch_to_one_recompute_per_window(
+    monkeypatch, rewatch_recomputes
+) -> None:
+    batch_id = uuid4()
+    create_calls: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fake_create_watch_event(_session: Session, **kwargs):
+        create_calls.append(kwargs)
+        return WatchEventCreateResult(watch_event=Mock(), created=True)
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        fake_create_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: DummyBatch(batch_id, status=kwargs["status"]),
+    )
+
+    payload = _payload()
+    WatchEventImportService.run_import(object(), payload=payload)
+
+    assert all(call["defer_rewatch"] is True for call in create_calls)
+    assert rewatch_recomputes == [
+        {(event.user_id, event.media_item_id) for event in payload.events}
+    ]
 
 
 def test_run_import_dry_run_skips_db_writes(monkeypatch) -> None:
@@ -220,12 +342,17 @@ def test_run_import_preserves_horrorfest_assignment(monkeypatch) -> None:
             created=True,
         ),
     )
+
+    def fake_include_watch_events(_session, **kwargs):
+        calls.update(kwargs)
+        return {}
+
     monkeypatch.setattr(
-        "app.services.imports.HorrorfestService.include_watch_event",
-        lambda *_args, **kwargs: calls.update(kwargs),
+        "app.services.imports.HorrorfestService.include_watch_events",
+        fake_include_watch_events,
     )
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
         lambda *_args, **_kwargs: None,
     )
     monkeypatch.setattr(
@@ -236,9 +363,10 @@ def test_run_import_preserves_horrorfest_assignment(monkeypatch) -> None:
     result = WatchEventImportService.run_import(session_obj, payload=payload)
 
     assert result.status == "completed"
-    assert calls["watch_id"] == watch_id
-    assert calls["horrorfest_year"] == 2025
-    assert calls["target_order"] == 7
+    assert calls["assignments"] == [
+        HorrorfestAssignment(watch_id=watch_id, horrorfest_year=2025, target_order=7)
+    ]
+    assert calls["source_kind"] == "auto_import"
     assert calls["commit"] is False
 
 
@@ -369,8 +497,8 @@ def test_run_incremental_resume_skips_rows_before_cursor(monkeypatch) -> None:
     )
     recorded_errors: list[dict] = []
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
-        lambda *_args, **kwargs: recorded_errors.append(kwargs),
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **kwargs: recorded_errors.extend(kwargs["errors"]),
     )
 
     def fake_finish_import_batch(_session: Session, **kwargs):
@@ -445,8 +573,8 @@ def test_run_incremental_skips_existing_source_event_id(monkeypatch) -> None:
     )
     recorded_errors: list[dict] = []
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
-        lambda *_args, **kwargs: recorded_errors.append(kwargs),
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **kwargs: recorded_errors.extend(kwargs["errors"]),
     )
     monkeypatch.setattr(
         "app.services.imports.ImportBatchService.finish_import_batch",
@@ -501,8 +629,8 @@ def test_run_import_counts_collision_deduped_rows(monkeypatch) -> None:
         fake_create_watch_event,
     )
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
-        lambda *_args, **kwargs: recorded_errors.append(kwargs),
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **kwargs: recorded_errors.extend(kwargs["errors"]),
     )
     monkeypatch.setattr(
         "app.services.imports.ImportBatchService.finish_import_batch",
@@ -565,7 +693,7 @@ def test_run_import_processes_oldest_watches_first(monkeypatch) -> None:
         ),
     )
     monkeypatch.setattr(
-        "app.services.imports.ImportBatchService.add_import_batch_error",
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
         lambda *_args, **_kwargs: None,
     )
     monkeypatch.setattr(
@@ -577,3 +705,783 @@ def test_run_import_processes_oldest_watches_first(monkeypatch) -> None:
 
     assert result.inserted_count == 2
     assert seen == ["evt-older", "evt-newer"]
+
+
+def test_run_bulk_import_resolves_matches_and_inserts_survivors(monkeypatch) -> None:
+    batch_id = uuid4()
+    user_id = uuid4()
+    media_item_id = uuid4()
+    existing_watch_id = uuid4()
+    base = datetime.fromisoformat("2025-01-01T10:00:00+00:00")
+
+    class DummySession:
+        def __init__(self) -> None:
+            self.commits = 0
+
+        def commit(self) -> None:
+            self.commits += 1
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def _event(offset_minutes: int, source_event_id: str) -> ImportedWatchEvent:
+        return ImportedWatchEvent(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_at=base.replace(minute=offset_minutes),
+            playback_source="jellyfin",
+            source_event_id=source_event_id,
+        )
+
+    payload = WatchEventImportRequest(
+        source="legacy_source_export",
+        mode=ImportMode.bootstrap,
+        bulk=True,
+        events=[
+            _event(0, "evt-existing"),
+            _event(1, "evt-first"),
+            _event(3, "evt-batch-collision"),
+            _event(3, "evt-first"),
+            _event(30, "evt-later"),
+        ],
+    )
+    staged_rows: list[tuple] = []
+    inserted: dict[str, object] = {}
+    recorded_errors: list[dict] = []
+    session_obj = DummySession()
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda *_args, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(
+            AssertionError("bulk import should not create rows one at a time")
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.stage_watch_event_import_rows",
+        lambda _session, *, rows: staged_rows.extend(rows),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.list_staged_watch_event_matches",
+        lambda _session, **_kwargs: {0: (existing_watch_id, None, None, None)},
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.insert_staged_watch_events",
+        lambda _session, **kwargs: (
+            inserted.update(kwargs) or len(kwargs["row_indexes"])
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_repository.recompute_rewatch_flags",
+        lambda _session, *, timelines: inserted.update(timelines=timelines) or 0,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.HorrorfestService.sync_watch_events",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **kwargs: recorded_errors.extend(kwargs["errors"]),
+    )
+
+    def fake_finish_import_batch(_session, **kwargs):
+        assert kwargs["watch_events_inserted"] == 2
+        assert kwargs["parameters_patch"]["collision_deduped_count"] == 1
+        assert kwargs["parameters_patch"]["cursor"]["source_event_id"] == "evt-later"
+        return DummyBatch(batch_id, status="completed")
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+
+    result = WatchEventImportService.run_import(session_obj, payload=payload)
+
+    assert len(staged_rows) == 5
+    assert inserted["row_indexes"] == [1, 4]
+    assert inserted["origin_kind"] == "manual_import"
+    assert inserted["timelines"] == [(user_id, media_item_id)]
+    assert session_obj.commits == 1
+    assert result.inserted_count == 2
+    assert result.skipped_count == 3
+    assert result.collision_deduped_count == 1
+    assert result.error_count == 0
+    assert [error["details"]["reason"] for error in recorded_errors] == [
+        "source_event",
+        "collision_window",
+        "source_event",
+    ]
+
+
+def test_run_bulk_import_dedupes_by_hash_before_collision_window(
+    monkeypatch,
+) -> None:
+    batch_id = uuid4()
+    user_id = uuid4()
+    media_item_id = uuid4()
+    existing_watch_id = uuid4()
+    base = datetime.fromisoformat("2025-01-01T10:00:00+00:00")
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def _event(minute: int, second: int, completed: bool) -> ImportedWatchEvent:
+        return ImportedWatchEvent(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_at=base.replace(minute=minute, second=second),
+            playback_source="jellyfin",
+            completed=completed,
+        )
+
+    payload = WatchEventImportRequest(
+        source="legacy_source_export",
+        mode=ImportMode.bootstrap,
+        bulk=True,
+        events=[_event(0, 5, True), _event(20, 0, True), _event(20, 40, False)],
+    )
+    staged_rows: list[tuple] = []
+    inserted: dict[str, object] = {}
+    recorded_errors: list[dict] = []
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda *_args, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.stage_watch_event_import_rows",
+        lambda _session, *, rows: staged_rows.extend(rows),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.list_staged_watch_event_matches",
+        lambda _session, **_kwargs: {0: (None, existing_watch_id, None, None)},
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.insert_staged_watch_events",
+        lambda _session, **kwargs: (
+            inserted.update(kwargs) or len(kwargs["row_indexes"])
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_repository.recompute_rewatch_flags",
+        lambda _session, *, timelines: 0,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.HorrorfestService.sync_watch_events",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **kwargs: recorded_errors.extend(kwargs["errors"]),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda *_args, **_kwargs: DummyBatch(batch_id, status="completed"),
+    )
+
+    result = WatchEventImportService.run_import(Mock(), payload=payload)
+
+    # Rows 1 and 2 share a minute but not the completed flag, which the
+    # collision search also requires to match, so both are kept.
+    assert staged_rows[1][-1] != staged_rows[2][-1]
+    assert inserted["row_indexes"] == [1, 2]
+    assert result.inserted_count == 2
+    assert result.collision_deduped_count == 1
+    assert [error["details"]["reason"] for error in recorded_errors] == [
+        "dedupe_hash",
+    ]
+
+
+def test_run_bulk_import_falls_back_to_row_engine_on_integrity_error(
+    monkeypatch,
+) -> None:
+    batch_id = uuid4()
+
+    class DummySession:
+        def __init__(self) -> None:
+            self.rollbacks = 0
+
+        def rollback(self) -> None:
+            self.rollbacks += 1
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fail_insert(*_args, **_kwargs):
+        raise IntegrityError("insert", {}, Exception("fk violation"))
+
+    session_obj = DummySession()
+    payload = _payload().model_copy(update={"bulk": True})
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda *_args, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.stage_watch_event_import_rows",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.list_staged_watch_event_matches",
+        lambda *_args, **_kwargs: {},
+    )
+    monkeypatch.setattr(
+        "app.services.imports.watch_event_import_repository.insert_staged_watch_events",
+        fail_insert,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        lambda *_args, **_kwargs: WatchEventCreateResult(
+            watch_event=Mock(), created=True
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.add_import_batch_errors",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda *_args, **_kwargs: DummyBatch(batch_id, status="completed"),
+    )
+
+    result = WatchEventImportService.run_import(session_obj, payload=payload)
+
+    assert session_obj.rollbacks == 1
+    assert result.inserted_count == 2
+
+
+def _legacy_row(*, source_event_id: str, watched_at: datetime) -> dict:
+    return {
+        "user_id": str(uuid4()),
+        "media_item_id": str(uuid4()),
+        "watched_at": watched_at.isoformat(),
+        "player": "legacy_backup",
+        "source_event_id": source_event_id,
+    }
+
+
+def test_run_legacy_source_import_stream_imports_chunks_under_one_batch(
+    monkeypatch,
+) -> None:
+    session_obj = object()
+    batch_id = uuid4()
+    started: list[dict] = []
+    created: list[str] = []
+    finished: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fake_start_import_batch(_session: Session, **kwargs):
+        started.append(kwargs)
+        return DummyBatch(batch_id)
+
+    def fake_create_watch_event(_session: Session, **kwargs):
+        created.append(kwargs["source_event_id"])
+        return WatchEventCreateResult(watch_event=Mock(), created=True)
+
+    def fake_finish_import_batch(_session: Session, **kwargs):
+        finished.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs["status"])
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        fake_start_import_batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        fake_create_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    chunks = [
+        LegacySourceImportChunk(rows=[], rejected_before_import=1),
+        LegacySourceImportChunk(
+            rows=[
+                _legacy_row(source_event_id="evt-2", watched_at=base.replace(day=2)),
+                _legacy_row(source_event_id="evt-1", watched_at=base),
+            ],
+            rejected_before_import=2,
+            media_items_created=1,
+        ),
+        LegacySourceImportChunk(
+            rows=[_legacy_row(source_event_id="evt-3", watched_at=base.replace(day=3))],
+            shows_created=1,
+        ),
+    ]
+
+    result = WatchEventImportService.run_legacy_source_import_stream(
+        session_obj,
+        options=LegacySourceWatchEventImportOptions(mode=ImportMode.bootstrap),
+        chunks=iter(chunks),
+    )
+
+    assert len(started) == 1
+    assert created == ["evt-1", "evt-2", "evt-3"]
+    assert result.status == "completed"
+    assert result.processed_count == 3
+    assert result.inserted_count == 3
+    assert result.rejected_before_import == 3
+    assert result.media_items_created == 1
+    assert result.shows_created == 1
+    assert finished[0]["parameters_patch"]["rejected_before_import"] == 3
+
+
+def test_run_legacy_source_import_stream_rejects_empty_input_before_batch(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: (_ for _ in ()).throw(
+            AssertionError("No batch expected")
+        ),
+    )
+
+    with pytest.raises(ValueError, match="No valid rows"):
+        WatchEventImportService.run_legacy_source_import_stream(
+            object(),
+            options=LegacySourceWatchEventImportOptions(mode=ImportMode.bootstrap),
+            chunks=iter([LegacySourceImportChunk(rows=[], rejected_before_import=2)]),
+        )
+
+
+def test_run_legacy_source_import_stream_marks_batch_failed_on_invalid_chunk(
+    monkeypatch,
+) -> None:
+    session_obj = Mock()
+    batch_id = uuid4()
+    finished: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fake_finish_import_batch(_session: Session, **kwargs):
+        finished.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs["status"])
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        lambda _session, **_kwargs: WatchEventCreateResult(
+            watch_event=Mock(), created=True
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+
+    chunks = [
+        LegacySourceImportChunk(
+            rows=[_legacy_row(source_event_id="evt-1", watched_at=datetime.now(UTC))]
+        ),
+        LegacySourceImportChunk(rows=[{"player": "legacy_backup"}]),
+    ]
+
+    with pytest.raises(WatchEventImportFailedError) as exc_info:
+        WatchEventImportService.run_legacy_source_import_stream(
+            session_obj,
+            options=LegacySourceWatchEventImportOptions(mode=ImportMode.bootstrap),
+            chunks=iter(chunks),
+        )
+
+    assert exc_info.value.import_batch_id == batch_id
+    assert isinstance(exc_info.value.__cause__, ValidationError)
+    session_obj.rollback.assert_called_once()
+    assert finished[0]["status"] == "failed"
+    assert finished[0]["watch_events_inserted"] == 1
+    assert finished[0]["parameters_patch"]["cursor"] is None
+
+
+def test_run_import_commit_every_writes_checkpoints(monkeypatch) -> None:
+    session_obj = object()
+    batch_id = uuid4()
+    started: list[dict] = []
+    progress: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+
+    def fake_start_import_batch(_session: Session, **kwargs):
+        started.append(kwargs)
+        return DummyBatch(batch_id)
+
+    def fake_update_import_batch_progress(_session: Session, **kwargs):
+        progress.append(kwargs)
+        return DummyBatch(batch_id)
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        fake_start_import_batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.update_import_batch_progress",
+        fake_update_import_batch_progress,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        lambda _session, **_kwargs: WatchEventCreateResult(
+            watch_event=Mock(), created=True
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: DummyBatch(batch_id, status=kwargs["status"]),
+    )
+
+    payload = _payload().model_copy(update={"commit_every": 1})
+    result = WatchEventImportService.run_import(session_obj, payload=payload)
+
+    assert result.inserted_count == 2
+    assert started[0]["parameters"]["commit_every"] == 1
+    checkpoints = [call["parameters_patch"]["checkpoint"] for call in progress]
+    assert [checkpoint["row_index"] for checkpoint in checkpoints] == [1, 2]
+    assert [checkpoint["inserted_count"] for checkpoint in checkpoints] == [1, 2]
+    assert checkpoints[-1]["cursor"] == result.cursor_after
+    assert checkpoints[-1]["rejected_before_import"] == 1
+
+
+def test_run_import_claims_queued_batch_and_publishes_progress(monkeypatch) -> None:
+    session_obj = object()
+    batch_id = uuid4()
+    progress: list[dict] = []
+    finished: list[dict] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "queued") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+            self.source = "legacy_source_export"
+
+    def fake_update_import_batch_progress(_session: Session, **kwargs):
+        progress.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs.get("status", "running"))
+
+    def fake_finish_import_batch(_session: Session, **kwargs):
+        finished.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs["status"])
+
+    def fail_start_import_batch(_session: Session, **_kwargs):
+        raise AssertionError("a queued batch must be claimed, not started")
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        fail_start_import_batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.update_import_batch_progress",
+        fake_update_import_batch_progress,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        lambda _session, **_kwargs: WatchEventCreateResult(
+            watch_event=Mock(), created=True
+        ),
+    )
+
+    payload = _payload().model_copy(update={"commit_every": 1})
+    result = WatchEventImportService.run_import(
+        session_obj, payload=payload, import_batch_id=batch_id
+    )
+
+    assert result.import_batch_id == batch_id
+    assert progress[0]["parameters_patch"]["commit_every"] == 1
+    published = [call["parameters_patch"]["progress"] for call in progress[1:]]
+    assert [item["processed_count"] for item in published] == [1, 2]
+    assert [item["total_count"] for item in published] == [2, 2]
+    assert published[0]["eta_seconds"] is not None
+    assert published[-1]["eta_seconds"] == 0
+    assert finished[0]["parameters_patch"]["progress"]["inserted_count"] == 2
+
+
+def test_run_import_rejects_batch_that_is_not_queued(monkeypatch) -> None:
+    class DummyBatch:
+        source = "legacy_source_export"
+        status = "running"
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(),
+    )
+
+    with pytest.raises(ValueError, match="not queued"):
+        WatchEventImportService.run_import(
+            object(), payload=_payload(), import_batch_id=uuid4()
+        )
+
+
+def test_run_import_resumes_from_checkpoint_without_rescanning(
+    monkeypatch, batch_locks
+) -> None:
+    session_obj = object()
+    batch_id = uuid4()
+    created: list[str] = []
+    finished: list[dict] = []
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "running") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+            self.source = "legacy_source_export"
+            self.parameters = {
+                "cursor_before": None,
+                "commit_every": 1,
+                "checkpoint": {
+                    "row_index": 1,
+                    "chunk_start": 0,
+                    "chunk_end": 2,
+                    "input_digest": input_digest,
+                    "cursor": {
+                        "watched_at": "2024-01-01T00:00:00Z",
+                        "source_event_id": "evt-1",
+                    },
+                    "inserted_count": 1,
+                    "skipped_count": 0,
+                    "collision_deduped_count": 0,
+                    "error_count": 0,
+                    "rejected_before_import": 1,
+                    "media_items_created": 0,
+                    "shows_created": 0,
+                },
+            }
+
+    def fake_create_watch_event(_session: Session, **kwargs):
+        created.append(kwargs["source_event_id"])
+        return WatchEventCreateResult(watch_event=Mock(), created=True)
+
+    def fake_finish_import_batch(_session: Session, **kwargs):
+        finished.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs["status"])
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id, "failed"),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.start_import_batch",
+        lambda _session, **_kwargs: (_ for _ in ()).throw(
+            AssertionError("A resumed run must reuse its batch")
+        ),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.update_import_batch_progress",
+        lambda _session, **_kwargs: DummyBatch(batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        fake_create_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        fake_finish_import_batch,
+    )
+
+    payload = _payload().model_copy(
+        update={
+            "resume_import_batch_id": batch_id,
+            "events": [
+                _payload()
+                .events[0]
+                .model_copy(
+                    update={
+                        "source_event_id": "evt-2",
+                        "watched_at": base.replace(day=2),
+                    }
+                ),
+                _payload()
+                .events[0]
+                .model_copy(update={"source_event_id": "evt-1", "watched_at": base}),
+            ],
+        }
+    )
+    input_digest = hashlib.sha256(
+        WatchEventImportService._digest_input(payload.events)
+    ).hexdigest()
+    result = WatchEventImportService.run_import(session_obj, payload=payload)
+
+    assert created == ["evt-2"]
+    assert result.import_batch_id == batch_id
+    assert result.processed_count == 2
+    assert result.inserted_count == 2
+    assert result.rejected_before_import == 1
+    assert result.cursor_after["source_event_id"] == "evt-2"
+    assert finished[0]["watch_events_inserted"] == 2
+    assert batch_locks == [batch_id]
+
+
+def test_run_import_resumes_queued_batch_as_a_fresh_claim(
+    monkeypatch, batch_locks
+) -> None:
+    batch_id = uuid4()
+    progress: list[dict] = []
+    created: list[str] = []
+
+    class DummyBatch:
+        def __init__(self, import_batch_id: UUID, status: str = "queued") -> None:
+            self.import_batch_id = import_batch_id
+            self.status = status
+            self.source = "legacy_source_export"
+            self.parameters = {"mode": "bootstrap", "background": True}
+
+    def fake_update_import_batch_progress(_session: Session, **kwargs):
+        progress.append(kwargs)
+        return DummyBatch(batch_id, status=kwargs.get("status", "running"))
+
+    def fake_create_watch_event(_session: Session, **kwargs):
+        created.append(kwargs["source_event_id"])
+        return WatchEventCreateResult(watch_event=Mock(), created=True)
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: DummyBatch(import_batch_id),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.update_import_batch_progress",
+        fake_update_import_batch_progress,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: DummyBatch(batch_id, status=kwargs["status"]),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        fake_create_watch_event,
+    )
+
+    payload = _payload().model_copy(update={"resume_import_batch_id": batch_id})
+    result = WatchEventImportService.run_import(object(), payload=payload)
+
+    assert result.import_batch_id == batch_id
+    assert result.inserted_count == 2
+    assert len(created) == 2
+    assert progress[0]["watch_events_inserted"] == 0
+    assert progress[0]["parameters_patch"]["mode"] == "bootstrap"
+    assert batch_locks == [batch_id]
+
+
+def _resume_with_checkpoint(monkeypatch, checkpoint: dict) -> list[dict]:
+    finished: list[dict] = []
+    batch = Mock(
+        source="legacy_source_export",
+        status="failed",
+        parameters={"cursor_before": None, "commit_every": 1, "checkpoint": checkpoint},
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.update_import_batch_progress",
+        lambda _session, **_kwargs: batch,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.finish_import_batch",
+        lambda _session, **kwargs: finished.append(kwargs),
+    )
+    monkeypatch.setattr(
+        "app.services.imports.WatchEventService.create_watch_event",
+        Mock(side_effect=AssertionError("a mismatched resume must not import")),
+    )
+    return finished
+
+
+def test_run_import_refuses_resume_split_into_different_chunks(monkeypatch) -> None:
+    payload = _payload().model_copy(update={"resume_import_batch_id": uuid4()})
+    # The same two rows, checkpointed by an upload after its first one-row
+    # chunk, resumed from the CLI, which orders the whole file as one chunk.
+    finished = _resume_with_checkpoint(
+        monkeypatch,
+        {
+            "row_index": 1,
+            "chunk_start": 0,
+            "chunk_end": 1,
+            "input_digest": hashlib.sha256(
+                WatchEventImportService._digest_input(payload.events[:1])
+            ).hexdigest(),
+        },
+    )
+
+    with pytest.raises(WatchEventImportFailedError, match="does not match"):
+        WatchEventImportService.run_import(Mock(), payload=payload)
+
+    assert finished[0]["status"] == "failed"
+
+
+def test_run_import_refuses_resume_with_different_rows(monkeypatch) -> None:
+    _resume_with_checkpoint(
+        monkeypatch,
+        {
+            "row_index": 1,
+            "chunk_start": 0,
+            "chunk_end": 2,
+            "input_digest": hashlib.sha256(b"another file").hexdigest(),
+        },
+    )
+    payload = _payload().model_copy(update={"resume_import_batch_id": uuid4()})
+
+    with pytest.raises(WatchEventImportFailedError, match="does not match"):
+        WatchEventImportService.run_import(Mock(), payload=payload)
+
+
+def test_run_import_refuses_to_resume_finished_batch(monkeypatch) -> None:
+    batch = Mock(source="legacy_source_export", status="completed")
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        lambda _session, *, import_batch_id: batch,
+    )
+
+    payload = _payload().model_copy(update={"resume_import_batch_id": uuid4()})
+    with pytest.raises(ValueError, match="cannot be resumed"):
+        WatchEventImportService.run_import(object(), payload=payload)
+
+
+def test_run_import_refuses_to_resume_batch_owned_by_live_run(monkeypatch) -> None:
+    @contextmanager
+    def locked_elsewhere(_session, *, import_batch_id):
+        raise ImportBatchLockedError(
+            f"Import batch {import_batch_id} is being processed by another run"
+        )
+        yield
+
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.hold_import_batch_lock",
+        locked_elsewhere,
+    )
+    monkeypatch.setattr(
+        "app.services.imports.ImportBatchService.get_import_batch",
+        Mock(side_effect=AssertionError("the checkpoint is read only under the lock")),
+    )
+
+    payload = _payload().model_copy(update={"resume_import_batch_id": uuid4()})
+    with pytest.raises(ImportBatchLockedError, match="another run"):
+        WatchEventImportService.run_import(object(), payload=payload)
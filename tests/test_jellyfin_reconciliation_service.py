@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from app.core.dedupe import watch_event_dedupe_hash
 from app.schemas.jellyfin_integration import JellyfinReconcileRequest
 from app.services.jellyfin import JellyfinConfigurationError, JellyfinPlayedItem
 from app.services.jellyfin_reconciliation import JellyfinReconciliationService
@@ -59,6 +60,10 @@ def _install_user_and_cursor(monkeypatch, *, latest_batch=None):
         "app.services.jellyfin_reconciliation.ImportBatchService.get_latest_completed_import_batch_for_source",
         lambda *_args, **_kwargs: latest_batch,
     )
+    monkeypatch.setattr(
+        "app.services.jellyfin_reconciliation.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     return user
 
 
@@ -175,6 +180,49 @@ def test_reconcile_matches_existing_watch_at_playback_stop(monkeypatch) -> None:
     assert captured["collision_window_after_seconds"] == 3900
 
 
+def test_reconcile_probes_dedupe_hash_before_collision_window(monkeypatch) -> None:
+    session = Mock()
+    now = datetime(2026, 8, 20, 12, tzinfo=UTC)
+    user = _install_user_and_cursor(monkeypatch)
+    media_item = SimpleNamespace(media_item_id=uuid4())
+    probed: list[str] = []
+    monkeypatch.setattr(
+        "app.services.jellyfin_reconciliation.media_item_repository.find_media_item_by_jellyfin_item_id",
+        lambda *_args, **_kwargs: media_item,
+    )
+
+    def find_by_hash(_session, *, dedupe_hash):
+        probed.append(dedupe_hash)
+        return SimpleNamespace(watch_id=uuid4())
+
+    monkeypatch.setattr(
+        "app.services.jellyfin_reconciliation.watch_event_repository.get_watch_event_by_dedupe_hash",
+        find_by_hash,
+    )
+    monkeypatch.setattr(
+        "app.services.jellyfin_reconciliation.watch_event_repository.find_matching_watch_event",
+        Mock(side_effect=AssertionError("hash hits skip the window search")),
+    )
+
+    result = JellyfinReconciliationService.run(
+        session,
+        payload=JellyfinReconcileRequest(klug_user_id=user.user_id, dry_run=True),
+        client=DummyClient([_played_item()]),
+        now=now,
+    )
+
+    assert result.already_present_count == 1
+    assert probed == [
+        watch_event_dedupe_hash(
+            user_id=user.user_id,
+            media_item_id=media_item.media_item_id,
+            playback_source="jellyfin",
+            completed=True,
+            watched_at=datetime(2026, 8, 19, 12, tzinfo=UTC),
+        )
+    ]
+
+
 def test_completed_cursor_uses_five_minute_overlap(monkeypatch) -> None:
     session = Mock()
     now = datetime(2026, 8, 20, 12, tzinfo=UTC)
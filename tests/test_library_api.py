@@ -98,3 +98,28 @@ def test_list_library_shows_returns_rows(monkeypatch) -> None:
     payload = response.json()
     assert payload[0]["title"] == "Severance"
     assert payload[0]["watched_percent"] == "52.63"
+
+
+def test_list_library_movies_returns_sparse_fieldset(monkeypatch) -> None:
+    called: dict[str, object] = {}
+
+    def fake_list_movies(_session, **kwargs):
+        called.update(kwargs)
+        return [{"title": "Alien", "watch_count": 2}]
+
+    monkeypatch.setattr(LibraryService, "list_movies", fake_list_movies)
+
+    client = TestClient(app)
+    response = client.get("/api/v1/library/movies?fields=title,watch_count")
+
+    assert response.status_code == 200
+    assert called["fields"] == frozenset({"title", "watch_count"})
+    assert response.json() == [{"title": "Alien", "watch_count": 2}]
+
+
+def test_list_library_shows_rejects_unknown_fields() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/library/shows?fields=title,rating")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown fields: rating"
@@ -61,6 +61,38 @@ def test_list_playback_events_returns_items(monkeypatch) -> None:
     assert payload[0]["payload"]["state"] == "stopped"
 
 
+def test_list_playback_events_returns_sparse_fieldset(monkeypatch) -> None:
+    called: dict[str, object] = {}
+    occurred_at = datetime(2026, 2, 1, 21, 0, tzinfo=UTC)
+
+    def fake_list_playback_events(_session, **kwargs):
+        called.update(kwargs)
+        return [{"title": "The Matrix", "occurred_at": occurred_at}]
+
+    monkeypatch.setattr(
+        PlaybackEventService,
+        "list_playback_events",
+        fake_list_playback_events,
+    )
+
+    client = TestClient(app)
+    response = client.get("/api/v1/playback-events?fields=title,occurred_at")
+
+    assert response.status_code == 200
+    assert called["fields"] == frozenset({"title", "occurred_at"})
+    assert response.json() == [
+        {"occurred_at": "2026-02-01T21:00:00Z", "title": "The Matrix"}
+    ]
+
+
+def test_list_playback_events_rejects_unknown_fields() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/playback-events?fields=bogus")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown fields: bogus"
+
+
 def test_list_playback_events_forwards_filters(monkeypatch) -> None:
     event = DummyPlaybackEvent()
     called: dict[str, object] = {}
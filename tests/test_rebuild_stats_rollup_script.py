@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+from app.scripts import rebuild_stats_rollup
+
+
+class DummySession:
+    def close(self) -> None:
+        return None
+
+
+def test_run_rebuilds_each_user_with_rollup_data(monkeypatch, capsys) -> None:
+    user_ids = [uuid4(), uuid4()]
+    rebuilt: list = []
+
+    def fake_rebuild(_session, *, user_id):
+        rebuilt.append(user_id)
+        return 3
+
+    monkeypatch.setattr(rebuild_stats_rollup, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        rebuild_stats_rollup.StatsService,
+        "list_rollup_user_ids",
+        lambda _session: user_ids,
+    )
+    monkeypatch.setattr(
+        rebuild_stats_rollup.StatsService, "rebuild_rollups", fake_rebuild
+    )
+
+    exit_code = rebuild_stats_rollup.run([])
+
+    assert exit_code == 0
+    assert rebuilt == user_ids
+    assert "Rebuilt 6 rollup buckets across 2 users." in (capsys.readouterr().out)
+
+
+def test_run_with_user_id_only_rebuilds_that_user(monkeypatch) -> None:
+    user_id = uuid4()
+    rebuilt: list = []
+
+    def fake_rebuild(_session, *, user_id):
+        rebuilt.append(user_id)
+        return 1
+
+    def fail_list(_session):
+        raise AssertionError("user ids should not be listed")
+
+    monkeypatch.setattr(rebuild_stats_rollup, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        rebuild_stats_rollup.StatsService, "list_rollup_user_ids", fail_list
+    )
+    monkeypatch.setattr(
+        rebuild_stats_rollup.StatsService, "rebuild_rollups", fake_rebuild
+    )
+
+    assert rebuild_stats_rollup.run(["--user-id", str(user_id)]) == 0
+    assert rebuilt == [user_id]
+
+
+def test_run_invalid_user_id_returns_2() -> None:
+    assert rebuild_stats_rollup.run(["--user-id", "not-a-uuid"]) == 2
@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+from app.scripts import recompute_rewatch_flags
+
+
+class DummySession:
+    def close(self) -> None:
+        return None
+
+
+def test_run_recomputes_users_in_chunks(monkeypatch, capsys) -> None:
+    user_ids = [uuid4() for _ in range(5)]
+    chunks: list[dict] = []
+
+    def fake_recompute(_session, *, user_ids, dry_run):
+        chunks.append({"user_ids": user_ids, "dry_run": dry_run})
+        return len(user_ids)
+
+    monkeypatch.setattr(recompute_rewatch_flags, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        recompute_rewatch_flags.WatchEventService,
+        "list_watch_event_user_ids",
+        lambda _session: user_ids,
+    )
+    monkeypatch.setattr(
+        recompute_rewatch_flags.WatchEventService,
+        "recompute_rewatch_flags_for_users",
+        fake_recompute,
+    )
+
+    exit_code = recompute_rewatch_flags.run(["--users-per-chunk", "2"])
+
+    assert exit_code == 0
+    assert [chunk["user_ids"] for chunk in chunks] == [
+        user_ids[0:2],
+        user_ids[2:4],
+        user_ids[4:5],
+    ]
+    assert all(chunk["dry_run"] is False for chunk in chunks)
+    assert "Changed rewatch flags on 5 watch events across 5 users." in (
+        capsys.readouterr().out
+    )
+
+
+def test_run_dry_run_reports_would_change(monkeypatch, capsys) -> None:
+    dry_runs: list[bool] = []
+
+    def fake_recompute(_session, *, user_ids, dry_run):
+        dry_runs.append(dry_run)
+        return 3
+
+    monkeypatch.setattr(recompute_rewatch_flags, "SessionLocal", DummySession)
+    monkeypatch.setattr(
+        recompute_rewatch_flags.WatchEventService,
+        "list_watch_event_user_ids",
+        lambda _session: [uuid4()],
+    )
+    monkeypatch.setattr(
+        recompute_rewatch_flags.WatchEventService,
+        "recompute_rewatch_flags_for_users",
+        fake_recompute,
+    )
+
+    exit_code = recompute_rewatch_flags.run(["--dry-run"])
+
+    assert exit_code == 0
+    assert dry_runs == [True]
+    assert "Would change rewatch flags on 3 watch events across 1 users." in (
+        capsys.readouterr().out
+    )
+
+
+def test_run_invalid_users_per_chunk_returns_2() -> None:
+    assert recompute_rewatch_flags.run(["--users-per-chunk", "0"]) == 2
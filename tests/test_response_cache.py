@@ -0,0 +1,52 @@
+from app.core.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+    strong_etag,
+)
+
+
+def _entry(body: bytes) -> CachedResponse:
+    return CachedResponse(body=body, headers=(), etag=strong_etag(body))
+
+
+def test_cache_evicts_least_recently_used_entries_over_the_byte_cap() -> None:
+    cache = ResponseCache(max_bytes=25)
+    cache.put("a", _entry(b"a" * 10))
+    cache.put("b", _entry(b"b" * 10))
+    assert cache.get("a") is not None
+
+    cache.put("c", _entry(b"c" * 10))
+
+    assert cache.get("b") is None
+    assert [cache.get(key).body[:1] for key in ("a", "c")] == [b"a", b"c"]
+    assert cache.size == 20
+
+
+def test_cache_replaces_entries_and_skips_oversized_ones() -> None:
+    cache = ResponseCache(max_bytes=25)
+    cache.put("a", _entry(b"a" * 10))
+    cache.put("a", _entry(b"A" * 5))
+    cache.put("huge", _entry(b"h" * 26))
+
+    assert len(cache) == 1
+    assert cache.get("a").body == b"AAAAA"
+    assert cache.size == 5
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = ResponseCache(max_bytes=0)
+    cache.put("a", _entry(b""))
+
+    assert not cache.enabled
+    assert cache.get("a") is None
+
+
+def test_etag_matches_lists_weak_tags_and_wildcards() -> None:
+    etag = strong_etag(b"payload")
+
+    assert etag == strong_etag(b"payload") != strong_etag(b"other")
+    assert etag_matches(f'"nope", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"nope"', etag)
+    assert not etag_matches(None, etag)
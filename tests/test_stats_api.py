@@ -1,11 +1,13 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from fastapi.testclient import TestClient
 
 from app.core.config import get_settings
+from app.core.response_cache import get_response_cache
 from app.main import app
+from app.services.data_generations import DataGenerationService
 from app.services.stats import StatsService
 
 
@@ -94,6 +96,128 @@ def test_stats_horrorfest_endpoint_returns_rows(monkeypatch) -> None:
     assert response.json()[0]["entry_count"] == 12
 
 
+def test_stats_timeseries_endpoint_forwards_filters(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    captured = {}
+
+    def fake_time_series(_session, **kwargs):
+        captured.update(kwargs)
+        return {
+            **kwargs,
+            "points": [
+                {
+                    "period_start": date(2026, 3, 2),
+                    "period_end": date(2026, 3, 8),
+                    "watch_count": 2,
+                    "movie_count": 2,
+                    "episode_count": 0,
+                    "rewatch_count": 0,
+                    "rated_watch_count": 1,
+                    "total_runtime_seconds": 12000,
+                    "average_rating_value": Decimal("7.00"),
+                }
+            ],
+        }
+
+    monkeypatch.setattr(StatsService, "get_time_series", fake_time_series)
+    client = TestClient(app)
+    response = client.get(
+        "/api/v1/stats/timeseries?granularity=week&media_type=movie"
+        "&local_date_from=2026-03-01&local_date_to=2026-03-08"
+    )
+
+    assert response.status_code == 200
+    assert captured == {
+        "user_id": None,
+        "granularity": "week",
+        "local_date_from": date(2026, 3, 1),
+        "local_date_to": date(2026, 3, 8),
+        "media_type": "movie",
+    }
+    assert response.json()["points"][0]["period_end"] == "2026-03-08"
+
+
+def test_stats_timeseries_defaults_open_range_to_rollup_dates(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    captured = {}
+
+    def fake_list(_session, **kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(
+        "app.services.stats.stats_repository.get_daily_rollup_date_range",
+        lambda _session, **_kwargs: (date(2025, 10, 1), date(2026, 2, 14)),
+    )
+    monkeypatch.setattr(
+        "app.services.stats.stats_repository.list_time_series_stats", fake_list
+    )
+    client = TestClient(app)
+    response = client.get("/api/v1/stats/timeseries?local_date_to=2026-01-31")
+
+    assert response.status_code == 200
+    assert response.json()["local_date_from"] == "2025-10-01"
+    assert (captured["granularity"], captured["local_date_to"]) == (
+        "month",
+        date(2026, 1, 31),
+    )
+
+
+def test_stats_timeseries_fills_open_end_beyond_rollup_dates(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    ranges: list[tuple[date, date]] = []
+
+    def fake_list(_session, **kwargs):
+        ranges.append((kwargs["local_date_from"], kwargs["local_date_to"]))
+        return []
+
+    monkeypatch.setattr(
+        "app.services.stats.stats_repository.get_daily_rollup_date_range",
+        lambda _session, **_kwargs: (date(2025, 10, 1), date(2026, 2, 14)),
+    )
+    monkeypatch.setattr(
+        "app.services.stats.stats_repository.list_time_series_stats", fake_list
+    )
+    client = TestClient(app)
+
+    after_last = client.get("/api/v1/stats/timeseries?local_date_from=2026-03-01")
+    before_first = client.get("/api/v1/stats/timeseries?local_date_to=2025-09-15")
+
+    assert after_last.status_code == before_first.status_code == 200
+    assert ranges == [
+        (date(2026, 3, 1), date(2026, 3, 1)),
+        (date(2025, 9, 15), date(2025, 9, 15)),
+    ]
+    assert after_last.json()["local_date_to"] == "2026-03-01"
+    assert before_first.json()["local_date_from"] == "2025-09-15"
+
+
+def test_stats_timeseries_rejects_invalid_ranges(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+
+    def fail_list(*_args, **_kwargs):
+        raise AssertionError("invalid ranges should not be queried")
+
+    monkeypatch.setattr(
+        "app.services.stats.stats_repository.list_time_series_stats", fail_list
+    )
+    client = TestClient(app)
+
+    reversed_range = client.get(
+        "/api/v1/stats/timeseries?local_date_from=2026-02-01&local_date_to=2026-01-01"
+    )
+    too_many_days = client.get(
+        "/api/v1/stats/timeseries?granularity=day"
+        "&local_date_from=2020-01-01&local_date_to=2026-01-01"
+    )
+    unknown_granularity = client.get("/api/v1/stats/timeseries?granularity=hour")
+
+    assert reversed_range.status_code == 422
+    assert too_many_days.status_code == 422
+    assert "day periods" in too_many_days.json()["detail"]
+    assert unknown_granularity.status_code == 422
+
+
 def test_stats_endpoints_forward_user_id(monkeypatch) -> None:
     _set_permissive_auth(monkeypatch)
     user_id = uuid4()
@@ -122,3 +246,82 @@ def test_stats_endpoints_forward_user_id(monkeypatch) -> None:
     response = client.get(f"/api/v1/stats/summary?user_id={user_id}")
     assert response.status_code == 200
     assert captured["user_id"] == user_id
+
+
+def _enable_response_cache(monkeypatch, generation: list[tuple[int, ...]]) -> None:
+    monkeypatch.setenv("KLUG_RESPONSE_CACHE_MAX_MB", "1")
+    get_settings.cache_clear()
+    get_response_cache.cache_clear()
+    monkeypatch.setattr(
+        DataGenerationService,
+        "get_generations",
+        lambda _session, *, user_id: generation[0],
+    )
+
+
+def test_stats_monthly_is_served_from_cache_until_generation_changes(
+    monkeypatch,
+) -> None:
+    _set_permissive_auth(monkeypatch)
+    generation = [(2, 7)]
+    _enable_response_cache(monkeypatch, generation)
+    calls: list[UUID | None] = []
+
+    def fake_monthly(_session, *, user_id):
+        calls.append(user_id)
+        return []
+
+    monkeypatch.setattr(StatsService, "list_monthly", fake_monthly)
+    client = TestClient(app)
+    user_id = uuid4()
+
+    first = client.get(f"/api/v1/stats/monthly?user_id={user_id}")
+    cached = client.get(f"/api/v1/stats/monthly?user_id={user_id}")
+    other_user = client.get(f"/api/v1/stats/monthly?user_id={uuid4()}")
+    # A lower generation committing late still changes the key.
+    generation[0] = (2, 5)
+    refreshed = client.get(f"/api/v1/stats/monthly?user_id={user_id}")
+
+    assert first.status_code == cached.status_code == 200
+    assert first.headers["etag"] == cached.headers["etag"] == refreshed.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert cached.json() == []
+    assert other_user.status_code == 200
+    assert len(calls) == 3
+
+
+def test_stats_summary_answers_matching_if_none_match_with_304(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    _enable_response_cache(monkeypatch, [1])
+    calls: list[UUID | None] = []
+
+    def fake_summary(_session, *, user_id):
+        calls.append(user_id)
+        return {
+            "user_id": user_id,
+            "total_active_watches": 1,
+            "total_completed_watches": 1,
+            "total_rewatches": 0,
+            "total_watch_time_seconds": 60,
+            "total_watch_time_hours": Decimal("0.02"),
+            "movie_watch_count": 1,
+            "episode_watch_count": 0,
+            "average_rating_value": None,
+            "unrated_completed_watch_count": 1,
+        }
+
+    monkeypatch.setattr(StatsService, "get_summary", fake_summary)
+    client = TestClient(app)
+
+    first = client.get("/api/v1/stats/summary")
+    not_modified = client.get(
+        "/api/v1/stats/summary", headers={"If-None-Match": first.headers["etag"]}
+    )
+    stale = client.get("/api/v1/stats/summary", headers={"If-None-Match": '"stale"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == first.headers["etag"]
+    assert stale.status_code == 200
+    assert stale.json()["total_active_watches"] == 1
+    assert calls == [None]
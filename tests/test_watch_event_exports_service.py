@@ -0,0 +1,126 @@
+import csv
+import gzip
+import io
+import json
+from collections import namedtuple
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.watch_events import WATCH_EVENT_EXPORT_FIELDS
+from app.schemas.imports import LegacySourceWatchEventRow
+from app.scripts import import_watch_events
+from app.services.watch_event_exports import WatchEventExportService
+
+ExportRow = namedtuple("ExportRow", WATCH_EVENT_EXPORT_FIELDS)
+
+
+def _export_row(**overrides) -> ExportRow:
+    values = dict.fromkeys(WATCH_EVENT_EXPORT_FIELDS)
+    values.update(
+        watch_id=uuid4(),
+        user_id=uuid4(),
+        media_item_id=uuid4(),
+        watched_at=datetime(2025, 10, 3, 22, 15, tzinfo=UTC),
+        player="jellyfin",
+        completed=True,
+        rewatch=False,
+        rating=Decimal("8.50"),
+        origin_kind="playback_event",
+        created_at=datetime(2025, 10, 3, 22, 16, tzinfo=UTC),
+        type="movie",
+        title="Alien",
+        year=1979,
+        tmdb_id=348,
+        horrorfest_year=2025,
+        horrorfest_watch_order=1,
+    )
+    values.update(overrides)
+    return ExportRow(**values)
+
+
+@pytest.fixture
+def export_batches(monkeypatch) -> list[dict]:
+    calls: list[dict] = []
+    batches = [
+        [_export_row(), _export_row(player="kodi", title="Aliens", rating=None)],
+        [_export_row(type="episode", title="Pilot", season_number=1)],
+    ]
+
+    def fake_iter(_session, **kwargs):
+        calls.append(kwargs)
+        yield from batches
+
+    monkeypatch.setattr(
+        "app.services.watch_event_exports.watch_event_repository.iter_watch_event_export_rows",
+        fake_iter,
+    )
+    return calls
+
+
+def _export(**kwargs) -> bytes:
+    options = {"user_id": None, "file_format": "ndjson", "compress": False}
+    options.update(kwargs)
+    return b"".join(WatchEventExportService.iter_export(object(), **options))
+
+
+def test_ndjson_export_writes_one_reimportable_row_per_line(export_batches) -> None:
+    lines = _export(batch_size=2).decode("utf-8").splitlines()
+
+    rows = [json.loads(line) for line in lines]
+    assert export_batches == [{"user_id": None, "batch_size": 2}]
+    assert [row["title"] for row in rows] == ["Alien", "Aliens", "Pilot"]
+    assert rows[0]["watched_at"] == "2025-10-03T22:15:00Z"
+    assert rows[0]["rating"] == "8.50"
+    assert rows[1]["rating"] is None
+    mapped = LegacySourceWatchEventRow.model_validate(rows[0])
+    assert (mapped.player, mapped.rating, mapped.horrorfest_year) == (
+        "jellyfin",
+        Decimal("8.50"),
+        2025,
+    )
+
+
+def test_csv_export_writes_header_and_blank_nulls(export_batches) -> None:
+    rows = list(csv.DictReader(io.StringIO(_export(file_format="csv").decode())))
+
+    assert list(rows[0]) == list(WATCH_EVENT_EXPORT_FIELDS)
+    assert [row["player"] for row in rows] == ["jellyfin", "kodi", "jellyfin"]
+    assert rows[0]["completed"] == "true"
+    assert rows[1]["rating"] == ""
+    assert rows[2]["season_number"] == "1"
+
+
+def test_gzip_export_round_trips_through_import_script(
+    export_batches, tmp_path: Path
+) -> None:
+    export_path = tmp_path / "history.ndjson.gz"
+    export_path.write_bytes(_export(compress=True))
+
+    file_format = import_watch_events._detect_format(export_path, "auto")
+    rows = import_watch_events._load_rows(export_path, file_format)
+
+    assert file_format == "ndjson"
+    assert [row["title"] for row in rows] == ["Alien", "Aliens", "Pilot"]
+    assert gzip.decompress(export_path.read_bytes()).count(b"\n") == 3
+
+
+def test_csv_export_of_empty_history_is_header_only(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "app.services.watch_event_exports.watch_event_repository.iter_watch_event_export_rows",
+        lambda *_args, **_kwargs: iter(()),
+    )
+
+    assert _export(file_format="csv").decode().splitlines() == [
+        ",".join(WATCH_EVENT_EXPORT_FIELDS)
+    ]
+
+
+def test_export_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported export format: xml"):
+        WatchEventExportService.iter_export(
+            object(), user_id=None, file_format="xml", compress=False
+        )
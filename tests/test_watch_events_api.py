@@ -6,9 +6,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.core.config import get_settings
+from app.core.pagination import WatchEventCursor
 from app.main import app
+from app.services.watch_event_exports import WatchEventExportService
 from app.services.watch_events import WatchEventConstraintError, WatchEventService
 from app.services.watch_events import WatchEventCreateResult
+from app.services.watch_events import WatchEventOperationResult
 
 
 class DummyWatchEvent:
@@ -163,6 +166,185 @@ def test_list_unrated_watch_events_returns_items(monkeypatch) -> None:
     assert response.json()[0]["rating_value"] is None
 
 
+def test_list_watch_events_sets_next_cursor_for_full_page(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    rows = [
+        {"watch_id": uuid4(), "watched_at": datetime(2026, 1, day, tzinfo=UTC)}
+        for day in (3, 2)
+    ]
+    monkeypatch.setattr(
+        WatchEventService,
+        "list_watch_events",
+        lambda _session, **_kwargs: [
+            {**vars(DummyWatchEvent()), **row} for row in rows
+        ],
+    )
+
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events?limit=2")
+
+    assert response.status_code == 200
+    cursor = WatchEventCursor.decode(response.headers["X-Next-Cursor"])
+    assert cursor.watch_id == rows[-1]["watch_id"]
+    assert cursor.watched_at == rows[-1]["watched_at"]
+
+
+def test_list_watch_events_omits_next_cursor_for_short_page(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    monkeypatch.setattr(
+        WatchEventService,
+        "list_watch_events",
+        lambda _session, **_kwargs: [DummyWatchEvent()],
+    )
+
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events?limit=2")
+
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_unrated_watch_events_invalid_cursor_returns_422(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events/unrated?cursor=bogus")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "cursor is invalid"
+
+
+def test_list_watch_events_returns_sparse_fieldset(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    called: dict[str, object] = {}
+    rows = [
+        {
+            "watch_id": uuid4(),
+            "watched_at": datetime(2026, 1, day, tzinfo=UTC),
+            "display_title": f"Movie {day}",
+            "user_timezone": "UTC",
+        }
+        for day in (3, 2)
+    ]
+
+    def fake_list_watch_events(_session, **kwargs):
+        called.update(kwargs)
+        return rows
+
+    monkeypatch.setattr(WatchEventService, "list_watch_events", fake_list_watch_events)
+
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events?limit=2&fields=display_title")
+
+    assert response.status_code == 200
+    assert called["fields"] == frozenset({"display_title"})
+    assert response.json() == [
+        {"display_title": "Movie 3"},
+        {"display_title": "Movie 2"},
+    ]
+    cursor = WatchEventCursor.decode(response.headers["X-Next-Cursor"])
+    assert cursor.watch_id == rows[-1]["watch_id"]
+
+
+def test_list_unrated_watch_events_rejects_unknown_fields() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events/unrated?fields=watch_id,secret")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown fields: secret"
+
+
+def test_export_watch_events_streams_gzipped_csv(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    user_id = uuid4()
+    called: dict[str, object] = {}
+
+    def fake_iter_export(_session, **kwargs):
+        called.update(kwargs)
+        return iter([b"watch_id\n", b"abc\n"])
+
+    monkeypatch.setattr(WatchEventExportService, "iter_export", fake_iter_export)
+
+    client = TestClient(app)
+    response = client.get(
+        f"/api/v1/watch-events/export?user_id={user_id}&file_format=csv&gzip=true"
+    )
+
+    assert response.status_code == 200
+    assert called == {"user_id": user_id, "file_format": "csv", "compress": True}
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].startswith(
+        'attachment; filename="klug-watch-history-'
+    )
+    assert response.headers["content-disposition"].endswith('.csv.gz"')
+    assert response.content == b"watch_id\nabc\n"
+
+
+def test_export_watch_events_rejects_unknown_format() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/watch-events/export?file_format=xml")
+    assert response.status_code == 422
+
+
+def test_apply_watch_event_batch_reports_per_item_results(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+    deleted = DummyWatchEvent()
+    deleted.is_deleted = True
+    missing_id = uuid4()
+    called: dict[str, object] = {}
+
+    def fake_apply(_session, **kwargs):
+        called.update(kwargs)
+        return [
+            WatchEventOperationResult(
+                action="delete", watch_id=deleted.watch_id, watch_event=deleted
+            ),
+            WatchEventOperationResult(
+                action="delete",
+                watch_id=missing_id,
+                error=f"Watch event '{missing_id}' not found",
+            ),
+        ]
+
+    monkeypatch.setattr(WatchEventService, "apply_watch_event_operations", fake_apply)
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/watch-events/batch",
+        json={
+            "updated_by": "operator",
+            "operations": [
+                {"action": "delete", "watch_id": str(deleted.watch_id)},
+                {"action": "delete", "watch_id": str(missing_id)},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert (payload["applied_count"], payload["rejected_count"]) == (1, 1)
+    assert payload["results"][0]["status"] == "applied"
+    assert payload["results"][0]["watch_event"]["is_deleted"] is True
+    assert payload["results"][1]["status"] == "rejected"
+    assert payload["results"][1]["watch_event"] is None
+    assert called["operations"][1].watch_id == missing_id
+
+
+def test_apply_watch_event_batch_rejects_unknown_action(monkeypatch) -> None:
+    _set_permissive_auth(monkeypatch)
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/watch-events/batch",
+        json={
+            "updated_by": "operator",
+            "operations": [{"action": "merge", "watch_id": str(uuid4())}],
+        },
+    )
+
+    assert response.status_code == 422
+
+
 def test_list_watch_events_returns_enriched_media_fields(monkeypatch) -> None:
     _set_permissive_auth(monkeypatch)
     watch_id = uuid4()
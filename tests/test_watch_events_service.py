@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import Mock
 from uuid import uuid4
@@ -6,9 +6,12 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.core.dedupe import watch_event_dedupe_hash
+from app.core.pagination import WatchEventCursor
 from app.services.watch_events import (
     WatchEventConstraintError,
     WatchEventCreateResult,
+    WatchEventOperation,
     WatchEventService,
 )
 
@@ -29,6 +32,10 @@ def test_create_watch_event_normalizes_input(monkeypatch) -> None:
         "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
         lambda *_args, **_kwargs: None,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.find_matching_watch_event",
         lambda *_args, **_kwargs: None,
@@ -51,7 +58,7 @@ def test_create_watch_event_normalizes_input(monkeypatch) -> None:
         fake_create_watch_event,
     )
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         lambda *_args, **_kwargs: None,
     )
 
@@ -128,6 +135,10 @@ def test_create_watch_event_integrity_error_maps_to_domain_error(monkeypatch) ->
         "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
         lambda *_args, **_kwargs: None,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.find_matching_watch_event",
         lambda *_args, **_kwargs: None,
@@ -173,6 +184,10 @@ def test_create_watch_event_marks_rewatch_when_prior_watch_exists(monkeypatch) -
         "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
         lambda *_args, **_kwargs: None,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.find_matching_watch_event",
         lambda *_args, **_kwargs: None,
@@ -191,7 +206,7 @@ def test_create_watch_event_marks_rewatch_when_prior_watch_exists(monkeypatch) -
         fake_create_watch_event,
     )
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         lambda *_args, **_kwargs: None,
     )
 
@@ -220,13 +235,20 @@ def test_create_watch_event_recomputes_media_timeline_after_insert(monkeypatch)
     session = Mock()
     media_item_id = uuid4()
     user_id = uuid4()
-    inserted_event = Mock(user_id=user_id, media_item_id=media_item_id)
+    watched_at = datetime.now(UTC)
+    inserted_event = Mock(
+        user_id=user_id, media_item_id=media_item_id, watched_at=watched_at
+    )
     recompute = Mock()
 
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
         lambda *_args, **_kwargs: None,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.find_matching_watch_event",
         lambda *_args, **_kwargs: None,
@@ -240,7 +262,7 @@ def test_create_watch_event_recomputes_media_timeline_after_insert(monkeypatch)
         lambda *_args, **_kwargs: inserted_event,
     )
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         recompute,
     )
 
@@ -248,7 +270,7 @@ def test_create_watch_event_recomputes_media_timeline_after_insert(monkeypatch)
         session,
         user_id=user_id,
         media_item_id=media_item_id,
-        watched_at=datetime.now(UTC),
+        watched_at=watched_at,
         playback_source="manual",
         total_seconds=None,
         watched_seconds=None,
@@ -265,7 +287,169 @@ def test_create_watch_event_recomputes_media_timeline_after_insert(monkeypatch)
         session,
         user_id=user_id,
         media_item_id=media_item_id,
+        watch_event=inserted_event,
+        edit_points=[watched_at],
+    )
+    session.commit.assert_called_once()
+
+
+def test_create_watch_event_defer_rewatch_skips_timeline_queries(monkeypatch) -> None:
+    session = Mock()
+    inserted_event = Mock()
+    recompute = Mock()
+
+    def fail_prior_watch_event_exists(*_args, **_kwargs):
+        raise AssertionError("deferred creates must not look up prior watches")
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.find_matching_watch_event",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.prior_watch_event_exists",
+        fail_prior_watch_event_exists,
+    )
+
+    def fake_create_watch_event(_session, **kwargs):
+        assert kwargs["rewatch"] is False
+        return inserted_event
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.create_watch_event",
+        fake_create_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
+        recompute,
+    )
+
+    result = WatchEventService.create_watch_event(
+        session,
+        user_id=uuid4(),
+        media_item_id=uuid4(),
+        watched_at=datetime.now(UTC),
+        playback_source="legacy_backup",
+        total_seconds=None,
+        watched_seconds=None,
+        progress_percent=None,
+        completed=True,
+        rating_value=None,
+        rating_scale=None,
+        media_version_id=None,
+        source_event_id=None,
+        defer_rewatch=True,
+    )
+
+    assert result.created is True
+    recompute.assert_not_called()
+    session.commit.assert_called_once()
+
+
+def _timeline_watch(day: int, *, rewatch: bool, is_deleted: bool = False) -> Mock:
+    return Mock(
+        watch_id=uuid4(),
+        media_item_id=None,
+        watched_at=datetime(2026, 1, day, tzinfo=UTC),
+        rewatch=rewatch,
+        is_deleted=is_deleted,
+    )
+
+
+def test_refresh_rewatch_after_edit_demotes_displaced_first_watch(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    media_item_id = uuid4()
+    old_first = _timeline_watch(5, rewatch=False)
+    inserted = _timeline_watch(2, rewatch=True)
+    inserted.media_item_id = media_item_id
+    lookups: list[dict[str, object]] = []
+
+    def fake_first_active_watch_event(_session, **kwargs):
+        lookups.append(kwargs)
+        return inserted if kwargs.get("watched_from") is None else old_first
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.first_active_watch_event",
+        fake_first_active_watch_event,
+    )
+
+    WatchEventService._refresh_rewatch_after_edit(
+        session,
+        user_id=uuid4(),
+        media_item_id=media_item_id,
+        watch_event=inserted,
+        edit_points=[inserted.watched_at, inserted.watched_at],
+    )
+
+    assert inserted.rewatch is False
+    assert old_first.rewatch is True
+    assert len(lookups) == 2
+    assert lookups[1]["exclude_watch_id"] == inserted.watch_id
+
+
+def test_refresh_rewatch_after_edit_promotes_next_watch_after_delete(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    media_item_id = uuid4()
+    deleted = _timeline_watch(1, rewatch=False, is_deleted=True)
+    deleted.media_item_id = media_item_id
+    next_watch = _timeline_watch(3, rewatch=True)
+    later_watch = _timeline_watch(4, rewatch=True)
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.first_active_watch_event",
+        lambda *_args, **_kwargs: next_watch,
+    )
+
+    WatchEventService._refresh_rewatch_after_edit(
+        session,
+        user_id=uuid4(),
+        media_item_id=media_item_id,
+        watch_event=deleted,
+        edit_points=[deleted.watched_at],
+    )
+
+    assert deleted.rewatch is False
+    assert next_watch.rewatch is False
+    assert later_watch.rewatch is True
+    session.add.assert_called_once_with(next_watch)
+
+
+def test_recompute_rewatch_flags_dedupes_timelines_and_commits(monkeypatch) -> None:
+    session = Mock()
+    user_id = uuid4()
+    media_item_id = uuid4()
+    seen: list = []
+
+    def fake_recompute(_session, *, timelines):
+        seen.append(timelines)
+        return 3
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.recompute_rewatch_flags",
+        fake_recompute,
+    )
+
+    assert WatchEventService.recompute_rewatch_flags(session, timelines=[]) == 0
+    session.commit.assert_not_called()
+
+    updated = WatchEventService.recompute_rewatch_flags(
+        session,
+        timelines=[(user_id, media_item_id), (user_id, media_item_id)],
     )
+
+    assert updated == 3
+    assert seen == [[(user_id, media_item_id)]]
     session.commit.assert_called_once()
 
 
@@ -308,6 +492,10 @@ def test_create_watch_event_returns_existing_collision_match(monkeypatch) -> Non
         "app.services.watch_events.watch_event_repository.get_watch_event_by_source_event",
         lambda *_args, **_kwargs: None,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.find_matching_watch_event",
         lambda *_args, **_kwargs: existing_event,
@@ -336,6 +524,135 @@ def test_create_watch_event_returns_existing_collision_match(monkeypatch) -> Non
     session.commit.assert_not_called()
 
 
+def test_create_watch_event_prefers_dedupe_hash_match(monkeypatch) -> None:
+    session = Mock()
+    existing_event = Mock()
+    user_id = uuid4()
+    media_item_id = uuid4()
+    watched_at = datetime(2026, 3, 1, 20, 30, 45, tzinfo=UTC)
+    probed: list[str] = []
+
+    def fake_get_by_hash(_session, *, dedupe_hash):
+        probed.append(dedupe_hash)
+        return existing_event
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        fake_get_by_hash,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.find_matching_watch_event",
+        Mock(side_effect=AssertionError("hash hits skip the window search")),
+    )
+
+    result = WatchEventService.create_watch_event(
+        session,
+        user_id=user_id,
+        media_item_id=media_item_id,
+        watched_at=watched_at,
+        playback_source=" jellyfin ",
+        total_seconds=None,
+        watched_seconds=None,
+        progress_percent=None,
+        completed=False,
+        rating_value=None,
+        rating_scale=None,
+        media_version_id=None,
+        source_event_id=None,
+    )
+
+    assert probed == [
+        watch_event_dedupe_hash(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            playback_source="jellyfin",
+            completed=False,
+            watched_at=watched_at,
+        )
+    ]
+    assert result.watch_event is existing_event
+    assert result.created is False
+    assert result.match_reason == "dedupe_hash"
+    session.commit.assert_not_called()
+
+
+def test_create_watch_event_skips_hash_probe_below_one_minute_window(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    created: dict[str, object] = {}
+    windows: list[int] = []
+
+    monkeypatch.setattr(
+        "app.services.watch_events.WatchEventService._watch_collision_window_seconds",
+        lambda: 30,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        Mock(side_effect=AssertionError("a sub-minute window skips the probe")),
+    )
+
+    def fake_find_matching_watch_event(_session, **kwargs):
+        windows.append(kwargs["collision_window_seconds"])
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.find_matching_watch_event",
+        fake_find_matching_watch_event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.create_watch_event",
+        lambda _session, **kwargs: created.update(kwargs) or Mock(),
+    )
+
+    result = WatchEventService.create_watch_event(
+        session,
+        user_id=uuid4(),
+        media_item_id=uuid4(),
+        watched_at=datetime.now(UTC),
+        playback_source="jellyfin",
+        total_seconds=None,
+        watched_seconds=None,
+        progress_percent=None,
+        completed=True,
+        rating_value=None,
+        rating_scale=None,
+        media_version_id=None,
+        source_event_id=None,
+        defer_rewatch=True,
+    )
+
+    assert result.created is True
+    assert windows == [30]
+    assert created["dedupe_hash"] is None
+
+
+def test_watch_event_dedupe_hash_buckets_by_utc_minute() -> None:
+    user_id = uuid4()
+    media_item_id = uuid4()
+
+    def _hash(
+        watched_at: datetime,
+        playback_source: str = "jellyfin",
+        completed: bool = True,
+    ) -> str:
+        return watch_event_dedupe_hash(
+            user_id=user_id,
+            media_item_id=media_item_id,
+            playback_source=playback_source,
+            completed=completed,
+            watched_at=watched_at,
+        )
+
+    start = datetime(2026, 3, 1, 20, 30, tzinfo=UTC)
+    assert _hash(start) == _hash(start.replace(second=59, microsecond=999999))
+    assert _hash(start) == _hash(start.astimezone(timezone(timedelta(hours=-7))))
+    assert _hash(start) != _hash(start + timedelta(minutes=1))
+    assert _hash(start) != _hash(start, playback_source="plex")
+    assert _hash(start) != _hash(start, completed=False)
+    with pytest.raises(ValueError, match="watched_at must include timezone"):
+        _hash(start.replace(tzinfo=None))
+
+
 def test_create_manual_movie_watch_reuses_existing_media_item(monkeypatch) -> None:
     session = Mock()
     media_item_id = uuid4()
@@ -576,7 +893,7 @@ def test_soft_delete_watch_event_marks_deleted(monkeypatch) -> None:
     )
     recompute = Mock()
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         recompute,
     )
 
@@ -603,23 +920,30 @@ def test_restore_watch_event_clears_deleted_fields(monkeypatch) -> None:
         watch_id=watch_id,
         user_id=uuid4(),
         media_item_id=uuid4(),
+        watched_at=datetime(2026, 3, 1, 20, 30, 15, tzinfo=UTC),
+        playback_source="jellyfin",
+        completed=True,
         is_deleted=True,
         deleted_at=datetime.now(UTC),
         deleted_by="operator",
         deleted_reason="duplicate",
-        dedupe_hash="abc",
+        dedupe_hash=None,
     )
 
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.get_watch_event",
         lambda *_args, **_kwargs: event,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: None,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.update_watch_event",
         lambda *_args, **_kwargs: event,
     )
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         Mock(),
     )
 
@@ -634,7 +958,13 @@ def test_restore_watch_event_clears_deleted_fields(monkeypatch) -> None:
     assert result.deleted_at is None
     assert result.deleted_by is None
     assert result.deleted_reason is None
-    assert result.dedupe_hash is None
+    assert result.dedupe_hash == watch_event_dedupe_hash(
+        user_id=event.user_id,
+        media_item_id=event.media_item_id,
+        playback_source="jellyfin",
+        completed=True,
+        watched_at=datetime(2026, 3, 1, 20, 30, tzinfo=UTC),
+    )
     session.commit.assert_called_once()
 
 
@@ -649,6 +979,8 @@ def test_correct_watch_event_reassigns_media_item_and_clears_invalid_media_versi
         user_id=uuid4(),
         media_item_id=old_media_item_id,
         watched_at=datetime.now(UTC),
+        playback_source="jellyfin",
+        is_deleted=False,
         media_version_id=uuid4(),
         completed=True,
         rewatch=False,
@@ -667,13 +999,17 @@ def test_correct_watch_event_reassigns_media_item_and_clears_invalid_media_versi
         "app.services.watch_events.watch_event_repository.media_version_matches_media_item",
         lambda *_args, **_kwargs: False,
     )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: event,
+    )
     monkeypatch.setattr(
         "app.services.watch_events.watch_event_repository.update_watch_event",
         lambda *_args, **_kwargs: event,
     )
     recompute = Mock()
     monkeypatch.setattr(
-        "app.services.watch_events.WatchEventService._recompute_rewatch_for_media_timeline",
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
         recompute,
     )
 
@@ -692,7 +1028,13 @@ def test_correct_watch_event_reassigns_media_item_and_clears_invalid_media_versi
     assert result.media_version_id is None
     assert result.updated_by == "operator"
     assert result.update_reason == "wrong match"
-    assert result.dedupe_hash is None
+    assert result.dedupe_hash == watch_event_dedupe_hash(
+        user_id=event.user_id,
+        media_item_id=new_media_item_id,
+        playback_source="jellyfin",
+        completed=True,
+        watched_at=event.watched_at,
+    )
     assert recompute.call_count == 2
     session.commit.assert_called_once()
 
@@ -748,6 +1090,74 @@ def test_list_unrated_watch_events_clamps_limit(monkeypatch) -> None:
     )
 
 
+def test_list_watch_events_passes_decoded_cursor(monkeypatch) -> None:
+    session = Mock()
+    cursor = WatchEventCursor(
+        watched_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC), watch_id=uuid4()
+    )
+    captured: dict[str, object] = {}
+
+    def fake_list_watch_events(_session, **kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.list_watch_events",
+        fake_list_watch_events,
+    )
+
+    WatchEventService.list_watch_events(
+        session,
+        user_id=None,
+        media_item_id=None,
+        watched_after=None,
+        watched_before=None,
+        local_date_from=None,
+        local_date_to=None,
+        query=None,
+        media_type=None,
+        include_deleted=False,
+        deleted_only=False,
+        limit=25,
+        offset=0,
+        cursor=cursor.encode(),
+    )
+
+    assert captured["cursor"] == cursor
+
+
+def test_list_unrated_watch_events_rejects_cursor_with_offset() -> None:
+    cursor = WatchEventCursor(watched_at=datetime.now(UTC), watch_id=uuid4())
+
+    with pytest.raises(ValueError, match="cursor cannot be combined with offset"):
+        WatchEventService.list_unrated_watch_events(
+            Mock(), user_id=None, limit=25, offset=25, cursor=cursor.encode()
+        )
+
+
+@pytest.mark.parametrize(
+    "token", ["not-a-cursor", "bm8tcGlwZQ", "MjAyNi0wMS0wMlQwMzowNDowNXxub3BlCg"]
+)
+def test_watch_event_cursor_rejects_malformed_tokens(token: str) -> None:
+    with pytest.raises(ValueError, match="cursor is invalid"):
+        WatchEventCursor.decode(token)
+
+
+def test_next_page_cursor_points_at_last_row_of_full_page() -> None:
+    rows = [
+        {"watch_id": uuid4(), "watched_at": datetime(2026, 1, day, tzinfo=UTC)}
+        for day in (3, 2)
+    ]
+
+    token = WatchEventService.next_page_cursor(rows, limit=2)
+
+    assert token is not None
+    assert WatchEventCursor.decode(token) == WatchEventCursor(
+        watched_at=rows[-1]["watched_at"], watch_id=rows[-1]["watch_id"]
+    )
+    assert WatchEventService.next_page_cursor(rows, limit=3) is None
+
+
 def test_rate_watch_event_sets_ten_point_rating(monkeypatch) -> None:
     session = Mock()
     event = Mock(
@@ -830,7 +1240,7 @@ def test_set_watch_event_version_override_updates_watch_fields(monkeypatch) -> N
     assert result.watch_version_name == "Director's Cut"
     assert result.watch_runtime_seconds == 132 * 60
     assert result.updated_by == "operator"
-    assert result.dedupe_hash is None
+    assert result.dedupe_hash == "abc"
     session.commit.assert_called_once()
 
 
@@ -865,3 +1275,205 @@ def test_clear_watch_event_version_override(monkeypatch) -> None:
     assert result.watch_version_name is None
     assert result.watch_runtime_seconds is None
     session.commit.assert_called_once()
+
+
+def test_apply_watch_event_operations_recomputes_once_per_timeline(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    user_id = uuid4()
+    media_item_id = uuid4()
+    other_media_item_id = uuid4()
+
+    def watch(*, is_deleted: bool = False) -> Mock:
+        return Mock(
+            watch_id=uuid4(),
+            user_id=user_id,
+            media_item_id=media_item_id,
+            watched_at=datetime(2026, 1, 1, tzinfo=UTC),
+            is_deleted=is_deleted,
+            media_version_id=None,
+        )
+
+    duplicate = watch()
+    other_duplicate = watch()
+    already_deleted = watch(is_deleted=True)
+    moved = watch()
+    rated = watch()
+    events = [duplicate, other_duplicate, already_deleted, moved, rated]
+    recompute = Mock(return_value=3)
+    horrorfest_sync = Mock()
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.list_watch_events_by_ids",
+        lambda *_args, **_kwargs: events,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.recompute_rewatch_flags",
+        recompute,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.MediaItemService.get_media_item",
+        lambda *_args, **_kwargs: Mock(media_item_id=other_media_item_id),
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.HorrorfestService.sync_watch_event_changes",
+        horrorfest_sync,
+    )
+    missing_id = uuid4()
+
+    results = WatchEventService.apply_watch_event_operations(
+        session,
+        operations=[
+            WatchEventOperation(action="delete", watch_id=duplicate.watch_id),
+            WatchEventOperation(action="delete", watch_id=other_duplicate.watch_id),
+            WatchEventOperation(action="delete", watch_id=already_deleted.watch_id),
+            WatchEventOperation(action="delete", watch_id=missing_id),
+            WatchEventOperation(
+                action="correct",
+                watch_id=moved.watch_id,
+                media_item_id=other_media_item_id,
+            ),
+            WatchEventOperation(action="rate", watch_id=rated.watch_id, rating_value=8),
+        ],
+        updated_by=" operator ",
+        update_reason="kodi duplicate burst",
+    )
+
+    assert [result.error for result in results] == [
+        None,
+        None,
+        "Watch event is already deleted",
+        f"Watch event '{missing_id}' not found",
+        None,
+        None,
+    ]
+    assert results[0].watch_event is duplicate
+    assert duplicate.is_deleted is True
+    assert duplicate.deleted_by == "operator"
+    assert moved.media_item_id == other_media_item_id
+    assert rated.rating_value == Decimal("8")
+    recompute.assert_called_once_with(
+        session,
+        timelines=sorted({(user_id, media_item_id), (user_id, other_media_item_id)}),
+    )
+    horrorfest_sync.assert_called_once_with(
+        session, watch_events=[duplicate, other_duplicate, moved]
+    )
+    session.commit.assert_called_once()
+
+
+def test_apply_watch_event_operations_rejects_rate_without_value(
+    monkeypatch,
+) -> None:
+    session = Mock()
+    event = Mock(watch_id=uuid4(), is_deleted=False)
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.list_watch_events_by_ids",
+        lambda *_args, **_kwargs: [event],
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.HorrorfestService.sync_watch_event_changes",
+        Mock(),
+    )
+
+    results = WatchEventService.apply_watch_event_operations(
+        session,
+        operations=[WatchEventOperation(action="rate", watch_id=event.watch_id)],
+        updated_by="operator",
+        update_reason=None,
+    )
+
+    assert results[0].error == "rating_value is required to rate a watch event"
+    assert results[0].watch_event is None
+
+
+def test_restore_watch_event_into_taken_minute_leaves_hash_empty(monkeypatch) -> None:
+    session = Mock()
+    event = Mock(
+        watch_id=uuid4(),
+        user_id=uuid4(),
+        media_item_id=uuid4(),
+        watched_at=datetime(2026, 3, 1, 20, 30, 15, tzinfo=UTC),
+        playback_source="jellyfin",
+        completed=True,
+        is_deleted=True,
+        dedupe_hash=None,
+    )
+    relogged = Mock(watch_id=uuid4())
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event",
+        lambda *_args, **_kwargs: event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: relogged,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.update_watch_event",
+        lambda *_args, **_kwargs: event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
+        Mock(),
+    )
+
+    result = WatchEventService.restore_watch_event(
+        session,
+        watch_id=event.watch_id,
+        updated_by="operator",
+        update_reason="restored",
+    )
+
+    assert result.is_deleted is False
+    assert result.dedupe_hash is None
+    session.commit.assert_called_once()
+
+
+def test_correct_watch_event_into_taken_minute_drops_hash(monkeypatch) -> None:
+    session = Mock()
+    event = Mock(
+        watch_id=uuid4(),
+        user_id=uuid4(),
+        media_item_id=uuid4(),
+        watched_at=datetime(2026, 3, 1, 20, 30, tzinfo=UTC),
+        playback_source="jellyfin",
+        completed=True,
+        is_deleted=False,
+        media_version_id=None,
+        rewatch=False,
+        dedupe_hash="abc",
+    )
+    holder = Mock(watch_id=uuid4())
+
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event",
+        lambda *_args, **_kwargs: event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.get_watch_event_by_dedupe_hash",
+        lambda *_args, **_kwargs: holder,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.watch_event_repository.update_watch_event",
+        lambda *_args, **_kwargs: event,
+    )
+    monkeypatch.setattr(
+        "app.services.watch_events.WatchEventService._refresh_rewatch_after_edit",
+        Mock(),
+    )
+
+    result = WatchEventService.correct_watch_event(
+        session,
+        watch_id=event.watch_id,
+        updated_by="operator",
+        update_reason="moved",
+        watched_at=datetime(2026, 3, 1, 21, 5, 10, tzinfo=UTC),
+        media_item_id=None,
+        completed=None,
+        rewatch=None,
+    )
+
+    assert result.watched_at == datetime(2026, 3, 1, 21, 5, 10, tzinfo=UTC)
+    assert result.dedupe_hash is None
+    session.commit.assert_called_once()